@@ -1,3 +1,4 @@
 using System.Runtime.CompilerServices;
 
 [assembly: InternalsVisibleTo("CrlMonitor.Tests")]
+[assembly: InternalsVisibleTo("CrlMonitor.Benchmarks")]
@@ -1,13 +1,25 @@
 using System.Text.Json;
 using System.Text.Json.Serialization;
 using CrlMonitor.Crl;
+using CrlMonitor.Fetching;
 using CrlMonitor.Models;
 using CrlMonitor.Notifications;
+using CrlMonitor.Reporting;
+using CrlMonitor.Runner;
+using CrlMonitor.Service;
 using Serilog;
 
 namespace CrlMonitor;
 
-internal static class ConfigLoader
+/// <summary>
+/// Reads and validates the configuration file into <see cref="RunOptions"/>.
+/// </summary>
+/// <remarks>
+/// The JSON is read with a source-generated serializer, so no reflection metadata is built at startup. The validated
+/// options are deliberately not cached between runs: validation checks paths that can change in the meantime, and the
+/// options carry SMTP and LDAP credentials that must not be written to disk.
+/// </remarks>
+internal static partial class ConfigLoader
 {
     private const double DefaultExpiryThreshold = 0.8;
     private const double MinExpiryThreshold = 0.1;
@@ -17,10 +29,45 @@ internal static class ConfigLoader
     private const long MaxMaxCrlSizeBytes = 100 * 1024 * 1024;
     private const string DefaultReportSubject = "CRL Health Report";
     private const string DefaultAlertPrefix = "[CRL Alert]";
+    private const long DefaultCsvCompressionThresholdBytes = 256 * 1024;
+    private const string DefaultDirectoryPattern = "*.crl";
     private const int MinFetchTimeoutSeconds = 1;
     private const int MaxFetchTimeoutSeconds = 600;
     private const int MinParallelFetches = 1;
     private const int MaxParallelFetches = 64;
+    private const int MinParallelProcessing = 1;
+    private const int MaxParallelProcessing = 64;
+    private const int MinRunDeadlineSeconds = 1;
+    private const int MaxRunDeadlineSeconds = 86400;
+    private const double DefaultShardPartialMaxAgeMinutes = 60;
+    private const double MaxShardPartialMaxAgeMinutes = 10080;
+    private const long DefaultParseCacheMaxBytes = 64 * 1024 * 1024;
+    private const long MaxParseCacheMaxBytes = 1024L * 1024 * 1024;
+    private const double DefaultMinCheckIntervalMinutes = 5;
+    private const double DefaultMaxCheckIntervalMinutes = 360;
+    private const double DefaultReportIntervalMinutes = 60;
+    private const double MinServiceIntervalMinutes = 1;
+    private const double MaxServiceIntervalMinutes = 10080;
+    private const int DefaultMaxRequestsPerHost = 4;
+    private const int MaxMaxRequestsPerHost = 64;
+    private const double MaxRequestsPerSecondPerHost = 1000;
+    private const int MaxBurstPerHost = 1000;
+    private const double DefaultConnectionLifetimeMinutes = 5;
+    private const double MaxConnectionLifetimeMinutes = 1440;
+    private const double DefaultConnectionIdleTimeoutSeconds = 90;
+    private const double MaxConnectionIdleTimeoutSeconds = 3600;
+    private const double MinHedgeLatencyMultiplier = 2;
+    private const double MaxHedgeLatencyMultiplier = 100;
+    private const int DefaultMaxRetries = 2;
+    private const int MaxMaxRetries = 5;
+    private const int DefaultRetryBaseDelayMs = 250;
+    private const int DefaultRetryMaxDelayMs = 5000;
+    private const int MaxRetryDelayMs = 60000;
+    private const int DefaultCircuitBreakerFailures = 3;
+    private const int MaxCircuitBreakerFailures = 100;
+    private const int DefaultCircuitBreakerCooldownSeconds = 30;
+    private const int MaxCircuitBreakerCooldownSeconds = 3600;
+    private const string DeltaRevocationListQuery = "?deltaRevocationList;binary";
     private const double MinAlertCooldownHours = 0;
     private const double MaxAlertCooldownHours = 168;
     private static readonly HashSet<string> SupportedSchemes = new(StringComparer.OrdinalIgnoreCase)
@@ -31,10 +78,8 @@ internal static class ConfigLoader
         "ldaps",
         "file"
     };
-    private static readonly JsonSerializerOptions SerializerOptions = new() {
-        PropertyNameCaseInsensitive = true,
-        ReadCommentHandling = JsonCommentHandling.Skip
-    };
+
+    private static ReadOnlySpan<byte> Utf8ByteOrderMark => [0xEF, 0xBB, 0xBF];
 
     public static RunOptions Load(string configPath)
     {
@@ -45,10 +90,10 @@ internal static class ConfigLoader
             throw new FileNotFoundException("Configuration file not found.", absolutePath);
         }
 
+        var content = File.ReadAllBytes(absolutePath);
         var configDirectory = Path.GetDirectoryName(absolutePath) ?? AppContext.BaseDirectory;
-        using var stream = File.OpenRead(absolutePath);
         var document =
-            JsonSerializer.Deserialize<ConfigDocument>(stream, SerializerOptions) ??
+            JsonSerializer.Deserialize(StripByteOrderMark(content), ConfigJsonContext.Default.ConfigDocument) ??
             throw new InvalidOperationException("Configuration file is empty.");
 
         var csvPath = RequirePath(document.CsvOutputPath, nameof(document.CsvOutputPath));
@@ -69,18 +114,64 @@ internal static class ConfigLoader
             throw new InvalidOperationException($"max_parallel_fetches must be between {MinParallelFetches} and {MaxParallelFetches}.");
         }
 
+        var maxParallelProcessing = document.MaxParallelProcessing ?? Math.Min(Environment.ProcessorCount, MaxParallelProcessing);
+        if (maxParallelProcessing is < MinParallelProcessing or > MaxParallelProcessing)
+        {
+            throw new InvalidOperationException($"max_parallel_processing must be between {MinParallelProcessing} and {MaxParallelProcessing}.");
+        }
+
+        var runDeadlineSeconds = document.RunDeadlineSeconds;
+        if (runDeadlineSeconds is < MinRunDeadlineSeconds or > MaxRunDeadlineSeconds)
+        {
+            throw new InvalidOperationException($"run_deadline_seconds must be between {MinRunDeadlineSeconds} and {MaxRunDeadlineSeconds} seconds.");
+        }
+
+        var shardPartialMaxAgeMinutes = document.ShardPartialMaxAgeMinutes ?? DefaultShardPartialMaxAgeMinutes;
+        if (shardPartialMaxAgeMinutes is <= 0 or > MaxShardPartialMaxAgeMinutes)
+        {
+            throw new InvalidOperationException($"shard_partial_max_age_minutes must be greater than 0 and at most {MaxShardPartialMaxAgeMinutes} minutes.");
+        }
+
         var maxCrlSizeBytes = ResolveMaxCrlSize(document.MaxCrlSizeBytes, DefaultMaxCrlSizeBytes, "max_crl_size_bytes");
-        var entries = BuildEntries(document.Uris, configDirectory, maxCrlSizeBytes);
+        var caBundlePath = ResolveOptionalPath(configDirectory, document.CaBundlePath);
+        if (caBundlePath != null && !File.Exists(caBundlePath))
+        {
+            throw new InvalidOperationException($"ca_bundle_path '{document.CaBundlePath}' not found.");
+        }
+
+        var countRevokedOnly = document.CountRevokedOnly ?? false;
+        var revocationIndexPath = ResolveOptionalPath(configDirectory, document.RevocationIndexPath);
+        if (revocationIndexPath != null)
+        {
+            if (countRevokedOnly)
+            {
+                throw new InvalidOperationException("revocation_index_path cannot be used when count_revoked_only is true.");
+            }
+
+            ValidateFilePath(document.RevocationIndexPath!, "revocation_index_path");
+        }
+
+        var entries = BuildEntries(document, configDirectory, maxCrlSizeBytes, caBundlePath);
+        var parseCacheMaxBytes = document.ParseCacheMaxBytes ?? DefaultParseCacheMaxBytes;
+        if (parseCacheMaxBytes is < 0 or > MaxParseCacheMaxBytes)
+        {
+            throw new InvalidOperationException($"parse_cache_max_bytes must be between 0 and {MaxParseCacheMaxBytes} bytes.");
+        }
 
         // Only parse SMTP if reports or alerts are enabled
         var smtpNeeded = (document.Reports?.Enabled == true) || (document.Alerts?.Enabled == true);
         var smtpOptions = smtpNeeded && document.Smtp != null ? ParseSmtp(document.Smtp, "smtp") : null;
 
+        var serviceOptions = ParseServiceOptions(document.Service);
+        var httpOptions = ParseHttpOptions(document.Http);
+        var resilienceOptions = ParseResilienceOptions(document.Resilience);
         var reportOptions = ParseReportOptions(document.Reports, smtpOptions);
         var alertOptions = ParseAlertOptions(document.Alerts, smtpOptions);
         var htmlEnabled = document.HtmlReportEnabled ?? false;
         var htmlPath = ResolveOptionalPath(configDirectory, document.HtmlReportPath);
         var consoleVerbose = document.ConsoleVerbose ?? false;
+        var consoleReports = document.ConsoleReports ?? true;
+        var ndjsonPath = ResolveNdjsonPath(configDirectory, document.NdjsonOutputPath, consoleReports);
 
         if (htmlEnabled)
         {
@@ -95,7 +186,7 @@ internal static class ConfigLoader
         return htmlEnabled && string.IsNullOrWhiteSpace(htmlPath)
             ? throw new InvalidOperationException("html_report_path is required when html_report_enabled is true.")
             : new RunOptions(
-            document.ConsoleReports ?? true,
+            consoleReports,
             consoleVerbose,
             document.CsvReports ?? true,
             ResolvePath(configDirectory, csvPath),
@@ -103,70 +194,270 @@ internal static class ConfigLoader
             htmlEnabled,
             htmlPath,
             document.HtmlReportUrl,
+            document.HtmlReportDataFile ?? false,
+            ndjsonPath,
             maxCrlSizeBytes,
             TimeSpan.FromSeconds(timeoutSeconds),
             maxParallel,
+            maxParallelProcessing,
+            runDeadlineSeconds.HasValue ? TimeSpan.FromSeconds(runDeadlineSeconds.Value) : null,
+            TimeSpan.FromMinutes(shardPartialMaxAgeMinutes),
             ResolvePath(configDirectory, stateFilePath),
             document.UseSystemProxy ?? true,
+            httpOptions,
+            resilienceOptions,
+            ResolveOptionalPath(configDirectory, document.HttpCachePath),
+            parseCacheMaxBytes,
+            countRevokedOnly,
+            caBundlePath,
+            ResolveOptionalPath(configDirectory, document.RevocationSnapshotPath),
+            revocationIndexPath,
+            serviceOptions,
             entries,
             reportOptions,
             alertOptions);
     }
 
 
+    private static ReadOnlySpan<byte> StripByteOrderMark(byte[] content)
+    {
+        // Windows editors often save with a byte order mark, which the span reader would reject.
+        var json = content.AsSpan();
+        return json.StartsWith(Utf8ByteOrderMark) ? json[Utf8ByteOrderMark.Length..] : json;
+    }
+
+    /// <summary>
+    /// Collects the CRL entries from the inline <c>uris</c>, the <c>crl_groups</c> and every <c>include</c> file.
+    /// Each include file is read, turned into entries and released before the next one is opened, so memory is bound
+    /// by the largest file rather than by the whole inventory.
+    /// </summary>
     private static List<CrlConfigEntry> BuildEntries(
-        IReadOnlyList<CrlDocument>? documents,
-        string baseDirectory,
-        long defaultMaxCrlSizeBytes)
+        ConfigDocument document,
+        string configDirectory,
+        long defaultMaxCrlSizeBytes,
+        string? caBundlePath)
     {
-        if (documents == null || documents.Count == 0)
+        var collector = new EntryCollector(caBundlePath);
+        var rootDefaults = new CrlDefaults(null, null, null, defaultMaxCrlSizeBytes);
+        collector.AddAll(document.Uris, configDirectory, rootDefaults);
+        if (document.CrlGroups != null)
         {
-            throw new InvalidOperationException("At least one CRL entry is required.");
+            foreach (var group in document.CrlGroups)
+            {
+                AddGroup(collector, group, configDirectory, defaultMaxCrlSizeBytes, "crl_groups");
+            }
         }
 
-        var seen = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
-        var entries = new List<CrlConfigEntry>(documents.Count);
-        foreach (var document in documents)
+        if (document.Include != null)
         {
-            if (string.IsNullOrWhiteSpace(document.Uri))
+            foreach (var pattern in document.Include)
             {
-                throw new InvalidOperationException("Each CRL entry must specify a uri.");
+                foreach (var includePath in ResolveIncludes(configDirectory, pattern))
+                {
+                    var group = ReadInclude(includePath);
+                    AddGroup(collector, group, Path.GetDirectoryName(includePath)!, defaultMaxCrlSizeBytes, includePath);
+                }
             }
+        }
 
-            if (!Uri.TryCreate(document.Uri, UriKind.Absolute, out var uri))
-            {
-                uri = TryCreateFileUri(document.Uri, baseDirectory) ?? throw new InvalidOperationException($"Invalid uri '{document.Uri}'.");
-            }
+        return collector.Entries.Count == 0
+            ? throw new InvalidOperationException("At least one CRL entry is required.")
+            : collector.Entries;
+    }
 
-            EnsureSupportedScheme(uri);
-            if (!seen.Add(uri.ToString()))
+    private static void AddGroup(EntryCollector collector, CrlGroupDocument group, string baseDirectory, long defaultMaxCrlSizeBytes, string source)
+    {
+        var defaults = ResolveDefaults(group.Defaults, baseDirectory, defaultMaxCrlSizeBytes, source);
+        collector.AddAll(group.Uris, baseDirectory, defaults);
+        if (group.Directories == null)
+        {
+            return;
+        }
+
+        foreach (var directory in group.Directories)
+        {
+            foreach (var file in EnumerateCrlFiles(directory, baseDirectory, source))
             {
-                throw new InvalidOperationException($"Found duplicate uri '{uri}'.");
+                collector.Add(new CrlDocument { Uri = new Uri(file).AbsoluteUri }, baseDirectory, defaults);
             }
+        }
+    }
 
-            var signatureMode = ParseSignatureMode(document.SignatureValidationMode);
-            var caPath = ResolveCaPath(signatureMode, document.CaCertificatePath, baseDirectory, uri);
-            var threshold = ParseExpiryThreshold(document.ExpiryThreshold, uri);
-            var ldap = ParseLdap(document.Ldap, uri);
-            var maxCrlSizeBytes = ResolveMaxCrlSize(
-                document.MaxCrlSizeBytes,
-                defaultMaxCrlSizeBytes,
-                $"max_crl_size_bytes for {uri}");
+    private static CrlDefaults ResolveDefaults(CrlDefaultsDocument? document, string baseDirectory, long defaultMaxCrlSizeBytes, string source)
+    {
+        if (document == null)
+        {
+            return new CrlDefaults(null, null, null, defaultMaxCrlSizeBytes);
+        }
 
-            if (ldap != null && !IsLdapScheme(uri))
-            {
-                throw new InvalidOperationException($"LDAP credentials can only be specified for ldap/ldaps URIs. Offending URI: {uri}");
-            }
+        var signatureMode = string.IsNullOrWhiteSpace(document.SignatureValidationMode)
+            ? (SignatureValidationMode?)null
+            : ParseSignatureMode(document.SignatureValidationMode);
+        var caPath = ResolveOptionalPath(baseDirectory, document.CaCertificatePath);
+        if (caPath != null && !File.Exists(caPath))
+        {
+            throw new InvalidOperationException($"defaults.ca_certificate_path '{document.CaCertificatePath}' not found in {source}.");
+        }
 
-            if (ldap == null && IsLdapScheme(uri) && document.Ldap != null)
+        if (document.ExpiryThreshold is < MinExpiryThreshold or > MaxExpiryThreshold)
+        {
+            throw new InvalidOperationException($"defaults.expiry_threshold in {source} must be between {MinExpiryThreshold} and {MaxExpiryThreshold}.");
+        }
+
+        var maxCrlSizeBytes = ResolveMaxCrlSize(document.MaxCrlSizeBytes, defaultMaxCrlSizeBytes, $"defaults.max_crl_size_bytes in {source}");
+        return new CrlDefaults(signatureMode, caPath, document.ExpiryThreshold, maxCrlSizeBytes);
+    }
+
+    /// <summary>
+    /// Expands one <c>include</c> value. A wildcard (<c>*</c> or <c>?</c>) is allowed in the file name only; matches
+    /// are returned in ordinal order so the entry order does not depend on the file system.
+    /// </summary>
+    private static List<string> ResolveIncludes(string configDirectory, string? pattern)
+    {
+        if (string.IsNullOrWhiteSpace(pattern))
+        {
+            throw new InvalidOperationException("include entries must not be empty.");
+        }
+
+        var fullPattern = ResolvePath(configDirectory, pattern);
+        var fileName = Path.GetFileName(fullPattern);
+        if (fileName.AsSpan().IndexOfAny('*', '?') < 0)
+        {
+            if (!File.Exists(fullPattern))
             {
-                throw new InvalidOperationException($"LDAP block for {uri} must specify both username and password.");
+                throw new InvalidOperationException($"include '{pattern}' not found.");
             }
 
-            entries.Add(new CrlConfigEntry(uri, signatureMode, caPath, threshold, ldap, maxCrlSizeBytes));
+            return [fullPattern];
+        }
+
+        var directory = Path.GetDirectoryName(fullPattern);
+        if (string.IsNullOrEmpty(directory) || !Directory.Exists(directory))
+        {
+            throw new InvalidOperationException($"include '{pattern}' refers to a directory that does not exist.");
+        }
+
+        var matches = Directory.EnumerateFiles(directory, fileName).Order(StringComparer.Ordinal).ToList();
+        if (matches.Count == 0)
+        {
+            Log.Warning("include {Pattern} matched no files", pattern);
         }
 
-        return entries;
+        return matches;
+    }
+
+    private static CrlGroupDocument ReadInclude(string path)
+    {
+        try
+        {
+            return JsonSerializer.Deserialize(StripByteOrderMark(File.ReadAllBytes(path)), ConfigJsonContext.Default.CrlGroupDocument)
+                ?? throw new InvalidOperationException($"include file '{path}' is empty.");
+        }
+        catch (JsonException ex)
+        {
+            throw new InvalidOperationException($"include file '{path}' is not valid JSON: {ex.Message}", ex);
+        }
+    }
+
+    private static IEnumerable<string> EnumerateCrlFiles(CrlDirectoryDocument document, string baseDirectory, string source)
+    {
+        if (string.IsNullOrWhiteSpace(document.Path))
+        {
+            throw new InvalidOperationException($"Each directories entry in {source} must specify a path.");
+        }
+
+        var directory = ResolvePath(baseDirectory, document.Path);
+        if (!Directory.Exists(directory))
+        {
+            throw new InvalidOperationException($"directories path '{document.Path}' not found in {source}.");
+        }
+
+        var options = new EnumerationOptions {
+            RecurseSubdirectories = document.Recursive ?? false,
+            MatchCasing = MatchCasing.CaseInsensitive
+        };
+        var pattern = string.IsNullOrWhiteSpace(document.Pattern) ? DefaultDirectoryPattern : document.Pattern;
+        return Directory.EnumerateFiles(directory, pattern, options).Order(StringComparer.Ordinal);
+    }
+
+    private static CrlConfigEntry BuildEntry(
+        CrlDocument document,
+        string baseDirectory,
+        CrlDefaults defaults,
+        string? caBundlePath,
+        HashSet<string> knownCaPaths)
+    {
+        if (string.IsNullOrWhiteSpace(document.Uri))
+        {
+            throw new InvalidOperationException("Each CRL entry must specify a uri.");
+        }
+
+        var uri = ParseCrlUri(document.Uri, baseDirectory, "uri");
+        var signatureMode = string.IsNullOrWhiteSpace(document.SignatureValidationMode)
+            ? defaults.SignatureValidationMode ?? SignatureValidationMode.None
+            : ParseSignatureMode(document.SignatureValidationMode);
+        var caPath = ResolveCaPath(
+            signatureMode,
+            document.CaCertificatePath ?? defaults.CaCertificatePath,
+            caBundlePath,
+            baseDirectory,
+            uri,
+            knownCaPaths);
+        var threshold = ParseExpiryThreshold(document.ExpiryThreshold ?? defaults.ExpiryThreshold, uri);
+        var ldap = ParseLdap(document.Ldap, uri);
+        var maxCrlSizeBytes = ResolveMaxCrlSize(
+            document.MaxCrlSizeBytes,
+            defaults.MaxCrlSizeBytes,
+            $"max_crl_size_bytes for {uri}");
+
+        if (ldap != null && !IsLdapScheme(uri))
+        {
+            throw new InvalidOperationException($"LDAP credentials can only be specified for ldap/ldaps URIs. Offending URI: {uri}");
+        }
+
+        if (ldap == null && IsLdapScheme(uri) && document.Ldap != null)
+        {
+            throw new InvalidOperationException($"LDAP block for {uri} must specify both username and password.");
+        }
+
+        var deltaUri = ParseDeltaUri(document.DeltaUri, baseDirectory, uri);
+        return new CrlConfigEntry(uri, signatureMode, caPath, threshold, ldap, maxCrlSizeBytes, deltaUri);
+    }
+
+    private static Uri ParseCrlUri(string value, string baseDirectory, string fieldName)
+    {
+        if (!Uri.TryCreate(value, UriKind.Absolute, out var uri))
+        {
+            uri = TryCreateFileUri(value, baseDirectory) ?? throw new InvalidOperationException($"Invalid {fieldName} '{value}'.");
+        }
+
+        EnsureSupportedScheme(uri);
+        return uri;
+    }
+
+    private static Uri? ParseDeltaUri(string? value, string baseDirectory, Uri baseUri)
+    {
+        if (string.IsNullOrWhiteSpace(value))
+        {
+            return null;
+        }
+
+        var deltaUri = ParseCrlUri(value, baseDirectory, "delta_uri");
+        if (IsLdapScheme(deltaUri) && string.IsNullOrEmpty(deltaUri.Query))
+        {
+            // Directories publish deltas in deltaRevocationList, usually on the base CRL's own entry.
+            deltaUri = new Uri(deltaUri.AbsoluteUri + DeltaRevocationListQuery);
+        }
+
+        if (deltaUri == baseUri)
+        {
+            throw new InvalidOperationException($"delta_uri for {baseUri} must differ from uri.");
+        }
+
+        // The delta is fetched with the entry's LDAP credentials, so it has to live in the same kind of store.
+        return IsLdapScheme(deltaUri) != IsLdapScheme(baseUri)
+            ? throw new InvalidOperationException($"delta_uri for {baseUri} must use LDAP if and only if uri does.")
+            : deltaUri;
     }
 
     private static Uri? TryCreateFileUri(string value, string baseDirectory)
@@ -199,8 +490,10 @@ internal static class ConfigLoader
     private static string? ResolveCaPath(
         SignatureValidationMode mode,
         string? caPath,
+        string? caBundlePath,
         string baseDirectory,
-        Uri uri)
+        Uri uri,
+        HashSet<string> knownCaPaths)
     {
         if (mode == SignatureValidationMode.None)
         {
@@ -209,13 +502,23 @@ internal static class ConfigLoader
 
         if (string.IsNullOrWhiteSpace(caPath))
         {
-            throw new InvalidOperationException($"ca_certificate_path is required when signature_validation_mode is ca-cert. Offending URI: {uri}");
+            // Entries without their own CA file verify against the shared bundle, which is picked by issuer at validation time.
+            return caBundlePath ?? throw new InvalidOperationException($"ca_certificate_path or ca_bundle_path is required when signature_validation_mode is ca-cert. Offending URI: {uri}");
         }
 
+        // Large inventories share a handful of CA files, so each one is checked on disk only once.
         var resolved = ResolvePath(baseDirectory, caPath);
-        return !File.Exists(resolved)
-            ? throw new InvalidOperationException($"ca_certificate_path '{caPath}' not found for URI {uri}.")
-            : resolved;
+        if (!knownCaPaths.Contains(resolved))
+        {
+            if (!File.Exists(resolved))
+            {
+                throw new InvalidOperationException($"ca_certificate_path '{caPath}' not found for URI {uri}.");
+            }
+
+            _ = knownCaPaths.Add(resolved);
+        }
+
+        return resolved;
     }
 
     private static double ParseExpiryThreshold(double? value, Uri uri)
@@ -320,10 +623,135 @@ internal static class ConfigLoader
             "csv_output_path" => "crl-report.csv",
             "html_report_path" => "crl-report.html",
             "state_file_path" => "crl-report.json",
+            "revocation_index_path" => "revocations.idx",
+            "ndjson_output_path" => "crl-results.ndjson",
             _ => "crl-report.txt"
         };
     }
 
+    private static string? ResolveNdjsonPath(string configDirectory, string? path, bool consoleReports)
+    {
+        if (string.IsNullOrWhiteSpace(path))
+        {
+            return null;
+        }
+
+        if (path.Trim() == NdjsonReporter.StandardOutputPath)
+        {
+            // The console report clears and redraws the terminal, which would corrupt a piped result stream.
+            return consoleReports
+                ? throw new InvalidOperationException("ndjson_output_path '-' (standard output) requires console_reports to be false.")
+                : NdjsonReporter.StandardOutputPath;
+        }
+
+        ValidateFilePath(path, "ndjson_output_path");
+        return ResolvePath(configDirectory, path);
+    }
+
+    private static ServiceOptions ParseServiceOptions(ServiceDocument? document)
+    {
+        var minMinutes = ParseServiceInterval(document?.MinCheckIntervalMinutes, DefaultMinCheckIntervalMinutes, "service.min_check_interval_minutes");
+        var maxMinutes = ParseServiceInterval(document?.MaxCheckIntervalMinutes, DefaultMaxCheckIntervalMinutes, "service.max_check_interval_minutes");
+        var reportMinutes = ParseServiceInterval(document?.ReportIntervalMinutes, DefaultReportIntervalMinutes, "service.report_interval_minutes");
+        return maxMinutes < minMinutes
+            ? throw new InvalidOperationException("service.max_check_interval_minutes must be greater than or equal to service.min_check_interval_minutes.")
+            : new ServiceOptions(
+            TimeSpan.FromMinutes(minMinutes),
+            TimeSpan.FromMinutes(maxMinutes),
+            TimeSpan.FromMinutes(reportMinutes));
+    }
+
+    private static double ParseServiceInterval(double? value, double fallback, string propertyName)
+    {
+        var minutes = value ?? fallback;
+        return minutes is < MinServiceIntervalMinutes or > MaxServiceIntervalMinutes
+            ? throw new InvalidOperationException($"{propertyName} must be between {MinServiceIntervalMinutes} and {MaxServiceIntervalMinutes} minutes.")
+            : minutes;
+    }
+
+    private static HttpClientOptions ParseHttpOptions(HttpDocument? document)
+    {
+        var maxRequests = document?.MaxRequestsPerHost ?? DefaultMaxRequestsPerHost;
+        if (maxRequests is < 1 or > MaxMaxRequestsPerHost)
+        {
+            throw new InvalidOperationException($"http.max_requests_per_host must be between 1 and {MaxMaxRequestsPerHost}.");
+        }
+
+        var rate = document?.RequestsPerSecondPerHost ?? 0;
+        if (rate is < 0 or > MaxRequestsPerSecondPerHost)
+        {
+            throw new InvalidOperationException($"http.requests_per_second_per_host must be between 0 and {MaxRequestsPerSecondPerHost}.");
+        }
+
+        var burst = document?.BurstPerHost ?? maxRequests;
+        if (burst is < 1 or > MaxBurstPerHost)
+        {
+            throw new InvalidOperationException($"http.burst_per_host must be between 1 and {MaxBurstPerHost}.");
+        }
+
+        var lifetimeMinutes = document?.ConnectionLifetimeMinutes ?? DefaultConnectionLifetimeMinutes;
+        if (lifetimeMinutes is <= 0 or > MaxConnectionLifetimeMinutes)
+        {
+            throw new InvalidOperationException($"http.connection_lifetime_minutes must be greater than 0 and at most {MaxConnectionLifetimeMinutes}.");
+        }
+
+        var idleSeconds = document?.ConnectionIdleTimeoutSeconds ?? DefaultConnectionIdleTimeoutSeconds;
+        if (idleSeconds is <= 0 or > MaxConnectionIdleTimeoutSeconds)
+        {
+            throw new InvalidOperationException($"http.connection_idle_timeout_seconds must be greater than 0 and at most {MaxConnectionIdleTimeoutSeconds}.");
+        }
+
+        var hedgeMultiplier = document?.HedgeLatencyMultiplier ?? 0;
+        return hedgeMultiplier != 0 && hedgeMultiplier is < MinHedgeLatencyMultiplier or > MaxHedgeLatencyMultiplier
+            ? throw new InvalidOperationException($"http.hedge_latency_multiplier must be 0 (off) or between {MinHedgeLatencyMultiplier} and {MaxHedgeLatencyMultiplier}.")
+            : new HttpClientOptions(
+            maxRequests,
+            rate,
+            burst,
+            TimeSpan.FromMinutes(lifetimeMinutes),
+            TimeSpan.FromSeconds(idleSeconds),
+            document?.EnableHttp2 ?? true,
+            document?.AutomaticDecompression ?? true,
+            hedgeMultiplier);
+    }
+
+    private static FetchResilienceOptions ParseResilienceOptions(ResilienceDocument? document)
+    {
+        var maxRetries = document?.MaxRetries ?? DefaultMaxRetries;
+        if (maxRetries is < 0 or > MaxMaxRetries)
+        {
+            throw new InvalidOperationException($"resilience.max_retries must be between 0 and {MaxMaxRetries}.");
+        }
+
+        var baseDelayMs = document?.RetryBaseDelayMs ?? DefaultRetryBaseDelayMs;
+        if (baseDelayMs is < 1 or > MaxRetryDelayMs)
+        {
+            throw new InvalidOperationException($"resilience.retry_base_delay_ms must be between 1 and {MaxRetryDelayMs}.");
+        }
+
+        var maxDelayMs = document?.RetryMaxDelayMs ?? Math.Max(DefaultRetryMaxDelayMs, baseDelayMs);
+        if (maxDelayMs < baseDelayMs || maxDelayMs > MaxRetryDelayMs)
+        {
+            throw new InvalidOperationException($"resilience.retry_max_delay_ms must be between resilience.retry_base_delay_ms and {MaxRetryDelayMs}.");
+        }
+
+        var breakerFailures = document?.CircuitBreakerFailures ?? DefaultCircuitBreakerFailures;
+        if (breakerFailures is < 0 or > MaxCircuitBreakerFailures)
+        {
+            throw new InvalidOperationException($"resilience.circuit_breaker_failures must be between 0 and {MaxCircuitBreakerFailures}.");
+        }
+
+        var cooldownSeconds = document?.CircuitBreakerCooldownSeconds ?? DefaultCircuitBreakerCooldownSeconds;
+        return cooldownSeconds is < 1 or > MaxCircuitBreakerCooldownSeconds
+            ? throw new InvalidOperationException($"resilience.circuit_breaker_cooldown_seconds must be between 1 and {MaxCircuitBreakerCooldownSeconds}.")
+            : new FetchResilienceOptions(
+            maxRetries,
+            TimeSpan.FromMilliseconds(baseDelayMs),
+            TimeSpan.FromMilliseconds(maxDelayMs),
+            breakerFailures,
+            TimeSpan.FromSeconds(cooldownSeconds));
+    }
+
     private static ReportOptions? ParseReportOptions(ReportsDocument? document, SmtpOptions? smtp)
     {
         if (document == null || document.Enabled != true)
@@ -356,6 +784,12 @@ internal static class ConfigLoader
             }
         }
 
+        var compressionThreshold = document.CsvCompressionThresholdBytes ?? DefaultCsvCompressionThresholdBytes;
+        if (compressionThreshold < 0)
+        {
+            throw new InvalidOperationException("reports.csv_compression_threshold_bytes must be zero or greater.");
+        }
+
         return new ReportOptions(
             true,
             recipients,
@@ -363,7 +797,21 @@ internal static class ConfigLoader
             includeSummary,
             includeFullCsv,
             frequencyHours,
-            smtp);
+            smtp,
+            ParseCsvCompression(document.CsvCompression),
+            compressionThreshold);
+    }
+
+    private static CsvAttachmentCompression ParseCsvCompression(string? value)
+    {
+        return string.IsNullOrWhiteSpace(value)
+            ? CsvAttachmentCompression.None
+            : value.Trim().ToUpperInvariant() switch {
+                "NONE" => CsvAttachmentCompression.None,
+                "GZIP" => CsvAttachmentCompression.Gzip,
+                "ZIP" => CsvAttachmentCompression.Zip,
+                _ => throw new InvalidOperationException($"reports.csv_compression '{value}' is not supported. Allowed values: none, gzip, zip.")
+            };
     }
 
     private static AlertOptions? ParseAlertOptions(AlertsDocument? document, SmtpOptions? smtp)
@@ -386,6 +834,11 @@ internal static class ConfigLoader
             ? DefaultAlertPrefix
             : document.SubjectPrefix;
         var includeDetails = document.IncludeDetails ?? true;
+        if (document.NewRevocationsThreshold is < 0)
+        {
+            throw new InvalidOperationException("alerts.new_revocations_threshold must be zero or greater.");
+        }
+
         return smtp == null
             ? throw new InvalidOperationException("smtp block is required when alerts are enabled.")
             : new AlertOptions(
@@ -395,7 +848,8 @@ internal static class ConfigLoader
             TimeSpan.FromHours(cooldownHours),
             subjectPrefix,
             includeDetails,
-            smtp);
+            smtp,
+            document.NewRevocationsThreshold);
     }
 
     private static List<CrlStatus> ParseAlertStatuses(List<string>? statuses)
@@ -427,7 +881,8 @@ internal static class ConfigLoader
             "EXPIRING" => CrlStatus.Expiring,
             "EXPIRED" => CrlStatus.Expired,
             "ERROR" => CrlStatus.Error,
-            _ => throw new InvalidOperationException($"alerts.statuses entry '{value}' is not supported. Allowed values: OK, WARNING, EXPIRING, EXPIRED, ERROR.")
+            "DEFERRED" => CrlStatus.Deferred,
+            _ => throw new InvalidOperationException($"alerts.statuses entry '{value}' is not supported. Allowed values: OK, WARNING, EXPIRING, EXPIRED, ERROR, DEFERRED.")
         };
     }
 
@@ -505,6 +960,13 @@ internal static class ConfigLoader
             enableStartTls);
     }
 
+    [JsonSourceGenerationOptions(PropertyNameCaseInsensitive = true, ReadCommentHandling = JsonCommentHandling.Skip)]
+    [JsonSerializable(typeof(ConfigDocument))]
+    [JsonSerializable(typeof(CrlGroupDocument))]
+    private sealed partial class ConfigJsonContext : JsonSerializerContext
+    {
+    }
+
     private sealed record ConfigDocument
     {
         [JsonPropertyName("console_reports")]
@@ -543,20 +1005,148 @@ internal static class ConfigLoader
         [JsonPropertyName("html_report_url")]
         public string? HtmlReportUrl { get; init; }
 
+        [JsonPropertyName("html_report_data_file")]
+        public bool? HtmlReportDataFile { get; init; }
+
+        [JsonPropertyName("ndjson_output_path")]
+        public string? NdjsonOutputPath { get; init; }
+
         [JsonPropertyName("max_crl_size_bytes")]
         public long? MaxCrlSizeBytes { get; init; }
 
+        [JsonPropertyName("max_parallel_processing")]
+        public int? MaxParallelProcessing { get; init; }
+
+        [JsonPropertyName("run_deadline_seconds")]
+        public int? RunDeadlineSeconds { get; init; }
+
+        [JsonPropertyName("shard_partial_max_age_minutes")]
+        public double? ShardPartialMaxAgeMinutes { get; init; }
+
         [JsonPropertyName("use_system_proxy")]
         public bool? UseSystemProxy { get; init; }
 
+        [JsonPropertyName("http_cache_path")]
+        public string? HttpCachePath { get; init; }
+
+        [JsonPropertyName("parse_cache_max_bytes")]
+        public long? ParseCacheMaxBytes { get; init; }
+
+        [JsonPropertyName("count_revoked_only")]
+        public bool? CountRevokedOnly { get; init; }
+
+        [JsonPropertyName("ca_bundle_path")]
+        public string? CaBundlePath { get; init; }
+
+        [JsonPropertyName("revocation_snapshot_path")]
+        public string? RevocationSnapshotPath { get; init; }
+
+        [JsonPropertyName("revocation_index_path")]
+        public string? RevocationIndexPath { get; init; }
+
         [JsonPropertyName("reports")]
         public ReportsDocument? Reports { get; init; }
 
         [JsonPropertyName("alerts")]
         public AlertsDocument? Alerts { get; init; }
 
+        [JsonPropertyName("service")]
+        public ServiceDocument? Service { get; init; }
+
+        [JsonPropertyName("http")]
+        public HttpDocument? Http { get; init; }
+
+        [JsonPropertyName("resilience")]
+        public ResilienceDocument? Resilience { get; init; }
+
+        [JsonPropertyName("uris")]
+        public List<CrlDocument>? Uris { get; init; }
+
+        [JsonPropertyName("crl_groups")]
+        public List<CrlGroupDocument>? CrlGroups { get; init; }
+
+        [JsonPropertyName("include")]
+        public List<string>? Include { get; init; }
+    }
+
+    /// <summary>
+    /// Resolved group defaults, applied to every entry of the group that does not set the value itself.
+    /// </summary>
+    private sealed record CrlDefaults(
+        SignatureValidationMode? SignatureValidationMode,
+        string? CaCertificatePath,
+        double? ExpiryThreshold,
+        long MaxCrlSizeBytes);
+
+    private sealed class EntryCollector(string? caBundlePath)
+    {
+        private readonly HashSet<string> _seen = new(StringComparer.OrdinalIgnoreCase);
+        private readonly HashSet<string> _knownCaPaths = new(StringComparer.Ordinal);
+
+        public List<CrlConfigEntry> Entries { get; } = [];
+
+        public void AddAll(List<CrlDocument>? documents, string baseDirectory, CrlDefaults defaults)
+        {
+            if (documents == null)
+            {
+                return;
+            }
+
+            foreach (var document in documents)
+            {
+                this.Add(document, baseDirectory, defaults);
+            }
+        }
+
+        public void Add(CrlDocument document, string baseDirectory, CrlDefaults defaults)
+        {
+            var entry = BuildEntry(document, baseDirectory, defaults, caBundlePath, this._knownCaPaths);
+            if (!this._seen.Add(entry.Uri.ToString()))
+            {
+                throw new InvalidOperationException($"Found duplicate uri '{entry.Uri}'.");
+            }
+
+            this.Entries.Add(entry);
+        }
+    }
+
+    private sealed record CrlGroupDocument
+    {
+        [JsonPropertyName("defaults")]
+        public CrlDefaultsDocument? Defaults { get; init; }
+
         [JsonPropertyName("uris")]
         public List<CrlDocument>? Uris { get; init; }
+
+        [JsonPropertyName("directories")]
+        public List<CrlDirectoryDocument>? Directories { get; init; }
+    }
+
+    private sealed record CrlDefaultsDocument
+    {
+        [JsonPropertyName("signature_validation_mode")]
+        public string? SignatureValidationMode { get; init; }
+
+        [JsonPropertyName("ca_certificate_path")]
+        public string? CaCertificatePath { get; init; }
+
+        [JsonPropertyName("expiry_threshold")]
+        public double? ExpiryThreshold { get; init; }
+
+        [JsonPropertyName("max_crl_size_bytes")]
+        public long? MaxCrlSizeBytes { get; init; }
+    }
+
+    private sealed record CrlDirectoryDocument
+    {
+        [JsonPropertyName("path")]
+        public string? Path { get; init; }
+
+        [JsonPropertyName("pattern")]
+        public string? Pattern { get; init; }
+
+        [JsonPropertyName("recursive")]
+        public bool? Recursive { get; init; }
     }
 
     private sealed record CrlDocument
@@ -564,6 +1154,9 @@ internal static class ConfigLoader
         [JsonPropertyName("uri")]
         public string? Uri { get; init; }
 
+        [JsonPropertyName("delta_uri")]
+        public string? DeltaUri { get; init; }
+
         [JsonPropertyName("signature_validation_mode")]
         public string? SignatureValidationMode { get; init; }
 
@@ -608,6 +1201,12 @@ internal static class ConfigLoader
 
         [JsonPropertyName("report_frequency_hours")]
         public double? ReportFrequencyHours { get; init; }
+
+        [JsonPropertyName("csv_compression")]
+        public string? CsvCompression { get; init; }
+
+        [JsonPropertyName("csv_compression_threshold_bytes")]
+        public long? CsvCompressionThresholdBytes { get; init; }
     }
 
     private sealed record AlertsDocument
@@ -629,8 +1228,68 @@ internal static class ConfigLoader
 
         [JsonPropertyName("include_details")]
         public bool? IncludeDetails { get; init; }
+
+        [JsonPropertyName("new_revocations_threshold")]
+        public int? NewRevocationsThreshold { get; init; }
+    }
+
+
+    private sealed record ServiceDocument
+    {
+        [JsonPropertyName("min_check_interval_minutes")]
+        public double? MinCheckIntervalMinutes { get; init; }
+
+        [JsonPropertyName("max_check_interval_minutes")]
+        public double? MaxCheckIntervalMinutes { get; init; }
+
+        [JsonPropertyName("report_interval_minutes")]
+        public double? ReportIntervalMinutes { get; init; }
     }
 
+    private sealed record HttpDocument
+    {
+        [JsonPropertyName("max_requests_per_host")]
+        public int? MaxRequestsPerHost { get; init; }
+
+        [JsonPropertyName("requests_per_second_per_host")]
+        public double? RequestsPerSecondPerHost { get; init; }
+
+        [JsonPropertyName("burst_per_host")]
+        public int? BurstPerHost { get; init; }
+
+        [JsonPropertyName("connection_lifetime_minutes")]
+        public double? ConnectionLifetimeMinutes { get; init; }
+
+        [JsonPropertyName("connection_idle_timeout_seconds")]
+        public double? ConnectionIdleTimeoutSeconds { get; init; }
+
+        [JsonPropertyName("enable_http2")]
+        public bool? EnableHttp2 { get; init; }
+
+        [JsonPropertyName("automatic_decompression")]
+        public bool? AutomaticDecompression { get; init; }
+
+        [JsonPropertyName("hedge_latency_multiplier")]
+        public double? HedgeLatencyMultiplier { get; init; }
+    }
+
+    private sealed record ResilienceDocument
+    {
+        [JsonPropertyName("max_retries")]
+        public int? MaxRetries { get; init; }
+
+        [JsonPropertyName("retry_base_delay_ms")]
+        public int? RetryBaseDelayMs { get; init; }
+
+        [JsonPropertyName("retry_max_delay_ms")]
+        public int? RetryMaxDelayMs { get; init; }
+
+        [JsonPropertyName("circuit_breaker_failures")]
+        public int? CircuitBreakerFailures { get; init; }
+
+        [JsonPropertyName("circuit_breaker_cooldown_seconds")]
+        public int? CircuitBreakerCooldownSeconds { get; init; }
+    }
 
     private sealed record SmtpDocument
     {
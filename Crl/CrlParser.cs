@@ -1,49 +1,96 @@
+using Org.BouncyCastle.Asn1;
 using Org.BouncyCastle.Asn1.X509;
+using Org.BouncyCastle.Math;
 using Org.BouncyCastle.X509;
+using Org.BouncyCastle.X509.Extension;
 
 namespace CrlMonitor.Crl;
 
-internal sealed class CrlParser(SignatureValidationMode validationMode) : ICrlParser
+internal sealed class CrlParser(SignatureValidationMode validationMode, bool countRevokedOnly = false) : ICrlParser
 {
     private readonly SignatureValidationMode _validationMode = validationMode;
+    private readonly bool _countRevokedOnly = countRevokedOnly;
 
     public ParsedCrl Parse(byte[] crlBytes)
     {
         ArgumentNullException.ThrowIfNull(crlBytes);
-        if (crlBytes.Length == 0)
+        return this.Parse(crlBytes.AsMemory());
+    }
+
+    public ParsedCrl Parse(ReadOnlyMemory<byte> crlBytes)
+    {
+        return this.Decode(crlBytes).Parsed;
+    }
+
+    public (ParsedCrl Parsed, X509Crl? Crl) Decode(ReadOnlyMemory<byte> crlBytes)
+    {
+        if (crlBytes.IsEmpty)
         {
             throw new ArgumentException("CRL data is empty", nameof(crlBytes));
         }
 
         var parser = new X509CrlParser();
-        var crl = parser.ReadCrl(crlBytes) ?? throw new InvalidOperationException("Failed to parse CRL");
+        using var stream = new ReadOnlyMemoryStream(crlBytes);
+        var crl = parser.ReadCrl(stream) ?? throw new InvalidOperationException("Failed to parse CRL");
 
         var issuer = crl.IssuerDN.ToString();
         var thisUpdate = ToUtc(crl.ThisUpdate);
         var nextUpdate = crl.NextUpdate.HasValue ? (DateTime?)ToUtc(crl.NextUpdate.Value) : null;
-        var revoked = ExtractRevokedSerials(crl);
-        var isDelta = crl.GetExtensionValue(X509Extensions.DeltaCrlIndicator) != null;
+        var baseCrlNumber = ReadIntegerExtension(crl, X509Extensions.DeltaCrlIndicator);
+        var isDelta = baseCrlNumber != null;
+        var (revoked, removed) = this.ExtractRevokedSerials(crl, isDelta);
 
         var signatureStatus = this._validationMode == SignatureValidationMode.None ? "Skipped" : "Unknown";
 
-        return new ParsedCrl(issuer, thisUpdate, nextUpdate, revoked, isDelta, signatureStatus, null, crl);
+        var parsed = new ParsedCrl(
+            issuer,
+            thisUpdate,
+            nextUpdate,
+            revoked,
+            isDelta,
+            signatureStatus,
+            null,
+            ReadIntegerExtension(crl, X509Extensions.CrlNumber),
+            baseCrlNumber,
+            removed);
+        return (parsed, crl);
     }
 
-    private static List<string> ExtractRevokedSerials(X509Crl crl)
+    private (RevokedSerialCollection Revoked, RevokedSerialCollection? Removed) ExtractRevokedSerials(X509Crl crl, bool isDelta)
     {
-        var revoked = new List<string>();
         var entries = crl.GetRevokedCertificates();
-        if (entries == null)
+        if (!isDelta || entries == null)
         {
-            return revoked;
+            return (this.BuildSerials(entries), null);
         }
 
-        foreach (var entry in entries)
-        {
-            revoked.Add(entry.SerialNumber.ToString(16).ToUpperInvariant());
-        }
+        // A delta lists certificates that left the base CRL with reason removeFromCRL; they are not revocations.
+        var removed = entries.Where(IsRemovedFromCrl).ToList();
+        return removed.Count == 0
+            ? (this.BuildSerials(entries), RevokedSerialCollection.Empty)
+            : (this.BuildSerials(entries.Where(entry => !IsRemovedFromCrl(entry)).ToList()), this.BuildSerials(removed));
+    }
+
+    private RevokedSerialCollection BuildSerials(ICollection<X509CrlEntry>? entries)
+    {
+        return this._countRevokedOnly
+            ? RevokedSerialCollection.CountOnly(entries?.Count ?? 0)
+            : entries == null
+                ? RevokedSerialCollection.Empty
+                : RevokedSerialCollection.Create(entries.Select(entry => entry.SerialNumber));
+    }
 
-        return revoked;
+    private static bool IsRemovedFromCrl(X509CrlEntry entry)
+    {
+        var value = entry.GetExtensionValue(X509Extensions.ReasonCode);
+        return value != null &&
+               DerEnumerated.GetInstance(X509ExtensionUtilities.FromExtensionValue(value)).IntValueExact == CrlReason.RemoveFromCrl;
+    }
+
+    private static BigInteger? ReadIntegerExtension(X509Crl crl, DerObjectIdentifier oid)
+    {
+        var value = crl.GetExtensionValue(oid);
+        return value == null ? null : DerInteger.GetInstance(X509ExtensionUtilities.FromExtensionValue(value)).Value;
     }
 
     private static DateTime ToUtc(DateTime value)
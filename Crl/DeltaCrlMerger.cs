@@ -0,0 +1,63 @@
+namespace CrlMonitor.Crl;
+
+/// <summary>
+/// Combines a base CRL with a delta CRL into the effective revocation state described by RFC 5280 section 5.2.4.
+/// </summary>
+internal static class DeltaCrlMerger
+{
+    /// <summary>
+    /// Returns true when <paramref name="baseCrl"/> is new enough for <paramref name="deltaCrl"/> to be applied to it.
+    /// </summary>
+    public static bool CanApply(ParsedCrl baseCrl, ParsedCrl deltaCrl)
+    {
+        ArgumentNullException.ThrowIfNull(baseCrl);
+        ArgumentNullException.ThrowIfNull(deltaCrl);
+        return !baseCrl.IsDelta &&
+               deltaCrl.IsDelta &&
+               string.Equals(baseCrl.Issuer, deltaCrl.Issuer, StringComparison.Ordinal) &&
+               baseCrl.CrlNumber != null &&
+               deltaCrl.BaseCrlNumber != null &&
+               baseCrl.CrlNumber.CompareTo(deltaCrl.BaseCrlNumber) >= 0;
+    }
+
+    /// <summary>
+    /// Applies <paramref name="deltaCrl"/> to <paramref name="baseCrl"/>. The result takes its validity window from the
+    /// delta, except that it expires no later than the base, and is flagged as a delta so reports show how it was built.
+    /// </summary>
+    /// <exception cref="InvalidOperationException">The delta does not apply to this base.</exception>
+    public static ParsedCrl Merge(ParsedCrl baseCrl, ParsedCrl deltaCrl)
+    {
+        ArgumentNullException.ThrowIfNull(baseCrl);
+        ArgumentNullException.ThrowIfNull(deltaCrl);
+        if (baseCrl.IsDelta)
+        {
+            throw new InvalidOperationException("Base CRL carries a delta CRL indicator.");
+        }
+
+        if (!deltaCrl.IsDelta)
+        {
+            throw new InvalidOperationException("Delta CRL does not carry a delta CRL indicator.");
+        }
+
+        if (!string.Equals(baseCrl.Issuer, deltaCrl.Issuer, StringComparison.Ordinal))
+        {
+            throw new InvalidOperationException($"Delta CRL issuer '{deltaCrl.Issuer}' does not match base CRL issuer '{baseCrl.Issuer}'.");
+        }
+
+        if (!CanApply(baseCrl, deltaCrl))
+        {
+            throw new InvalidOperationException(
+                $"Delta CRL requires base CRL number {deltaCrl.BaseCrlNumber} or later; base CRL number is {baseCrl.CrlNumber?.ToString() ?? "missing"}.");
+        }
+
+        var revoked = RevokedSerialCollection.Merge(baseCrl.RevokedSerialNumbers, deltaCrl.RevokedSerialNumbers, deltaCrl.RemovedSerialNumbers);
+        var nextUpdate = baseCrl.NextUpdate.HasValue && deltaCrl.NextUpdate.HasValue
+            ? (baseCrl.NextUpdate.Value < deltaCrl.NextUpdate.Value ? baseCrl.NextUpdate : deltaCrl.NextUpdate)
+            : deltaCrl.NextUpdate ?? baseCrl.NextUpdate;
+        return deltaCrl with {
+            NextUpdate = nextUpdate,
+            RevokedSerialNumbers = revoked,
+            RemovedSerialNumbers = null
+        };
+    }
+}
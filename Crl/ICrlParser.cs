@@ -1,6 +1,12 @@
+using Org.BouncyCastle.X509;
+
 namespace CrlMonitor.Crl;
 
 internal interface ICrlParser
 {
-    ParsedCrl Parse(byte[] crlBytes);
+    /// <summary>
+    /// Parses a CRL. The decoded <see cref="X509Crl"/> is returned alongside only so its signature can be checked;
+    /// callers drop it once validated instead of keeping it with the result.
+    /// </summary>
+    (ParsedCrl Parsed, X509Crl? Crl) Decode(ReadOnlyMemory<byte> crlBytes);
 }
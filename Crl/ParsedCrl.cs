@@ -1,13 +1,21 @@
-using Org.BouncyCastle.X509;
+using Org.BouncyCastle.Math;
 
 namespace CrlMonitor.Crl;
 
+/// <summary>
+/// A parsed CRL. For delta CRLs, <see cref="BaseCrlNumber"/> is the DeltaCrlIndicator value and
+/// <see cref="RemovedSerialNumbers"/> holds entries marked removeFromCRL, which are kept out of
+/// <see cref="RevokedSerialNumbers"/>. The decoded BouncyCastle CRL is not kept here: it holds every entry, so it is
+/// only passed to the signature validator and then dropped (see <see cref="ICrlParser.Decode"/>).
+/// </summary>
 internal sealed record ParsedCrl(
     string Issuer,
     DateTime ThisUpdate,
     DateTime? NextUpdate,
-    IReadOnlyList<string> RevokedSerialNumbers,
+    RevokedSerialCollection RevokedSerialNumbers,
     bool IsDelta,
     string SignatureStatus,
     string? SignatureError,
-    X509Crl RawCrl);
+    BigInteger? CrlNumber = null,
+    BigInteger? BaseCrlNumber = null,
+    RevokedSerialCollection? RemovedSerialNumbers = null);
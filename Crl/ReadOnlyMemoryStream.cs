@@ -0,0 +1,75 @@
+namespace CrlMonitor.Crl;
+
+/// <summary>
+/// Read-only, seekable stream over a <see cref="ReadOnlyMemory{T}"/>, used to hand pooled or memory-mapped CRL
+/// bytes to the ASN.1 reader without copying them into a new array.
+/// </summary>
+internal sealed class ReadOnlyMemoryStream(ReadOnlyMemory<byte> content) : Stream
+{
+    private readonly ReadOnlyMemory<byte> _content = content;
+    private int _position;
+
+    public override bool CanRead => true;
+
+    public override bool CanSeek => true;
+
+    public override bool CanWrite => false;
+
+    public override long Length => this._content.Length;
+
+    public override long Position
+    {
+        get => this._position;
+        set
+        {
+            ArgumentOutOfRangeException.ThrowIfNegative(value);
+            ArgumentOutOfRangeException.ThrowIfGreaterThan(value, this._content.Length);
+            this._position = (int)value;
+        }
+    }
+
+    public override int Read(byte[] buffer, int offset, int count)
+    {
+        ArgumentNullException.ThrowIfNull(buffer);
+        return this.Read(buffer.AsSpan(offset, count));
+    }
+
+    public override int Read(Span<byte> buffer)
+    {
+        var remaining = this._content.Span[this._position..];
+        var count = Math.Min(remaining.Length, buffer.Length);
+        remaining[..count].CopyTo(buffer);
+        this._position += count;
+        return count;
+    }
+
+    public override int ReadByte()
+    {
+        return this._position < this._content.Length ? this._content.Span[this._position++] : -1;
+    }
+
+    public override long Seek(long offset, SeekOrigin origin)
+    {
+        this.Position = origin switch {
+            SeekOrigin.Begin => offset,
+            SeekOrigin.Current => this._position + offset,
+            SeekOrigin.End => this._content.Length + offset,
+            _ => throw new ArgumentOutOfRangeException(nameof(origin))
+        };
+        return this._position;
+    }
+
+    public override void Flush()
+    {
+    }
+
+    public override void SetLength(long value)
+    {
+        throw new NotSupportedException();
+    }
+
+    public override void Write(byte[] buffer, int offset, int count)
+    {
+        throw new NotSupportedException();
+    }
+}
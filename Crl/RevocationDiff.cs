@@ -0,0 +1,17 @@
+namespace CrlMonitor.Crl;
+
+/// <summary>
+/// Serials that appeared in or disappeared from a CRL since its previous snapshot.
+/// </summary>
+internal sealed record RevocationDiff(RevokedSerialCollection Added, RevokedSerialCollection Removed)
+{
+    public int AddedCount => this.Added.Count;
+
+    public int RemovedCount => this.Removed.Count;
+
+    public static RevocationDiff Compute(RevokedSerialCollection previous, RevokedSerialCollection current)
+    {
+        var (added, removed) = RevokedSerialCollection.Diff(previous, current);
+        return new RevocationDiff(added, removed);
+    }
+}
@@ -0,0 +1,297 @@
+using System.Buffers;
+using System.Buffers.Binary;
+using System.Text;
+using CrlMonitor.Fetching;
+
+namespace CrlMonitor.Crl;
+
+/// <summary>
+/// Read-only, memory-mapped index of the revoked serials of every monitored CRL, ordered by issuer. Lookups binary
+/// search each CRL's sorted serial table straight from the mapped file, so nothing is fetched, parsed or copied.
+/// </summary>
+/// <remarks>
+/// Layout (little-endian): a header (magic, version, CRL count, generation time), one 64-bit position per CRL, then
+/// each CRL as issuer and URI (length-prefixed UTF-8), this update ticks, serial count, the offset table and the
+/// concatenated serial encodings of its <see cref="RevokedSerialCollection"/>.
+/// </remarks>
+internal sealed class RevocationIndex : IDisposable
+{
+    private const uint Magic = 0x494C5243; // "CRLI" little-endian
+    private const byte Version = 1;
+    private const int HeaderSize = 20;
+    private readonly MemoryMappedCrlContent _content;
+    private readonly IndexedCrl[] _entries;
+
+    private RevocationIndex(MemoryMappedCrlContent content, IndexedCrl[] entries, DateTime generatedAtUtc)
+    {
+        this._content = content;
+        this._entries = entries;
+        this.GeneratedAtUtc = generatedAtUtc;
+        this.Crls = Array.ConvertAll(entries, entry => entry.Crl);
+    }
+
+    public DateTime GeneratedAtUtc { get; }
+
+    /// <summary>
+    /// The indexed CRLs, ordered by issuer then URI.
+    /// </summary>
+    public IReadOnlyList<RevocationIndexCrl> Crls { get; }
+
+    /// <summary>
+    /// Writes an index holding <paramref name="entries"/>. Every entry must have its serials retained.
+    /// </summary>
+    public static void Write(Stream destination, IEnumerable<RevocationIndexEntry> entries, DateTime generatedAtUtc)
+    {
+        ArgumentNullException.ThrowIfNull(destination);
+        ArgumentNullException.ThrowIfNull(entries);
+        var ordered = entries
+            .OrderBy(entry => entry.Issuer, StringComparer.Ordinal)
+            .ThenBy(entry => entry.CrlUri.ToString(), StringComparer.Ordinal)
+            .ToList();
+        var issuers = new byte[ordered.Count][];
+        var uris = new byte[ordered.Count][];
+        var positions = new byte[ordered.Count * sizeof(long)];
+        var position = HeaderSize + (long)positions.Length;
+        for (var index = 0; index < ordered.Count; index++)
+        {
+            var entry = ordered[index];
+            issuers[index] = Encoding.UTF8.GetBytes(entry.Issuer);
+            uris[index] = Encoding.UTF8.GetBytes(entry.CrlUri.ToString());
+            BinaryPrimitives.WriteInt64LittleEndian(positions.AsSpan(index * sizeof(long)), position);
+            position += (sizeof(int) * 3L) + issuers[index].Length + uris[index].Length + sizeof(long)
+                + ((entry.Serials.Count + 1L) * sizeof(int)) + entry.Serials.EncodedBuffer.Length;
+        }
+
+        Span<byte> header = stackalloc byte[HeaderSize];
+        BinaryPrimitives.WriteUInt32LittleEndian(header, Magic);
+        header[4] = Version;
+        BinaryPrimitives.WriteInt32LittleEndian(header[8..], ordered.Count);
+        BinaryPrimitives.WriteInt64LittleEndian(header[12..], generatedAtUtc.Ticks);
+        destination.Write(header);
+        destination.Write(positions);
+
+        for (var index = 0; index < ordered.Count; index++)
+        {
+            var entry = ordered[index];
+            WriteInt32(destination, issuers[index].Length);
+            destination.Write(issuers[index]);
+            WriteInt32(destination, uris[index].Length);
+            destination.Write(uris[index]);
+            WriteInt64(destination, entry.ThisUpdate.ToUniversalTime().Ticks);
+            WriteInt32(destination, entry.Serials.Count);
+            WriteOffsets(destination, entry.Serials.Offsets);
+            destination.Write(entry.Serials.EncodedBuffer);
+        }
+    }
+
+    /// <summary>
+    /// Maps an index file for lookups. Only the per-CRL headers are read up front.
+    /// </summary>
+    /// <exception cref="InvalidDataException">The file is not a valid revocation index.</exception>
+    public static RevocationIndex Open(string path)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(path);
+        var length = new FileInfo(path).Length;
+        if (length < HeaderSize)
+        {
+            throw new InvalidDataException($"'{path}' is not a revocation index.");
+        }
+
+        var content = MemoryMappedCrlContent.Open(path, length);
+        try
+        {
+            var data = content.GetSpan();
+            if (BinaryPrimitives.ReadUInt32LittleEndian(data) != Magic || data[4] != Version)
+            {
+                throw new InvalidDataException($"'{path}' is not a revocation index.");
+            }
+
+            var count = BinaryPrimitives.ReadInt32LittleEndian(data[8..]);
+            var generatedAtUtc = ReadTimestamp(data[12..]);
+            if (count < 0 || count > (data.Length - HeaderSize) / sizeof(long))
+            {
+                throw new InvalidDataException("Corrupt revocation index header.");
+            }
+
+            var entries = new IndexedCrl[count];
+            for (var index = 0; index < count; index++)
+            {
+                var position = BinaryPrimitives.ReadInt64LittleEndian(data[(HeaderSize + (index * sizeof(long)))..]);
+                entries[index] = ReadEntryHeader(data, position);
+            }
+
+            return new RevocationIndex(content, entries, generatedAtUtc);
+        }
+        catch
+        {
+            ((IDisposable)content).Dispose();
+            throw;
+        }
+    }
+
+    /// <summary>
+    /// Returns every indexed CRL that lists the serial.
+    /// </summary>
+    /// <exception cref="FormatException"><paramref name="serialHex"/> is not a hexadecimal serial number.</exception>
+    public IReadOnlyList<RevocationIndexCrl> Lookup(string serialHex)
+    {
+        var encoded = RevokedSerialCollection.EncodeHex(serialHex)
+            ?? throw new FormatException($"'{serialHex}' is not a hexadecimal serial number.");
+        return this.Lookup(encoded);
+    }
+
+    public IReadOnlyList<RevocationIndexCrl> Lookup(ReadOnlySpan<byte> encoded)
+    {
+        var data = this._content.GetSpan();
+        List<RevocationIndexCrl>? matches = null;
+        foreach (var entry in this._entries)
+        {
+            if (Contains(data, entry, encoded))
+            {
+                (matches ??= []).Add(entry.Crl);
+            }
+        }
+
+        return matches ?? (IReadOnlyList<RevocationIndexCrl>)[];
+    }
+
+    /// <summary>
+    /// Copies the serials of one indexed CRL back onto the managed heap.
+    /// </summary>
+    public RevokedSerialCollection ReadSerials(int index)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegative(index);
+        ArgumentOutOfRangeException.ThrowIfGreaterThanOrEqual(index, this._entries.Length);
+        var entry = this._entries[index];
+        var data = this._content.GetSpan();
+        var offsets = new int[entry.Crl.RevokedCount + 1];
+        for (var serial = 0; serial < offsets.Length; serial++)
+        {
+            offsets[serial] = BinaryPrimitives.ReadInt32LittleEndian(data[(entry.OffsetsStart + (serial * sizeof(int)))..]);
+        }
+
+        var buffer = data.Slice(entry.DataStart, entry.DataLength).ToArray();
+        return RevokedSerialCollection.FromSortedEncoding(buffer, offsets);
+    }
+
+    public void Dispose()
+    {
+        ((IDisposable)this._content).Dispose();
+    }
+
+    private static bool Contains(ReadOnlySpan<byte> data, IndexedCrl entry, ReadOnlySpan<byte> encoded)
+    {
+        var low = 0;
+        var high = entry.Crl.RevokedCount - 1;
+        while (low <= high)
+        {
+            var mid = low + ((high - low) >> 1);
+            var comparison = RevokedSerialCollection.Compare(GetSerial(data, entry, mid), encoded);
+            if (comparison == 0)
+            {
+                return true;
+            }
+
+            if (comparison < 0)
+            {
+                low = mid + 1;
+            }
+            else
+            {
+                high = mid - 1;
+            }
+        }
+
+        return false;
+    }
+
+    private static ReadOnlySpan<byte> GetSerial(ReadOnlySpan<byte> data, IndexedCrl entry, int index)
+    {
+        var offsets = data[(entry.OffsetsStart + (index * sizeof(int)))..];
+        var start = BinaryPrimitives.ReadInt32LittleEndian(offsets);
+        var end = BinaryPrimitives.ReadInt32LittleEndian(offsets[sizeof(int)..]);
+        return start < 0 || end < start || end > entry.DataLength
+            ? throw new InvalidDataException("Corrupt revocation index offsets.")
+            : data.Slice(entry.DataStart + start, end - start);
+    }
+
+    private static IndexedCrl ReadEntryHeader(ReadOnlySpan<byte> data, long position)
+    {
+        var cursor = CheckRange(data, position, sizeof(int));
+        var issuerLength = BinaryPrimitives.ReadInt32LittleEndian(data[cursor..]);
+        cursor = CheckRange(data, cursor + sizeof(int), issuerLength);
+        var issuer = Encoding.UTF8.GetString(data.Slice(cursor, issuerLength));
+        cursor = CheckRange(data, cursor + issuerLength, sizeof(int));
+        var uriLength = BinaryPrimitives.ReadInt32LittleEndian(data[cursor..]);
+        cursor = CheckRange(data, cursor + sizeof(int), uriLength);
+        var uriText = Encoding.UTF8.GetString(data.Slice(cursor, uriLength));
+        cursor = CheckRange(data, cursor + uriLength, sizeof(long) + sizeof(int));
+        var thisUpdate = ReadTimestamp(data[cursor..]);
+        var count = BinaryPrimitives.ReadInt32LittleEndian(data[(cursor + sizeof(long))..]);
+        if (count < 0 || !Uri.TryCreate(uriText, UriKind.Absolute, out var uri))
+        {
+            throw new InvalidDataException("Corrupt revocation index entry.");
+        }
+
+        var offsetsStart = CheckRange(data, cursor + sizeof(long) + sizeof(int), (count + 1L) * sizeof(int));
+        var dataStart = offsetsStart + ((count + 1) * sizeof(int));
+        var firstOffset = BinaryPrimitives.ReadInt32LittleEndian(data[offsetsStart..]);
+        var dataLength = BinaryPrimitives.ReadInt32LittleEndian(data[(dataStart - sizeof(int))..]);
+        if (firstOffset != 0)
+        {
+            throw new InvalidDataException("Corrupt revocation index offsets.");
+        }
+
+        _ = CheckRange(data, dataStart, dataLength);
+        return new IndexedCrl(new RevocationIndexCrl(issuer, uri, thisUpdate, count), offsetsStart, dataStart, dataLength);
+    }
+
+    private static int CheckRange(ReadOnlySpan<byte> data, long start, long length)
+    {
+        return start < 0 || length < 0 || start + length > data.Length
+            ? throw new InvalidDataException("Revocation index is truncated or corrupt.")
+            : (int)start;
+    }
+
+    private static DateTime ReadTimestamp(ReadOnlySpan<byte> data)
+    {
+        var ticks = BinaryPrimitives.ReadInt64LittleEndian(data);
+        return ticks < DateTime.MinValue.Ticks || ticks > DateTime.MaxValue.Ticks
+            ? throw new InvalidDataException("Corrupt revocation index timestamp.")
+            : new DateTime(ticks, DateTimeKind.Utc);
+    }
+
+    private static void WriteInt32(Stream destination, int value)
+    {
+        Span<byte> buffer = stackalloc byte[sizeof(int)];
+        BinaryPrimitives.WriteInt32LittleEndian(buffer, value);
+        destination.Write(buffer);
+    }
+
+    private static void WriteInt64(Stream destination, long value)
+    {
+        Span<byte> buffer = stackalloc byte[sizeof(long)];
+        BinaryPrimitives.WriteInt64LittleEndian(buffer, value);
+        destination.Write(buffer);
+    }
+
+    private static void WriteOffsets(Stream destination, ReadOnlySpan<int> offsets)
+    {
+        var buffer = ArrayPool<byte>.Shared.Rent(offsets.Length * sizeof(int));
+        try
+        {
+            for (var index = 0; index < offsets.Length; index++)
+            {
+                BinaryPrimitives.WriteInt32LittleEndian(buffer.AsSpan(index * sizeof(int)), offsets[index]);
+            }
+
+            destination.Write(buffer, 0, offsets.Length * sizeof(int));
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+    }
+
+    private sealed record IndexedCrl(RevocationIndexCrl Crl, int OffsetsStart, int DataStart, int DataLength);
+}
@@ -0,0 +1,6 @@
+namespace CrlMonitor.Crl;
+
+/// <summary>
+/// Describes a CRL held in a <see cref="RevocationIndex"/>.
+/// </summary>
+internal sealed record RevocationIndexCrl(string Issuer, Uri CrlUri, DateTime ThisUpdate, int RevokedCount);
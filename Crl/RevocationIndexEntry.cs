@@ -0,0 +1,6 @@
+namespace CrlMonitor.Crl;
+
+/// <summary>
+/// One CRL's revoked serials as written to a <see cref="RevocationIndex"/>.
+/// </summary>
+internal sealed record RevocationIndexEntry(string Issuer, Uri CrlUri, DateTime ThisUpdate, RevokedSerialCollection Serials);
@@ -0,0 +1,585 @@
+using System.Buffers;
+using System.Buffers.Binary;
+using System.Collections;
+using System.Globalization;
+using Org.BouncyCastle.Math;
+
+namespace CrlMonitor.Crl;
+
+/// <summary>
+/// Compact, sorted store of revoked serial numbers. All serials share one byte buffer indexed by an offset table;
+/// hex strings are only produced when enumerated or requested by index.
+/// </summary>
+/// <remarks>
+/// Positive serials are stored as their unsigned big-endian magnitude. Negative serials (malformed but seen in the
+/// wild) carry a leading zero byte, which a minimal positive magnitude never has, so the encodings cannot collide.
+/// Entries are ordered by encoded length then bytes; that order is only used for binary search.
+/// </remarks>
+internal sealed class RevokedSerialCollection : IEnumerable<string>
+{
+    private const byte NegativeMarker = 0x00;
+    private const uint SnapshotMagic = 0x534C5243; // "CRLS" little-endian
+    private const byte SnapshotVersion = 1;
+    private const int SnapshotHeaderSize = 13;
+    private readonly byte[] _buffer;
+    private readonly int[] _offsets;
+
+    private RevokedSerialCollection(byte[] buffer, int[] offsets, int count, int entryCount, bool serialsRetained)
+    {
+        this._buffer = buffer;
+        this._offsets = offsets;
+        this.Count = count;
+        this.EntryCount = entryCount;
+        this.SerialsRetained = serialsRetained;
+    }
+
+    public static RevokedSerialCollection Empty { get; } = new([], [0], 0, 0, true);
+
+    /// <summary>
+    /// Number of distinct serials held, which is what indexing, lookups and diffs work over.
+    /// </summary>
+    public int Count { get; }
+
+    /// <summary>
+    /// Number of entries the CRL listed, counting a repeated serial each time it appears. This is the revoked count
+    /// the reports show, and it is the same whether or not the serials were retained. A base merged with a delta
+    /// counts each serial once, because the delta entry replaces the base entry for the same serial.
+    /// </summary>
+    public int EntryCount { get; }
+
+    /// <summary>
+    /// False when the CRL was parsed in count-only mode; only <see cref="Count"/> is meaningful then.
+    /// </summary>
+    public bool SerialsRetained { get; }
+
+    public long SizeBytes => this._buffer.LongLength + ((long)this._offsets.Length * sizeof(int));
+
+    public static RevokedSerialCollection CountOnly(int count)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegative(count);
+        return new RevokedSerialCollection([], [0], count, count, false);
+    }
+
+    public static RevokedSerialCollection Create(IEnumerable<BigInteger> serials)
+    {
+        ArgumentNullException.ThrowIfNull(serials);
+        var builder = new Builder();
+        try
+        {
+            foreach (var serial in serials)
+            {
+                builder.Add(Encode(serial));
+            }
+
+            return builder.Build();
+        }
+        finally
+        {
+            builder.Release();
+        }
+    }
+
+    public static RevokedSerialCollection FromHex(IEnumerable<string> serials)
+    {
+        ArgumentNullException.ThrowIfNull(serials);
+        var builder = new Builder();
+        try
+        {
+            foreach (var serial in serials)
+            {
+                builder.Add(EncodeHex(serial) ?? throw new FormatException($"'{serial}' is not a hexadecimal serial number."));
+            }
+
+            return builder.Build();
+        }
+        finally
+        {
+            builder.Release();
+        }
+    }
+
+    /// <summary>
+    /// Applies a delta CRL to a base: the result holds every base serial not in <paramref name="removed"/> plus every
+    /// serial in <paramref name="added"/>. When any input is count-only the result is count-only, with the count
+    /// estimated as base + added - removed.
+    /// </summary>
+    public static RevokedSerialCollection Merge(
+        RevokedSerialCollection baseSerials,
+        RevokedSerialCollection added,
+        RevokedSerialCollection? removed)
+    {
+        ArgumentNullException.ThrowIfNull(baseSerials);
+        ArgumentNullException.ThrowIfNull(added);
+        removed ??= Empty;
+        if (!baseSerials.SerialsRetained || !added.SerialsRetained || !removed.SerialsRetained)
+        {
+            return CountOnly(Math.Max(0, baseSerials.EntryCount + added.EntryCount - removed.EntryCount));
+        }
+
+        if (added.Count == 0 && removed.Count == 0)
+        {
+            return baseSerials;
+        }
+
+        var builder = new Builder();
+        try
+        {
+            for (var index = 0; index < baseSerials.Count; index++)
+            {
+                var encoded = baseSerials.GetEncoded(index);
+                if (removed.Count == 0 || removed.IndexOf(encoded) < 0)
+                {
+                    builder.Add(encoded);
+                }
+            }
+
+            for (var index = 0; index < added.Count; index++)
+            {
+                builder.Add(added.GetEncoded(index));
+            }
+
+            return builder.Build(countRepeats: false);
+        }
+        finally
+        {
+            builder.Release();
+        }
+    }
+
+    /// <summary>
+    /// Compares two retained collections with a single linear merge over their sorted encodings.
+    /// </summary>
+    /// <returns>Serials present only in <paramref name="current"/> and serials present only in <paramref name="previous"/>.</returns>
+    public static (RevokedSerialCollection Added, RevokedSerialCollection Removed) Diff(
+        RevokedSerialCollection previous,
+        RevokedSerialCollection current)
+    {
+        ArgumentNullException.ThrowIfNull(previous);
+        ArgumentNullException.ThrowIfNull(current);
+        previous.EnsureRetained();
+        current.EnsureRetained();
+
+        var added = new SortedWriter();
+        var removed = new SortedWriter();
+        var left = 0;
+        var right = 0;
+        while (left < previous.Count && right < current.Count)
+        {
+            var before = previous.GetEncoded(left);
+            var after = current.GetEncoded(right);
+            var comparison = Compare(before, after);
+            if (comparison == 0)
+            {
+                left++;
+                right++;
+            }
+            else if (comparison < 0)
+            {
+                removed.Add(before);
+                left++;
+            }
+            else
+            {
+                added.Add(after);
+                right++;
+            }
+        }
+
+        for (; left < previous.Count; left++)
+        {
+            removed.Add(previous.GetEncoded(left));
+        }
+
+        for (; right < current.Count; right++)
+        {
+            added.Add(current.GetEncoded(right));
+        }
+
+        return (added.Build(), removed.Build());
+    }
+
+    /// <summary>
+    /// Writes the collection as a compact binary snapshot: a header, one little-endian 16-bit length per serial and
+    /// the concatenated encodings in sorted order.
+    /// </summary>
+    public void WriteSnapshot(Stream destination)
+    {
+        ArgumentNullException.ThrowIfNull(destination);
+        this.EnsureRetained();
+        var buffer = this._offsets[this.Count];
+        Span<byte> header = stackalloc byte[SnapshotHeaderSize];
+        BinaryPrimitives.WriteUInt32LittleEndian(header, SnapshotMagic);
+        header[4] = SnapshotVersion;
+        BinaryPrimitives.WriteInt32LittleEndian(header[5..], this.Count);
+        BinaryPrimitives.WriteInt32LittleEndian(header[9..], buffer);
+        destination.Write(header);
+
+        var lengths = ArrayPool<byte>.Shared.Rent(Math.Max(1, this.Count * sizeof(ushort)));
+        try
+        {
+            for (var index = 0; index < this.Count; index++)
+            {
+                var length = this._offsets[index + 1] - this._offsets[index];
+                if (length > ushort.MaxValue)
+                {
+                    throw new InvalidOperationException("Serial number is too long to snapshot.");
+                }
+
+                BinaryPrimitives.WriteUInt16LittleEndian(lengths.AsSpan(index * sizeof(ushort)), (ushort)length);
+            }
+
+            destination.Write(lengths, 0, this.Count * sizeof(ushort));
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(lengths);
+        }
+
+        destination.Write(this._buffer, 0, buffer);
+    }
+
+    /// <summary>
+    /// Reads a snapshot written by <see cref="WriteSnapshot"/>. The data is already sorted, so no re-sorting is done.
+    /// </summary>
+    /// <exception cref="InvalidDataException">The stream does not hold a valid snapshot.</exception>
+    public static RevokedSerialCollection ReadSnapshot(Stream source)
+    {
+        ArgumentNullException.ThrowIfNull(source);
+        Span<byte> header = stackalloc byte[SnapshotHeaderSize];
+        source.ReadExactly(header);
+        if (BinaryPrimitives.ReadUInt32LittleEndian(header) != SnapshotMagic || header[4] != SnapshotVersion)
+        {
+            throw new InvalidDataException("Unrecognised revoked serial snapshot.");
+        }
+
+        var count = BinaryPrimitives.ReadInt32LittleEndian(header[5..]);
+        var bufferLength = BinaryPrimitives.ReadInt32LittleEndian(header[9..]);
+        if (count < 0 || bufferLength < 0)
+        {
+            throw new InvalidDataException("Corrupt revoked serial snapshot header.");
+        }
+
+        if (count == 0)
+        {
+            return Empty;
+        }
+
+        var lengths = new byte[count * sizeof(ushort)];
+        source.ReadExactly(lengths);
+        var offsets = new int[count + 1];
+        for (var index = 0; index < count; index++)
+        {
+            offsets[index + 1] = offsets[index] + BinaryPrimitives.ReadUInt16LittleEndian(lengths.AsSpan(index * sizeof(ushort)));
+        }
+
+        if (offsets[count] != bufferLength)
+        {
+            throw new InvalidDataException("Corrupt revoked serial snapshot lengths.");
+        }
+
+        var buffer = new byte[bufferLength];
+        source.ReadExactly(buffer);
+        return new RevokedSerialCollection(buffer, offsets, count, count, true);
+    }
+
+    /// <summary>
+    /// Returns this collection reporting <paramref name="entryCount"/> CRL entries, for snapshots that store the raw
+    /// entry count beside the distinct serials.
+    /// </summary>
+    internal RevokedSerialCollection WithEntryCount(int entryCount)
+    {
+        ArgumentOutOfRangeException.ThrowIfLessThan(entryCount, this.Count);
+        return entryCount == this.EntryCount
+            ? this
+            : new RevokedSerialCollection(this._buffer, this._offsets, this.Count, entryCount, this.SerialsRetained);
+    }
+
+    /// <summary>
+    /// Rebuilds a collection from an encoding buffer and offset table that are already sorted and distinct, as
+    /// exposed by <see cref="EncodedBuffer"/> and <see cref="Offsets"/>.
+    /// </summary>
+    internal static RevokedSerialCollection FromSortedEncoding(byte[] buffer, int[] offsets)
+    {
+        ArgumentNullException.ThrowIfNull(buffer);
+        ArgumentNullException.ThrowIfNull(offsets);
+        return offsets.Length < 2 ? Empty : new RevokedSerialCollection(buffer, offsets, offsets.Length - 1, offsets.Length - 1, true);
+    }
+
+    /// <summary>
+    /// The concatenated serial encodings in sorted order.
+    /// </summary>
+    internal ReadOnlySpan<byte> EncodedBuffer
+    {
+        get
+        {
+            this.EnsureRetained();
+            return this._buffer.AsSpan(0, this._offsets[this.Count]);
+        }
+    }
+
+    /// <summary>
+    /// Start offset of each serial within <see cref="EncodedBuffer"/>, followed by its total length.
+    /// </summary>
+    internal ReadOnlySpan<int> Offsets
+    {
+        get
+        {
+            this.EnsureRetained();
+            return this._offsets.AsSpan(0, this.Count + 1);
+        }
+    }
+
+    public ReadOnlySpan<byte> GetEncoded(int index)
+    {
+        this.EnsureRetained();
+        ArgumentOutOfRangeException.ThrowIfNegative(index);
+        ArgumentOutOfRangeException.ThrowIfGreaterThanOrEqual(index, this.Count);
+        return this._buffer.AsSpan(this._offsets[index], this._offsets[index + 1] - this._offsets[index]);
+    }
+
+    public string GetHex(int index)
+    {
+        var encoded = this.GetEncoded(index);
+        var negative = encoded.Length > 0 && encoded[0] == NegativeMarker;
+        var magnitude = negative ? encoded[1..] : encoded;
+        var hex = magnitude.IsEmpty ? "0" : Convert.ToHexString(magnitude).TrimStart('0');
+        return negative ? "-" + hex : hex;
+    }
+
+    public bool Contains(string serialHex)
+    {
+        var encoded = EncodeHex(serialHex);
+        return encoded != null && this.IndexOf(encoded) >= 0;
+    }
+
+    public bool Contains(BigInteger serial)
+    {
+        ArgumentNullException.ThrowIfNull(serial);
+        return this.IndexOf(Encode(serial)) >= 0;
+    }
+
+    /// <summary>
+    /// Binary search for an encoded serial; returns the index or a negative value when absent.
+    /// </summary>
+    public int IndexOf(ReadOnlySpan<byte> encoded)
+    {
+        this.EnsureRetained();
+        var low = 0;
+        var high = this.Count - 1;
+        while (low <= high)
+        {
+            var mid = low + ((high - low) >> 1);
+            var comparison = Compare(this.GetEncoded(mid), encoded);
+            if (comparison == 0)
+            {
+                return mid;
+            }
+
+            if (comparison < 0)
+            {
+                low = mid + 1;
+            }
+            else
+            {
+                high = mid - 1;
+            }
+        }
+
+        return ~low;
+    }
+
+    public IEnumerator<string> GetEnumerator()
+    {
+        this.EnsureRetained();
+        for (var index = 0; index < this.Count; index++)
+        {
+            yield return this.GetHex(index);
+        }
+    }
+
+    IEnumerator IEnumerable.GetEnumerator()
+    {
+        return this.GetEnumerator();
+    }
+
+    internal static int Compare(ReadOnlySpan<byte> left, ReadOnlySpan<byte> right)
+    {
+        return left.Length != right.Length ? left.Length.CompareTo(right.Length) : left.SequenceCompareTo(right);
+    }
+
+    internal static byte[] Encode(BigInteger serial)
+    {
+        if (serial.SignValue >= 0)
+        {
+            return serial.ToByteArrayUnsigned();
+        }
+
+        var magnitude = serial.Abs().ToByteArrayUnsigned();
+        var encoded = new byte[magnitude.Length + 1];
+        encoded[0] = NegativeMarker;
+        magnitude.CopyTo(encoded, 1);
+        return encoded;
+    }
+
+    internal static byte[]? EncodeHex(string? serialHex)
+    {
+        if (string.IsNullOrWhiteSpace(serialHex))
+        {
+            return null;
+        }
+
+        var text = serialHex.Trim().Replace(":", string.Empty, StringComparison.Ordinal).Replace(" ", string.Empty, StringComparison.Ordinal);
+        var negative = text.StartsWith('-');
+        if (negative)
+        {
+            text = text[1..];
+        }
+
+        text = text.TrimStart('0');
+        if (text.Length % 2 == 1)
+        {
+            text = "0" + text;
+        }
+
+        byte[] magnitude;
+        try
+        {
+            magnitude = Convert.FromHexString(text);
+        }
+        catch (FormatException)
+        {
+            return null;
+        }
+
+        if (!negative || magnitude.Length == 0)
+        {
+            return magnitude;
+        }
+
+        var encoded = new byte[magnitude.Length + 1];
+        encoded[0] = NegativeMarker;
+        magnitude.CopyTo(encoded, 1);
+        return encoded;
+    }
+
+    private void EnsureRetained()
+    {
+        if (!this.SerialsRetained)
+        {
+            throw new InvalidOperationException(string.Create(
+                CultureInfo.InvariantCulture,
+                $"Revoked serials were not retained (count-only parse of {this.EntryCount} entries)."));
+        }
+    }
+
+    /// <summary>
+    /// Appends serials that are already sorted and distinct, so no sorting or de-duplication is needed.
+    /// </summary>
+    private sealed class SortedWriter
+    {
+        private readonly ArrayBufferWriter<byte> _buffer = new();
+        private readonly List<int> _offsets = [0];
+
+        public void Add(ReadOnlySpan<byte> encoded)
+        {
+            this._buffer.Write(encoded);
+            this._offsets.Add(this._buffer.WrittenCount);
+        }
+
+        public RevokedSerialCollection Build()
+        {
+            var count = this._offsets.Count - 1;
+            return count == 0
+                ? Empty
+                : new RevokedSerialCollection(this._buffer.WrittenSpan.ToArray(), [.. this._offsets], count, count, true);
+        }
+    }
+
+    /// <summary>
+    /// Accumulates encoded serials in a pooled scratch buffer, then sorts and copies them into an exact-size buffer.
+    /// </summary>
+    private sealed class Builder
+    {
+        private byte[] _scratch = ArrayPool<byte>.Shared.Rent(4096);
+        private readonly List<int> _starts = [];
+        private int _length;
+
+        public void Add(ReadOnlySpan<byte> encoded)
+        {
+            if (this._length + encoded.Length > this._scratch.Length)
+            {
+                var grown = ArrayPool<byte>.Shared.Rent(Math.Max(this._scratch.Length * 2, this._length + encoded.Length));
+                this._scratch.AsSpan(0, this._length).CopyTo(grown);
+                ArrayPool<byte>.Shared.Return(this._scratch);
+                this._scratch = grown;
+            }
+
+            this._starts.Add(this._length);
+            encoded.CopyTo(this._scratch.AsSpan(this._length));
+            this._length += encoded.Length;
+        }
+
+        /// <summary>
+        /// Sorts and de-duplicates the serials. With <paramref name="countRepeats"/> the result's
+        /// <see cref="EntryCount"/> still counts every serial added, repeats included.
+        /// </summary>
+        public RevokedSerialCollection Build(bool countRepeats = true)
+        {
+            var count = this._starts.Count;
+            if (count == 0)
+            {
+                return Empty;
+            }
+
+            var order = new int[count];
+            for (var index = 0; index < count; index++)
+            {
+                order[index] = index;
+            }
+
+            Array.Sort(order, (left, right) => Compare(this.Slice(left), this.Slice(right)));
+
+            var buffer = new byte[this._length];
+            var offsets = new int[count + 1];
+            var position = 0;
+            var written = 0;
+            for (var index = 0; index < count; index++)
+            {
+                var slice = this.Slice(order[index]);
+                if (written > 0 && Compare(slice, buffer.AsSpan(offsets[written - 1], position - offsets[written - 1])) == 0)
+                {
+                    // Duplicate serials are collapsed so Count matches the distinct entries a lookup can find;
+                    // EntryCount keeps the raw number for reporting.
+                    continue;
+                }
+
+                offsets[written] = position;
+                slice.CopyTo(buffer.AsSpan(position));
+                position += slice.Length;
+                written++;
+            }
+
+            offsets[written] = position;
+            if (written != count || position != buffer.Length)
+            {
+                Array.Resize(ref buffer, position);
+                Array.Resize(ref offsets, written + 1);
+            }
+
+            return new RevokedSerialCollection(buffer, offsets, written, countRepeats ? count : written, true);
+        }
+
+        public void Release()
+        {
+            ArrayPool<byte>.Shared.Return(this._scratch);
+            this._scratch = [];
+        }
+
+        private ReadOnlySpan<byte> Slice(int index)
+        {
+            var start = this._starts[index];
+            var end = index + 1 < this._starts.Count ? this._starts[index + 1] : this._length;
+            return this._scratch.AsSpan(start, end - start);
+        }
+    }
+}
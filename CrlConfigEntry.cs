@@ -8,4 +8,5 @@ internal sealed record CrlConfigEntry(
     string? CaCertificatePath,
     double ExpiryThreshold,
     LdapCredentials? Ldap,
-    long MaxCrlSizeBytes);
+    long MaxCrlSizeBytes,
+    Uri? DeltaUri = null);
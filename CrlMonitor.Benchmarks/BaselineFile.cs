@@ -0,0 +1,92 @@
+using System.Globalization;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using BenchmarkDotNet.Reports;
+
+#pragma warning disable CA1303 // Benchmark tooling emits English-only output; no localization planned
+
+namespace CrlMonitor.Benchmarks;
+
+/// <summary>
+/// Stores mean time and allocations per benchmark case and flags cases that regressed against a stored baseline.
+/// </summary>
+internal static class BaselineFile
+{
+    // Timing is noisier than allocation, so it gets the wider tolerance.
+    private const double MeanTolerance = 0.10;
+    private const double AllocationTolerance = 0.05;
+    private static readonly JsonSerializerOptions SerializerOptions = new() { WriteIndented = true };
+
+    public static void Save(string path, IEnumerable<Summary> summaries)
+    {
+        var directory = Path.GetDirectoryName(Path.GetFullPath(path));
+        if (!string.IsNullOrEmpty(directory))
+        {
+            _ = Directory.CreateDirectory(directory);
+        }
+
+        var document = new BaselineDocument(DateTime.UtcNow, Environment.MachineName, Collect(summaries));
+        File.WriteAllText(path, JsonSerializer.Serialize(document, SerializerOptions));
+    }
+
+    /// <summary>
+    /// Prints one line per case present in both the baseline and the results and returns the number of regressions.
+    /// </summary>
+    public static int Compare(string path, IEnumerable<Summary> summaries, TextWriter output)
+    {
+        var baseline = JsonSerializer.Deserialize<BaselineDocument>(File.ReadAllText(path), SerializerOptions)
+            ?? throw new InvalidDataException($"Baseline '{path}' is empty.");
+        var previous = baseline.Benchmarks.ToDictionary(entry => entry.Name, StringComparer.Ordinal);
+        var regressions = 0;
+        output.WriteLine(string.Create(CultureInfo.InvariantCulture, $"Comparing with baseline recorded {baseline.RecordedAtUtc:u} on {baseline.Machine}"));
+        foreach (var current in Collect(summaries))
+        {
+            if (!previous.TryGetValue(current.Name, out var before))
+            {
+                output.WriteLine($"  NEW        {current.Name}");
+                continue;
+            }
+
+            var meanChange = Change(before.MeanNanoseconds, current.MeanNanoseconds);
+            var allocationChange = Change(before.AllocatedBytes, current.AllocatedBytes);
+            var regressed = meanChange > MeanTolerance || allocationChange > AllocationTolerance;
+            if (regressed)
+            {
+                regressions++;
+            }
+
+            output.WriteLine(string.Create(
+                CultureInfo.InvariantCulture,
+                $"  {(regressed ? "REGRESSED" : "ok"),-10} {current.Name}: time {meanChange:+0.0%;-0.0%}, allocated {allocationChange:+0.0%;-0.0%}"));
+        }
+
+        return regressions;
+    }
+
+    private static List<BaselineEntry> Collect(IEnumerable<Summary> summaries)
+    {
+        return summaries
+            .SelectMany(summary => summary.Reports)
+            .Where(report => report.Success && report.ResultStatistics != null)
+            .Select(report => new BaselineEntry(
+                report.BenchmarkCase.DisplayInfo,
+                report.ResultStatistics!.Mean,
+                report.GcStats.GetBytesAllocatedPerOperation(report.BenchmarkCase) ?? 0))
+            .ToList();
+    }
+
+    private static double Change(double before, double after)
+    {
+        return before <= 0 ? (after <= 0 ? 0 : 1) : (after - before) / before;
+    }
+
+    private sealed record BaselineDocument(
+        [property: JsonPropertyName("recorded_at_utc")] DateTime RecordedAtUtc,
+        [property: JsonPropertyName("machine")] string Machine,
+        [property: JsonPropertyName("benchmarks")] IReadOnlyList<BaselineEntry> Benchmarks);
+
+    private sealed record BaselineEntry(
+        [property: JsonPropertyName("name")] string Name,
+        [property: JsonPropertyName("mean_ns")] double MeanNanoseconds,
+        [property: JsonPropertyName("allocated_bytes")] long AllocatedBytes);
+}
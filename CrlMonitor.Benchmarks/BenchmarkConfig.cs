@@ -0,0 +1,23 @@
+using BenchmarkDotNet.Columns;
+using BenchmarkDotNet.Configs;
+using BenchmarkDotNet.Diagnosers;
+using BenchmarkDotNet.Exporters;
+using BenchmarkDotNet.Exporters.Json;
+using BenchmarkDotNet.Order;
+
+namespace CrlMonitor.Benchmarks;
+
+/// <summary>
+/// Shared configuration: allocation and GC collection counts for every benchmark, P95 alongside the mean, and
+/// Markdown plus full JSON results under <c>BenchmarkDotNet.Artifacts</c>.
+/// </summary>
+internal sealed class BenchmarkConfig : ManualConfig
+{
+    public BenchmarkConfig()
+    {
+        _ = this.AddDiagnoser(MemoryDiagnoser.Default);
+        _ = this.AddColumn(StatisticColumn.P95);
+        _ = this.AddExporter(MarkdownExporter.GitHub, JsonExporter.Full);
+        _ = this.WithOrderer(new DefaultOrderer(SummaryOrderPolicy.Declared));
+    }
+}
@@ -0,0 +1,141 @@
+using BenchmarkDotNet.Attributes;
+using CrlMonitor.Crl;
+using CrlMonitor.Fetching;
+using CrlMonitor.Health;
+using CrlMonitor.Runner;
+using CrlMonitor.State;
+using CrlMonitor.Validation;
+
+namespace CrlMonitor.Benchmarks;
+
+/// <summary>
+/// Measures a full <see cref="CrlCheckRunner.RunAsync(IReadOnlyList{CrlConfigEntry}, TimeSpan, int, int, CancellationToken)"/>
+/// over in-memory CRLs, so the fetch/process pipeline and parsing dominate rather than the network.
+/// </summary>
+[ThreadingDiagnoser]
+public class CrlCheckRunnerBenchmarks
+{
+    private const int CrlCount = 100;
+    private const int EntriesPerCrl = 10_000;
+    private static readonly string[] HttpSchemes = ["http"];
+    private List<CrlConfigEntry> _entries = null!;
+    private CrlCheckRunner _runner = null!;
+
+    /// <summary>
+    /// Worker count for both the fetch and the processing stage.
+    /// </summary>
+    [Params(1, 4, 16)]
+    public int Parallelism { get; set; }
+
+    /// <summary>
+    /// Simulated download time per CRL.
+    /// </summary>
+    [Params(0, 10)]
+    public int FetchLatencyMs { get; set; }
+
+    /// <summary>
+    /// Builds one CRL served for every configured URI.
+    /// </summary>
+    [GlobalSetup]
+    public void Setup()
+    {
+        var crl = SyntheticCrls.Build(EntriesPerCrl, SyntheticKeyType.Rsa).CrlBytes;
+        this._entries = Enumerable.Range(0, CrlCount)
+            .Select(index => new CrlConfigEntry(
+                new Uri(FormattableString.Invariant($"http://bench/{index}.crl")),
+                SignatureValidationMode.None,
+                null,
+                0.8,
+                null,
+                long.MaxValue))
+            .ToList();
+        var fetcher = new InMemoryFetcher(crl, TimeSpan.FromMilliseconds(this.FetchLatencyMs));
+        this._runner = new CrlCheckRunner(
+            new FetcherResolver([new FetcherMapping(HttpSchemes, fetcher)]),
+            new CrlParser(SignatureValidationMode.None),
+            new CrlSignatureValidator(),
+            new CrlHealthEvaluator(),
+            new NullStateStore());
+    }
+
+    /// <summary>
+    /// Checks every configured CRL once.
+    /// </summary>
+    [Benchmark]
+    public async Task<int> RunAsync()
+    {
+        var run = await this._runner.RunAsync(
+            this._entries,
+            TimeSpan.FromMinutes(1),
+            this.Parallelism,
+            this.Parallelism,
+            CancellationToken.None).ConfigureAwait(false);
+        return run.Results.Count;
+    }
+
+    private sealed class InMemoryFetcher(byte[] content, TimeSpan latency) : ICrlFetcher
+    {
+        public async Task<FetchedCrl> FetchAsync(CrlConfigEntry entry, CancellationToken cancellationToken)
+        {
+            if (latency > TimeSpan.Zero)
+            {
+                await Task.Delay(latency, cancellationToken).ConfigureAwait(false);
+            }
+
+            return new FetchedCrl(content, latency, content.Length);
+        }
+    }
+
+    private sealed class NullStateStore : IStateStore
+    {
+        public Task<DateTime?> GetLastFetchAsync(Uri uri, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<DateTime?>(null);
+        }
+
+        public Task SaveLastFetchAsync(Uri uri, DateTime fetchedAtUtc, CancellationToken cancellationToken)
+        {
+            return Task.CompletedTask;
+        }
+
+        public Task<DateTime?> GetLastReportSentAsync(CancellationToken cancellationToken)
+        {
+            return Task.FromResult<DateTime?>(null);
+        }
+
+        public Task SaveLastReportSentAsync(DateTime sentAtUtc, CancellationToken cancellationToken)
+        {
+            return Task.CompletedTask;
+        }
+
+        public Task<DateTime?> GetAlertCooldownAsync(string key, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<DateTime?>(null);
+        }
+
+        public Task SaveAlertCooldownAsync(string key, DateTime triggeredAtUtc, CancellationToken cancellationToken)
+        {
+            return Task.CompletedTask;
+        }
+
+        public Task<IReadOnlyDictionary<Uri, DateTime>> GetLastFetchesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<IReadOnlyDictionary<Uri, DateTime>>(new Dictionary<Uri, DateTime>());
+        }
+
+        public Task<IReadOnlyDictionary<Uri, CrlHistory>> GetCrlHistoriesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<IReadOnlyDictionary<Uri, CrlHistory>>(new Dictionary<Uri, CrlHistory>());
+        }
+
+        public Task<IReadOnlyDictionary<string, DateTime>> GetAlertCooldownsAsync(IReadOnlyCollection<string> keys, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<IReadOnlyDictionary<string, DateTime>>(new Dictionary<string, DateTime>());
+        }
+
+        public Task SaveBatchAsync(StateBatch batch, CancellationToken cancellationToken)
+        {
+            return Task.CompletedTask;
+        }
+    }
+}
@@ -0,0 +1,49 @@
+using BenchmarkDotNet.Attributes;
+using CrlMonitor.Crl;
+
+namespace CrlMonitor.Benchmarks;
+
+/// <summary>
+/// Measures <see cref="CrlParser.Parse(ReadOnlyMemory{byte})"/> from small to very large CRLs.
+/// </summary>
+public class CrlParserBenchmarks
+{
+    private ReadOnlyMemory<byte> _crl;
+    private CrlParser _parser = null!;
+    private CrlParser _countOnlyParser = null!;
+
+    /// <summary>
+    /// Number of revoked serials in the CRL.
+    /// </summary>
+    [Params(10, 1_000, 100_000, 1_000_000)]
+    public int Entries { get; set; }
+
+    /// <summary>
+    /// Builds the CRL once per parameter set; generation is not measured.
+    /// </summary>
+    [GlobalSetup]
+    public void Setup()
+    {
+        this._crl = SyntheticCrls.Build(this.Entries, SyntheticKeyType.Rsa).CrlBytes;
+        this._parser = new CrlParser(SignatureValidationMode.CaCertificate);
+        this._countOnlyParser = new CrlParser(SignatureValidationMode.CaCertificate, countRevokedOnly: true);
+    }
+
+    /// <summary>
+    /// Parses the CRL and retains every revoked serial.
+    /// </summary>
+    [Benchmark(Baseline = true)]
+    public int Parse()
+    {
+        return this._parser.Parse(this._crl).RevokedSerialNumbers.Count;
+    }
+
+    /// <summary>
+    /// Parses the CRL in count-only mode.
+    /// </summary>
+    [Benchmark]
+    public int ParseCountOnly()
+    {
+        return this._countOnlyParser.Parse(this._crl).RevokedSerialNumbers.Count;
+    }
+}
@@ -0,0 +1,68 @@
+using BenchmarkDotNet.Attributes;
+using CrlMonitor.Crl;
+using CrlMonitor.Validation;
+using Org.BouncyCastle.X509;
+
+namespace CrlMonitor.Benchmarks;
+
+/// <summary>
+/// Measures <see cref="CrlSignatureValidator.Validate"/> for RSA and ECDSA signed CRLs. The CA certificate is cached
+/// after the first call, so this is dominated by hashing the CRL and verifying the signature.
+/// </summary>
+public class CrlSignatureValidatorBenchmarks
+{
+    private string _directory = null!;
+    private ParsedCrl _parsed = null!;
+    private X509Crl? _crl;
+    private CrlConfigEntry _entry = null!;
+    private CrlSignatureValidator _validator = null!;
+
+    /// <summary>
+    /// Signing key algorithm.
+    /// </summary>
+    [Params(SyntheticKeyType.Rsa, SyntheticKeyType.Ecdsa)]
+    public SyntheticKeyType KeyType { get; set; }
+
+    /// <summary>
+    /// Number of revoked serials in the CRL.
+    /// </summary>
+    [Params(10, 100_000)]
+    public int Entries { get; set; }
+
+    /// <summary>
+    /// Builds and parses the CRL and writes its CA certificate to a temp file.
+    /// </summary>
+    [GlobalSetup]
+    public void Setup()
+    {
+        var crl = SyntheticCrls.Build(this.Entries, this.KeyType);
+        this._directory = Directory.CreateDirectory(Path.Combine(Path.GetTempPath(), "crlmonitor-bench-" + Guid.NewGuid().ToString("N"))).FullName;
+        var caPath = Path.Combine(this._directory, "ca.cer");
+        File.WriteAllBytes(caPath, crl.CaCertificate);
+        (this._parsed, this._crl) = new CrlParser(SignatureValidationMode.CaCertificate).Decode(crl.CrlBytes);
+        this._entry = new CrlConfigEntry(new Uri("http://bench/ca.crl"), SignatureValidationMode.CaCertificate, caPath, 0.8, null, long.MaxValue);
+        this._validator = new CrlSignatureValidator(new CaCertificateCache());
+        if (this._validator.Validate(this._parsed, this._crl, this._entry).Status != "Valid")
+        {
+            throw new InvalidOperationException("Synthetic CRL failed signature validation.");
+        }
+    }
+
+    /// <summary>
+    /// Removes the temp CA certificate.
+    /// </summary>
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        Directory.Delete(this._directory, recursive: true);
+    }
+
+    /// <summary>
+    /// Verifies the CRL signature against the cached CA key.
+    /// </summary>
+    [Benchmark]
+    public string Validate()
+    {
+        return this._validator.Validate(this._parsed, this._crl, this._entry).Status;
+    }
+}
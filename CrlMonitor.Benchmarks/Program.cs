@@ -0,0 +1,44 @@
+using BenchmarkDotNet.Running;
+
+namespace CrlMonitor.Benchmarks;
+
+internal static class Program
+{
+    private const string SaveBaselineFlag = "--save-baseline";
+    private const string CompareBaselineFlag = "--compare-baseline";
+    private const string BaselinePathOption = "--baseline-path";
+    private const string DefaultBaselinePath = "baseline/benchmarks-baseline.json";
+
+    /// <summary>
+    /// Runs the benchmarks selected by the usual BenchmarkDotNet arguments (for example <c>--filter *Parser*</c>).
+    /// <c>--save-baseline</c> records the results; <c>--compare-baseline</c> checks them against the recording and
+    /// exits with 1 when any case regressed.
+    /// </summary>
+    public static int Main(string[] args)
+    {
+        var saveBaseline = args.Contains(SaveBaselineFlag, StringComparer.OrdinalIgnoreCase);
+        var compareBaseline = args.Contains(CompareBaselineFlag, StringComparer.OrdinalIgnoreCase);
+        var baselinePath = DefaultBaselinePath;
+        var benchmarkArgs = new List<string>();
+        for (var index = 0; index < args.Length; index++)
+        {
+            if (string.Equals(args[index], BaselinePathOption, StringComparison.OrdinalIgnoreCase) && index + 1 < args.Length)
+            {
+                baselinePath = args[++index];
+            }
+            else if (!string.Equals(args[index], SaveBaselineFlag, StringComparison.OrdinalIgnoreCase)
+                && !string.Equals(args[index], CompareBaselineFlag, StringComparison.OrdinalIgnoreCase))
+            {
+                benchmarkArgs.Add(args[index]);
+            }
+        }
+
+        var summaries = BenchmarkSwitcher.FromAssembly(typeof(Program).Assembly).Run([.. benchmarkArgs], new BenchmarkConfig()).ToList();
+        if (saveBaseline)
+        {
+            BaselineFile.Save(baselinePath, summaries);
+        }
+
+        return compareBaseline && BaselineFile.Compare(baselinePath, summaries, Console.Out) > 0 ? 1 : 0;
+    }
+}
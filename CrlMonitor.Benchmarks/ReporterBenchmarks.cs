@@ -0,0 +1,88 @@
+using BenchmarkDotNet.Attributes;
+using CrlMonitor.Crl;
+using CrlMonitor.Diagnostics;
+using CrlMonitor.Models;
+using CrlMonitor.Reporting;
+
+namespace CrlMonitor.Benchmarks;
+
+/// <summary>
+/// Measures the CSV, HTML and console reporters on a run with 10,000 results.
+/// </summary>
+public class ReporterBenchmarks
+{
+    private const int ResultCount = 10_000;
+    private static readonly CrlStatus[] Statuses = [CrlStatus.Ok, CrlStatus.Ok, CrlStatus.Ok, CrlStatus.Expiring, CrlStatus.Expired, CrlStatus.Error];
+    private string _directory = null!;
+    private CrlCheckRun _run = null!;
+    private TextWriter _console = null!;
+
+    /// <summary>
+    /// Builds the run from one parsed CRL and silences console output.
+    /// </summary>
+    [GlobalSetup]
+    public void Setup()
+    {
+        var parsed = new CrlParser(SignatureValidationMode.None).Parse(SyntheticCrls.Build(100, SyntheticKeyType.Rsa).CrlBytes);
+        var now = DateTime.UtcNow;
+        var results = new List<CrlCheckResult>(ResultCount);
+        for (var index = 0; index < ResultCount; index++)
+        {
+            var status = Statuses[index % Statuses.Length];
+            var failed = status == CrlStatus.Error;
+            results.Add(new CrlCheckResult(
+                new Uri(FormattableString.Invariant($"http://bench/{index}.crl")),
+                status,
+                TimeSpan.FromMilliseconds(index % 250),
+                failed ? null : parsed,
+                failed ? "Connection refused" : null,
+                now.AddHours(-1),
+                TimeSpan.FromMilliseconds(index % 200),
+                failed ? null : 4096,
+                now,
+                failed ? null : "Valid"));
+        }
+
+        this._run = new CrlCheckRun(results, new RunDiagnostics(), now);
+        this._directory = Directory.CreateDirectory(Path.Combine(Path.GetTempPath(), "crlmonitor-bench-" + Guid.NewGuid().ToString("N"))).FullName;
+        this._console = Console.Out;
+        Console.SetOut(TextWriter.Null);
+    }
+
+    /// <summary>
+    /// Restores the console and removes generated reports.
+    /// </summary>
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        Console.SetOut(this._console);
+        Directory.Delete(this._directory, recursive: true);
+    }
+
+    /// <summary>
+    /// Writes the CSV report.
+    /// </summary>
+    [Benchmark]
+    public Task CsvReport()
+    {
+        return new CsvReporter(Path.Combine(this._directory, "report.csv"), new ReportingStatus()).ReportAsync(this._run, CancellationToken.None);
+    }
+
+    /// <summary>
+    /// Writes the HTML report.
+    /// </summary>
+    [Benchmark]
+    public Task HtmlReport()
+    {
+        return new HtmlReporter(Path.Combine(this._directory, "report.html"), new ReportingStatus()).ReportAsync(this._run, CancellationToken.None);
+    }
+
+    /// <summary>
+    /// Renders the verbose console report to a null writer.
+    /// </summary>
+    [Benchmark]
+    public Task ConsoleReport()
+    {
+        return new ConsoleReporter(new ReportingStatus(), verbose: true).ReportAsync(this._run, CancellationToken.None);
+    }
+}
@@ -0,0 +1,95 @@
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Engines;
+using CrlMonitor.Fetching;
+using CrlMonitor.State;
+
+namespace CrlMonitor.Benchmarks;
+
+/// <summary>
+/// Measures the work a run does before its first fetch: loading the configuration, reading the state file and
+/// building the HTTP client. Every launch is a fresh process that runs the case once, so the figures include JIT and
+/// first-use costs, which is what a cron-style invocation pays.
+/// </summary>
+[SimpleJob(RunStrategy.ColdStart, launchCount: 10, warmupCount: 0, iterationCount: 1)]
+public class StartupBenchmarks
+{
+    private const int CrlCount = 50;
+    private static readonly HttpClientOptions HttpOptions = new(4, 0, 4, TimeSpan.FromMinutes(5), TimeSpan.FromSeconds(90), true, true);
+    private string _directory = null!;
+    private string _configPath = null!;
+    private string _statePath = null!;
+    private List<Uri> _uris = null!;
+
+    /// <summary>
+    /// Writes a configuration with <see cref="CrlCount"/> CRLs and a state file that has a fetch time for each.
+    /// </summary>
+    [GlobalSetup]
+    public void Setup()
+    {
+        this._directory = Directory.CreateDirectory(Path.Combine(Path.GetTempPath(), "crlmonitor-bench-" + Guid.NewGuid().ToString("N"))).FullName;
+        this._uris = Enumerable.Range(0, CrlCount)
+            .Select(index => new Uri(FormattableString.Invariant($"http://bench/{index}.crl")))
+            .ToList();
+        var uris = string.Join(",\n", this._uris.Select(uri => FormattableString.Invariant($"    {{ \"uri\": \"{uri}\" }}")));
+        this._configPath = Path.Combine(this._directory, "config.json");
+        File.WriteAllText(this._configPath, FormattableString.Invariant($$"""
+            {
+              "csv_output_path": "report.csv",
+              "fetch_timeout_seconds": 30,
+              "max_parallel_fetches": 4,
+              "state_file_path": "state.json",
+              "uris": [
+            {{uris}}
+              ]
+            }
+            """));
+
+        this._statePath = Path.Combine(this._directory, "state.json");
+        using var store = new FileStateStore(this._statePath);
+        var batch = new StateBatch(store);
+        foreach (var uri in this._uris)
+        {
+            batch.SetLastFetch(uri, DateTime.UtcNow);
+        }
+
+        batch.CommitAsync(CancellationToken.None).GetAwaiter().GetResult();
+    }
+
+    /// <summary>
+    /// Removes the generated files.
+    /// </summary>
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        Directory.Delete(this._directory, recursive: true);
+    }
+
+    /// <summary>
+    /// Parses and validates the configuration file.
+    /// </summary>
+    [Benchmark]
+    public int LoadConfig()
+    {
+        return ConfigLoader.Load(this._configPath).Crls.Count;
+    }
+
+    /// <summary>
+    /// Opens the state file and reads the previous fetch time of every CRL.
+    /// </summary>
+    [Benchmark]
+    public async Task<int> ReadState()
+    {
+        using var store = new FileStateStore(this._statePath);
+        var fetches = await store.GetLastFetchesAsync(this._uris, CancellationToken.None).ConfigureAwait(false);
+        return fetches.Count;
+    }
+
+    /// <summary>
+    /// Builds the CRL download client with the system proxy.
+    /// </summary>
+    [Benchmark]
+    public void CreateHttpClient()
+    {
+        using var client = CrlHttpClientFactory.Create(HttpOptions, useSystemProxy: true);
+    }
+}
@@ -0,0 +1,87 @@
+using Org.BouncyCastle.Asn1.Sec;
+using Org.BouncyCastle.Asn1.X509;
+using Org.BouncyCastle.Crypto;
+using Org.BouncyCastle.Crypto.Generators;
+using Org.BouncyCastle.Crypto.Operators;
+using Org.BouncyCastle.Crypto.Parameters;
+using Org.BouncyCastle.Math;
+using Org.BouncyCastle.Security;
+using Org.BouncyCastle.X509;
+
+namespace CrlMonitor.Benchmarks;
+
+/// <summary>
+/// Signing key algorithm for synthetic CRLs.
+/// </summary>
+public enum SyntheticKeyType
+{
+    /// <summary>RSA 2048 with SHA-256.</summary>
+    Rsa,
+
+    /// <summary>ECDSA P-256 with SHA-256.</summary>
+    Ecdsa
+}
+
+/// <summary>
+/// Builds signed CRLs of a given size, in the same way as the test suite's <c>CrlTestBuilder</c>.
+/// </summary>
+internal static class SyntheticCrls
+{
+    private static readonly DateTime IssuedAt = new(2026, 1, 1, 0, 0, 0, DateTimeKind.Utc);
+
+    /// <summary>
+    /// Builds a CRL with <paramref name="entries"/> revoked serials. Serials are 12-13 bytes, like those of common
+    /// public CAs, and deterministic so repeated runs hash and sort the same data.
+    /// </summary>
+    public static SyntheticCrl Build(int entries, SyntheticKeyType keyType)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegative(entries);
+        var key = GenerateKeyPair(keyType);
+        var algorithm = keyType == SyntheticKeyType.Rsa ? "SHA256WITHRSA" : "SHA256WITHECDSA";
+        var subject = new X509Name(keyType == SyntheticKeyType.Rsa ? "CN=Benchmark RSA CA" : "CN=Benchmark ECDSA CA");
+
+        var certificateGenerator = new X509V3CertificateGenerator();
+        certificateGenerator.SetSerialNumber(BigInteger.One);
+        certificateGenerator.SetIssuerDN(subject);
+        certificateGenerator.SetSubjectDN(subject);
+        certificateGenerator.SetNotBefore(IssuedAt.AddYears(-1));
+        certificateGenerator.SetNotAfter(IssuedAt.AddYears(10));
+        certificateGenerator.SetPublicKey(key.Public);
+        certificateGenerator.AddExtension(X509Extensions.BasicConstraints, true, new BasicConstraints(true));
+        var certificate = certificateGenerator.Generate(new Asn1SignatureFactory(algorithm, key.Private));
+
+        var crlGenerator = new X509V2CrlGenerator();
+        crlGenerator.SetIssuerDN(subject);
+        crlGenerator.SetThisUpdate(IssuedAt);
+        crlGenerator.SetNextUpdate(IssuedAt.AddDays(7));
+        crlGenerator.AddExtension(X509Extensions.CrlNumber, false, new CrlNumber(BigInteger.ValueOf(entries)));
+        var serialBase = BigInteger.ValueOf(0x5DEECE66DL).ShiftLeft(48);
+        for (var index = 0; index < entries; index++)
+        {
+            var serial = serialBase.Add(BigInteger.ValueOf(index * 7919L));
+            crlGenerator.AddCrlEntry(serial, IssuedAt.AddSeconds(-index), CrlReason.KeyCompromise);
+        }
+
+        var crl = crlGenerator.Generate(new Asn1SignatureFactory(algorithm, key.Private));
+        return new SyntheticCrl(crl.GetEncoded(), certificate.GetEncoded());
+    }
+
+    private static AsymmetricCipherKeyPair GenerateKeyPair(SyntheticKeyType keyType)
+    {
+        if (keyType == SyntheticKeyType.Rsa)
+        {
+            var rsa = new RsaKeyPairGenerator();
+            rsa.Init(new RsaKeyGenerationParameters(BigInteger.ValueOf(0x10001), new SecureRandom(), 2048, 12));
+            return rsa.GenerateKeyPair();
+        }
+
+        var ec = new ECKeyPairGenerator("EC");
+        ec.Init(new ECKeyGenerationParameters(SecObjectIdentifiers.SecP256r1, new SecureRandom()));
+        return ec.GenerateKeyPair();
+    }
+}
+
+/// <summary>
+/// DER-encoded CRL and the certificate of the key that signed it.
+/// </summary>
+internal sealed record SyntheticCrl(byte[] CrlBytes, byte[] CaCertificate);
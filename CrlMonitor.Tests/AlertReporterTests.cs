@@ -1,3 +1,4 @@
+using CrlMonitor.Crl;
 using CrlMonitor.Models;
 using CrlMonitor.Notifications;
 using CrlMonitor.Notifications.Alerts;
@@ -31,7 +32,9 @@ public static class AlertReporterTests
         Assert.Contains("http://expiring", client.LastMessage.Body, StringComparison.Ordinal);
         Assert.Contains("http://failed", client.LastMessage.Body, StringComparison.Ordinal);
         Assert.Contains("View full report: https://example.com/crl/report.html", client.LastMessage.Body, StringComparison.Ordinal);
-        Assert.NotEmpty(state.SavedKeys);
+        Assert.Equal(3, state.SavedKeys.Count);
+        Assert.Equal(1, state.Reads);
+        Assert.Equal(1, state.Writes);
     }
 
     /// <summary>
@@ -55,6 +58,33 @@ public static class AlertReporterTests
         Assert.False(client.WasSent);
     }
 
+    /// <summary>
+    /// Ensures a jump in new revocations above the threshold raises an alert even when the status is OK.
+    /// </summary>
+    [Fact]
+    public static async Task SendsAlertWhenNewRevocationsExceedThreshold()
+    {
+        var options = BuildOptions(CrlStatus.Expired) with { NewRevocationsThreshold = 2 };
+        var state = new RecordingAlertStateStore();
+        var client = new RecordingEmailClient();
+        var reporter = new AlertReporter(options, client, state, null);
+        var now = DateTime.UtcNow;
+        var spike = new RevocationDiff(RevokedSerialCollection.FromHex(["01", "02", "03"]), RevokedSerialCollection.Empty);
+        var quiet = new RevocationDiff(RevokedSerialCollection.FromHex(["04"]), RevokedSerialCollection.Empty);
+        var results = new List<CrlCheckResult>
+        {
+            new(new Uri("http://spike"), CrlStatus.Ok, TimeSpan.Zero, null, null, null, null, null, now, "Valid", RevocationChanges: spike),
+            new(new Uri("http://quiet"), CrlStatus.Ok, TimeSpan.Zero, null, null, null, null, null, now, "Valid", RevocationChanges: quiet)
+        };
+
+        await reporter.ReportAsync(new CrlCheckRun(results, new Diagnostics.RunDiagnostics(), now), CancellationToken.None).ConfigureAwait(true);
+
+        Assert.True(client.WasSent);
+        Assert.Contains("New revocations: 3 (removed: 0)", client.LastMessage!.Body, StringComparison.Ordinal);
+        Assert.DoesNotContain("http://quiet", client.LastMessage.Body, StringComparison.Ordinal);
+        Assert.Contains("NEW_REVOCATIONS|http://spike/", state.SavedKeys);
+    }
+
     private static AlertOptions BuildOptions(params CrlStatus[] statuses)
     {
         return new AlertOptions(
@@ -83,6 +113,8 @@ public static class AlertReporterTests
     {
         public HashSet<string> SavedKeys { get; } = new(StringComparer.OrdinalIgnoreCase);
         public Dictionary<string, DateTime> Cooldowns { get; set; } = new(StringComparer.OrdinalIgnoreCase);
+        public int Reads { get; private set; }
+        public int Writes { get; private set; }
 
         public Task<DateTime?> GetLastFetchAsync(Uri uri, CancellationToken cancellationToken)
         {
@@ -117,6 +149,43 @@ public static class AlertReporterTests
             _ = this.SavedKeys.Add(key);
             return Task.CompletedTask;
         }
+
+        public Task<IReadOnlyDictionary<Uri, DateTime>> GetLastFetchesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<IReadOnlyDictionary<Uri, DateTime>>(new Dictionary<Uri, DateTime>());
+        }
+
+        public Task<IReadOnlyDictionary<Uri, CrlHistory>> GetCrlHistoriesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<IReadOnlyDictionary<Uri, CrlHistory>>(new Dictionary<Uri, CrlHistory>());
+        }
+
+        public Task<IReadOnlyDictionary<string, DateTime>> GetAlertCooldownsAsync(IReadOnlyCollection<string> keys, CancellationToken cancellationToken)
+        {
+            this.Reads++;
+            var found = new Dictionary<string, DateTime>(StringComparer.OrdinalIgnoreCase);
+            foreach (var key in keys)
+            {
+                if (this.Cooldowns.TryGetValue(key, out var timestamp))
+                {
+                    found[key] = timestamp;
+                }
+            }
+
+            return Task.FromResult<IReadOnlyDictionary<string, DateTime>>(found);
+        }
+
+        public Task SaveBatchAsync(StateBatch batch, CancellationToken cancellationToken)
+        {
+            this.Writes++;
+            foreach (var (key, triggeredAtUtc) in batch.AlertCooldowns)
+            {
+                this.Cooldowns[key] = triggeredAtUtc;
+                _ = this.SavedKeys.Add(key);
+            }
+
+            return Task.CompletedTask;
+        }
     }
 
     private sealed class RecordingEmailClient : IEmailClient
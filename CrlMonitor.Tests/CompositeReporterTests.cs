@@ -0,0 +1,95 @@
+using System.Collections.Concurrent;
+using CrlMonitor.Diagnostics;
+using CrlMonitor.Models;
+using CrlMonitor.Reporting;
+
+namespace CrlMonitor.Tests;
+
+/// <summary>
+/// Validates how the composite reporter schedules and isolates reporters.
+/// </summary>
+public static class CompositeReporterTests
+{
+    private static readonly string[] ExpectedOrder = ["fast", "slow", "final"];
+    private static readonly string[] ExpectedFinalOrder = ["html", "email", "console"];
+
+    /// <summary>
+    /// Ensures reporters run concurrently and final reporters only start once the others have finished.
+    /// </summary>
+    [Fact]
+    public static async Task ReportAsyncRunsReportersConcurrentlyBeforeFinalReporters()
+    {
+        var finished = new ConcurrentQueue<string>();
+        using var slowStarted = new SemaphoreSlim(0);
+        var slow = new RecordingReporter("slow", finished, async () =>
+        {
+            _ = slowStarted.Release();
+            await Task.Delay(200).ConfigureAwait(false);
+        });
+        var fast = new RecordingReporter("fast", finished, async () =>
+        {
+            // Only completes if the slow reporter is already running alongside it.
+            Assert.True(await slowStarted.WaitAsync(TimeSpan.FromSeconds(5)).ConfigureAwait(false));
+        });
+        var final = new RecordingReporter("final", finished, () => Task.CompletedTask);
+        using var composite = new CompositeReporter([slow, fast], [final]);
+
+        await composite.ReportAsync(BuildRun(), CancellationToken.None).ConfigureAwait(true);
+
+        Assert.Equal(ExpectedOrder, finished);
+    }
+
+    /// <summary>
+    /// Ensures final reporters run one after another in order, so the report email only goes out once the HTML
+    /// report is written.
+    /// </summary>
+    [Fact]
+    public static async Task ReportAsyncRunsFinalReportersInOrder()
+    {
+        var finished = new ConcurrentQueue<string>();
+        var html = new RecordingReporter("html", finished, () => Task.Delay(100));
+        var email = new RecordingReporter("email", finished, () => Task.Delay(100));
+        var console = new RecordingReporter("console", finished, () => Task.CompletedTask);
+        using var composite = new CompositeReporter([html], [email, console]);
+
+        await composite.ReportAsync(BuildRun(), CancellationToken.None).ConfigureAwait(true);
+
+        Assert.Equal(ExpectedFinalOrder, finished);
+    }
+
+    /// <summary>
+    /// Ensures a failing reporter does not stop the others and its failure is raised at the end.
+    /// </summary>
+    [Fact]
+    public static async Task ReportAsyncIsolatesFailingReporter()
+    {
+        var finished = new ConcurrentQueue<string>();
+        var failing = new RecordingReporter("failing", finished, () => throw new IOException("SMTP unavailable"));
+        var healthy = new RecordingReporter("healthy", finished, () => Task.CompletedTask);
+        var final = new RecordingReporter("final", finished, () => Task.CompletedTask);
+        using var composite = new CompositeReporter([failing, healthy], [final]);
+
+        var ex = await Assert.ThrowsAsync<InvalidOperationException>(() => composite.ReportAsync(BuildRun(), CancellationToken.None)).ConfigureAwait(true);
+
+        Assert.Contains("SMTP unavailable", ex.Message, StringComparison.Ordinal);
+        Assert.Contains("healthy", finished);
+        Assert.Contains("final", finished);
+        Assert.DoesNotContain("failing", finished);
+    }
+
+    private static CrlCheckRun BuildRun()
+    {
+        var now = DateTime.UtcNow;
+        var result = new CrlCheckResult(new Uri("http://example.com/ca.crl"), CrlStatus.Ok, TimeSpan.Zero, null, null, null, null, null, now, "Valid");
+        return new CrlCheckRun([result], new RunDiagnostics(), now);
+    }
+
+    private sealed class RecordingReporter(string name, ConcurrentQueue<string> finished, Func<Task> work) : IReporter
+    {
+        public async Task ReportAsync(CrlCheckRun run, CancellationToken cancellationToken)
+        {
+            await work().ConfigureAwait(false);
+            finished.Enqueue(name);
+        }
+    }
+}
@@ -1,6 +1,8 @@
+using System.Text;
 using System.Text.Json;
 using CrlMonitor.Crl;
 using CrlMonitor.Models;
+using CrlMonitor.Notifications;
 
 namespace CrlMonitor.Tests;
 
@@ -9,6 +11,12 @@ namespace CrlMonitor.Tests;
 /// </summary>
 public static class ConfigLoaderTests
 {
+    private static readonly string[] IncludedUriOrder = [
+        "http://example.com/inline.crl",
+        "http://example.com/a1.crl",
+        "http://example.com/a2.crl",
+        "http://example.com/b.crl"
+    ];
     private static readonly JsonSerializerOptions JsonOptions = new() {
         WriteIndented = true
     };
@@ -61,6 +69,7 @@ public static class ConfigLoaderTests
         Assert.True(options.HtmlReportEnabled);
         Assert.Equal(Path.Combine(temp.Path, "reports", "latest.html"), options.HtmlReportPath);
         Assert.Null(options.HtmlReportUrl);
+        Assert.False(options.HtmlReportDataFile);
         Assert.Equal(TimeSpan.FromSeconds(45), options.FetchTimeout);
         Assert.Equal(3, options.MaxParallelFetches);
         Assert.Equal(Path.Combine(temp.Path, "state", "state.json"), options.StateFilePath);
@@ -256,6 +265,116 @@ public static class ConfigLoaderTests
         Assert.Contains("fetch_timeout_seconds", ex.Message, StringComparison.OrdinalIgnoreCase);
     }
 
+    /// <summary>
+    /// Ensures the run deadline must stay within the allowed range.
+    /// </summary>
+    [Fact]
+    public static void LoadThrowsWhenRunDeadlineOutOfRange()
+    {
+        using var temp = new TempFolder();
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "console_reports": true,
+          "csv_reports": true,
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "run_deadline_seconds": 0,
+          "state_file_path": "state.json",
+          "uris": [
+            { "uri": "http://example.com/root.crl" }
+          ]
+        }
+        """);
+
+        var ex = Assert.Throws<InvalidOperationException>(() => ConfigLoader.Load(configPath));
+        Assert.Contains("run_deadline_seconds", ex.Message, StringComparison.OrdinalIgnoreCase);
+    }
+
+    /// <summary>
+    /// Ensures the retry delays must be ordered and within range.
+    /// </summary>
+    [Fact]
+    public static void LoadThrowsWhenRetryMaxDelayBelowBaseDelay()
+    {
+        using var temp = new TempFolder();
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "console_reports": true,
+          "csv_reports": true,
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "resilience": {
+            "retry_base_delay_ms": 1000,
+            "retry_max_delay_ms": 500
+          },
+          "uris": [
+            { "uri": "http://example.com/root.crl" }
+          ]
+        }
+        """);
+
+        var ex = Assert.Throws<InvalidOperationException>(() => ConfigLoader.Load(configPath));
+        Assert.Contains("resilience.retry_max_delay_ms", ex.Message, StringComparison.Ordinal);
+    }
+
+    /// <summary>
+    /// Ensures the revocation index cannot be combined with count-only parsing, which keeps no serials to index.
+    /// </summary>
+    [Fact]
+    public static void LoadThrowsWhenRevocationIndexUsedWithCountOnly()
+    {
+        using var temp = new TempFolder();
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "console_reports": true,
+          "csv_reports": true,
+          "csv_output_path": "report.csv",
+          "csv_append_timestamp": false,
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "count_revoked_only": true,
+          "revocation_index_path": "revocations.idx",
+          "uris": [
+            { "uri": "http://example.com/root.crl" }
+          ]
+        }
+        """);
+
+        var ex = Assert.Throws<InvalidOperationException>(() => ConfigLoader.Load(configPath));
+        Assert.Contains("revocation_index_path", ex.Message, StringComparison.OrdinalIgnoreCase);
+    }
+
+    /// <summary>
+    /// Ensures NDJSON cannot go to standard output while the console report is also drawing there.
+    /// </summary>
+    [Fact]
+    public static void LoadThrowsWhenNdjsonStdoutUsedWithConsoleReports()
+    {
+        using var temp = new TempFolder();
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "console_reports": true,
+          "csv_reports": true,
+          "csv_output_path": "report.csv",
+          "csv_append_timestamp": false,
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "ndjson_output_path": "-",
+          "uris": [
+            { "uri": "http://example.com/root.crl" }
+          ]
+        }
+        """);
+
+        var ex = Assert.Throws<InvalidOperationException>(() => ConfigLoader.Load(configPath));
+        Assert.Contains("ndjson_output_path", ex.Message, StringComparison.OrdinalIgnoreCase);
+    }
+
     /// <summary>
     /// Ensures relative file URIs resolve against config directory.
     /// </summary>
@@ -317,6 +436,39 @@ public static class ConfigLoaderTests
         Assert.Contains("ca_certificate_path", ex.Message, StringComparison.OrdinalIgnoreCase);
     }
 
+    /// <summary>
+    /// Ensures entries without a CA certificate fall back to the configured CA bundle.
+    /// </summary>
+    [Fact]
+    public static void LoadUsesCaBundleWhenCaCertMissing()
+    {
+        using var temp = new TempFolder();
+        var bundlePath = temp.WriteFile("bundle.pem", "dummy");
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "console_reports": true,
+          "csv_reports": true,
+          "csv_output_path": "report.csv",
+          "csv_append_timestamp": false,
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "ca_bundle_path": "bundle.pem",
+          "uris": [
+            {
+              "uri": "http://example.com/root.crl",
+              "signature_validation_mode": "ca-cert"
+            }
+          ]
+        }
+        """);
+
+        var options = ConfigLoader.Load(configPath);
+
+        Assert.Equal(Path.GetFullPath(bundlePath), options.CaBundlePath);
+        Assert.Equal(options.CaBundlePath, options.Crls[0].CaCertificatePath);
+    }
+
     /// <summary>
     /// Ensures report and alert sections are parsed.
     /// </summary>
@@ -505,6 +657,7 @@ public static class ConfigLoaderTests
           "html_report_enabled": true,
           "html_report_path": "reports/report.html",
           "html_report_url": "https://example.com/report.html",
+          "html_report_data_file": true,
           "smtp": {
             "host": "smtp.example.com",
             "port": 25,
@@ -528,6 +681,7 @@ public static class ConfigLoaderTests
         Assert.True(options.HtmlReportEnabled);
         Assert.Equal(Path.Combine(temp.Path, "reports", "report.html"), options.HtmlReportPath);
         Assert.Equal("https://example.com/report.html", options.HtmlReportUrl);
+        Assert.True(options.HtmlReportDataFile);
     }
 
     /// <summary>
@@ -731,6 +885,87 @@ public static class ConfigLoaderTests
         var options = ConfigLoader.Load(configPath);
         Assert.NotNull(options.Reports);
         Assert.Null(options.Reports.FrequencyHours);
+        Assert.Equal(CsvAttachmentCompression.None, options.Reports.CsvCompression);
+        Assert.Equal(256L * 1024, options.Reports.CsvCompressionThresholdBytes);
+    }
+
+    /// <summary>
+    /// Ensures CSV attachment compression settings are parsed.
+    /// </summary>
+    [Fact]
+    public static void LoadParsesCsvCompression()
+    {
+        using var temp = new TempFolder();
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "console_reports": true,
+          "csv_reports": true,
+          "csv_output_path": "report.csv",
+          "csv_append_timestamp": false,
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "smtp": {
+            "host": "smtp.example.com",
+            "port": 25,
+            "username": "svc",
+            "password": "pw",
+            "from": "svc@example.com"
+          },
+          "reports": {
+            "enabled": true,
+            "csv_compression": "Zip",
+            "csv_compression_threshold_bytes": 1024,
+            "recipients": ["ops@example.com"]
+          },
+          "uris": [
+            { "uri": "http://example.com/root.crl" }
+          ]
+        }
+        """);
+
+        var options = ConfigLoader.Load(configPath);
+        Assert.NotNull(options.Reports);
+        Assert.Equal(CsvAttachmentCompression.Zip, options.Reports.CsvCompression);
+        Assert.Equal(1024L, options.Reports.CsvCompressionThresholdBytes);
+    }
+
+    /// <summary>
+    /// Ensures unknown CSV compression formats are rejected.
+    /// </summary>
+    [Fact]
+    public static void LoadThrowsWhenCsvCompressionUnknown()
+    {
+        using var temp = new TempFolder();
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "console_reports": true,
+          "csv_reports": true,
+          "csv_output_path": "report.csv",
+          "csv_append_timestamp": false,
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "smtp": {
+            "host": "smtp.example.com",
+            "port": 25,
+            "username": "svc",
+            "password": "pw",
+            "from": "svc@example.com"
+          },
+          "reports": {
+            "enabled": true,
+            "csv_compression": "bzip2",
+            "recipients": ["ops@example.com"]
+          },
+          "uris": [
+            { "uri": "http://example.com/root.crl" }
+          ]
+        }
+        """);
+
+        var ex = Assert.Throws<InvalidOperationException>(() => ConfigLoader.Load(configPath));
+        Assert.Contains("reports.csv_compression 'bzip2' is not supported", ex.Message, StringComparison.Ordinal);
     }
 
     /// <summary>
@@ -760,6 +995,164 @@ public static class ConfigLoaderTests
         Assert.Contains("duplicate", ex.Message, StringComparison.OrdinalIgnoreCase);
     }
 
+    /// <summary>
+    /// Ensures include files are expanded in order and their group defaults apply unless an entry overrides them.
+    /// </summary>
+    [Fact]
+    public static void LoadAppliesIncludedGroupDefaults()
+    {
+        using var temp = new TempFolder();
+        var caPath = temp.WriteFile("groups/issuing-ca.pem", "dummy");
+        _ = temp.WriteJson("groups/b.json", /*lang=json,strict*/ """
+        {
+          "uris": [ { "uri": "http://example.com/b.crl" } ]
+        }
+        """);
+        _ = temp.WriteJson("groups/a.json", /*lang=json,strict*/ """
+        {
+          "defaults": {
+            "signature_validation_mode": "ca-cert",
+            "ca_certificate_path": "issuing-ca.pem",
+            "expiry_threshold": 0.5,
+            "max_crl_size_bytes": 1024
+          },
+          "uris": [
+            { "uri": "http://example.com/a1.crl" },
+            { "uri": "http://example.com/a2.crl", "signature_validation_mode": "none", "expiry_threshold": 0.9 }
+          ]
+        }
+        """);
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "uris": [ { "uri": "http://example.com/inline.crl" } ],
+          "include": [ "groups/*.json" ]
+        }
+        """);
+
+        var crls = ConfigLoader.Load(configPath).Crls;
+
+        Assert.Equal(IncludedUriOrder, crls.Select(entry => entry.Uri.ToString()));
+        Assert.Equal(SignatureValidationMode.CaCertificate, crls[1].SignatureValidationMode);
+        Assert.Equal(Path.GetFullPath(caPath), crls[1].CaCertificatePath);
+        Assert.Equal(0.5, crls[1].ExpiryThreshold);
+        Assert.Equal(1024, crls[1].MaxCrlSizeBytes);
+        Assert.Equal(SignatureValidationMode.None, crls[2].SignatureValidationMode);
+        Assert.Equal(0.9, crls[2].ExpiryThreshold);
+        Assert.Equal(1024, crls[2].MaxCrlSizeBytes);
+        Assert.Equal(0.8, crls[3].ExpiryThreshold);
+    }
+
+    /// <summary>
+    /// Ensures directory sources become file entries and duplicates are detected across sources.
+    /// </summary>
+    [Fact]
+    public static void LoadExpandsDirectorySources()
+    {
+        using var temp = new TempFolder();
+        var first = temp.WriteBinary("crls/a.crl", [0]);
+        var second = temp.WriteBinary("crls/nested/b.CRL", [0]);
+        _ = temp.WriteFile("crls/readme.txt", "ignored");
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "crl_groups": [
+            { "directories": [ { "path": "crls", "recursive": true } ] }
+          ]
+        }
+        """);
+        var duplicatePath = temp.WriteJson("duplicate.json", $$"""
+        {
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "uris": [ { "uri": "{{new Uri(first).AbsoluteUri}}" } ],
+          "crl_groups": [
+            { "directories": [ { "path": "crls" } ] }
+          ]
+        }
+        """);
+
+        var crls = ConfigLoader.Load(configPath).Crls;
+
+        Assert.Equal(2, crls.Count);
+        Assert.Equal(new Uri(first), crls[0].Uri);
+        Assert.Equal(new Uri(second), crls[1].Uri);
+        var ex = Assert.Throws<InvalidOperationException>(() => ConfigLoader.Load(duplicatePath));
+        Assert.Contains("duplicate", ex.Message, StringComparison.OrdinalIgnoreCase);
+    }
+
+    /// <summary>
+    /// Ensures delta URIs are parsed and validated against the base URI.
+    /// </summary>
+    [Fact]
+    public static void LoadParsesDeltaUri()
+    {
+        using var temp = new TempFolder();
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "uris": [
+            { "uri": "http://example.com/root.crl", "delta_uri": "http://example.com/root-delta.crl" },
+            { "uri": "http://example.com/other.crl" }
+          ]
+        }
+        """);
+        var invalidPath = temp.WriteJson("invalid.json", /*lang=json,strict*/ """
+        {
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "uris": [
+            { "uri": "http://example.com/root.crl", "delta_uri": "ldap://dc1.example.com/CN=Delta" }
+          ]
+        }
+        """);
+
+        var options = ConfigLoader.Load(configPath);
+
+        Assert.Equal(new Uri("http://example.com/root-delta.crl"), options.Crls[0].DeltaUri);
+        Assert.Null(options.Crls[1].DeltaUri);
+        var ex = Assert.Throws<InvalidOperationException>(() => ConfigLoader.Load(invalidPath));
+        Assert.Contains("delta_uri", ex.Message, StringComparison.Ordinal);
+    }
+
+    /// <summary>
+    /// Ensures an LDAP delta URI without an attribute list reads deltaRevocationList, which also allows the delta to
+    /// live on the base CRL's own entry.
+    /// </summary>
+    [Fact]
+    public static void LoadReadsLdapDeltaFromSameEntry()
+    {
+        using var temp = new TempFolder();
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "uris": [
+            { "uri": "ldap://dc1.example.com/CN=Root,O=Corp", "delta_uri": "ldap://dc1.example.com/CN=Root,O=Corp" }
+          ]
+        }
+        """);
+
+        var options = ConfigLoader.Load(configPath);
+
+        Assert.Equal(new Uri("ldap://dc1.example.com/CN=Root,O=Corp?deltaRevocationList;binary"), options.Crls[0].DeltaUri);
+    }
+
     /// <summary>
     /// Ensures LDAP credentials are disallowed for non-LDAP URIs.
     /// </summary>
@@ -978,6 +1371,186 @@ public static class ConfigLoaderTests
         }
     }
 
+    /// <summary>
+    /// Ensures service scheduling settings fall back to defaults and honour overrides.
+    /// </summary>
+    [Fact]
+    public static void LoadParsesServiceOptions()
+    {
+        using var temp = new TempFolder();
+        var defaultsPath = temp.WriteJson("defaults.json", /*lang=json,strict*/ """
+        {
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "uris": [
+            { "uri": "http://example.com/root.crl" }
+          ]
+        }
+        """);
+        var overridePath = temp.WriteJson("override.json", /*lang=json,strict*/ """
+        {
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "service": {
+            "min_check_interval_minutes": 2,
+            "max_check_interval_minutes": 120,
+            "report_interval_minutes": 15
+          },
+          "uris": [
+            { "uri": "http://example.com/root.crl" }
+          ]
+        }
+        """);
+
+        var defaults = ConfigLoader.Load(defaultsPath).Service;
+        var overridden = ConfigLoader.Load(overridePath).Service;
+
+        Assert.Equal(TimeSpan.FromMinutes(5), defaults.MinCheckInterval);
+        Assert.Equal(TimeSpan.FromHours(6), defaults.MaxCheckInterval);
+        Assert.Equal(TimeSpan.FromHours(1), defaults.ReportInterval);
+        Assert.Equal(TimeSpan.FromMinutes(2), overridden.MinCheckInterval);
+        Assert.Equal(TimeSpan.FromHours(2), overridden.MaxCheckInterval);
+        Assert.Equal(TimeSpan.FromMinutes(15), overridden.ReportInterval);
+    }
+
+    /// <summary>
+    /// Ensures the maximum check interval cannot be below the minimum.
+    /// </summary>
+    [Fact]
+    public static void LoadThrowsWhenServiceIntervalsInverted()
+    {
+        using var temp = new TempFolder();
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "service": {
+            "min_check_interval_minutes": 30,
+            "max_check_interval_minutes": 10
+          },
+          "uris": [
+            { "uri": "http://example.com/root.crl" }
+          ]
+        }
+        """);
+
+        var ex = Assert.Throws<InvalidOperationException>(() => ConfigLoader.Load(configPath));
+        Assert.Contains("max_check_interval_minutes", ex.Message, StringComparison.Ordinal);
+    }
+
+    /// <summary>
+    /// Ensures HTTP connection and throttling settings fall back to defaults and honour overrides.
+    /// </summary>
+    [Fact]
+    public static void LoadParsesHttpOptions()
+    {
+        using var temp = new TempFolder();
+        var defaultsPath = temp.WriteJson("defaults.json", /*lang=json,strict*/ """
+        {
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "uris": [
+            { "uri": "http://example.com/root.crl" }
+          ]
+        }
+        """);
+        var overridePath = temp.WriteJson("override.json", /*lang=json,strict*/ """
+        {
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "http": {
+            "max_requests_per_host": 2,
+            "requests_per_second_per_host": 0.5,
+            "burst_per_host": 1,
+            "connection_lifetime_minutes": 10,
+            "connection_idle_timeout_seconds": 30,
+            "enable_http2": false,
+            "automatic_decompression": false
+          },
+          "uris": [
+            { "uri": "http://example.com/root.crl" }
+          ]
+        }
+        """);
+
+        var defaults = ConfigLoader.Load(defaultsPath).Http;
+        var overridden = ConfigLoader.Load(overridePath).Http;
+
+        Assert.Equal(4, defaults.MaxRequestsPerHost);
+        Assert.Equal(0, defaults.RequestsPerSecondPerHost);
+        Assert.Equal(TimeSpan.FromMinutes(5), defaults.ConnectionLifetime);
+        Assert.True(defaults.EnableHttp2);
+        Assert.Equal(2, overridden.MaxRequestsPerHost);
+        Assert.Equal(0.5, overridden.RequestsPerSecondPerHost);
+        Assert.Equal(1, overridden.BurstPerHost);
+        Assert.Equal(TimeSpan.FromSeconds(30), overridden.ConnectionIdleTimeout);
+        Assert.False(overridden.EnableHttp2);
+        Assert.False(overridden.AutomaticDecompression);
+    }
+
+    /// <summary>
+    /// Ensures out-of-range HTTP throttling settings are rejected.
+    /// </summary>
+    [Fact]
+    public static void LoadThrowsWhenHttpRateNegative()
+    {
+        using var temp = new TempFolder();
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "http": {
+            "requests_per_second_per_host": -1
+          },
+          "uris": [
+            { "uri": "http://example.com/root.crl" }
+          ]
+        }
+        """);
+
+        var ex = Assert.Throws<InvalidOperationException>(() => ConfigLoader.Load(configPath));
+        Assert.Contains("requests_per_second_per_host", ex.Message, StringComparison.Ordinal);
+    }
+
+    /// <summary>
+    /// Ensures a file saved with a UTF-8 byte order mark is still read.
+    /// </summary>
+    [Fact]
+    public static void LoadAcceptsByteOrderMark()
+    {
+        using var temp = new TempFolder();
+        var configPath = temp.WriteJson("config.json", /*lang=json,strict*/ """
+        {
+          "csv_output_path": "report.csv",
+          "fetch_timeout_seconds": 30,
+          "max_parallel_fetches": 1,
+          "state_file_path": "state.json",
+          "uris": [
+            { "uri": "http://example.com/root.crl" }
+          ]
+        }
+        """);
+
+        var json = File.ReadAllText(configPath);
+        _ = temp.WriteBinary("config.json", [.. Encoding.UTF8.GetPreamble(), .. Encoding.UTF8.GetBytes(json)]);
+
+        var options = ConfigLoader.Load(configPath);
+
+        Assert.Equal(TimeSpan.FromSeconds(30), options.FetchTimeout);
+    }
+
     private sealed class TempFolder : IDisposable
     {
         public string Path { get; } = Directory.CreateTempSubdirectory().FullName;
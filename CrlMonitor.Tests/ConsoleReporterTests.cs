@@ -24,6 +24,7 @@ public static class ConsoleReporterTests
         var reporter = new ConsoleReporter(status, verbose: true);
         var diagnostics = new RunDiagnostics();
         diagnostics.AddRuntimeWarning("Disk full");
+        diagnostics.RecordStageTimings(new CrlStageTimings(Transfer: TimeSpan.FromMilliseconds(50), Parse: TimeSpan.FromMilliseconds(2.5)));
         var fetchedAt = DateTime.UtcNow.AddHours(-1);
         var generatedAt = DateTime.UtcNow;
         var run = new CrlCheckRun(
@@ -84,6 +85,9 @@ public static class ConsoleReporterTests
             Assert.Contains(expectedPrevious, output, StringComparison.Ordinal);
             Assert.Contains("Summary:", output, StringComparison.Ordinal);
             Assert.Contains("Disk full", output, StringComparison.Ordinal);
+            Assert.Contains("Stage timings (ms):", output, StringComparison.Ordinal);
+            Assert.Contains("Transfer", output, StringComparison.Ordinal);
+            Assert.Contains("2.5", output, StringComparison.Ordinal);
             Assert.Contains("CSV: report.csv", output, StringComparison.Ordinal);
             Assert.Contains(expectedHtmlPath, output, StringComparison.Ordinal);
             Assert.Contains("Report written to:", output, StringComparison.Ordinal);
@@ -1,4 +1,7 @@
+using System.Net;
+using System.Net.Sockets;
 using CrlMonitor.Crl;
+using CrlMonitor.Diagnostics;
 using CrlMonitor.Fetching;
 using CrlMonitor.Models;
 using CrlMonitor.Runner;
@@ -6,6 +9,7 @@ using CrlMonitor.Health;
 using CrlMonitor.Tests.TestUtilities;
 using CrlMonitor.Validation;
 using CrlMonitor.State;
+using Org.BouncyCastle.X509;
 
 namespace CrlMonitor.Tests;
 
@@ -185,6 +189,17 @@ public static class CrlCheckRunnerTests
             var run = await runner.RunAsync(fileEntries, TimeSpan.FromSeconds(5), 1, CancellationToken.None).ConfigureAwait(true);
 
             Assert.Equal(CrlStatus.Ok, run.Results[0].Status);
+            var timings = Assert.IsType<CrlStageTimings>(run.Results[0].Timings);
+            Assert.Null(timings.Dns);
+            Assert.NotNull(timings.Transfer);
+            Assert.NotNull(timings.Parse);
+            Assert.NotNull(timings.Verify);
+            Assert.NotNull(timings.Health);
+            Assert.Null(timings.StateWrite);
+            var parse = Assert.Single(run.Diagnostics.GetStageTimingSummaries(), summary => summary.Stage == CrlTimingStage.Parse);
+            Assert.Equal(1, parse.Count);
+            Assert.Equal(timings.Parse, parse.Max);
+            Assert.Contains(run.Diagnostics.GetStageTimingSummaries(), summary => summary.Stage == CrlTimingStage.StateWrite && summary.Count == 1);
         }
         finally
         {
@@ -279,12 +294,13 @@ public static class CrlCheckRunnerTests
             LastFetchToReturn = DateTime.UtcNow.AddHours(-3)
         };
         var runner = new CrlCheckRunner(resolver, parser, signatureValidator, healthEvaluator, stateStore);
-        var entry = CreateEntry("http://example.com/crl");
+        var entries = new[] { CreateEntry("http://example.com/crl"), CreateEntry("http://example.com/other.crl") };
 
-        var run = await runner.RunAsync(new[] { entry }, TimeSpan.Zero, 1, CancellationToken.None).ConfigureAwait(true);
+        var run = await runner.RunAsync(entries, TimeSpan.Zero, 2, CancellationToken.None).ConfigureAwait(true);
 
         _ = Assert.NotNull(stateStore.LastSavedAt);
-        Assert.Equal(stateStore.LastFetchToReturn, run.Results[0].PreviousFetchUtc);
+        Assert.Equal(1, stateStore.BatchCount);
+        Assert.All(run.Results, result => Assert.Equal(stateStore.LastFetchToReturn, result.PreviousFetchUtc));
     }
 
     /// <summary>
@@ -311,6 +327,305 @@ public static class CrlCheckRunnerTests
         Assert.NotEmpty(run.Diagnostics.StateWarnings);
     }
 
+    /// <summary>
+    /// Ensures unchanged content is served from the memo store while health is re-evaluated.
+    /// </summary>
+    [Fact]
+    public static async Task RunAsyncReusesMemoisedParseForUnchangedContent()
+    {
+        var (parsedCrl, _, _, _) = CrlTestBuilder.BuildParsedCrl(false);
+        var parser = new StubParser(parsedCrl);
+        var resolver = new StubResolver(new StubFetcher([1, 2, 3]));
+        var healthEvaluator = new StubHealthEvaluator("Healthy");
+        var memoStore = new CrlMemoStore(1024);
+        var runner = new CrlCheckRunner(resolver, parser, new StubSignatureValidator("Valid"), healthEvaluator, new NullStateStore(), memoStore);
+        var entries = new[] { CreateEntry("http://example.com/crl") };
+
+        var first = await runner.RunAsync(entries, TimeSpan.Zero, 1, CancellationToken.None).ConfigureAwait(true);
+        var second = await runner.RunAsync(entries, TimeSpan.Zero, 1, CancellationToken.None).ConfigureAwait(true);
+
+        Assert.Equal(1, parser.ParseCount);
+        Assert.Equal(2, healthEvaluator.EvaluateCount);
+        Assert.Equal(CrlStatus.Ok, first.Results[0].Status);
+        Assert.Equal(CrlStatus.Ok, second.Results[0].Status);
+        Assert.Same(first.Results[0].ParsedCrl, second.Results[0].ParsedCrl);
+    }
+
+    /// <summary>
+    /// Ensures processing concurrency is limited independently of fetch concurrency and queue depths are reported.
+    /// </summary>
+    [Fact]
+    public static async Task RunAsyncLimitsProcessingSeparatelyFromFetching()
+    {
+        var (parsed, _, _, _) = CrlTestBuilder.BuildParsedCrl(false);
+        var parser = new SlowParser(parsed, TimeSpan.FromMilliseconds(50));
+        var fetcher = new ConcurrentFetcher(TimeSpan.FromMilliseconds(100));
+        var runner = new CrlCheckRunner(new StubResolver(fetcher), parser, new StubSignatureValidator("Valid"), new StubHealthEvaluator("Healthy"), new NullStateStore());
+        var entries = new[]
+        {
+            CreateEntry("http://a"),
+            CreateEntry("http://b"),
+            CreateEntry("http://c"),
+            CreateEntry("http://d")
+        };
+
+        var run = await runner.RunAsync(entries, TimeSpan.FromSeconds(5), 4, 1, CancellationToken.None).ConfigureAwait(true);
+
+        Assert.True(fetcher.MaxConcurrency >= 2, $"Expected fetch concurrency >= 2, saw {fetcher.MaxConcurrency}");
+        Assert.Equal(1, parser.MaxConcurrency);
+        Assert.Equal(entries.Select(entry => entry.Uri), run.Results.Select(result => result.Uri));
+        Assert.All(run.Results, result => Assert.Equal(CrlStatus.Ok, result.Status));
+        Assert.Equal(entries.Length, run.Diagnostics.QueueDepthPeaks[PipelineStage.Fetch]);
+        Assert.True(run.Diagnostics.QueueDepthPeaks.ContainsKey(PipelineStage.Process));
+    }
+
+    /// <summary>
+    /// Ensures delta entries merge the delta into the base and only re-fetch the base when the delta requires it.
+    /// </summary>
+    [Fact]
+    public static async Task RunAsyncFetchesBaseOnlyWhenDeltaRequiresIt()
+    {
+        var baseUri = new Uri("http://example.com/base.crl");
+        var deltaUri = new Uri("http://example.com/delta.crl");
+        var fetcher = new UriFetcher();
+        fetcher.Content[baseUri] = CrlTestBuilder.BuildCrlBytes(10, revokedSerials: [1, 2]);
+        fetcher.Content[deltaUri] = CrlTestBuilder.BuildCrlBytes(11, baseCrlNumber: 10, revokedSerials: [3], removedSerials: [1]);
+        var runner = new CrlCheckRunner(
+            new StubResolver(fetcher),
+            new CrlParser(SignatureValidationMode.None),
+            new StubSignatureValidator("Valid"),
+            new StubHealthEvaluator("Healthy"),
+            new NullStateStore());
+        var entries = new[] { CreateEntry(baseUri.ToString()) with { DeltaUri = deltaUri } };
+
+        var first = await runner.RunAsync(entries, TimeSpan.Zero, 1, CancellationToken.None).ConfigureAwait(true);
+        var second = await runner.RunAsync(entries, TimeSpan.Zero, 1, CancellationToken.None).ConfigureAwait(true);
+        fetcher.Content[baseUri] = CrlTestBuilder.BuildCrlBytes(12, revokedSerials: [2, 3]);
+        fetcher.Content[deltaUri] = CrlTestBuilder.BuildCrlBytes(13, baseCrlNumber: 12, revokedSerials: [4]);
+        var third = await runner.RunAsync(entries, TimeSpan.Zero, 1, CancellationToken.None).ConfigureAwait(true);
+
+        Assert.Equal(2, fetcher.FetchCounts[baseUri]);
+        Assert.Equal(3, fetcher.FetchCounts[deltaUri]);
+        Assert.All(new[] { first, second, third }, run => Assert.Equal(CrlStatus.Ok, run.Results[0].Status));
+        Assert.Equal(ExpectedAfterFirstDelta, second.Results[0].ParsedCrl!.RevokedSerialNumbers.OrderBy(value => value, StringComparer.Ordinal));
+        Assert.Equal(ExpectedAfterSecondDelta, third.Results[0].ParsedCrl!.RevokedSerialNumbers.OrderBy(value => value, StringComparer.Ordinal));
+    }
+
+    /// <summary>
+    /// Ensures a base CRL saved by one run is reused by a separate runner instead of being fetched again.
+    /// </summary>
+    [Fact]
+    public static async Task RunAsyncReusesSavedBaseAcrossRunners()
+    {
+        var baseUri = new Uri("http://example.com/base.crl");
+        var deltaUri = new Uri("http://example.com/delta.crl");
+        var fetcher = new UriFetcher();
+        fetcher.Content[baseUri] = CrlTestBuilder.BuildCrlBytes(10, revokedSerials: [1, 2]);
+        fetcher.Content[deltaUri] = CrlTestBuilder.BuildCrlBytes(11, baseCrlNumber: 10, revokedSerials: [3], removedSerials: [1]);
+        var entries = new[] { CreateEntry(baseUri.ToString()) with { DeltaUri = deltaUri } };
+        var baseDirectory = Path.Combine(Path.GetTempPath(), Path.GetRandomFileName());
+
+        try
+        {
+            var first = await CreateDeltaRunner(fetcher, baseDirectory).RunAsync(entries, TimeSpan.Zero, 1, CancellationToken.None).ConfigureAwait(true);
+            var second = await CreateDeltaRunner(fetcher, baseDirectory).RunAsync(entries, TimeSpan.Zero, 1, CancellationToken.None).ConfigureAwait(true);
+
+            Assert.Equal(1, fetcher.FetchCounts[baseUri]);
+            Assert.Equal(2, fetcher.FetchCounts[deltaUri]);
+            Assert.Equal(CrlStatus.Ok, first.Results[0].Status);
+            Assert.Equal(CrlStatus.Ok, second.Results[0].Status);
+            Assert.Equal("Valid", second.Results[0].SignatureStatus);
+            Assert.Equal(ExpectedAfterFirstDelta, second.Results[0].ParsedCrl!.RevokedSerialNumbers.OrderBy(value => value, StringComparer.Ordinal));
+        }
+        finally
+        {
+            if (Directory.Exists(baseDirectory))
+            {
+                Directory.Delete(baseDirectory, recursive: true);
+            }
+        }
+    }
+
+    private static CrlCheckRunner CreateDeltaRunner(UriFetcher fetcher, string baseDirectory)
+    {
+        return new CrlCheckRunner(
+            new StubResolver(fetcher),
+            new CrlParser(SignatureValidationMode.None),
+            new StubSignatureValidator("Valid"),
+            new StubHealthEvaluator("Healthy"),
+            new NullStateStore(),
+            deltaBaseStore: new FileDeltaBaseStore(baseDirectory));
+    }
+
+    private static readonly string[] ExpectedAfterFirstDelta = ["2", "3"];
+    private static readonly string[] ExpectedAfterSecondDelta = ["2", "3", "4"];
+
+    /// <summary>
+    /// Ensures a streamed run yields finished results while slower checks are still in flight.
+    /// </summary>
+    [Fact]
+    public static async Task StreamYieldsResultsBeforeSlowChecksFinish()
+    {
+        var (parsed, _, _, _) = CrlTestBuilder.BuildParsedCrl(false);
+        var fetcher = new GatedFetcher(new Uri("http://slow"));
+        var runner = new CrlCheckRunner(new StubResolver(fetcher), new StubParser(parsed), new StubSignatureValidator("Valid"), new StubHealthEvaluator("Healthy"), new NullStateStore());
+        var entries = new[] { CreateEntry("http://slow"), CreateEntry("http://fast") };
+
+        var stream = runner.Stream(entries, TimeSpan.FromSeconds(5), 2, 2, CancellationToken.None);
+        var streamed = new List<Uri>();
+        await foreach (var result in stream.ReadResultsAsync(CancellationToken.None).ConfigureAwait(true))
+        {
+            streamed.Add(result.Uri);
+            fetcher.Release();
+        }
+
+        var run = await stream.Completion.ConfigureAwait(true);
+        Assert.Equal(FastThenSlow, streamed);
+        Assert.Equal(entries.Select(entry => entry.Uri), run.Results.Select(result => result.Uri));
+    }
+
+    /// <summary>
+    /// Ensures CRLs are checked most urgent first while results stay in configuration order.
+    /// </summary>
+    [Fact]
+    public static async Task RunAsyncChecksMostUrgentCrlsFirst()
+    {
+        var now = DateTime.UtcNow;
+        var parsed = CrlTestBuilder.BuildParsedCrl(false).Parsed;
+        var fetcher = new OrderRecordingFetcher();
+        var stateStore = new RecordingStateStore();
+        var calm = CreateEntry("http://example.com/calm.crl");
+        var soon = CreateEntry("http://example.com/soon.crl");
+        var failed = CreateEntry("http://example.com/failed.crl");
+        var unknown = CreateEntry("http://example.com/unknown.crl");
+        stateStore.Histories[calm.Uri] = new CrlHistory(now.AddHours(-1), now.AddHours(-1), now.AddDays(7), null);
+        stateStore.Histories[soon.Uri] = new CrlHistory(now.AddHours(-1), now.AddDays(-6), now.AddDays(1), null);
+        stateStore.Histories[failed.Uri] = new CrlHistory(now.AddHours(-2), now.AddHours(-2), now.AddDays(7), now.AddHours(-1));
+        var runner = new CrlCheckRunner(
+            new StubResolver(fetcher),
+            new StubParser(parsed),
+            new StubSignatureValidator("Valid"),
+            new StubHealthEvaluator("Healthy"),
+            stateStore);
+        var entries = new[] { calm, soon, failed, unknown };
+
+        var run = await runner.RunAsync(entries, TimeSpan.Zero, 1, 1, CancellationToken.None).ConfigureAwait(true);
+
+        Assert.Equal(new[] { failed.Uri, unknown.Uri, soon.Uri, calm.Uri }, fetcher.Fetched);
+        Assert.Equal(entries.Select(entry => entry.Uri), run.Results.Select(result => result.Uri));
+    }
+
+    /// <summary>
+    /// Ensures CRLs not yet near their threshold are deferred once less than a fetch timeout is left, while urgent
+    /// ones are still checked.
+    /// </summary>
+    [Fact]
+    public static async Task RunAsyncDefersLowRiskCrlsNearDeadline()
+    {
+        var now = DateTime.UtcNow;
+        var parsed = CrlTestBuilder.BuildParsedCrl(false).Parsed;
+        var fetcher = new OrderRecordingFetcher();
+        var stateStore = new RecordingStateStore();
+        var calm = CreateEntry("http://example.com/calm.crl");
+        var unknown = CreateEntry("http://example.com/unknown.crl");
+        stateStore.Histories[calm.Uri] = new CrlHistory(now.AddHours(-1), now.AddHours(-1), now.AddDays(7), null);
+        var runner = new CrlCheckRunner(
+            new StubResolver(fetcher),
+            new StubParser(parsed),
+            new StubSignatureValidator("Valid"),
+            new StubHealthEvaluator("Healthy"),
+            stateStore);
+
+        var run = await runner.RunAsync([calm, unknown], TimeSpan.FromHours(2), 1, 1, TimeSpan.FromHours(1), CancellationToken.None)
+            .ConfigureAwait(true);
+
+        Assert.Equal(CrlStatus.Deferred, run.Results[0].Status);
+        Assert.Equal(CrlStatus.Ok, run.Results[1].Status);
+        Assert.Equal(unknown.Uri, Assert.Single(fetcher.Fetched));
+        Assert.Contains(run.Diagnostics.RuntimeWarnings, warning => warning.Contains("deferred 1 CRL(s)", StringComparison.Ordinal));
+        Assert.Empty(stateStore.SavedFailures);
+    }
+
+    /// <summary>
+    /// Ensures a transient failure is retried and the retry is counted against the host.
+    /// </summary>
+    [Fact]
+    public static async Task RunAsyncRetriesTransientFetchFailure()
+    {
+        var parsed = CrlTestBuilder.BuildParsedCrl(false).Parsed;
+        var fetcher = new FailingFetcher(1, new HttpRequestException("Service unavailable", null, HttpStatusCode.ServiceUnavailable));
+        var runner = new CrlCheckRunner(
+            new StubResolver(fetcher),
+            new StubParser(parsed),
+            new StubSignatureValidator("Valid"),
+            new StubHealthEvaluator("Healthy"),
+            new NullStateStore(),
+            resilience: new FetchResilienceOptions(2, TimeSpan.FromMilliseconds(1), TimeSpan.FromMilliseconds(1), 3, TimeSpan.FromHours(1)));
+
+        var run = await runner.RunAsync([CreateEntry("http://example.com/crl")], TimeSpan.FromSeconds(30), 1, CancellationToken.None)
+            .ConfigureAwait(true);
+
+        Assert.Equal(CrlStatus.Ok, run.Results[0].Status);
+        Assert.Equal(2, fetcher.Calls);
+        Assert.Equal(1, run.Diagnostics.FetchRetries["example.com"]);
+    }
+
+    /// <summary>
+    /// Ensures repeated connection failures open the host's circuit so its remaining CRLs fail without a fetch.
+    /// </summary>
+    [Fact]
+    public static async Task RunAsyncSkipsHostOnceCircuitOpens()
+    {
+        var parsed = CrlTestBuilder.BuildParsedCrl(false).Parsed;
+        var fetcher = new FailingFetcher(int.MaxValue, new HttpRequestException("Connection refused", new SocketException((int)SocketError.ConnectionRefused)));
+        var runner = new CrlCheckRunner(
+            new StubResolver(fetcher),
+            new StubParser(parsed),
+            new StubSignatureValidator("Valid"),
+            new StubHealthEvaluator("Healthy"),
+            new NullStateStore(),
+            resilience: new FetchResilienceOptions(0, TimeSpan.Zero, TimeSpan.Zero, 2, TimeSpan.FromHours(1)));
+        var entries = Enumerable.Range(0, 5)
+            .Select(index => CreateEntry(FormattableString.Invariant($"http://dead.example.com/{index}.crl")))
+            .ToList();
+
+        var run = await runner.RunAsync(entries, TimeSpan.FromSeconds(30), 1, CancellationToken.None).ConfigureAwait(true);
+
+        Assert.Equal(2, fetcher.Calls);
+        Assert.All(run.Results, result => Assert.Equal(CrlStatus.Error, result.Status));
+        Assert.Equal(3, run.Results.Count(result => result.ErrorInfo!.Contains("stopped responding", StringComparison.Ordinal)));
+        Assert.Equal(3, run.Diagnostics.CircuitRejections["dead.example.com"]);
+        Assert.Contains(run.Diagnostics.RuntimeWarnings, warning => warning.StartsWith("Circuit opened for dead.example.com", StringComparison.Ordinal));
+    }
+
+    /// <summary>
+    /// Ensures one unreachable CRL counts once against its host after its retries, so a healthy CRL on the same host
+    /// is still fetched.
+    /// </summary>
+    [Fact]
+    public static async Task RunAsyncKeepsCircuitClosedForSingleBrokenCrl()
+    {
+        var parsed = CrlTestBuilder.BuildParsedCrl(false).Parsed;
+        var broken = CreateEntry("http://shared.example.com/broken.crl");
+        var healthy = CreateEntry("http://shared.example.com/healthy.crl");
+        var fetcher = new BrokenUriFetcher(broken.Uri, new HttpRequestException("Connection refused", new SocketException((int)SocketError.ConnectionRefused)));
+        var runner = new CrlCheckRunner(
+            new StubResolver(fetcher),
+            new StubParser(parsed),
+            new StubSignatureValidator("Valid"),
+            new StubHealthEvaluator("Healthy"),
+            new NullStateStore(),
+            resilience: new FetchResilienceOptions(2, TimeSpan.FromMilliseconds(1), TimeSpan.FromMilliseconds(1), 2, TimeSpan.FromHours(1)));
+
+        var run = await runner.RunAsync([broken, healthy], TimeSpan.FromSeconds(30), 1, CancellationToken.None).ConfigureAwait(true);
+
+        Assert.Equal(CrlStatus.Error, run.Results[0].Status);
+        Assert.Equal(CrlStatus.Ok, run.Results[1].Status);
+        Assert.Equal(3, fetcher.BrokenCalls);
+        Assert.Empty(run.Diagnostics.CircuitRejections);
+        Assert.DoesNotContain(run.Diagnostics.RuntimeWarnings, warning => warning.StartsWith("Circuit opened", StringComparison.Ordinal));
+    }
+
     private static CrlConfigEntry CreateEntry(string uri)
     {
         return new CrlConfigEntry(new Uri(uri), SignatureValidationMode.None, null, 0.8, null, 10 * 1024 * 1024);
@@ -341,9 +656,31 @@ public static class CrlCheckRunnerTests
     {
         private readonly ParsedCrl _parsed = parsed;
 
-        public ParsedCrl Parse(byte[] crlBytes)
+        public int ParseCount { get; private set; }
+
+        public (ParsedCrl Parsed, X509Crl? Crl) Decode(ReadOnlyMemory<byte> crlBytes)
+        {
+            this.ParseCount++;
+            return (this._parsed, null);
+        }
+    }
+
+    private sealed class SlowParser(ParsedCrl parsed, TimeSpan delay) : ICrlParser
+    {
+        private readonly ParsedCrl _parsed = parsed;
+        private readonly TimeSpan _delay = delay;
+        private int _current;
+        private int _maxConcurrency;
+
+        public int MaxConcurrency => Volatile.Read(ref this._maxConcurrency);
+
+        public (ParsedCrl Parsed, X509Crl? Crl) Decode(ReadOnlyMemory<byte> crlBytes)
         {
-            return this._parsed;
+            var inFlight = Interlocked.Increment(ref this._current);
+            _ = Interlocked.Exchange(ref this._maxConcurrency, Math.Max(Volatile.Read(ref this._maxConcurrency), inFlight));
+            Thread.Sleep(this._delay);
+            _ = Interlocked.Decrement(ref this._current);
+            return (this._parsed, null);
         }
     }
 
@@ -356,7 +693,7 @@ public static class CrlCheckRunnerTests
         {
         }
 
-        public SignatureValidationResult Validate(ParsedCrl parsedCrl, CrlConfigEntry entry)
+        public SignatureValidationResult Validate(ParsedCrl parsedCrl, X509Crl? crl, CrlConfigEntry entry)
         {
             return new SignatureValidationResult(this._status, this._message);
         }
@@ -366,8 +703,11 @@ public static class CrlCheckRunnerTests
     {
         private readonly string _status = status;
 
+        public int EvaluateCount { get; private set; }
+
         public HealthEvaluationResult Evaluate(ParsedCrl parsedCrl, CrlConfigEntry entry, DateTime utcNow)
         {
+            this.EvaluateCount++;
             return new HealthEvaluationResult(this._status, this._status == "Healthy" ? null : "Health issue");
         }
     }
@@ -411,6 +751,102 @@ public static class CrlCheckRunnerTests
         }
     }
 
+    private sealed class UriFetcher : ICrlFetcher
+    {
+        public Dictionary<Uri, byte[]> Content { get; } = [];
+
+        public Dictionary<Uri, int> FetchCounts { get; } = [];
+
+        public Task<FetchedCrl> FetchAsync(CrlConfigEntry entry, CancellationToken cancellationToken)
+        {
+            lock (this.FetchCounts)
+            {
+                this.FetchCounts[entry.Uri] = this.FetchCounts.GetValueOrDefault(entry.Uri) + 1;
+            }
+
+            var content = this.Content[entry.Uri];
+            return Task.FromResult(new FetchedCrl(content, TimeSpan.Zero, content.Length));
+        }
+    }
+
+    private sealed class OrderRecordingFetcher : ICrlFetcher
+    {
+        private readonly List<Uri> _fetched = [];
+
+        public IReadOnlyList<Uri> Fetched
+        {
+            get
+            {
+                lock (this._fetched)
+                {
+                    return [.. this._fetched];
+                }
+            }
+        }
+
+        public Task<FetchedCrl> FetchAsync(CrlConfigEntry entry, CancellationToken cancellationToken)
+        {
+            lock (this._fetched)
+            {
+                this._fetched.Add(entry.Uri);
+            }
+
+            return Task.FromResult(new FetchedCrl([], TimeSpan.Zero, 0));
+        }
+    }
+
+    private sealed class FailingFetcher(int failures, Exception exception) : ICrlFetcher
+    {
+        private int _calls;
+
+        public int Calls => Volatile.Read(ref this._calls);
+
+        public Task<FetchedCrl> FetchAsync(CrlConfigEntry entry, CancellationToken cancellationToken)
+        {
+            return Interlocked.Increment(ref this._calls) <= failures
+                ? throw exception
+                : Task.FromResult(new FetchedCrl([], TimeSpan.Zero, 0));
+        }
+    }
+
+    private sealed class BrokenUriFetcher(Uri brokenUri, Exception exception) : ICrlFetcher
+    {
+        private int _brokenCalls;
+
+        public int BrokenCalls => Volatile.Read(ref this._brokenCalls);
+
+        public Task<FetchedCrl> FetchAsync(CrlConfigEntry entry, CancellationToken cancellationToken)
+        {
+            if (entry.Uri != brokenUri)
+            {
+                return Task.FromResult(new FetchedCrl([], TimeSpan.Zero, 0));
+            }
+
+            _ = Interlocked.Increment(ref this._brokenCalls);
+            throw exception;
+        }
+    }
+
+    private sealed class GatedFetcher(Uri gatedUri) : ICrlFetcher
+    {
+        private readonly TaskCompletionSource _gate = new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+        public void Release()
+        {
+            _ = this._gate.TrySetResult();
+        }
+
+        public async Task<FetchedCrl> FetchAsync(CrlConfigEntry entry, CancellationToken cancellationToken)
+        {
+            if (entry.Uri == gatedUri)
+            {
+                await this._gate.Task.WaitAsync(cancellationToken).ConfigureAwait(false);
+            }
+
+            return new FetchedCrl([], TimeSpan.Zero, 0);
+        }
+    }
+
     private sealed class TimeoutFetcher : ICrlFetcher
     {
         public async Task<FetchedCrl> FetchAsync(CrlConfigEntry entry, CancellationToken cancellationToken)
@@ -421,6 +857,7 @@ public static class CrlCheckRunnerTests
     }
 
     private static readonly string[] FileSchemes = ["file"];
+    private static readonly Uri[] FastThenSlow = [new("http://fast"), new("http://slow")];
 
     private sealed class NullStateStore : IStateStore
     {
@@ -453,6 +890,26 @@ public static class CrlCheckRunnerTests
         {
             return Task.CompletedTask;
         }
+
+        public Task<IReadOnlyDictionary<Uri, DateTime>> GetLastFetchesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<IReadOnlyDictionary<Uri, DateTime>>(new Dictionary<Uri, DateTime>());
+        }
+
+        public Task<IReadOnlyDictionary<Uri, CrlHistory>> GetCrlHistoriesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<IReadOnlyDictionary<Uri, CrlHistory>>(new Dictionary<Uri, CrlHistory>());
+        }
+
+        public Task<IReadOnlyDictionary<string, DateTime>> GetAlertCooldownsAsync(IReadOnlyCollection<string> keys, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<IReadOnlyDictionary<string, DateTime>>(new Dictionary<string, DateTime>());
+        }
+
+        public Task SaveBatchAsync(StateBatch batch, CancellationToken cancellationToken)
+        {
+            return Task.CompletedTask;
+        }
     }
 
     private sealed class RecordingStateStore : IStateStore
@@ -461,6 +918,9 @@ public static class CrlCheckRunnerTests
         public Exception? SaveException { get; set; }
         public DateTime? LastSavedAt { get; private set; }
         public DateTime? LastFetchToReturn { get; set; }
+        public int BatchCount { get; private set; }
+        public Dictionary<Uri, CrlHistory> Histories { get; } = [];
+        public Dictionary<Uri, DateTime> SavedFailures { get; } = [];
 
         public Task<DateTime?> GetLastFetchAsync(Uri uri, CancellationToken cancellationToken)
         {
@@ -497,5 +957,73 @@ public static class CrlCheckRunnerTests
         {
             return Task.CompletedTask;
         }
+
+        public Task<IReadOnlyDictionary<Uri, DateTime>> GetLastFetchesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken)
+        {
+            if (this.LoadException != null)
+            {
+                throw this.LoadException;
+            }
+
+            var found = new Dictionary<Uri, DateTime>();
+            if (this.LastFetchToReturn.HasValue)
+            {
+                foreach (var uri in uris)
+                {
+                    found[uri] = this.LastFetchToReturn.Value;
+                }
+            }
+
+            return Task.FromResult<IReadOnlyDictionary<Uri, DateTime>>(found);
+        }
+
+        public Task<IReadOnlyDictionary<Uri, CrlHistory>> GetCrlHistoriesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken)
+        {
+            if (this.LoadException != null)
+            {
+                throw this.LoadException;
+            }
+
+            var found = new Dictionary<Uri, CrlHistory>();
+            foreach (var uri in uris)
+            {
+                if (this.Histories.TryGetValue(uri, out var history))
+                {
+                    found[uri] = history;
+                }
+                else if (this.LastFetchToReturn.HasValue)
+                {
+                    found[uri] = new CrlHistory(this.LastFetchToReturn, null, null, null);
+                }
+            }
+
+            return Task.FromResult<IReadOnlyDictionary<Uri, CrlHistory>>(found);
+        }
+
+        public Task<IReadOnlyDictionary<string, DateTime>> GetAlertCooldownsAsync(IReadOnlyCollection<string> keys, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<IReadOnlyDictionary<string, DateTime>>(new Dictionary<string, DateTime>());
+        }
+
+        public Task SaveBatchAsync(StateBatch batch, CancellationToken cancellationToken)
+        {
+            if (this.SaveException != null)
+            {
+                throw this.SaveException;
+            }
+
+            this.BatchCount++;
+            foreach (var fetchedAtUtc in batch.LastFetches.Values)
+            {
+                this.LastSavedAt = fetchedAtUtc;
+            }
+
+            foreach (var (uri, failedAtUtc) in batch.LastFailures)
+            {
+                this.SavedFailures[uri] = failedAtUtc;
+            }
+
+            return Task.CompletedTask;
+        }
     }
 }
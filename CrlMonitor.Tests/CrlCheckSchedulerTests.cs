@@ -0,0 +1,94 @@
+using CrlMonitor.Crl;
+using CrlMonitor.Models;
+using CrlMonitor.Service;
+using CrlMonitor.Tests.TestUtilities;
+
+namespace CrlMonitor.Tests;
+
+/// <summary>
+/// Tests the adaptive per-CRL scheduler used by service mode.
+/// </summary>
+public static class CrlCheckSchedulerTests
+{
+    private static readonly ServiceOptions Options = new(TimeSpan.FromMinutes(5), TimeSpan.FromHours(6), TimeSpan.FromHours(1));
+
+    /// <summary>
+    /// Every CRL is due immediately after start-up.
+    /// </summary>
+    [Fact]
+    public static void AllEntriesDueAtStart()
+    {
+        var now = DateTime.UtcNow;
+        var scheduler = new CrlCheckScheduler([CreateEntry("http://a"), CreateEntry("http://b")], Options, now);
+
+        Assert.Equal(2, scheduler.GetDue(now).Count);
+    }
+
+    /// <summary>
+    /// A fresh CRL far from its threshold is polled at the maximum interval.
+    /// </summary>
+    [Fact]
+    public static void StableCrlUsesMaximumInterval()
+    {
+        var now = DateTime.UtcNow;
+        var entry = CreateEntry("http://stable");
+        var scheduler = new CrlCheckScheduler([entry], Options, now);
+        var (parsed, _, _, _) = CrlTestBuilder.BuildParsedCrl(false, now, now.AddDays(7));
+
+        scheduler.Record(entry, CreateResult(entry, CrlStatus.Ok, parsed), now);
+
+        Assert.Equal(now + Options.MaxCheckInterval, scheduler.GetNextCheck(entry.Uri));
+        Assert.Empty(scheduler.GetDue(now.AddHours(1)));
+    }
+
+    /// <summary>
+    /// The interval shrinks as the CRL approaches its expiry threshold.
+    /// </summary>
+    [Fact]
+    public static void CrlNearThresholdIsPolledSooner()
+    {
+        var now = DateTime.UtcNow;
+        var entry = CreateEntry("http://near");
+        var scheduler = new CrlCheckScheduler([entry], Options, now);
+        var (parsed, _, _, _) = CrlTestBuilder.BuildParsedCrl(false, now.AddHours(-7), now.AddHours(3));
+
+        scheduler.Record(entry, CreateResult(entry, CrlStatus.Ok, parsed), now);
+
+        // Threshold (0.8) falls one hour from now, so the next check lands halfway there.
+        var delay = scheduler.GetNextCheck(entry.Uri) - now;
+        Assert.InRange(delay, TimeSpan.FromMinutes(29), TimeSpan.FromMinutes(31));
+    }
+
+    /// <summary>
+    /// Failures are retried at the minimum interval with a capped backoff.
+    /// </summary>
+    [Fact]
+    public static void FailuresRetryQuicklyWithCappedBackoff()
+    {
+        var now = DateTime.UtcNow;
+        var entry = CreateEntry("http://failing");
+        var scheduler = new CrlCheckScheduler([entry], Options, now);
+        var failure = CreateResult(entry, CrlStatus.Error, null);
+
+        scheduler.Record(entry, failure, now);
+        var first = scheduler.GetNextCheck(entry.Uri) - now;
+        scheduler.Record(entry, failure, now);
+        scheduler.Record(entry, failure, now);
+        scheduler.Record(entry, failure, now);
+        var capped = scheduler.GetNextCheck(entry.Uri) - now;
+
+        Assert.Equal(TimeSpan.FromMinutes(5), first);
+        Assert.Equal(TimeSpan.FromMinutes(20), capped);
+        Assert.Equal(4, scheduler.GetConsecutiveFailures(entry.Uri));
+    }
+
+    private static CrlConfigEntry CreateEntry(string uri)
+    {
+        return new CrlConfigEntry(new Uri(uri), SignatureValidationMode.None, null, 0.8, null, 10 * 1024 * 1024);
+    }
+
+    private static CrlCheckResult CreateResult(CrlConfigEntry entry, CrlStatus status, ParsedCrl? parsed)
+    {
+        return new CrlCheckResult(entry.Uri, status, TimeSpan.Zero, parsed, null, null, null, null, DateTime.UtcNow, null);
+    }
+}
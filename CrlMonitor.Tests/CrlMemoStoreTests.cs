@@ -0,0 +1,145 @@
+using CrlMonitor.Crl;
+using CrlMonitor.Runner;
+using CrlMonitor.State;
+using CrlMonitor.Tests.TestUtilities;
+using CrlMonitor.Validation;
+
+namespace CrlMonitor.Tests;
+
+/// <summary>
+/// Tests the content-hash memo store.
+/// </summary>
+public static class CrlMemoStoreTests
+{
+    /// <summary>
+    /// Least recently used entries are evicted once the size budget is exceeded.
+    /// </summary>
+    [Fact]
+    public static void AddEvictsLeastRecentlyUsedEntries()
+    {
+        var (parsed, _, _, _) = CrlTestBuilder.BuildParsedCrl(false);
+        var memo = new CrlMemoEntry(parsed, SignatureValidationResult.Valid());
+        var store = new CrlMemoStore(100);
+
+        store.Add("a", memo, 40);
+        store.Add("b", memo, 40);
+        Assert.True(store.TryGet("a", out _));
+        store.Add("c", memo, 40);
+
+        Assert.True(store.TryGet("a", out _));
+        Assert.False(store.TryGet("b", out _));
+        Assert.True(store.TryGet("c", out _));
+        Assert.Equal(80, store.SizeBytes);
+    }
+
+    /// <summary>
+    /// Entries larger than the whole budget are never stored.
+    /// </summary>
+    [Fact]
+    public static void AddIgnoresEntriesLargerThanCapacity()
+    {
+        var (parsed, _, _, _) = CrlTestBuilder.BuildParsedCrl(false);
+        var store = new CrlMemoStore(10);
+
+        store.Add("big", new CrlMemoEntry(parsed, SignatureValidationResult.Valid()), 11);
+
+        Assert.Equal(0, store.Count);
+    }
+
+    /// <summary>
+    /// Entries saved by one file store are read back by a separate instance, as a later run would.
+    /// </summary>
+    [Fact]
+    public static void FileStoreReadsEntriesSavedByEarlierInstance()
+    {
+        using var temp = new TempFolder();
+        var (parsed, _, _, _) = CrlTestBuilder.BuildParsedCrl(false);
+        new FileCrlMemoStore(temp.Path, 1024 * 1024).Add("a", new CrlMemoEntry(parsed, SignatureValidationResult.Valid()), 40);
+
+        var reopened = new FileCrlMemoStore(temp.Path, 1024 * 1024);
+
+        Assert.True(reopened.TryGet("a", out var entry));
+        Assert.NotNull(entry);
+        Assert.Equal(parsed.Issuer, entry.Parsed.Issuer);
+        Assert.Equal(parsed.ThisUpdate, entry.Parsed.ThisUpdate);
+        Assert.Equal(parsed.NextUpdate, entry.Parsed.NextUpdate);
+        Assert.Equal(parsed.RevokedSerialNumbers, entry.Parsed.RevokedSerialNumbers);
+        Assert.Equal("Valid", entry.Signature.Status);
+        Assert.False(reopened.TryGet("b", out _));
+    }
+
+    /// <summary>
+    /// The file store deletes its oldest entries once the directory exceeds the size budget.
+    /// </summary>
+    [Fact]
+    public static void FileStoreEvictsOldestFilesBeyondCapacity()
+    {
+        using var temp = new TempFolder();
+        var (parsed, _, _, _) = CrlTestBuilder.BuildParsedCrl(false);
+        var memo = new CrlMemoEntry(parsed, SignatureValidationResult.Valid());
+        new FileCrlMemoStore(temp.Path, 1024 * 1024).Add("probe", memo, 0);
+        var fileSize = new FileInfo(Directory.GetFiles(temp.Path).Single()).Length;
+        Directory.Delete(temp.Path, true);
+        var store = new FileCrlMemoStore(temp.Path, (2 * fileSize) + 1);
+
+        store.Add("a", memo, 0);
+        File.SetLastWriteTimeUtc(Directory.GetFiles(temp.Path).Single(), DateTime.UtcNow.AddMinutes(-10));
+        store.Add("b", memo, 0);
+        store.Add("c", memo, 0);
+
+        var reopened = new FileCrlMemoStore(temp.Path, 1024 * 1024);
+        Assert.Equal(2, Directory.GetFiles(temp.Path).Length);
+        Assert.False(reopened.TryGet("a", out _));
+        Assert.True(reopened.TryGet("b", out _));
+        Assert.True(reopened.TryGet("c", out _));
+    }
+
+    /// <summary>
+    /// Keys change with content and with CA certificate identity.
+    /// </summary>
+    [Fact]
+    public static void KeyDependsOnContentAndCaIdentity()
+    {
+        var unsigned = new CrlConfigEntry(new Uri("http://example.com"), SignatureValidationMode.None, null, 0.8, null, 1024);
+        var caPath = Path.Combine(Path.GetTempPath(), Guid.NewGuid().ToString() + ".pem");
+        File.WriteAllBytes(caPath, [1, 2, 3]);
+        try
+        {
+            var signed = unsigned with { SignatureValidationMode = SignatureValidationMode.CaCertificate, CaCertificatePath = caPath };
+
+            var baseline = CrlMemoKey.Create([1, 2, 3], unsigned);
+
+            Assert.Equal(baseline, CrlMemoKey.Create([1, 2, 3], unsigned));
+            Assert.NotEqual(baseline, CrlMemoKey.Create([1, 2, 4], unsigned));
+            Assert.NotEqual(baseline, CrlMemoKey.Create([1, 2, 3], signed));
+        }
+        finally
+        {
+            File.Delete(caPath);
+        }
+    }
+
+    private sealed class TempFolder : IDisposable
+    {
+        public TempFolder()
+        {
+            this.Path = Directory.CreateDirectory(System.IO.Path.Combine(System.IO.Path.GetTempPath(), Guid.NewGuid().ToString())).FullName;
+        }
+
+        public string Path { get; }
+
+        public void Dispose()
+        {
+            try
+            {
+                Directory.Delete(this.Path, true);
+            }
+            catch (IOException)
+            {
+            }
+            catch (UnauthorizedAccessException)
+            {
+            }
+        }
+    }
+}
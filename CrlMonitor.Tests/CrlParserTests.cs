@@ -47,7 +47,7 @@ public static class CrlParserTests
         var crlBytes = CreateTestCrl(thisUpdate, nextUpdate, includeDeltaIndicator: true, SampleRevokedSerials);
 
         var parser = new CrlParser(SignatureValidationMode.None);
-        var parsed = parser.Parse(crlBytes);
+        var (parsed, crl) = parser.Decode(crlBytes);
 
         Assert.Equal("CN=Test CA", parsed.Issuer);
         Assert.Equal(thisUpdate, parsed.ThisUpdate);
@@ -58,7 +58,7 @@ public static class CrlParserTests
         Assert.True(parsed.IsDelta);
         Assert.Equal("Skipped", parsed.SignatureStatus);
         Assert.Null(parsed.SignatureError);
-        Assert.NotNull(parsed.RawCrl);
+        Assert.NotNull(crl);
     }
 
     /// <summary>
@@ -71,10 +71,27 @@ public static class CrlParserTests
         var crlBytes = CreateTestCrl(thisUpdate, thisUpdate.AddDays(1), includeDeltaIndicator: false);
 
         var parser = new CrlParser(SignatureValidationMode.CaCertificate);
-        var parsed = parser.Parse(crlBytes);
+        var (parsed, crl) = parser.Decode(crlBytes);
 
         Assert.Equal("Unknown", parsed.SignatureStatus);
-        Assert.NotNull(parsed.RawCrl);
+        Assert.NotNull(crl);
+    }
+
+    /// <summary>
+    /// Ensures count-only parsing keeps the revoked total without retaining serials.
+    /// </summary>
+    [Fact]
+    public static void ParseCountOnlyKeepsCountWithoutSerials()
+    {
+        var thisUpdate = new DateTime(2024, 10, 1, 8, 0, 0, DateTimeKind.Utc);
+        var crlBytes = CreateTestCrl(thisUpdate, thisUpdate.AddDays(1), includeDeltaIndicator: false, SampleRevokedSerials);
+
+        var parser = new CrlParser(SignatureValidationMode.None, countRevokedOnly: true);
+        var parsed = parser.Parse(crlBytes);
+
+        Assert.Equal(SampleRevokedSerials.Length, parsed.RevokedSerialNumbers.Count);
+        Assert.False(parsed.RevokedSerialNumbers.SerialsRetained);
+        _ = Assert.Throws<InvalidOperationException>(() => parsed.RevokedSerialNumbers.GetHex(0));
     }
 
     private static byte[] CreateTestCrl(
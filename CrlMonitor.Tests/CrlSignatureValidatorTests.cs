@@ -1,3 +1,4 @@
+using System.Text;
 using CrlMonitor.Crl;
 using CrlMonitor.Validation;
 using CrlMonitor.Tests.TestUtilities;
@@ -16,11 +17,11 @@ public static class CrlSignatureValidatorTests
     [Fact]
     public static void ValidateReturnsSkippedWhenModeNone()
     {
-        var (parsed, _, _, _) = CrlTestBuilder.BuildParsedCrl(false);
+        var (parsed, _, _, crlBytes) = CrlTestBuilder.BuildParsedCrl(false);
         var validator = new CrlSignatureValidator();
         var entry = new CrlConfigEntry(new Uri("http://example.com"), SignatureValidationMode.None, null, 0.8, null, 10 * 1024 * 1024);
 
-        var result = validator.Validate(parsed, entry);
+        var result = validator.Validate(parsed, Decode(crlBytes), entry);
 
         Assert.Equal("Skipped", result.Status);
     }
@@ -31,12 +32,12 @@ public static class CrlSignatureValidatorTests
     [Fact]
     public static void ValidateAcceptsValidSignature()
     {
-        var (parsed, caCert, _, _) = CrlTestBuilder.BuildParsedCrl(false);
+        var (parsed, caCert, _, crlBytes) = CrlTestBuilder.BuildParsedCrl(false);
         using var temp = new TempFile(caCert.GetEncoded());
         var validator = new CrlSignatureValidator();
         var entry = new CrlConfigEntry(new Uri("http://example.com"), SignatureValidationMode.CaCertificate, temp.Path, 0.8, null, 10 * 1024 * 1024);
 
-        var result = validator.Validate(parsed, entry);
+        var result = validator.Validate(parsed, Decode(crlBytes), entry);
 
         Assert.Equal("Valid", result.Status);
     }
@@ -47,13 +48,13 @@ public static class CrlSignatureValidatorTests
     [Fact]
     public static void ValidateSkipsWhenCaCertTooLarge()
     {
-        var (parsed, _, _, _) = CrlTestBuilder.BuildParsedCrl(false);
+        var (parsed, _, _, crlBytes) = CrlTestBuilder.BuildParsedCrl(false);
         var oversized = new byte[205_000];
         using var temp = new TempFile(oversized);
         var validator = new CrlSignatureValidator();
         var entry = new CrlConfigEntry(new Uri("http://example.com"), SignatureValidationMode.CaCertificate, temp.Path, 0.8, null, 10 * 1024 * 1024);
 
-        var result = validator.Validate(parsed, entry);
+        var result = validator.Validate(parsed, Decode(crlBytes), entry);
 
         Assert.Equal("Skipped", result.Status);
         Assert.Contains("200 KB", result.ErrorMessage, StringComparison.OrdinalIgnoreCase);
@@ -65,12 +66,12 @@ public static class CrlSignatureValidatorTests
     [Fact]
     public static void ValidateRejectsInvalidSignature()
     {
-        var (parsed, caCert, _, _) = CrlTestBuilder.BuildParsedCrl(true);
+        var (parsed, caCert, _, crlBytes) = CrlTestBuilder.BuildParsedCrl(true);
         using var temp = new TempFile(caCert.GetEncoded());
         var validator = new CrlSignatureValidator();
         var entry = new CrlConfigEntry(new Uri("http://example.com"), SignatureValidationMode.CaCertificate, temp.Path, 0.8, null, 10 * 1024 * 1024);
 
-        var result = validator.Validate(parsed, entry);
+        var result = validator.Validate(parsed, Decode(crlBytes), entry);
 
         Assert.Equal("Invalid", result.Status);
         Assert.False(string.IsNullOrWhiteSpace(result.ErrorMessage));
@@ -101,10 +102,8 @@ public static class CrlSignatureValidatorTests
 
         var revokedCerts = rawCrl.GetRevokedCertificates();
         var serialNumbers = revokedCerts != null
-            ? revokedCerts.Cast<Org.BouncyCastle.X509.X509CrlEntry>()
-                .Select(entry => entry.SerialNumber.ToString(16).ToUpperInvariant())
-                .ToList()
-            : [];
+            ? RevokedSerialCollection.Create(revokedCerts.Cast<Org.BouncyCastle.X509.X509CrlEntry>().Select(entry => entry.SerialNumber))
+            : RevokedSerialCollection.Empty;
 
         var parsed = new ParsedCrl(
             rawCrl.IssuerDN.ToString(),
@@ -113,8 +112,7 @@ public static class CrlSignatureValidatorTests
             serialNumbers,
             false,
             "Pending",
-            null,
-            rawCrl);
+            null);
 
         var validator = new CrlSignatureValidator();
         var entry = new CrlConfigEntry(
@@ -125,11 +123,82 @@ public static class CrlSignatureValidatorTests
             null,
             10 * 1024 * 1024);
 
-        var result = validator.Validate(parsed, entry);
+        var result = validator.Validate(parsed, rawCrl, entry);
 
         Assert.Equal("Valid", result.Status);
     }
 
+    /// <summary>
+    /// Ensures CA files are parsed once and reloaded only after they change.
+    /// </summary>
+    [Fact]
+    public static void ValidateReusesCachedCaUntilFileChanges()
+    {
+        var (parsed, caCert, _, crlBytes) = CrlTestBuilder.BuildParsedCrl(false);
+        var (_, otherCaCert, _, _) = CrlTestBuilder.BuildParsedCrl(false);
+        using var temp = new TempFile(caCert.GetEncoded());
+        var cache = new CaCertificateCache();
+        var validator = new CrlSignatureValidator(cache);
+        var entry = new CrlConfigEntry(new Uri("http://example.com"), SignatureValidationMode.CaCertificate, temp.Path, 0.8, null, 10 * 1024 * 1024);
+
+        Assert.Equal("Valid", validator.Validate(parsed, Decode(crlBytes), entry).Status);
+        Assert.Equal("Valid", validator.Validate(parsed, Decode(crlBytes), entry).Status);
+        Assert.Equal(1, cache.LoadCount);
+
+        File.WriteAllBytes(temp.Path, otherCaCert.GetEncoded());
+        File.SetLastWriteTimeUtc(temp.Path, DateTime.UtcNow.AddMinutes(1));
+
+        Assert.Equal("Invalid", validator.Validate(parsed, Decode(crlBytes), entry).Status);
+        Assert.Equal(2, cache.LoadCount);
+    }
+
+    /// <summary>
+    /// Ensures entries without a CA path are verified against the bundle certificate matching the issuer.
+    /// </summary>
+    [Fact]
+    public static void ValidateSelectsIssuerFromCaBundle()
+    {
+        var (parsed, caCert, _, crlBytes) = CrlTestBuilder.BuildParsedCrl(false);
+        var (_, sameSubjectCert, unrelatedCert, _) = CrlTestBuilder.BuildParsedCrl(true);
+        using var bundle = new TempFile(Encoding.ASCII.GetBytes(ToPem(unrelatedCert) + ToPem(sameSubjectCert) + ToPem(caCert)));
+        var validator = new CrlSignatureValidator(new CaCertificateCache(), bundle.Path);
+        var entry = new CrlConfigEntry(new Uri("http://example.com"), SignatureValidationMode.CaCertificate, null, 0.8, null, 10 * 1024 * 1024);
+
+        var result = validator.Validate(parsed, Decode(crlBytes), entry);
+
+        Assert.Equal("Valid", result.Status);
+    }
+
+    /// <summary>
+    /// Ensures a bundle without the CRL issuer reports an error rather than trying unrelated keys.
+    /// </summary>
+    [Fact]
+    public static void ValidateFailsWhenBundleLacksIssuer()
+    {
+        var (parsed, _, _, crlBytes) = CrlTestBuilder.BuildParsedCrl(false);
+        var (_, _, unrelatedCert, _) = CrlTestBuilder.BuildParsedCrl(true);
+        using var bundle = new TempFile(Encoding.ASCII.GetBytes(ToPem(unrelatedCert)));
+        var validator = new CrlSignatureValidator(new CaCertificateCache(), bundle.Path);
+        var entry = new CrlConfigEntry(new Uri("http://example.com"), SignatureValidationMode.CaCertificate, null, 0.8, null, 10 * 1024 * 1024);
+
+        var result = validator.Validate(parsed, Decode(crlBytes), entry);
+
+        Assert.Equal("Error", result.Status);
+        Assert.Contains("bundle", result.ErrorMessage, StringComparison.OrdinalIgnoreCase);
+    }
+
+    private static X509Crl Decode(byte[] crlBytes)
+    {
+        return new X509CrlParser().ReadCrl(crlBytes);
+    }
+
+    private static string ToPem(X509Certificate certificate)
+    {
+        return "-----BEGIN CERTIFICATE-----\n"
+            + Convert.ToBase64String(certificate.GetEncoded(), Base64FormattingOptions.InsertLineBreaks)
+            + "\n-----END CERTIFICATE-----\n";
+    }
+
     private sealed class TempFile : IDisposable
     {
         public string Path { get; }
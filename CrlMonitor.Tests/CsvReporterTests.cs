@@ -36,7 +36,8 @@ public static class CsvReporterTests
                     TimeSpan.FromMilliseconds(120),
                     4096,
                     checkedAt,
-                    "Valid"),
+                    "Valid",
+                    Timings: new CrlStageTimings(Wait: TimeSpan.FromMilliseconds(40), Transfer: TimeSpan.FromMilliseconds(12.5))),
                 new CrlCheckResult(
                     new Uri("ldap://dc1.example.com/CN=Example,O=Example Corp"),
                     CrlStatus.Error,
@@ -58,7 +59,7 @@ public static class CsvReporterTests
         var content = await File.ReadAllTextAsync(path).ConfigureAwait(true);
         var formattedPrev = TimeFormatter.FormatUtc(previousFetch);
         var formattedRun = TimeFormatter.FormatUtc(generatedAt);
-        Assert.Contains("URI,Issuer_Name,Status,This_Update_UTC,Next_Update_UTC,Expires_In,CRL_Size_bytes,Download_Duration_ms,Signature_Valid,Revoked_Count,Checked_Time_UTC,Previous_Checked_Time_UTC,CRL_Type,Status_Details", content, StringComparison.Ordinal);
+        Assert.Contains("URI,Issuer_Name,Status,This_Update_UTC,Next_Update_UTC,Expires_In,CRL_Size_bytes,Download_Duration_ms,Cache_Hit,Bytes_Saved,TTFB_ms,Connection_Reused,DNS_ms,Connect_ms,TLS_ms,Wait_ms,Transfer_ms,Parse_ms,Verify_ms,Health_ms,State_Write_ms,Signature_Valid,Revoked_Count,New_Revocations,Removed_Revocations,Checked_Time_UTC,Previous_Checked_Time_UTC,CRL_Type,Status_Details", content, StringComparison.Ordinal);
         Assert.Contains("Issuer_Name", content, StringComparison.Ordinal);
         Assert.Contains("CN=CA", content, StringComparison.Ordinal);
         Assert.Contains("Full", content, StringComparison.Ordinal);
@@ -66,6 +67,7 @@ public static class CsvReporterTests
         Assert.Contains(formattedPrev, content, StringComparison.Ordinal);
         Assert.Contains(formattedRun, content, StringComparison.Ordinal);
         Assert.Contains("4096", content, StringComparison.Ordinal);
+        Assert.Contains(",,,40.0,12.5,,,,,", content, StringComparison.Ordinal);
         Assert.Contains("# report_generated_utc", content, StringComparison.Ordinal);
     }
 
@@ -97,6 +99,30 @@ public static class CsvReporterTests
         Assert.Contains(",DISABLED,", content, StringComparison.Ordinal);
     }
 
+    /// <summary>
+    /// Ensures the streamed file matches the rendered CSV the email report attaches.
+    /// </summary>
+    [Fact]
+    public static async Task ReportAsyncWritesSameBytesAsRenderedCsv()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "run.csv");
+        var reporter = new CsvReporter(path, new ReportingStatus());
+        var timestamp = DateTime.UtcNow;
+        var run = new CrlCheckRun(
+            new[]
+            {
+                new CrlCheckResult(new Uri("http://example.com/ca.crl"), CrlStatus.Ok, TimeSpan.Zero, null, "Ünïcode détails", null, null, null, timestamp, "Valid")
+            },
+            new RunDiagnostics(),
+            timestamp);
+
+        await reporter.ReportAsync(run, CancellationToken.None).ConfigureAwait(true);
+
+        var rendered = await RunRenderCache.For(run).GetCsvAsync(CancellationToken.None).ConfigureAwait(true);
+        Assert.Equal(rendered, await File.ReadAllBytesAsync(path).ConfigureAwait(true));
+    }
+
     private sealed class TempFolder : IDisposable
     {
         public string Path { get; } = Directory.CreateDirectory(System.IO.Path.Combine(System.IO.Path.GetTempPath(), Guid.NewGuid().ToString())).FullName;
@@ -0,0 +1,80 @@
+using CrlMonitor.Crl;
+using CrlMonitor.Tests.TestUtilities;
+
+namespace CrlMonitor.Tests;
+
+/// <summary>
+/// Tests for <see cref="DeltaCrlMerger"/> and delta CRL parsing.
+/// </summary>
+public static class DeltaCrlMergerTests
+{
+    private static readonly string[] ExpectedAdded = ["4"];
+    private static readonly string[] ExpectedRemoved = ["1"];
+    private static readonly string[] ExpectedMerged = ["2", "3", "4"];
+
+    /// <summary>
+    /// Ensures the parser reads CRL numbers and separates removeFromCRL entries in deltas.
+    /// </summary>
+    [Fact]
+    public static void ParseReadsDeltaMetadata()
+    {
+        var parser = new CrlParser(SignatureValidationMode.None);
+
+        var delta = parser.Parse(CrlTestBuilder.BuildCrlBytes(11, baseCrlNumber: 10, revokedSerials: [4], removedSerials: [1]));
+
+        Assert.True(delta.IsDelta);
+        Assert.Equal(11, delta.CrlNumber!.IntValue);
+        Assert.Equal(10, delta.BaseCrlNumber!.IntValue);
+        Assert.Equal(ExpectedAdded, delta.RevokedSerialNumbers);
+        Assert.Equal(ExpectedRemoved, delta.RemovedSerialNumbers!);
+    }
+
+    /// <summary>
+    /// Ensures a delta adds and removes serials and bounds the validity window by the base.
+    /// </summary>
+    [Fact]
+    public static void MergeAppliesDeltaToBase()
+    {
+        var parser = new CrlParser(SignatureValidationMode.None);
+        var now = DateTime.UtcNow;
+        var baseCrl = parser.Parse(CrlTestBuilder.BuildCrlBytes(10, revokedSerials: [1, 2, 3], thisUpdate: now.AddDays(-1), nextUpdate: now.AddHours(2)));
+        var delta = parser.Parse(CrlTestBuilder.BuildCrlBytes(11, baseCrlNumber: 10, revokedSerials: [4], removedSerials: [1], thisUpdate: now, nextUpdate: now.AddHours(6)));
+
+        var merged = DeltaCrlMerger.Merge(baseCrl, delta);
+
+        Assert.Equal(ExpectedMerged, merged.RevokedSerialNumbers.OrderBy(value => value, StringComparer.Ordinal));
+        Assert.Equal(delta.ThisUpdate, merged.ThisUpdate);
+        Assert.Equal(baseCrl.NextUpdate, merged.NextUpdate);
+        Assert.True(merged.IsDelta);
+    }
+
+    /// <summary>
+    /// Ensures a delta that needs a newer base is rejected.
+    /// </summary>
+    [Fact]
+    public static void MergeRejectsStaleBase()
+    {
+        var parser = new CrlParser(SignatureValidationMode.None);
+        var baseCrl = parser.Parse(CrlTestBuilder.BuildCrlBytes(10));
+        var delta = parser.Parse(CrlTestBuilder.BuildCrlBytes(13, baseCrlNumber: 12));
+
+        Assert.False(DeltaCrlMerger.CanApply(baseCrl, delta));
+        _ = Assert.Throws<InvalidOperationException>(() => DeltaCrlMerger.Merge(baseCrl, delta));
+    }
+
+    /// <summary>
+    /// Ensures count-only parses still yield an estimated revoked count.
+    /// </summary>
+    [Fact]
+    public static void MergeEstimatesCountWhenSerialsNotRetained()
+    {
+        var parser = new CrlParser(SignatureValidationMode.None, countRevokedOnly: true);
+        var baseCrl = parser.Parse(CrlTestBuilder.BuildCrlBytes(10, revokedSerials: [1, 2, 3]));
+        var delta = parser.Parse(CrlTestBuilder.BuildCrlBytes(11, baseCrlNumber: 10, revokedSerials: [4, 5], removedSerials: [1]));
+
+        var merged = DeltaCrlMerger.Merge(baseCrl, delta);
+
+        Assert.False(merged.RevokedSerialNumbers.SerialsRetained);
+        Assert.Equal(4, merged.RevokedSerialNumbers.Count);
+    }
+}
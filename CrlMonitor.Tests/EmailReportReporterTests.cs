@@ -1,3 +1,4 @@
+using System.IO.Compression;
 using CrlMonitor.Diagnostics;
 using CrlMonitor.Models;
 using CrlMonitor.Notifications;
@@ -197,6 +198,66 @@ public static class EmailReportReporterTests
         Assert.True(client.WasSent);
     }
 
+    /// <summary>
+    /// Ensures a CSV above the threshold is gzip-compressed and decompresses to the shared CSV bytes.
+    /// </summary>
+    [Fact]
+    public static async Task CompressesCsvAttachmentAboveThreshold()
+    {
+        var options = new ReportOptions(
+            true,
+            new List<string> { "ops@example.com" },
+            "Test Report",
+            IncludeSummary: true,
+            IncludeFullCsv: true,
+            FrequencyHours: null,
+            new SmtpOptions("smtp.example.com", 25, "svc", "pw", "sender@example.com", true),
+            CsvAttachmentCompression.Gzip,
+            CsvCompressionThresholdBytes: 0);
+        var client = new RecordingEmailClient();
+        var reporter = new EmailReportReporter(options, client, new InMemoryStateStore(), new ReportingStatus(), null);
+        var run = BuildRun();
+
+        await reporter.ReportAsync(run, CancellationToken.None).ConfigureAwait(true);
+
+        var attachment = Assert.Single(client.LastMessage!.Attachments);
+        Assert.Equal("application/gzip", attachment.ContentType);
+        Assert.EndsWith(".csv.gz", attachment.FileName, StringComparison.Ordinal);
+        Assert.Contains("Full CSV attached (compressed as", client.LastMessage.Body, StringComparison.Ordinal);
+        using var gzip = new GZipStream(new MemoryStream(attachment.Content), CompressionMode.Decompress);
+        using var decompressed = new MemoryStream();
+        await gzip.CopyToAsync(decompressed).ConfigureAwait(true);
+        var csv = await RunRenderCache.For(run).GetCsvAsync(CancellationToken.None).ConfigureAwait(true);
+        Assert.Equal(csv, decompressed.ToArray());
+    }
+
+    /// <summary>
+    /// Ensures a CSV below the threshold is attached uncompressed even when compression is configured.
+    /// </summary>
+    [Fact]
+    public static async Task LeavesSmallCsvAttachmentUncompressed()
+    {
+        var options = new ReportOptions(
+            true,
+            new List<string> { "ops@example.com" },
+            "Test Report",
+            IncludeSummary: true,
+            IncludeFullCsv: true,
+            FrequencyHours: null,
+            new SmtpOptions("smtp.example.com", 25, "svc", "pw", "sender@example.com", true),
+            CsvAttachmentCompression.Zip,
+            CsvCompressionThresholdBytes: 1024 * 1024);
+        var client = new RecordingEmailClient();
+        var reporter = new EmailReportReporter(options, client, new InMemoryStateStore(), new ReportingStatus(), null);
+
+        await reporter.ReportAsync(BuildRun(), CancellationToken.None).ConfigureAwait(true);
+
+        var attachment = Assert.Single(client.LastMessage!.Attachments);
+        Assert.Equal("text/csv", attachment.ContentType);
+        Assert.EndsWith(".csv", attachment.FileName, StringComparison.Ordinal);
+        Assert.Contains("Full CSV attached.", client.LastMessage.Body, StringComparison.Ordinal);
+    }
+
     private static CrlCheckRun BuildRun()
     {
         var now = DateTime.UtcNow;
@@ -242,6 +303,26 @@ public static class EmailReportReporterTests
         {
             return Task.CompletedTask;
         }
+
+        public Task<IReadOnlyDictionary<Uri, DateTime>> GetLastFetchesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<IReadOnlyDictionary<Uri, DateTime>>(new Dictionary<Uri, DateTime>());
+        }
+
+        public Task<IReadOnlyDictionary<Uri, CrlHistory>> GetCrlHistoriesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<IReadOnlyDictionary<Uri, CrlHistory>>(new Dictionary<Uri, CrlHistory>());
+        }
+
+        public Task<IReadOnlyDictionary<string, DateTime>> GetAlertCooldownsAsync(IReadOnlyCollection<string> keys, CancellationToken cancellationToken)
+        {
+            return Task.FromResult<IReadOnlyDictionary<string, DateTime>>(new Dictionary<string, DateTime>());
+        }
+
+        public Task SaveBatchAsync(StateBatch batch, CancellationToken cancellationToken)
+        {
+            return Task.CompletedTask;
+        }
     }
 
     private sealed class RecordingEmailClient : IEmailClient
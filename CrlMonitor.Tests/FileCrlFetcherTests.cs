@@ -22,9 +22,9 @@ public static class FileCrlFetcherTests
         try
         {
             var entry = new CrlConfigEntry(new Uri(tempPath), SignatureValidationMode.None, null, 0.8, null, 10 * 1024 * 1024);
-            var result = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
+            using var result = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
 
-            Assert.Equal(bytes, result.Content);
+            Assert.Equal(bytes, result.Content.ToArray());
         }
         finally
         {
@@ -53,4 +53,36 @@ public static class FileCrlFetcherTests
             File.Delete(tempPath);
         }
     }
+
+    /// <summary>
+    /// Ensures large files are served from a memory-mapped view with the same contents.
+    /// </summary>
+    [Fact]
+    public static async Task FetchAsyncMapsLargeFiles()
+    {
+        var fetcher = new FileCrlFetcher();
+        var bytes = new byte[FileCrlFetcher.MemoryMapThresholdBytes + 17];
+        for (var index = 0; index < bytes.Length; index++)
+        {
+            bytes[index] = (byte)(index % 251);
+        }
+
+        var tempPath = Path.Combine(Path.GetTempPath(), Path.GetRandomFileName());
+        await File.WriteAllBytesAsync(tempPath, bytes).ConfigureAwait(true);
+
+        try
+        {
+            var entry = new CrlConfigEntry(new Uri(tempPath), SignatureValidationMode.None, null, 0.8, null, 10 * 1024 * 1024);
+            using (var result = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true))
+            {
+                _ = Assert.IsType<MemoryMappedCrlContent>(result.ContentOwner);
+                Assert.Equal(bytes.LongLength, result.ContentLength);
+                Assert.True(result.Content.Span.SequenceEqual(bytes));
+            }
+        }
+        finally
+        {
+            File.Delete(tempPath);
+        }
+    }
 }
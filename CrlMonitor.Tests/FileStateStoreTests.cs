@@ -7,6 +7,8 @@ namespace CrlMonitor.Tests;
 /// </summary>
 public static class FileStateStoreTests
 {
+    private static readonly string[] CooldownLookupKeys = ["KEY", "other"];
+
     /// <summary>
     /// Missing file returns null state.
     /// </summary>
@@ -144,6 +146,222 @@ public static class FileStateStoreTests
 #pragma warning restore CA2007
     }
 
+    /// <summary>
+    /// Changes recorded in the journal are visible to a new store before compaction.
+    /// </summary>
+    [Fact]
+    public static async Task JournalEntriesAreReplayedOnLoad()
+    {
+#pragma warning disable CA2007
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "state.json");
+        var first = new Uri("http://a.example.com");
+        var second = new Uri("http://b.example.com");
+        var timestamp = DateTime.UtcNow;
+        using var writer = new FileStateStore(path);
+
+        await writer.SaveLastFetchAsync(first, timestamp, CancellationToken.None);
+        await writer.SaveLastFetchAsync(second, timestamp.AddMinutes(1), CancellationToken.None);
+        await writer.SaveAlertCooldownAsync("key", timestamp, CancellationToken.None);
+
+        Assert.True(File.Exists(path + ".journal"));
+        using var reader = new FileStateStore(path);
+        Assert.Equal(timestamp, await reader.GetLastFetchAsync(first, CancellationToken.None));
+        Assert.Equal(timestamp.AddMinutes(1), await reader.GetLastFetchAsync(second, CancellationToken.None));
+        Assert.Equal(timestamp, await reader.GetAlertCooldownAsync("key", CancellationToken.None));
+    }
+
+    /// <summary>
+    /// Disposing folds the journal into the snapshot file.
+    /// </summary>
+    [Fact]
+    public static async Task DisposeCompactsJournalIntoSnapshot()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "state.json");
+        var sentAt = DateTime.UtcNow;
+        using (var store = new FileStateStore(path))
+        {
+            await store.SaveLastFetchAsync(new Uri("http://a.example.com"), sentAt, CancellationToken.None);
+            await store.SaveLastReportSentAsync(sentAt, CancellationToken.None);
+        }
+
+        Assert.False(File.Exists(path + ".journal"));
+        Assert.Contains("last_report_sent_utc", await File.ReadAllTextAsync(path), StringComparison.Ordinal);
+        using var reloaded = new FileStateStore(path);
+        Assert.Equal(sentAt, await reloaded.GetLastReportSentAsync(CancellationToken.None));
+    }
+
+    /// <summary>
+    /// A committed batch lands in the journal in one append and is read back by the bulk lookups.
+    /// </summary>
+    [Fact]
+    public static async Task CommittedBatchIsReadBackByBulkLookups()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "state.json");
+        var first = new Uri("http://a.example.com");
+        var second = new Uri("http://b.example.com");
+        var unknown = new Uri("http://c.example.com");
+        var timestamp = DateTime.UtcNow;
+        using var writer = new FileStateStore(path);
+        await writer.SaveLastReportSentAsync(timestamp, CancellationToken.None);
+        var batch = new StateBatch(writer);
+        batch.SetLastFetch(first, timestamp);
+        batch.SetLastFetch(second, timestamp.AddMinutes(1));
+        batch.SetLastFetch(second, timestamp.AddMinutes(2));
+        batch.SetAlertCooldown("key", timestamp);
+
+        await batch.CommitAsync(CancellationToken.None);
+
+        Assert.Equal(0, batch.Count);
+        Assert.Equal(3, (await File.ReadAllLinesAsync(path + ".journal")).Length);
+        using var reader = new FileStateStore(path);
+        var fetches = await reader.GetLastFetchesAsync([first, second, unknown], CancellationToken.None);
+        Assert.Equal(2, fetches.Count);
+        Assert.Equal(timestamp, fetches[first]);
+        Assert.Equal(timestamp.AddMinutes(2), fetches[second]);
+        var cooldowns = await reader.GetAlertCooldownsAsync(CooldownLookupKeys, CancellationToken.None);
+        Assert.Equal(timestamp, Assert.Single(cooldowns).Value);
+    }
+
+    /// <summary>
+    /// Recorded validity and failures survive compaction, and a CRL that loses its next update forgets the old one.
+    /// </summary>
+    [Fact]
+    public static async Task CrlHistoriesSurviveReload()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "state.json");
+        var first = new Uri("http://a.example.com");
+        var second = new Uri("http://b.example.com");
+        var unknown = new Uri("http://c.example.com");
+        var timestamp = DateTime.UtcNow;
+        using (var writer = new FileStateStore(path))
+        {
+            var batch = new StateBatch(writer);
+            batch.SetLastFetch(first, timestamp);
+            batch.SetValidity(first, timestamp.AddHours(-1), timestamp.AddDays(7));
+            batch.SetLastFailure(second, timestamp);
+            await batch.CommitAsync(CancellationToken.None);
+            batch.SetValidity(first, timestamp, null);
+            await batch.CommitAsync(CancellationToken.None);
+        }
+
+        using var reader = new FileStateStore(path);
+        var histories = await reader.GetCrlHistoriesAsync([first, second, unknown], CancellationToken.None);
+
+        Assert.Equal(2, histories.Count);
+        Assert.Equal(timestamp, histories[first].ThisUpdate);
+        Assert.Null(histories[first].NextUpdate);
+        Assert.False(histories[first].LastCheckFailed);
+        Assert.True(histories[second].LastCheckFailed);
+    }
+
+    /// <summary>
+    /// A torn trailing journal line does not discard earlier entries.
+    /// </summary>
+    [Fact]
+    public static async Task TornJournalLineIsIgnored()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "state.json");
+        var uri = new Uri("http://a.example.com");
+        var timestamp = DateTime.UtcNow;
+        using (var store = new FileStateStore(path))
+        {
+            await store.SaveLastReportSentAsync(timestamp, CancellationToken.None);
+        }
+
+        await File.WriteAllTextAsync(
+            path + ".journal",
+            FormattableString.Invariant($"{{\"type\":\"last_fetch\",\"key\":\"{uri}\",\"value\":\"{timestamp:O}\"}}\n{{\"type\":\"last_fe"));
+        using var reloaded = new FileStateStore(path);
+
+        Assert.Equal(timestamp, await reloaded.GetLastFetchAsync(uri, CancellationToken.None));
+        Assert.Equal(timestamp, await reloaded.GetLastReportSentAsync(CancellationToken.None));
+    }
+
+    /// <summary>
+    /// An append after a torn trailing journal line starts on a fresh line, so the new entry is not lost.
+    /// </summary>
+    [Fact]
+    public static async Task AppendAfterTornJournalLineKeepsNewEntry()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "state.json");
+        var first = new Uri("http://a.example.com");
+        var second = new Uri("http://b.example.com");
+        var timestamp = DateTime.UtcNow;
+        using (var store = new FileStateStore(path))
+        {
+            await store.SaveLastReportSentAsync(timestamp, CancellationToken.None);
+        }
+
+        await File.WriteAllTextAsync(
+            path + ".journal",
+            FormattableString.Invariant($"{{\"type\":\"last_fetch\",\"key\":\"{first}\",\"value\":\"{timestamp:O}\"}}\n{{\"type\":\"last_fe"));
+        using (var store = new FileStateStore(path))
+        {
+            await store.SaveLastFetchAsync(second, timestamp, CancellationToken.None);
+            Assert.Equal(2, (await File.ReadAllLinesAsync(path + ".journal")).Length);
+        }
+
+        using var reloaded = new FileStateStore(path);
+        Assert.Equal(timestamp, await reloaded.GetLastFetchAsync(first, CancellationToken.None));
+        Assert.Equal(timestamp, await reloaded.GetLastFetchAsync(second, CancellationToken.None));
+    }
+
+    /// <summary>
+    /// Two stores sharing one state file keep each other's updates through appends, compaction and disposal.
+    /// </summary>
+    [Fact]
+    public static async Task StoresSharingFileKeepEachOthersUpdates()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "state.json");
+        var first = new Uri("http://a.example.com");
+        var second = new Uri("http://b.example.com");
+        var timestamp = DateTime.UtcNow;
+        using var one = new FileStateStore(path);
+        using var two = new FileStateStore(path);
+
+        await one.SaveLastFetchAsync(first, timestamp, CancellationToken.None);
+        await two.SaveLastFetchAsync(second, timestamp.AddMinutes(1), CancellationToken.None);
+        await one.SaveAlertCooldownAsync("key", timestamp, CancellationToken.None);
+        one.Dispose();
+        await two.SaveLastReportSentAsync(timestamp, CancellationToken.None);
+        two.Dispose();
+
+        using var reloaded = new FileStateStore(path);
+        Assert.Equal(timestamp, await reloaded.GetLastFetchAsync(first, CancellationToken.None));
+        Assert.Equal(timestamp.AddMinutes(1), await reloaded.GetLastFetchAsync(second, CancellationToken.None));
+        Assert.Equal(timestamp, await reloaded.GetAlertCooldownAsync("key", CancellationToken.None));
+        Assert.Equal(timestamp, await reloaded.GetLastReportSentAsync(CancellationToken.None));
+    }
+
+    /// <summary>
+    /// A change that cannot be written is not visible from memory either.
+    /// </summary>
+    [Fact]
+    public static async Task FailedWriteDoesNotChangeMemory()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "state.json");
+        var uri = new Uri("http://a.example.com");
+        var timestamp = DateTime.UtcNow;
+        using var store = new FileStateStore(path);
+        await store.SaveLastFetchAsync(uri, timestamp, CancellationToken.None);
+
+        // A directory where the journal belongs makes the next append fail.
+        _ = Directory.CreateDirectory(path + ".journal");
+        _ = await Assert.ThrowsAnyAsync<UnauthorizedAccessException>(
+            () => store.SaveLastFetchAsync(uri, timestamp.AddMinutes(1), CancellationToken.None));
+
+        Assert.Equal(timestamp, await store.GetLastFetchAsync(uri, CancellationToken.None));
+#pragma warning restore CA2007
+    }
+
     private sealed class TempFolder : IDisposable
     {
         public TempFolder()
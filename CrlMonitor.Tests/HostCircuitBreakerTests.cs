@@ -0,0 +1,75 @@
+using CrlMonitor.Runner;
+
+namespace CrlMonitor.Tests;
+
+/// <summary>
+/// Tests for <see cref="HostCircuitBreaker"/>.
+/// </summary>
+public static class HostCircuitBreakerTests
+{
+    private static readonly DateTime Start = new(2026, 3, 4, 5, 6, 7, DateTimeKind.Utc);
+
+    /// <summary>
+    /// Ensures an open circuit turns CRLs away until the cool-down has passed, then lets a single probe through.
+    /// </summary>
+    [Fact]
+    public static void TryEnterAllowsOneProbeAfterCooldown()
+    {
+        var now = Start;
+        var breaker = new HostCircuitBreaker(2, TimeSpan.FromSeconds(30), () => now);
+
+        Assert.False(breaker.RecordFailure("crl.example.com"));
+        Assert.True(breaker.RecordFailure("crl.example.com"));
+        Assert.False(breaker.TryEnter("crl.example.com"));
+        Assert.True(breaker.TryEnter("other.example.com"));
+
+        now = Start.AddSeconds(30);
+        Assert.True(breaker.TryEnter("crl.example.com"));
+        Assert.False(breaker.TryEnter("crl.example.com"));
+
+        breaker.RecordSuccess("crl.example.com");
+        Assert.False(breaker.IsOpen("crl.example.com"));
+        Assert.True(breaker.TryEnter("crl.example.com"));
+    }
+
+    /// <summary>
+    /// Ensures a failed probe reopens the circuit for another full cool-down without reporting it as newly opened.
+    /// </summary>
+    [Fact]
+    public static void RecordFailureReopensAfterFailedProbe()
+    {
+        var now = Start;
+        var breaker = new HostCircuitBreaker(1, TimeSpan.FromSeconds(30), () => now);
+        Assert.True(breaker.RecordFailure("crl.example.com"));
+
+        now = Start.AddSeconds(45);
+        Assert.True(breaker.TryEnter("crl.example.com"));
+        Assert.False(breaker.RecordFailure("crl.example.com"));
+
+        now = Start.AddSeconds(60);
+        Assert.False(breaker.TryEnter("crl.example.com"));
+        now = Start.AddSeconds(75);
+        Assert.True(breaker.TryEnter("crl.example.com"));
+    }
+
+    /// <summary>
+    /// Ensures a probe in flight does not count as open, and a released probe reopens the circuit for the next caller.
+    /// </summary>
+    [Fact]
+    public static void ReleaseProbeReopensCircuitForNextProbe()
+    {
+        var now = Start;
+        var breaker = new HostCircuitBreaker(1, TimeSpan.FromSeconds(30), () => now);
+        Assert.True(breaker.RecordFailure("crl.example.com"));
+        Assert.True(breaker.IsOpen("crl.example.com"));
+
+        now = Start.AddSeconds(30);
+        Assert.True(breaker.TryEnter("crl.example.com"));
+        Assert.False(breaker.IsOpen("crl.example.com"));
+        Assert.False(breaker.TryEnter("crl.example.com"));
+
+        breaker.ReleaseProbe("crl.example.com");
+        Assert.True(breaker.IsOpen("crl.example.com"));
+        Assert.True(breaker.TryEnter("crl.example.com"));
+    }
+}
@@ -0,0 +1,249 @@
+using System.Net;
+using CrlMonitor.Fetching;
+
+namespace CrlMonitor.Tests;
+
+/// <summary>
+/// Tests for <see cref="HostThrottlingHandler"/> and <see cref="TokenBucket"/>.
+/// </summary>
+public static class HostThrottlingHandlerTests
+{
+    /// <summary>
+    /// Ensures concurrent requests are capped per host while other hosts proceed independently.
+    /// </summary>
+    [Fact]
+    public static async Task SendAsyncCapsConcurrencyPerHost()
+    {
+        var options = new HttpClientOptions(2, 0, 2, TimeSpan.FromMinutes(5), TimeSpan.FromSeconds(90), false, true);
+        using var inner = new SlowHandler(TimeSpan.FromMilliseconds(100));
+        using var handler = new HostThrottlingHandler(options) { InnerHandler = inner };
+        using var client = new HttpClient(handler);
+
+        var requests = Enumerable.Range(0, 6)
+            .Select(index => client.GetAsync(new Uri($"http://cdn.example.com/{index}.crl")))
+            .Append(client.GetAsync(new Uri("http://other.example.com/root.crl")))
+            .ToList();
+        var responses = await Task.WhenAll(requests).ConfigureAwait(true);
+        foreach (var response in responses)
+        {
+            response.Dispose();
+        }
+
+        Assert.Equal(2, inner.MaxConcurrency("cdn.example.com"));
+        Assert.Equal(1, inner.MaxConcurrency("other.example.com"));
+    }
+
+    /// <summary>
+    /// Ensures the per-host cap still holds while response bodies are downloading, not just until headers arrive.
+    /// </summary>
+    [Fact]
+    public static async Task SendAsyncHoldsSlotUntilBodyIsRead()
+    {
+        var options = new HttpClientOptions(2, 0, 2, TimeSpan.FromMinutes(5), TimeSpan.FromSeconds(90), false, true);
+        using var inner = new SlowBodyHandler(TimeSpan.FromMilliseconds(100));
+        using var handler = new HostThrottlingHandler(options) { InnerHandler = inner };
+        using var client = new HttpClient(handler);
+
+        var downloads = Enumerable.Range(0, 6)
+            .Select(index => DownloadAsync(client, new Uri($"http://cdn.example.com/{index}.crl")))
+            .ToList();
+        await Task.WhenAll(downloads).ConfigureAwait(true);
+
+        Assert.Equal(2, inner.MaxOpenBodies);
+    }
+
+    private static async Task DownloadAsync(HttpClient client, Uri uri)
+    {
+        using var response = await client.GetAsync(uri, HttpCompletionOption.ResponseHeadersRead).ConfigureAwait(true);
+        using var stream = await response.Content.ReadAsStreamAsync().ConfigureAwait(true);
+        var buffer = new byte[16];
+        while (await stream.ReadAsync(buffer).ConfigureAwait(true) > 0)
+        {
+        }
+    }
+
+    /// <summary>
+    /// Ensures the token bucket allows a burst and then refills at the configured rate.
+    /// </summary>
+    [Fact]
+    public static void TokenBucketAllowsBurstThenRefills()
+    {
+        var now = new DateTime(2025, 1, 1, 0, 0, 0, DateTimeKind.Utc);
+        var bucket = new TokenBucket(2, 3, () => now);
+
+        Assert.True(bucket.TryAcquire(out _));
+        Assert.True(bucket.TryAcquire(out _));
+        Assert.True(bucket.TryAcquire(out _));
+        Assert.False(bucket.TryAcquire(out var retryAfter));
+        Assert.Equal(TimeSpan.FromMilliseconds(500), retryAfter);
+
+        now = now.AddMilliseconds(500);
+        Assert.True(bucket.TryAcquire(out _));
+        Assert.False(bucket.TryAcquire(out _));
+
+        now = now.AddSeconds(10);
+        for (var index = 0; index < 3; index++)
+        {
+            Assert.True(bucket.TryAcquire(out _));
+        }
+
+        Assert.False(bucket.TryAcquire(out _));
+    }
+
+    private sealed class SlowHandler(TimeSpan delay) : HttpMessageHandler
+    {
+        private readonly TimeSpan _delay = delay;
+        private readonly object _sync = new();
+        private readonly Dictionary<string, int> _current = new(StringComparer.OrdinalIgnoreCase);
+        private readonly Dictionary<string, int> _max = new(StringComparer.OrdinalIgnoreCase);
+
+        public int MaxConcurrency(string host)
+        {
+            lock (this._sync)
+            {
+                return this._max.GetValueOrDefault(host);
+            }
+        }
+
+        protected override async Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            var host = request.RequestUri!.Host;
+            lock (this._sync)
+            {
+                var current = this._current.GetValueOrDefault(host) + 1;
+                this._current[host] = current;
+                this._max[host] = Math.Max(this._max.GetValueOrDefault(host), current);
+            }
+
+            try
+            {
+                await Task.Delay(this._delay, cancellationToken).ConfigureAwait(true);
+                return new HttpResponseMessage(HttpStatusCode.OK);
+            }
+            finally
+            {
+                lock (this._sync)
+                {
+                    this._current[host]--;
+                }
+            }
+        }
+    }
+
+    private sealed class SlowBodyHandler(TimeSpan delay) : HttpMessageHandler
+    {
+        private readonly TimeSpan _delay = delay;
+        private readonly object _sync = new();
+        private int _open;
+        private int _max;
+
+        public int MaxOpenBodies
+        {
+            get
+            {
+                lock (this._sync)
+                {
+                    return this._max;
+                }
+            }
+        }
+
+        protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            lock (this._sync)
+            {
+                this._open++;
+                this._max = Math.Max(this._max, this._open);
+            }
+
+            // Headers come back at once; the body then takes a while, and counts as open until it has been read.
+            return Task.FromResult(new HttpResponseMessage(HttpStatusCode.OK) {
+                Content = new StreamContent(new SlowBodyStream(this._delay, this.CloseBody))
+            });
+        }
+
+        private void CloseBody()
+        {
+            lock (this._sync)
+            {
+                this._open--;
+            }
+        }
+    }
+
+    private sealed class SlowBodyStream(TimeSpan delay, Action onEnd) : Stream
+    {
+        private readonly TimeSpan _delay = delay;
+        private readonly Action _onEnd = onEnd;
+        private bool _sent;
+        private bool _ended;
+
+        public override bool CanRead => true;
+
+        public override bool CanSeek => false;
+
+        public override bool CanWrite => false;
+
+        public override long Length => throw new NotSupportedException();
+
+        public override long Position
+        {
+            get => throw new NotSupportedException();
+            set => throw new NotSupportedException();
+        }
+
+        public override int Read(byte[] buffer, int offset, int count)
+        {
+            Thread.Sleep(this._delay);
+            return this.Next(buffer.AsSpan(offset, count));
+        }
+
+        public override async ValueTask<int> ReadAsync(Memory<byte> buffer, CancellationToken cancellationToken = default)
+        {
+            await Task.Delay(this._delay, cancellationToken).ConfigureAwait(true);
+            return this.Next(buffer.Span);
+        }
+
+        public override Task<int> ReadAsync(byte[] buffer, int offset, int count, CancellationToken cancellationToken)
+        {
+            return this.ReadAsync(buffer.AsMemory(offset, count), cancellationToken).AsTask();
+        }
+
+        public override void Flush()
+        {
+        }
+
+        public override long Seek(long offset, SeekOrigin origin)
+        {
+            throw new NotSupportedException();
+        }
+
+        public override void SetLength(long value)
+        {
+            throw new NotSupportedException();
+        }
+
+        public override void Write(byte[] buffer, int offset, int count)
+        {
+            throw new NotSupportedException();
+        }
+
+        private int Next(Span<byte> buffer)
+        {
+            if (!this._sent)
+            {
+                this._sent = true;
+                buffer[0] = 1;
+                return 1;
+            }
+
+            if (!this._ended)
+            {
+                this._ended = true;
+                this._onEnd();
+            }
+
+            return 0;
+        }
+    }
+}
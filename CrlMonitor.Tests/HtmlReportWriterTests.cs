@@ -1,3 +1,4 @@
+using System.Text.Json;
 using CrlMonitor.Models;
 using CrlMonitor.Reporting;
 
@@ -35,6 +36,29 @@ public static class HtmlReportWriterTests
         Assert.Contains("ERROR", content, StringComparison.Ordinal);
     }
 
+    /// <summary>
+    /// Ensures run-level stage percentiles and the per-entry breakdown are rendered.
+    /// </summary>
+    [Fact]
+    public static async Task WriteAsyncIncludesStageTimings()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "report.html");
+        var now = DateTime.UtcNow;
+        var timings = new CrlStageTimings(Dns: TimeSpan.FromMilliseconds(3), Transfer: TimeSpan.FromMilliseconds(20), Parse: TimeSpan.FromMilliseconds(1.5));
+        var result = new CrlCheckResult(new Uri("http://example.com"), CrlStatus.Ok, TimeSpan.Zero, null, null, null, TimeSpan.FromMilliseconds(25), 100, now, "Valid", Timings: timings);
+        var diagnostics = new Diagnostics.RunDiagnostics();
+        diagnostics.RecordStageTimings(timings);
+        var run = new CrlCheckRun([result], diagnostics, now);
+
+        await HtmlReportWriter.WriteAsync(path, run, CancellationToken.None).ConfigureAwait(true);
+
+        var content = await File.ReadAllTextAsync(path).ConfigureAwait(true);
+        Assert.Contains("Stage Timings (ms)", content, StringComparison.Ordinal);
+        Assert.Contains("<tr><td>Transfer</td><td>1</td><td>20.0</td>", content, StringComparison.Ordinal);
+        Assert.Contains("title=\"DNS 3.0 ms | Transfer 20.0 ms | Parse 1.5 ms\"", content, StringComparison.Ordinal);
+    }
+
     /// <summary>
     /// Ensures short HTTP/HTTPS URIs are wrapped in clickable anchor tags.
     /// </summary>
@@ -111,6 +135,67 @@ public static class HtmlReportWriterTests
         Assert.Contains(fileUri, content, StringComparison.Ordinal);
     }
 
+    /// <summary>
+    /// Ensures the data file mode moves rows into JSON, in status order, and replaces the previous report without leaving temp files.
+    /// </summary>
+    [Fact]
+    public static async Task WriteAsyncWithDataFileWritesRowsAsJson()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "report.html");
+        await File.WriteAllTextAsync(path, "stale").ConfigureAwait(true);
+        var now = new DateTime(2026, 3, 4, 5, 6, 7, DateTimeKind.Utc);
+        var results = new[]
+        {
+            new CrlCheckResult(new Uri("http://example.com/ok.crl"), CrlStatus.Ok, TimeSpan.Zero, null, null, null, TimeSpan.FromMilliseconds(12.4), 100, now, "Valid"),
+            new CrlCheckResult(new Uri("http://bad/ca.crl"), CrlStatus.Error, TimeSpan.Zero, null, "Failed", null, null, null, now, "Invalid")
+        };
+        var run = new CrlCheckRun(results, new Diagnostics.RunDiagnostics(), now);
+
+        await HtmlReportWriter.WriteAsync(path, run, useDataFile: true, CancellationToken.None).ConfigureAwait(true);
+
+        var content = await File.ReadAllTextAsync(path).ConfigureAwait(true);
+        Assert.Contains("CRLs Checked", content, StringComparison.Ordinal);
+        Assert.Contains(FormattableString.Invariant($"data-src=\"report.data.json?v={now.Ticks}\""), content, StringComparison.Ordinal);
+        Assert.DoesNotContain("http://example.com/ok.crl", content, StringComparison.Ordinal);
+
+        var dataPath = HtmlReportWriter.GetDataFilePath(path);
+        Assert.Equal(Path.Combine(temp.Path, "report.data.json"), dataPath);
+        using var data = JsonDocument.Parse(await File.ReadAllBytesAsync(dataPath).ConfigureAwait(true));
+        var rows = data.RootElement.GetProperty("rows");
+        Assert.Equal(2, rows.GetArrayLength());
+        Assert.Equal("http://bad/ca.crl", rows[0][0].GetString());
+        Assert.Equal("ERROR", rows[0][2].GetString());
+        Assert.Equal("Failed", rows[0][16].GetString());
+        Assert.Equal(JsonValueKind.Null, rows[0][6].ValueKind);
+        Assert.Equal("OK", rows[1][2].GetString());
+        Assert.Equal(100, rows[1][6].GetInt64());
+        Assert.Equal(12, rows[1][7].GetInt64());
+        Assert.Empty(Directory.GetFiles(temp.Path, "*.tmp"));
+    }
+
+    /// <summary>
+    /// Ensures deferred CRLs get a summary card and a rank in the client-side status sort.
+    /// </summary>
+    [Fact]
+    public static async Task WriteAsyncWithDataFileRanksDeferredStatus()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "report.html");
+        var now = new DateTime(2026, 3, 4, 5, 6, 7, DateTimeKind.Utc);
+        var results = new[]
+        {
+            new CrlCheckResult(new Uri("http://example.com/later.crl"), CrlStatus.Deferred, TimeSpan.Zero, null, "Deferred", null, null, null, now, null)
+        };
+        var run = new CrlCheckRun(results, new Diagnostics.RunDiagnostics(), now);
+
+        await HtmlReportWriter.WriteAsync(path, run, useDataFile: true, CancellationToken.None).ConfigureAwait(true);
+
+        var content = await File.ReadAllTextAsync(path).ConfigureAwait(true);
+        Assert.Contains("CRLs Deferred", content, StringComparison.Ordinal);
+        Assert.Contains("OK:4,DEFERRED:5}", content, StringComparison.Ordinal);
+    }
+
     private sealed class TempFolder : IDisposable
     {
         public string Path { get; } = Directory.CreateDirectory(System.IO.Path.Combine(System.IO.Path.GetTempPath(), Guid.NewGuid().ToString())).FullName;
@@ -1,4 +1,5 @@
 using System.Net;
+using System.Net.Http.Headers;
 using CrlMonitor.Crl;
 using CrlMonitor.Fetching;
 
@@ -23,14 +24,36 @@ public sealed class HttpCrlFetcherTests
         var fetcher = new HttpCrlFetcher(httpClient);
         var entry = new CrlConfigEntry(new Uri("http://localhost/crl"), SignatureValidationMode.None, null, 0.8, null, 10 * 1024 * 1024);
 
-        var fetched = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
+        using var fetched = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
 
-        Assert.Equal(responseBytes, fetched.Content);
+        Assert.Equal(responseBytes, fetched.Content.ToArray());
         Assert.Equal(responseBytes.Length, fetched.ContentLength);
         Assert.True(fetched.Duration >= TimeSpan.Zero);
         Assert.True(handler.RequestCount > 0);
     }
 
+    /// <summary>
+    /// Ensures time-to-first-byte and connection reuse are reported when the handler tracks connections.
+    /// </summary>
+    [Fact]
+    public async Task FetchAsyncReportsTimeToFirstByteAndConnectionReuse()
+    {
+        var options = new HttpClientOptions(4, 0, 4, TimeSpan.FromMinutes(5), TimeSpan.FromSeconds(90), false, true);
+        using var inner = new StubHandler(() => new HttpResponseMessage(HttpStatusCode.OK) {
+            Content = new ByteArrayContent([1, 2, 3])
+        });
+        using var throttling = new HostThrottlingHandler(options) { InnerHandler = inner };
+        using var httpClient = new HttpClient(throttling);
+        var fetcher = new HttpCrlFetcher(httpClient);
+        var entry = new CrlConfigEntry(new Uri("http://localhost/crl"), SignatureValidationMode.None, null, 0.8, null, 10 * 1024 * 1024);
+
+        using var fetched = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
+
+        Assert.NotNull(fetched.TimeToFirstByte);
+        Assert.True(fetched.TimeToFirstByte <= fetched.Duration);
+        Assert.True(fetched.ConnectionReused);
+    }
+
     /// <summary>
     /// Ensures non-success statuses bubble up as failures.
     /// </summary>
@@ -62,6 +85,113 @@ public sealed class HttpCrlFetcherTests
         _ = await Assert.ThrowsAsync<CrlTooLargeException>(() => fetcher.FetchAsync(entry, CancellationToken.None)).ConfigureAwait(true);
     }
 
+    /// <summary>
+    /// Ensures a 304 response reuses the cached bytes and reports a cache hit.
+    /// </summary>
+    [Fact]
+    public async Task FetchAsyncReusesCachedContentOnNotModified()
+    {
+        var responseBytes = new byte[] { 4, 5, 6, 7 };
+        var responses = new Queue<HttpResponseMessage>();
+        var fresh = new HttpResponseMessage(HttpStatusCode.OK) {
+            Content = new ByteArrayContent(responseBytes)
+        };
+        fresh.Headers.ETag = new EntityTagHeaderValue("\"v1\"");
+        responses.Enqueue(fresh);
+        responses.Enqueue(new HttpResponseMessage(HttpStatusCode.NotModified));
+        using var handler = new RecordingHandler(responses);
+        using var httpClient = new HttpClient(handler);
+        var cache = new InMemoryResponseCache();
+        var fetcher = new HttpCrlFetcher(httpClient, cache);
+        var entry = new CrlConfigEntry(new Uri("http://localhost/cached"), SignatureValidationMode.None, null, 0.8, null, 10 * 1024 * 1024);
+
+        using var first = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
+        using var second = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
+
+        Assert.False(first.CacheHit);
+        Assert.True(second.CacheHit);
+        Assert.Equal(responseBytes, second.Content.ToArray());
+        Assert.Equal(responseBytes.Length, second.ContentLength);
+        Assert.Empty(handler.Requests[0].IfNoneMatch);
+        Assert.Equal("\"v1\"", Assert.Single(handler.Requests[1].IfNoneMatch).ToString());
+    }
+
+    /// <summary>
+    /// Ensures responses without validators are not cached.
+    /// </summary>
+    [Fact]
+    public async Task FetchAsyncSkipsCacheWhenResponseHasNoValidators()
+    {
+        var responses = new Queue<HttpResponseMessage>();
+        responses.Enqueue(new HttpResponseMessage(HttpStatusCode.OK) {
+            Content = new ByteArrayContent([1, 2, 3])
+        });
+        using var handler = new RecordingHandler(responses);
+        using var httpClient = new HttpClient(handler);
+        var cache = new InMemoryResponseCache();
+        var fetcher = new HttpCrlFetcher(httpClient, cache);
+        var entry = new CrlConfigEntry(new Uri("http://localhost/uncached"), SignatureValidationMode.None, null, 0.8, null, 10 * 1024 * 1024);
+
+        using var fetched = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
+
+        Assert.Empty(cache.Entries);
+    }
+
+    /// <summary>
+    /// Ensures a request far slower than the host's usual time to first byte is hedged and the faster answer used.
+    /// </summary>
+    [Fact]
+    public async Task FetchAsyncHedgesSlowRequest()
+    {
+        using var handler = new StallingHandler(stalledRequest: 6);
+        using var httpClient = new HttpClient(handler);
+        var fetcher = new HttpCrlFetcher(httpClient, hedgeLatencyMultiplier: 3);
+        var entry = new CrlConfigEntry(new Uri("http://localhost/hedged"), SignatureValidationMode.None, null, 0.8, null, 10 * 1024 * 1024);
+        for (var index = 0; index < 5; index++)
+        {
+            using var warmup = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
+            Assert.False(warmup.Hedged);
+        }
+
+        using var fetched = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
+
+        Assert.True(fetched.Hedged);
+        Assert.Equal(new byte[] { 1, 2, 3 }, fetched.Content.ToArray());
+        Assert.Equal(7, handler.RequestCount);
+    }
+
+    /// <summary>
+    /// Ensures the file cache round-trips validators and content.
+    /// </summary>
+    [Fact]
+    public async Task FileResponseCacheRoundTripsEntries()
+    {
+        var directory = Path.Combine(Path.GetTempPath(), Guid.NewGuid().ToString());
+        try
+        {
+            var cache = new FileCrlResponseCache(directory);
+            var uri = new Uri("http://localhost/file-cache.crl");
+            var lastModified = new DateTimeOffset(2025, 1, 2, 3, 4, 5, TimeSpan.Zero);
+
+            await cache.SaveAsync(uri, new CachedCrlResponse("\"abc\"", lastModified, [9, 8, 7]), CancellationToken.None).ConfigureAwait(true);
+            var loaded = await cache.GetAsync(uri, CancellationToken.None).ConfigureAwait(true);
+            var missing = await cache.GetAsync(new Uri("http://localhost/other.crl"), CancellationToken.None).ConfigureAwait(true);
+
+            Assert.NotNull(loaded);
+            Assert.Equal("\"abc\"", loaded.ETag);
+            Assert.Equal(lastModified, loaded.LastModified);
+            Assert.Equal(new byte[] { 9, 8, 7 }, loaded.Content.ToArray());
+            Assert.Null(missing);
+        }
+        finally
+        {
+            if (Directory.Exists(directory))
+            {
+                Directory.Delete(directory, true);
+            }
+        }
+    }
+
     private sealed class StubHandler(Func<HttpResponseMessage> responseFactory) : HttpMessageHandler
     {
         private readonly Func<HttpResponseMessage> _responseFactory = responseFactory ?? throw new ArgumentNullException(nameof(responseFactory));
@@ -74,4 +204,51 @@ public sealed class HttpCrlFetcherTests
             return Task.FromResult(this._responseFactory());
         }
     }
+
+    private sealed class StallingHandler(int stalledRequest) : HttpMessageHandler
+    {
+        private int _requestCount;
+
+        public int RequestCount => Volatile.Read(ref this._requestCount);
+
+        protected override async Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            if (Interlocked.Increment(ref this._requestCount) == stalledRequest)
+            {
+                await Task.Delay(TimeSpan.FromSeconds(30), cancellationToken).ConfigureAwait(false);
+            }
+
+            return new HttpResponseMessage(HttpStatusCode.OK) { Content = new ByteArrayContent([1, 2, 3]) };
+        }
+    }
+
+    private sealed class RecordingHandler(Queue<HttpResponseMessage> responses) : HttpMessageHandler
+    {
+        private readonly Queue<HttpResponseMessage> _responses = responses ?? throw new ArgumentNullException(nameof(responses));
+
+        public List<HttpRequestHeaders> Requests { get; } = [];
+
+        protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            this.Requests.Add(request.Headers);
+            return Task.FromResult(this._responses.Dequeue());
+        }
+    }
+
+    private sealed class InMemoryResponseCache : ICrlResponseCache
+    {
+        public Dictionary<Uri, CachedCrlResponse> Entries { get; } = [];
+
+        public Task<CachedCrlResponse?> GetAsync(Uri uri, CancellationToken cancellationToken)
+        {
+            return Task.FromResult(this.Entries.TryGetValue(uri, out var cached) ? cached : null);
+        }
+
+        public Task SaveAsync(Uri uri, CachedCrlResponse response, CancellationToken cancellationToken)
+        {
+            // The content may sit in the fetcher's pooled buffer, so it is copied like a real cache would.
+            this.Entries[uri] = response with { Content = response.Content.ToArray() };
+            return Task.CompletedTask;
+        }
+    }
 }
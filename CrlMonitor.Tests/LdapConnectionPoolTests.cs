@@ -0,0 +1,172 @@
+using System.DirectoryServices.Protocols;
+using CrlMonitor.Fetching;
+
+namespace CrlMonitor.Tests;
+
+/// <summary>
+/// Tests for <see cref="LdapConnectionPool"/>.
+/// </summary>
+public static class LdapConnectionPoolTests
+{
+    private static readonly string[] Attributes = ["certificateRevocationList;binary"];
+
+    /// <summary>
+    /// Ensures sequential fetches against the same directory reuse one bound connection.
+    /// </summary>
+    [Fact]
+    public static async Task OpenAsyncReusesConnectionForSameDirectory()
+    {
+        var inner = new CountingFactory();
+        using var pool = new LdapConnectionPool(inner);
+        var credentials = new LdapCredentials("user", "pw");
+
+        using (var first = await pool.OpenAsync(new Uri("ldap://dc1.example.com/CN=A"), credentials, CancellationToken.None).ConfigureAwait(true))
+        {
+            _ = await first.SearchAsync("CN=A", Attributes, CancellationToken.None).ConfigureAwait(true);
+        }
+
+        using (var second = await pool.OpenAsync(new Uri("ldap://DC1.example.com/CN=B"), credentials, CancellationToken.None).ConfigureAwait(true))
+        {
+            _ = await second.SearchAsync("CN=B", Attributes, CancellationToken.None).ConfigureAwait(true);
+        }
+
+        Assert.Equal(1, inner.OpenCount);
+        Assert.Equal(1, pool.IdleCount);
+    }
+
+    /// <summary>
+    /// Ensures different credentials or ports never share a connection.
+    /// </summary>
+    [Fact]
+    public static async Task OpenAsyncSeparatesCredentialsAndPorts()
+    {
+        var inner = new CountingFactory();
+        using var pool = new LdapConnectionPool(inner);
+
+        using (await pool.OpenAsync(new Uri("ldap://dc1.example.com/CN=A"), new LdapCredentials("user", "pw"), CancellationToken.None).ConfigureAwait(true))
+        {
+        }
+
+        using (await pool.OpenAsync(new Uri("ldap://dc1.example.com/CN=A"), new LdapCredentials("other", "pw"), CancellationToken.None).ConfigureAwait(true))
+        {
+        }
+
+        using (await pool.OpenAsync(new Uri("ldap://dc1.example.com:3268/CN=A"), new LdapCredentials("user", "pw"), CancellationToken.None).ConfigureAwait(true))
+        {
+        }
+
+        Assert.Equal(3, inner.OpenCount);
+    }
+
+    /// <summary>
+    /// Ensures a connection that failed is closed rather than returned to the pool.
+    /// </summary>
+    [Fact]
+    public static async Task FailedConnectionIsNotReused()
+    {
+        var inner = new CountingFactory { FailSearches = 1 };
+        using var pool = new LdapConnectionPool(inner);
+        var uri = new Uri("ldap://dc1.example.com/CN=A");
+
+        using (var connection = await pool.OpenAsync(uri, null, CancellationToken.None).ConfigureAwait(true))
+        {
+            _ = await Assert.ThrowsAsync<LdapException>(() => connection.SearchAsync("CN=A", Attributes, CancellationToken.None)).ConfigureAwait(true);
+        }
+
+        Assert.Equal(0, pool.IdleCount);
+        Assert.Equal(1, inner.DisposeCount);
+    }
+
+    /// <summary>
+    /// Ensures a pooled connection dropped by the server is replaced transparently.
+    /// </summary>
+    [Fact]
+    public static async Task StaleReusedConnectionIsReplaced()
+    {
+        var inner = new CountingFactory();
+        using var pool = new LdapConnectionPool(inner);
+        var uri = new Uri("ldap://dc1.example.com/CN=A");
+        using (await pool.OpenAsync(uri, null, CancellationToken.None).ConfigureAwait(true))
+        {
+        }
+
+        inner.FailSearches = 1;
+        using (var connection = await pool.OpenAsync(uri, null, CancellationToken.None).ConfigureAwait(true))
+        {
+            var values = await connection.SearchAsync("CN=A", Attributes, CancellationToken.None).ConfigureAwait(true);
+            Assert.NotEmpty(values);
+        }
+
+        Assert.Equal(2, inner.OpenCount);
+        Assert.Equal(1, pool.IdleCount);
+    }
+
+    /// <summary>
+    /// Ensures connections idle past the timeout are closed instead of reused.
+    /// </summary>
+    [Fact]
+    public static async Task IdleConnectionsExpire()
+    {
+        var now = new DateTime(2025, 1, 1, 0, 0, 0, DateTimeKind.Utc);
+        var inner = new CountingFactory();
+        using var pool = new LdapConnectionPool(inner, TimeSpan.FromMinutes(1), () => now);
+        var uri = new Uri("ldap://dc1.example.com/CN=A");
+        using (await pool.OpenAsync(uri, null, CancellationToken.None).ConfigureAwait(true))
+        {
+        }
+
+        now = now.AddMinutes(5);
+        using (await pool.OpenAsync(uri, null, CancellationToken.None).ConfigureAwait(true))
+        {
+        }
+
+        Assert.Equal(2, inner.OpenCount);
+        Assert.Equal(1, inner.DisposeCount);
+    }
+
+    private sealed class CountingFactory : ILdapConnectionFactory
+    {
+        private int _openCount;
+        private int _disposeCount;
+
+        public int OpenCount => Volatile.Read(ref this._openCount);
+
+        public int DisposeCount => Volatile.Read(ref this._disposeCount);
+
+        public int FailSearches { get; set; }
+
+        public Task<ILdapConnection> OpenAsync(Uri uri, LdapCredentials? credentials, CancellationToken cancellationToken)
+        {
+            _ = Interlocked.Increment(ref this._openCount);
+            return Task.FromResult<ILdapConnection>(new CountingConnection(this));
+        }
+
+        private sealed class CountingConnection(CountingFactory owner) : ILdapConnection
+        {
+            private readonly CountingFactory _owner = owner;
+
+            public Task<IReadOnlyDictionary<string, byte[][]>> SearchAsync(
+                string distinguishedName,
+                IReadOnlyList<string> attributeNames,
+                CancellationToken cancellationToken)
+            {
+                if (this._owner.FailSearches > 0)
+                {
+                    this._owner.FailSearches--;
+                    throw new LdapException(81, "The LDAP server is unavailable.");
+                }
+
+                IReadOnlyDictionary<string, byte[][]> values = new Dictionary<string, byte[][]>
+                {
+                    [attributeNames[0]] = [[1, 2, 3]]
+                };
+                return Task.FromResult(values);
+            }
+
+            public void Dispose()
+            {
+                _ = Interlocked.Increment(ref this._owner._disposeCount);
+            }
+        }
+    }
+}
@@ -19,9 +19,9 @@ public static class LdapCrlFetcherTests
         var fetcher = new LdapCrlFetcher(factory);
         var entry = new CrlConfigEntry(new Uri("ldap://dc1.example.com/CN=Example,O=Corp"), SignatureValidationMode.None, null, 0.8, new LdapCredentials("user", "pw"), 10 * 1024 * 1024);
 
-        var result = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
+        using var result = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
 
-        Assert.Equal(expected, result.Content);
+        Assert.Equal(expected, result.Content.ToArray());
         Assert.Equal(expected.Length, result.ContentLength);
         Assert.Equal("CN=Example,O=Corp", factory.LastDistinguishedName);
     }
@@ -65,13 +65,66 @@ public static class LdapCrlFetcherTests
         _ = await Assert.ThrowsAsync<CrlTooLargeException>(() => fetcher.FetchAsync(entry, CancellationToken.None)).ConfigureAwait(true);
     }
 
+    /// <summary>
+    /// Ensures only the base CRL is requested, so a large delta on the same entry neither costs a download nor fails
+    /// the size check.
+    /// </summary>
+    [Fact]
+    public static async Task FetchAsyncRequestsOnlyBaseCrl()
+    {
+        var baseCrl = new byte[] { 0, 1, 2 };
+        var factory = new StubFactory(baseCrl, new byte[] { 9, 9, 9, 9, 9 });
+        var fetcher = new LdapCrlFetcher(factory);
+        var entry = new CrlConfigEntry(new Uri("ldap://dc1.example.com/CN=Example,O=Corp"), SignatureValidationMode.None, null, 0.8, null, 4);
+
+        using var result = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
+
+        Assert.Equal(baseCrl, result.Content.ToArray());
+        Assert.Equal(1, factory.SearchCount);
+        Assert.Equal("certificateRevocationList;binary", Assert.Single(factory.LastAttributes!));
+    }
+
+    /// <summary>
+    /// Ensures the attribute named in the URI is read, so a delta CRL on the base CRL's own entry can be fetched.
+    /// </summary>
+    [Fact]
+    public static async Task FetchAsyncReadsAttributeNamedInUri()
+    {
+        var delta = new byte[] { 9 };
+        var factory = new StubFactory(new byte[] { 0, 1, 2 }, delta);
+        var fetcher = new LdapCrlFetcher(factory);
+        var entry = new CrlConfigEntry(new Uri("ldap://dc1.example.com/CN=Example,O=Corp?deltaRevocationList?base?objectClass=cRLDistributionPoint"), SignatureValidationMode.None, null, 0.8, null, 10 * 1024 * 1024);
+
+        using var result = await fetcher.FetchAsync(entry, CancellationToken.None).ConfigureAwait(true);
+
+        Assert.Equal(delta, result.Content.ToArray());
+        Assert.Equal("CN=Example,O=Corp", factory.LastDistinguishedName);
+        Assert.Equal("deltaRevocationList;binary", Assert.Single(factory.LastAttributes!));
+    }
+
+    /// <summary>
+    /// Ensures cancellation interrupts an in-flight search.
+    /// </summary>
+    [Fact]
+    public static async Task FetchAsyncHonoursCancellationDuringSearch()
+    {
+        var factory = new StubFactory([0, 1, 2]) { SearchDelay = Timeout.InfiniteTimeSpan };
+        var fetcher = new LdapCrlFetcher(factory);
+        var entry = new CrlConfigEntry(new Uri("ldap://dc1.example.com/CN=Example,O=Corp"), SignatureValidationMode.None, null, 0.8, null, 10 * 1024 * 1024);
+        using var cts = new CancellationTokenSource(TimeSpan.FromMilliseconds(50));
+
+        _ = await Assert.ThrowsAnyAsync<OperationCanceledException>(() => fetcher.FetchAsync(entry, cts.Token)).ConfigureAwait(true);
+    }
+
     private sealed class StubFactory : ILdapConnectionFactory
     {
         private readonly byte[][] _values;
+        private readonly byte[]? _delta;
 
-        public StubFactory(byte[] singleValue)
+        public StubFactory(byte[] singleValue, byte[]? delta = null)
         {
             this._values = [singleValue];
+            this._delta = delta;
         }
 
         public StubFactory(byte[][] values)
@@ -81,20 +134,49 @@ public static class LdapCrlFetcherTests
 
         public string? LastDistinguishedName { get; private set; }
 
-        public ILdapConnection Open(Uri uri, LdapCredentials? credentials)
+        public IReadOnlyList<string>? LastAttributes { get; private set; }
+
+        public int SearchCount { get; private set; }
+
+        public TimeSpan SearchDelay { get; init; } = TimeSpan.Zero;
+
+        public Task<ILdapConnection> OpenAsync(Uri uri, LdapCredentials? credentials, CancellationToken cancellationToken)
         {
-            return new StubConnection(this, this._values);
+            return Task.FromResult<ILdapConnection>(new StubConnection(this));
         }
 
-        private sealed class StubConnection(StubFactory owner, byte[][] values) : ILdapConnection
+        private sealed class StubConnection(StubFactory owner) : ILdapConnection
         {
             private readonly StubFactory _owner = owner;
-            private readonly byte[][] _values = values;
 
-            public byte[][] GetAttributeValues(string distinguishedName, string attributeName)
+            public async Task<IReadOnlyDictionary<string, byte[][]>> SearchAsync(
+                string distinguishedName,
+                IReadOnlyList<string> attributeNames,
+                CancellationToken cancellationToken)
             {
                 this._owner.LastDistinguishedName = distinguishedName;
-                return this._values;
+                this._owner.LastAttributes = attributeNames;
+                this._owner.SearchCount++;
+                if (this._owner.SearchDelay != TimeSpan.Zero)
+                {
+                    await Task.Delay(this._owner.SearchDelay, cancellationToken).ConfigureAwait(true);
+                }
+
+                var values = new Dictionary<string, byte[][]>(StringComparer.OrdinalIgnoreCase);
+                if (this._owner._values.Length > 0)
+                {
+                    values["certificateRevocationList;binary"] = this._owner._values;
+                }
+
+                if (this._owner._delta != null)
+                {
+                    values["deltaRevocationList;binary"] = [this._owner._delta];
+                }
+
+                // Like a directory server, only return the attributes that were asked for.
+                return values
+                    .Where(pair => attributeNames.Contains(pair.Key, StringComparer.OrdinalIgnoreCase))
+                    .ToDictionary(pair => pair.Key, pair => pair.Value, StringComparer.OrdinalIgnoreCase);
             }
 
             public void Dispose()
@@ -0,0 +1,108 @@
+using System.Text.Json;
+using CrlMonitor.Diagnostics;
+using CrlMonitor.Models;
+using CrlMonitor.Reporting;
+
+namespace CrlMonitor.Tests;
+
+/// <summary>
+/// Validates the NDJSON result sink.
+/// </summary>
+public static class NdjsonReporterTests
+{
+    private static readonly DateTime CheckedAt = new(2026, 3, 4, 5, 6, 7, DateTimeKind.Utc);
+
+    /// <summary>
+    /// Ensures streamed results are written as they arrive and not repeated when the run completes.
+    /// </summary>
+    [Fact]
+    public static async Task StreamedResultsAreWrittenOnceFollowedBySummary()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "out", "results.ndjson");
+        var ok = BuildResult("http://ok/ca.crl", CrlStatus.Ok, null);
+        var failed = BuildResult("http://failed/ca.crl", CrlStatus.Error, "Could not connect");
+        using var reporter = new NdjsonReporter(path);
+
+        await reporter.ReportResultAsync(failed, CancellationToken.None).ConfigureAwait(true);
+        using (var shared = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.ReadWrite))
+        using (var reader = new StreamReader(shared))
+        {
+            // The first line is on disk before the run has finished.
+            Assert.Contains("http://failed/ca.crl", await reader.ReadLineAsync().ConfigureAwait(true), StringComparison.Ordinal);
+        }
+
+        await reporter.ReportResultAsync(ok, CancellationToken.None).ConfigureAwait(true);
+        await reporter.ReportAsync(new CrlCheckRun([ok, failed], new RunDiagnostics(), CheckedAt), CancellationToken.None).ConfigureAwait(true);
+
+        var lines = await File.ReadAllLinesAsync(path).ConfigureAwait(true);
+        Assert.Equal(3, lines.Length);
+        using var first = JsonDocument.Parse(lines[0]);
+        Assert.Equal("result", first.RootElement.GetProperty("type").GetString());
+        Assert.Equal("ERROR", first.RootElement.GetProperty("status").GetString());
+        Assert.Equal("Could not connect", first.RootElement.GetProperty("error").GetString());
+        Assert.Equal(12.5, first.RootElement.GetProperty("timings_ms").GetProperty("transfer").GetDouble());
+        using var summary = JsonDocument.Parse(lines[2]);
+        Assert.Equal("summary", summary.RootElement.GetProperty("type").GetString());
+        Assert.Equal(2, summary.RootElement.GetProperty("total").GetInt32());
+        Assert.Equal(1, summary.RootElement.GetProperty("errors").GetInt32());
+    }
+
+    /// <summary>
+    /// Ensures a run reported without streaming still lists every result.
+    /// </summary>
+    [Fact]
+    public static async Task ReportAsyncWritesAllResultsWhenNothingWasStreamed()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "results.ndjson");
+        using var reporter = new NdjsonReporter(path);
+        var results = new[]
+        {
+            BuildResult("http://a/ca.crl", CrlStatus.Ok, null),
+            BuildResult("http://b/ca.crl", CrlStatus.Expired, null)
+        };
+
+        await reporter.ReportAsync(new CrlCheckRun(results, new RunDiagnostics(), CheckedAt), CancellationToken.None).ConfigureAwait(true);
+
+        var lines = await File.ReadAllLinesAsync(path).ConfigureAwait(true);
+        Assert.Equal(3, lines.Length);
+        Assert.Contains("\"uri\":\"http://a/ca.crl\"", lines[0], StringComparison.Ordinal);
+        Assert.Contains("\"status\":\"EXPIRED\"", lines[1], StringComparison.Ordinal);
+    }
+
+    private static CrlCheckResult BuildResult(string uri, CrlStatus status, string? error)
+    {
+        return new CrlCheckResult(
+            new Uri(uri),
+            status,
+            TimeSpan.FromMilliseconds(30),
+            null,
+            error,
+            null,
+            TimeSpan.FromMilliseconds(20),
+            1024,
+            CheckedAt,
+            null,
+            Timings: new CrlStageTimings(Transfer: TimeSpan.FromMilliseconds(12.5)));
+    }
+
+    private sealed class TempFolder : IDisposable
+    {
+        public string Path { get; } = Directory.CreateDirectory(System.IO.Path.Combine(System.IO.Path.GetTempPath(), Guid.NewGuid().ToString())).FullName;
+
+        public void Dispose()
+        {
+            try
+            {
+                Directory.Delete(this.Path, true);
+            }
+            catch (IOException)
+            {
+            }
+            catch (UnauthorizedAccessException)
+            {
+            }
+        }
+    }
+}
@@ -0,0 +1,133 @@
+using CrlMonitor.Crl;
+using CrlMonitor.Models;
+using CrlMonitor.State;
+using CrlMonitor.Tests.TestUtilities;
+
+namespace CrlMonitor.Tests;
+
+/// <summary>
+/// Tests for <see cref="RevocationIndex"/> and <see cref="FileRevocationIndexStore"/>.
+/// </summary>
+public static class RevocationIndexTests
+{
+    private static readonly DateTime IssuedAt = new(2026, 1, 2, 3, 4, 5, DateTimeKind.Utc);
+    private static readonly string[] AllIssuers = ["CN=Alpha", "CN=Beta", "CN=Gamma"];
+    private static readonly string[] AlphaAndBeta = ["CN=Alpha", "CN=Beta"];
+
+    /// <summary>
+    /// Ensures a written index answers lookups from the mapped file for every CRL that lists a serial.
+    /// </summary>
+    [Fact]
+    public static void LookupFindsSerialsAcrossIssuers()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "revocations.idx");
+        var first = new RevocationIndexEntry("CN=Beta", new Uri("http://beta/ca.crl"), IssuedAt, RevokedSerialCollection.FromHex(["01", "0A0B", "-05"]));
+        var second = new RevocationIndexEntry("CN=Alpha", new Uri("http://alpha/ca.crl"), IssuedAt, RevokedSerialCollection.FromHex(["0A0B", "FF"]));
+        var empty = new RevocationIndexEntry("CN=Gamma", new Uri("http://gamma/ca.crl"), IssuedAt, RevokedSerialCollection.Empty);
+        using (var stream = File.Create(path))
+        {
+            RevocationIndex.Write(stream, [first, second, empty], IssuedAt);
+        }
+
+        using var index = RevocationIndex.Open(path);
+
+        Assert.Equal(IssuedAt, index.GeneratedAtUtc);
+        Assert.Equal(AllIssuers, index.Crls.Select(crl => crl.Issuer));
+        Assert.Equal(AlphaAndBeta, index.Lookup("0a:0b").Select(crl => crl.Issuer));
+        var negative = Assert.Single(index.Lookup("-5"));
+        Assert.Equal(new Uri("http://beta/ca.crl"), negative.CrlUri);
+        Assert.Equal(IssuedAt, negative.ThisUpdate);
+        Assert.Empty(index.Lookup("02"));
+        _ = Assert.Throws<FormatException>(() => index.Lookup("not-hex"));
+        Assert.Equal(first.Serials, index.ReadSerials(1));
+    }
+
+    /// <summary>
+    /// Ensures files that are not indexes are rejected.
+    /// </summary>
+    [Fact]
+    public static void OpenRejectsForeignFiles()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "revocations.idx");
+        File.WriteAllBytes(path, new byte[64]);
+
+        _ = Assert.Throws<InvalidDataException>(() => RevocationIndex.Open(path));
+    }
+
+    /// <summary>
+    /// Ensures the store keeps CRLs that were not checked this run and drops CRLs no longer configured.
+    /// </summary>
+    [Fact]
+    public static async Task StoreCarriesForwardUncheckedCrls()
+    {
+        using var temp = new TempFolder();
+        var path = Path.Combine(temp.Path, "index", "revocations.idx");
+        var alpha = new Uri("http://alpha/ca.crl");
+        var beta = new Uri("http://beta/ca.crl");
+        var removed = new Uri("http://removed/ca.crl");
+        var parsed = CrlTestBuilder.BuildParsedCrl(false).Parsed;
+        var initial = new FileRevocationIndexStore(path, [alpha, beta, removed]);
+        await initial.UpdateAsync(
+            [
+                BuildResult(alpha, parsed with { Issuer = "CN=Alpha", RevokedSerialNumbers = RevokedSerialCollection.FromHex(["01"]) }),
+                BuildResult(beta, parsed with { Issuer = "CN=Beta", RevokedSerialNumbers = RevokedSerialCollection.FromHex(["02"]) }),
+                BuildResult(removed, parsed with { Issuer = "CN=Removed", RevokedSerialNumbers = RevokedSerialCollection.FromHex(["03"]) })
+            ],
+            CancellationToken.None).ConfigureAwait(true);
+
+        var restarted = new FileRevocationIndexStore(path, [alpha, beta]);
+        await restarted.UpdateAsync(
+            [
+                BuildResult(alpha, parsed with { Issuer = "CN=Alpha", RevokedSerialNumbers = RevokedSerialCollection.FromHex(["01", "04"]) }),
+                BuildResult(beta, null)
+            ],
+            CancellationToken.None).ConfigureAwait(true);
+
+        using var index = RevocationIndex.Open(path);
+        Assert.Equal(AlphaAndBeta, index.Crls.Select(crl => crl.Issuer));
+        Assert.Equal("CN=Alpha", Assert.Single(index.Lookup("04")).Issuer);
+        Assert.Equal("CN=Beta", Assert.Single(index.Lookup("02")).Issuer);
+        Assert.Empty(index.Lookup("03"));
+    }
+
+    private static CrlCheckResult BuildResult(Uri uri, ParsedCrl? parsed)
+    {
+        return new CrlCheckResult(
+            uri,
+            parsed == null ? CrlStatus.Error : CrlStatus.Ok,
+            TimeSpan.Zero,
+            parsed,
+            parsed == null ? "Failed fetch" : null,
+            null,
+            null,
+            null,
+            IssuedAt,
+            null);
+    }
+
+    private sealed class TempFolder : IDisposable
+    {
+        public TempFolder()
+        {
+            this.Path = Directory.CreateDirectory(System.IO.Path.Combine(System.IO.Path.GetTempPath(), Guid.NewGuid().ToString())).FullName;
+        }
+
+        public string Path { get; }
+
+        public void Dispose()
+        {
+            try
+            {
+                Directory.Delete(this.Path, true);
+            }
+            catch (IOException)
+            {
+            }
+            catch (UnauthorizedAccessException)
+            {
+            }
+        }
+    }
+}
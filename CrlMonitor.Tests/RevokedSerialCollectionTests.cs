@@ -0,0 +1,119 @@
+using CrlMonitor.Crl;
+using Org.BouncyCastle.Math;
+
+namespace CrlMonitor.Tests;
+
+/// <summary>
+/// Tests for <see cref="RevokedSerialCollection"/>.
+/// </summary>
+public static class RevokedSerialCollectionTests
+{
+    private static readonly string[] ExpectedDistinct = ["A", "B"];
+    private static readonly string[] ExpectedAdded = ["3", "ABCDEF"];
+    private static readonly string[] ExpectedRemoved = ["1", "FF"];
+
+    /// <summary>
+    /// Ensures hex output matches the historical BigInteger formatting.
+    /// </summary>
+    [Fact]
+    public static void GetHexMatchesBigIntegerFormatting()
+    {
+        var serials = new[]
+        {
+            new BigInteger("0A", 16),
+            new BigInteger("00FF10", 16),
+            BigInteger.Zero,
+            new BigInteger("-1B", 16),
+            new BigInteger("123456789ABCDEF0123456789ABCDEF0", 16)
+        };
+
+        var collection = RevokedSerialCollection.Create(serials);
+
+        var expected = serials.Select(serial => serial.ToString(16).ToUpperInvariant()).OrderBy(value => value, StringComparer.Ordinal);
+        var actual = collection.OrderBy(value => value, StringComparer.Ordinal);
+        Assert.Equal(expected, actual);
+        Assert.Equal(serials.Length, collection.Count);
+    }
+
+    /// <summary>
+    /// Ensures lookups find stored serials regardless of insertion order or leading zeros.
+    /// </summary>
+    [Fact]
+    public static void ContainsUsesBinarySearch()
+    {
+        var collection = RevokedSerialCollection.FromHex(["FF", "01", "0100", "7F", "-05"]);
+
+        Assert.True(collection.Contains("01"));
+        Assert.True(collection.Contains("0001"));
+        Assert.True(collection.Contains("100"));
+        Assert.True(collection.Contains("ff"));
+        Assert.True(collection.Contains("-5"));
+        Assert.True(collection.Contains(new BigInteger("7F", 16)));
+        Assert.False(collection.Contains("05"));
+        Assert.False(collection.Contains("02"));
+        Assert.False(collection.Contains("not-hex"));
+    }
+
+    /// <summary>
+    /// Ensures duplicate serials collapse into a single entry while the reported entry count keeps every one.
+    /// </summary>
+    [Fact]
+    public static void DuplicatesAreCollapsed()
+    {
+        var collection = RevokedSerialCollection.FromHex(["0A", "A", "0B"]);
+
+        Assert.Equal(2, collection.Count);
+        Assert.Equal(3, collection.EntryCount);
+        Assert.Equal(3, RevokedSerialCollection.CountOnly(3).EntryCount);
+        Assert.Equal(ExpectedDistinct, collection.ToList());
+    }
+
+    /// <summary>
+    /// Ensures count-only collections refuse enumeration.
+    /// </summary>
+    [Fact]
+    public static void CountOnlyRejectsEnumeration()
+    {
+        var collection = RevokedSerialCollection.CountOnly(42);
+
+        Assert.Equal(42, collection.Count);
+        Assert.False(collection.SerialsRetained);
+        _ = Assert.Throws<InvalidOperationException>(() => collection.ToList());
+        _ = Assert.Throws<InvalidOperationException>(() => collection.Contains("01"));
+    }
+
+    /// <summary>
+    /// Ensures the linear diff reports serials added and removed between two snapshots.
+    /// </summary>
+    [Fact]
+    public static void DiffReportsAddedAndRemovedSerials()
+    {
+        var previous = RevokedSerialCollection.FromHex(["01", "02", "0100", "FF"]);
+        var current = RevokedSerialCollection.FromHex(["02", "03", "0100", "ABCDEF"]);
+
+        var diff = RevocationDiff.Compute(previous, current);
+
+        Assert.Equal(ExpectedAdded, diff.Added.OrderBy(value => value, StringComparer.Ordinal));
+        Assert.Equal(ExpectedRemoved, diff.Removed.OrderBy(value => value, StringComparer.Ordinal));
+        Assert.True(diff.Added.Contains("ABCDEF"));
+    }
+
+    /// <summary>
+    /// Ensures binary snapshots round-trip and reject foreign data.
+    /// </summary>
+    [Fact]
+    public static void SnapshotRoundTrips()
+    {
+        var original = RevokedSerialCollection.FromHex(["FF", "01", "0100", "-05"]);
+        using var stream = new MemoryStream();
+
+        original.WriteSnapshot(stream);
+        stream.Position = 0;
+        var restored = RevokedSerialCollection.ReadSnapshot(stream);
+
+        Assert.Equal(original, restored);
+        Assert.True(restored.Contains("-05"));
+        using var garbage = new MemoryStream(new byte[32]);
+        _ = Assert.Throws<InvalidDataException>(() => RevokedSerialCollection.ReadSnapshot(garbage));
+    }
+}
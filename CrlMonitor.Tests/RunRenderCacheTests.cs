@@ -0,0 +1,59 @@
+using System.Text;
+using CrlMonitor.Diagnostics;
+using CrlMonitor.Models;
+using CrlMonitor.Reporting;
+
+namespace CrlMonitor.Tests;
+
+/// <summary>
+/// Tests for <see cref="RunRenderCache"/>.
+/// </summary>
+public static class RunRenderCacheTests
+{
+    private static readonly string[] StatusOrder = ["http://error/", "http://expired/", "http://ok/", "http://ok-cached/"];
+
+    /// <summary>
+    /// Ensures a run's artifacts are computed once and shared between callers.
+    /// </summary>
+    [Fact]
+    public static async Task ForSharesArtifactsPerRun()
+    {
+        var run = BuildRun();
+
+        var first = RunRenderCache.For(run);
+        var second = RunRenderCache.For(run);
+        var firstCsv = await first.GetCsvAsync(CancellationToken.None).ConfigureAwait(true);
+        var secondCsv = await second.GetCsvAsync(CancellationToken.None).ConfigureAwait(true);
+
+        Assert.Same(first, second);
+        Assert.Same(firstCsv, secondCsv);
+        Assert.StartsWith("# report_generated_utc,", Encoding.UTF8.GetString(firstCsv), StringComparison.Ordinal);
+        Assert.NotSame(first, RunRenderCache.For(run with { }));
+    }
+
+    /// <summary>
+    /// Ensures summary counts, the status-ordered view and the error list are derived from the results.
+    /// </summary>
+    [Fact]
+    public static void ViewsReflectResults()
+    {
+        var cache = RunRenderCache.For(BuildRun());
+
+        Assert.Equal(new CrlStatusSummary(4, 2, 0, 0, 1, 1, 1), cache.Summary);
+        Assert.Equal(StatusOrder, cache.ResultsByStatus.Select(r => r.Uri.ToString()));
+        Assert.Equal("http://error/", Assert.Single(cache.Errors).Uri.ToString());
+    }
+
+    private static CrlCheckRun BuildRun()
+    {
+        var now = new DateTime(2026, 5, 6, 7, 8, 9, DateTimeKind.Utc);
+        var results = new List<CrlCheckResult>
+        {
+            new(new Uri("http://ok"), CrlStatus.Ok, TimeSpan.Zero, null, null, null, null, null, now, "Valid"),
+            new(new Uri("http://expired"), CrlStatus.Expired, TimeSpan.Zero, null, "Expired", null, null, null, now, "Valid"),
+            new(new Uri("http://ok-cached"), CrlStatus.Ok, TimeSpan.Zero, null, null, null, null, null, now, "Valid", CacheHit: true),
+            new(new Uri("http://error"), CrlStatus.Error, TimeSpan.Zero, null, "Failed", null, null, null, now, null)
+        };
+        return new CrlCheckRun(results, new RunDiagnostics(), now);
+    }
+}
@@ -0,0 +1,180 @@
+using CrlMonitor.Crl;
+using CrlMonitor.Diagnostics;
+using CrlMonitor.Models;
+using CrlMonitor.Sharding;
+using CrlMonitor.Tests.TestUtilities;
+
+namespace CrlMonitor.Tests;
+
+/// <summary>
+/// Tests for <see cref="ShardPartialFile"/> and <see cref="ShardMerger"/>.
+/// </summary>
+public static class ShardMergerTests
+{
+    private static readonly DateTime CheckedAt = new(2026, 3, 4, 5, 6, 7, DateTimeKind.Utc);
+
+    /// <summary>
+    /// Ensures partials written by each shard merge back into one run in configuration order, keeping what the
+    /// reports show.
+    /// </summary>
+    [Fact]
+    public static async Task MergeCombinesPartialsInConfigurationOrder()
+    {
+        using var temp = new TempFolder();
+        var entries = BuildEntries(12);
+        var parsed = CrlTestBuilder.BuildParsedCrl(false).Parsed;
+        for (var index = 1; index <= 2; index++)
+        {
+            var shard = new ShardSpec(index, 2);
+            var diagnostics = new RunDiagnostics();
+            diagnostics.AddRuntimeWarning(FormattableString.Invariant($"warning from shard {index}"));
+            var results = shard.Select(entries)
+                .Select(entry => new CrlCheckResult(
+                    entry.Uri,
+                    CrlStatus.Ok,
+                    TimeSpan.FromMilliseconds(15),
+                    parsed,
+                    null,
+                    CheckedAt.AddHours(-1),
+                    TimeSpan.FromMilliseconds(10),
+                    512,
+                    CheckedAt,
+                    "Valid",
+                    RevocationChanges: new RevocationDiff(RevokedSerialCollection.CountOnly(3), RevokedSerialCollection.Empty),
+                    Timings: new CrlStageTimings(Transfer: TimeSpan.FromMilliseconds(10), Parse: TimeSpan.FromMilliseconds(2))))
+                .ToList();
+            _ = await ShardPartialFile.WriteAsync(temp.Path, shard, new CrlCheckRun(results, diagnostics, CheckedAt.AddMinutes(index)), CancellationToken.None)
+                .ConfigureAwait(true);
+        }
+
+        var partials = await ShardPartialFile.ReadAllAsync(temp.Path, CancellationToken.None).ConfigureAwait(true);
+        var run = ShardMerger.Merge(entries, partials, CheckedAt.AddHours(1));
+
+        Assert.Equal(entries.Select(entry => entry.Uri), run.Results.Select(result => result.Uri));
+        Assert.Equal(CheckedAt.AddMinutes(2), run.GeneratedAtUtc);
+        Assert.Equal(2, run.Diagnostics.RuntimeWarnings.Count);
+        var first = run.Results[0];
+        Assert.Equal(CrlStatus.Ok, first.Status);
+        Assert.Equal(parsed.Issuer, first.ParsedCrl!.Issuer);
+        Assert.Equal(parsed.NextUpdate, first.ParsedCrl.NextUpdate);
+        Assert.Equal(parsed.RevokedSerialNumbers.EntryCount, first.ParsedCrl.RevokedSerialNumbers.EntryCount);
+        Assert.Equal(3, first.RevocationChanges!.AddedCount);
+        Assert.Equal(TimeSpan.FromMilliseconds(2), first.Timings!.Parse);
+        Assert.Equal(CheckedAt.AddHours(-1), first.PreviousFetchUtc);
+        Assert.Empty(Directory.GetFiles(temp.Path, "*.tmp"));
+    }
+
+    /// <summary>
+    /// Ensures CRLs of a shard with no partial are reported as errors rather than dropped.
+    /// </summary>
+    [Fact]
+    public static void MergeReportsMissingShardAsErrors()
+    {
+        var entries = BuildEntries(12);
+        var shard = new ShardSpec(1, 2);
+        var results = shard.Select(entries)
+            .Select(entry => new CrlCheckResult(entry.Uri, CrlStatus.Ok, TimeSpan.Zero, null, null, null, null, null, CheckedAt, "Valid"))
+            .ToList();
+        var partial = new ShardPartial(shard, new CrlCheckRun(results, new RunDiagnostics(), CheckedAt));
+
+        var run = ShardMerger.Merge(entries, [partial], CheckedAt);
+
+        Assert.Equal(entries.Count, run.Results.Count);
+        var missing = run.Results.Where(result => result.Status == CrlStatus.Error).ToList();
+        Assert.Equal(entries.Count - results.Count, missing.Count);
+        Assert.All(missing, result => Assert.Equal("No result from shard 2/2.", result.ErrorInfo));
+        Assert.Contains("No partial result for shard 2/2.", run.Diagnostics.RuntimeWarnings);
+    }
+
+    /// <summary>
+    /// Ensures a partial older than the maximum age is left out, so its CRLs are reported as missing rather than with
+    /// an earlier run's results.
+    /// </summary>
+    [Fact]
+    public static void MergeIgnoresStalePartials()
+    {
+        var entries = BuildEntries(12);
+        var partials = Enumerable.Range(1, 2)
+            .Select(index =>
+            {
+                var shard = new ShardSpec(index, 2);
+                var results = shard.Select(entries)
+                    .Select(entry => new CrlCheckResult(entry.Uri, CrlStatus.Ok, TimeSpan.Zero, null, null, null, null, null, CheckedAt, "Valid"))
+                    .ToList();
+                var generatedAt = index == 1 ? CheckedAt : CheckedAt.AddDays(-1);
+                return new ShardPartial(shard, new CrlCheckRun(results, new RunDiagnostics(), generatedAt));
+            })
+            .ToList();
+
+        var run = ShardMerger.Merge(entries, partials, CheckedAt.AddMinutes(5), TimeSpan.FromHours(1));
+
+        var stale = new ShardSpec(2, 2).Select(entries);
+        Assert.All(
+            run.Results.Where(result => stale.Any(entry => entry.Uri == result.Uri)),
+            result => Assert.Equal("No result from shard 2/2.", result.ErrorInfo));
+        Assert.Contains(run.Diagnostics.RuntimeWarnings, warning => warning.StartsWith("Ignored partial for shard 2/2", StringComparison.Ordinal));
+        Assert.Throws<InvalidOperationException>(() => ShardMerger.Merge(entries, partials, CheckedAt.AddDays(1), TimeSpan.FromHours(1)));
+    }
+
+    /// <summary>
+    /// Ensures merged partial files are deleted so the next merge does not pick them up again.
+    /// </summary>
+    [Fact]
+    public static async Task DeleteAllRemovesMergedPartials()
+    {
+        using var temp = new TempFolder();
+        var shard = new ShardSpec(1, 1);
+        _ = await ShardPartialFile.WriteAsync(temp.Path, shard, new CrlCheckRun([], new RunDiagnostics(), CheckedAt), CancellationToken.None)
+            .ConfigureAwait(true);
+        var partials = await ShardPartialFile.ReadAllAsync(temp.Path, CancellationToken.None).ConfigureAwait(true);
+
+        ShardPartialFile.DeleteAll(partials);
+
+        Assert.Empty(Directory.GetFiles(temp.Path));
+    }
+
+    /// <summary>
+    /// Ensures partials from different splits are not merged together.
+    /// </summary>
+    [Fact]
+    public static void MergeRejectsMixedShardCounts()
+    {
+        var run = new CrlCheckRun([], new RunDiagnostics(), CheckedAt);
+        ShardPartial[] partials = [new(new ShardSpec(1, 2), run), new(new ShardSpec(2, 3), run)];
+
+        var ex = Assert.Throws<InvalidOperationException>(() => ShardMerger.Merge(BuildEntries(1), partials, CheckedAt));
+        Assert.Contains("shard count", ex.Message, StringComparison.Ordinal);
+    }
+
+    private static List<CrlConfigEntry> BuildEntries(int count)
+    {
+        return Enumerable.Range(0, count)
+            .Select(index => new CrlConfigEntry(
+                new Uri(FormattableString.Invariant($"http://crl{index}.example.com/ca.crl")),
+                SignatureValidationMode.None,
+                null,
+                0.8,
+                null,
+                1024))
+            .ToList();
+    }
+
+    private sealed class TempFolder : IDisposable
+    {
+        public string Path { get; } = Directory.CreateTempSubdirectory().FullName;
+
+        public void Dispose()
+        {
+            try
+            {
+                Directory.Delete(this.Path, true);
+            }
+            catch (IOException)
+            {
+            }
+            catch (UnauthorizedAccessException)
+            {
+            }
+        }
+    }
+}
@@ -0,0 +1,63 @@
+using CrlMonitor.Crl;
+using CrlMonitor.Sharding;
+
+namespace CrlMonitor.Tests;
+
+/// <summary>
+/// Tests for <see cref="ShardSpec"/>.
+/// </summary>
+public static class ShardSpecTests
+{
+    /// <summary>
+    /// Ensures shard arguments are parsed and out-of-range values rejected.
+    /// </summary>
+    [Theory]
+    [InlineData("0/4")]
+    [InlineData("5/4")]
+    [InlineData("1/0")]
+    [InlineData("2")]
+    [InlineData("-1/4")]
+    [InlineData("1/2000")]
+    public static void ParseRejectsInvalidValues(string value)
+    {
+        Assert.Throws<InvalidOperationException>(() => ShardSpec.Parse(value));
+    }
+
+    /// <summary>
+    /// Ensures a valid argument round-trips and names its partial file.
+    /// </summary>
+    [Fact]
+    public static void ParseReadsIndexAndCount()
+    {
+        var shard = ShardSpec.Parse("2/4");
+
+        Assert.Equal(new ShardSpec(2, 4), shard);
+        Assert.Equal("2/4", shard.ToString());
+        Assert.Equal("shard-2-of-4.json", shard.PartialFileName);
+    }
+
+    /// <summary>
+    /// Ensures every CRL lands in exactly one shard, in configuration order, and keeps its shard across calls.
+    /// </summary>
+    [Fact]
+    public static void SelectPartitionsEntries()
+    {
+        var entries = Enumerable.Range(0, 200)
+            .Select(index => new CrlConfigEntry(
+                new Uri(FormattableString.Invariant($"http://crl{index}.example.com/ca.crl")),
+                SignatureValidationMode.None,
+                null,
+                0.8,
+                null,
+                1024))
+            .ToList();
+
+        var shards = Enumerable.Range(1, 3).Select(index => new ShardSpec(index, 3).Select(entries)).ToList();
+
+        Assert.Equal(entries.Count, shards.Sum(shard => shard.Count));
+        Assert.All(shards, shard => Assert.NotEmpty(shard));
+        Assert.Equal(entries, shards.SelectMany(shard => shard).OrderBy(entries.IndexOf));
+        Assert.All(shards[1], entry => Assert.Equal(2, ShardSpec.GetShardIndex(entry.Uri, 3)));
+        Assert.Equal(shards[0], new ShardSpec(1, 3).Select(entries));
+    }
+}
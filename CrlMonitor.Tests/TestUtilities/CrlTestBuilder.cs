@@ -11,6 +11,44 @@ namespace CrlMonitor.Tests.TestUtilities;
 
 internal static class CrlTestBuilder
 {
+    private static readonly Lazy<AsymmetricCipherKeyPair> SharedKey = new(GenerateKeyPair);
+
+    /// <summary>
+    /// Builds a CRL signed by a shared test key. Passing <paramref name="baseCrlNumber"/> makes it a delta CRL;
+    /// <paramref name="removedSerials"/> are listed with reason removeFromCRL.
+    /// </summary>
+    public static byte[] BuildCrlBytes(
+        long crlNumber,
+        long? baseCrlNumber = null,
+        IReadOnlyList<long>? revokedSerials = null,
+        IReadOnlyList<long>? removedSerials = null,
+        DateTime? thisUpdate = null,
+        DateTime? nextUpdate = null)
+    {
+        var generator = new X509V2CrlGenerator();
+        var issuedAt = thisUpdate ?? DateTime.UtcNow.AddHours(-1);
+        generator.SetIssuerDN(new X509Name("CN=Delta Test CA"));
+        generator.SetThisUpdate(issuedAt);
+        generator.SetNextUpdate(nextUpdate ?? issuedAt.AddDays(1));
+        generator.AddExtension(X509Extensions.CrlNumber, false, new CrlNumber(BigInteger.ValueOf(crlNumber)));
+        if (baseCrlNumber.HasValue)
+        {
+            generator.AddExtension(X509Extensions.DeltaCrlIndicator, true, new CrlNumber(BigInteger.ValueOf(baseCrlNumber.Value)));
+        }
+
+        foreach (var serial in revokedSerials ?? [])
+        {
+            generator.AddCrlEntry(BigInteger.ValueOf(serial), issuedAt, CrlReason.KeyCompromise);
+        }
+
+        foreach (var serial in removedSerials ?? [])
+        {
+            generator.AddCrlEntry(BigInteger.ValueOf(serial), issuedAt, CrlReason.RemoveFromCrl);
+        }
+
+        return generator.Generate(new Asn1SignatureFactory("SHA256WITHRSA", SharedKey.Value.Private)).GetEncoded();
+    }
+
     public static (ParsedCrl Parsed, X509Certificate CaCert, X509Certificate SignerCert, byte[] RawCrlBytes) BuildParsedCrl(
         bool signWithDifferentKey,
         DateTime? thisUpdateOverride = null,
@@ -0,0 +1,67 @@
+using System.Diagnostics.Metrics;
+using CrlMonitor.Models;
+
+namespace CrlMonitor.Diagnostics;
+
+/// <summary>
+/// Publishes check outcomes and stage timings on the <c>CrlMonitor</c> meter so that live tools such as
+/// <c>dotnet-counters monitor --counters CrlMonitor</c> or an OpenTelemetry exporter can watch a running service.
+/// </summary>
+internal static class CrlMonitorMetrics
+{
+    public const string MeterName = "CrlMonitor";
+
+    private static readonly Meter Meter = new(MeterName, typeof(CrlMonitorMetrics).Assembly.GetName().Version?.ToString());
+    private static readonly Counter<long> Checks = Meter.CreateCounter<long>(
+        "crlmonitor.checks",
+        unit: "{check}",
+        description: "CRL checks completed, by status.");
+    private static readonly Histogram<double> CheckDuration = Meter.CreateHistogram<double>(
+        "crlmonitor.check.duration",
+        unit: "ms",
+        description: "Time to fetch, parse and evaluate one CRL.");
+    private static readonly Histogram<double> StageDuration = Meter.CreateHistogram<double>(
+        "crlmonitor.check.stage.duration",
+        unit: "ms",
+        description: "Time one CRL check spent in each stage.");
+
+    public static void RecordCheck(CrlCheckResult result)
+    {
+        ArgumentNullException.ThrowIfNull(result);
+        var status = new KeyValuePair<string, object?>("status", result.Status.ToDisplayString());
+        Checks.Add(1, status);
+        CheckDuration.Record(result.Duration.TotalMilliseconds, status);
+        if (result.Timings == null || !StageDuration.Enabled)
+        {
+            return;
+        }
+
+        foreach (var stage in Enum.GetValues<CrlTimingStage>())
+        {
+            var duration = result.Timings.Get(stage);
+            if (duration.HasValue)
+            {
+                StageDuration.Record(duration.Value.TotalMilliseconds, new KeyValuePair<string, object?>("stage", GetStageName(stage)));
+            }
+        }
+    }
+
+    /// <summary>
+    /// Lower-case name used for the stage tag and in reports.
+    /// </summary>
+    public static string GetStageName(CrlTimingStage stage)
+    {
+        return stage switch {
+            CrlTimingStage.Dns => "dns",
+            CrlTimingStage.Connect => "connect",
+            CrlTimingStage.Tls => "tls",
+            CrlTimingStage.Wait => "wait",
+            CrlTimingStage.Transfer => "transfer",
+            CrlTimingStage.Parse => "parse",
+            CrlTimingStage.Verify => "verify",
+            CrlTimingStage.Health => "health",
+            CrlTimingStage.StateWrite => "state_write",
+            _ => throw new ArgumentOutOfRangeException(nameof(stage), stage, null)
+        };
+    }
+}
@@ -0,0 +1,11 @@
+namespace CrlMonitor.Diagnostics;
+
+/// <summary>
+/// Stages of the check pipeline, each fed by its own queue.
+/// </summary>
+internal enum PipelineStage
+{
+    Fetch,
+    Process,
+    State
+}
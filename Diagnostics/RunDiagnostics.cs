@@ -1,4 +1,5 @@
 using System.Collections.Concurrent;
+using CrlMonitor.Models;
 
 namespace CrlMonitor.Diagnostics;
 
@@ -8,12 +9,37 @@ internal sealed class RunDiagnostics
     private readonly ConcurrentQueue<string> _signatureWarnings = new();
     private readonly ConcurrentQueue<string> _configurationWarnings = new();
     private readonly ConcurrentQueue<string> _runtimeWarnings = new();
+    private readonly ConcurrentDictionary<PipelineStage, int> _queueDepthPeaks = new();
+    private readonly ConcurrentDictionary<CrlTimingStage, ConcurrentQueue<TimeSpan>> _stageTimings = new();
+    private readonly ConcurrentDictionary<string, int> _fetchRetries = new(StringComparer.OrdinalIgnoreCase);
+    private readonly ConcurrentDictionary<string, int> _hedgedFetches = new(StringComparer.OrdinalIgnoreCase);
+    private readonly ConcurrentDictionary<string, int> _circuitRejections = new(StringComparer.OrdinalIgnoreCase);
 
     public IReadOnlyCollection<string> StateWarnings => this._stateWarnings;
     public IReadOnlyCollection<string> SignatureWarnings => this._signatureWarnings;
     public IReadOnlyCollection<string> ConfigurationWarnings => this._configurationWarnings;
     public IReadOnlyCollection<string> RuntimeWarnings => this._runtimeWarnings;
 
+    /// <summary>
+    /// Highest number of items seen waiting in front of each pipeline stage.
+    /// </summary>
+    public IReadOnlyDictionary<PipelineStage, int> QueueDepthPeaks => this._queueDepthPeaks;
+
+    /// <summary>
+    /// Fetch attempts repeated after a transient failure, by host.
+    /// </summary>
+    public IReadOnlyDictionary<string, int> FetchRetries => this._fetchRetries;
+
+    /// <summary>
+    /// Fetches that sent a second request because the first was slow to answer, by host.
+    /// </summary>
+    public IReadOnlyDictionary<string, int> HedgedFetches => this._hedgedFetches;
+
+    /// <summary>
+    /// CRLs failed without a fetch because their host's circuit was open, by host.
+    /// </summary>
+    public IReadOnlyDictionary<string, int> CircuitRejections => this._circuitRejections;
+
     public void AddStateWarning(string message)
     {
         Enqueue(this._stateWarnings, message);
@@ -34,6 +60,76 @@ internal sealed class RunDiagnostics
         Enqueue(this._runtimeWarnings, message);
     }
 
+    public void RecordQueueDepth(PipelineStage stage, int depth)
+    {
+        _ = this._queueDepthPeaks.AddOrUpdate(stage, depth, (_, peak) => Math.Max(peak, depth));
+    }
+
+    public void RecordFetchRetries(string host, int count = 1)
+    {
+        _ = this._fetchRetries.AddOrUpdate(host, count, (_, total) => total + count);
+    }
+
+    public void RecordHedgedFetches(string host, int count = 1)
+    {
+        _ = this._hedgedFetches.AddOrUpdate(host, count, (_, total) => total + count);
+    }
+
+    public void RecordCircuitRejections(string host, int count = 1)
+    {
+        _ = this._circuitRejections.AddOrUpdate(host, count, (_, total) => total + count);
+    }
+
+    public void RecordStageTimings(CrlStageTimings? timings)
+    {
+        if (timings == null)
+        {
+            return;
+        }
+
+        foreach (var stage in Enum.GetValues<CrlTimingStage>())
+        {
+            var duration = timings.Get(stage);
+            if (duration.HasValue)
+            {
+                this._stageTimings.GetOrAdd(stage, _ => new ConcurrentQueue<TimeSpan>()).Enqueue(duration.Value);
+            }
+        }
+    }
+
+    /// <summary>
+    /// Nearest-rank percentiles for every stage that at least one check went through, in pipeline order.
+    /// </summary>
+    public IReadOnlyList<StageTimingSummary> GetStageTimingSummaries()
+    {
+        var summaries = new List<StageTimingSummary>();
+        foreach (var stage in Enum.GetValues<CrlTimingStage>())
+        {
+            if (!this._stageTimings.TryGetValue(stage, out var queue) || queue.IsEmpty)
+            {
+                continue;
+            }
+
+            var sorted = queue.ToArray();
+            Array.Sort(sorted);
+            summaries.Add(new StageTimingSummary(
+                stage,
+                sorted.Length,
+                Percentile(sorted, 0.50),
+                Percentile(sorted, 0.95),
+                Percentile(sorted, 0.99),
+                sorted[^1]));
+        }
+
+        return summaries;
+    }
+
+    private static TimeSpan Percentile(TimeSpan[] sorted, double percentile)
+    {
+        var rank = (int)Math.Ceiling(percentile * sorted.Length);
+        return sorted[Math.Clamp(rank - 1, 0, sorted.Length - 1)];
+    }
+
     private static void Enqueue(ConcurrentQueue<string> queue, string message)
     {
         if (!string.IsNullOrWhiteSpace(message))
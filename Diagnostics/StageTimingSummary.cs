@@ -0,0 +1,14 @@
+using CrlMonitor.Models;
+
+namespace CrlMonitor.Diagnostics;
+
+/// <summary>
+/// Distribution of one stage's duration across the checks in a run that went through it.
+/// </summary>
+internal sealed record StageTimingSummary(
+    CrlTimingStage Stage,
+    int Count,
+    TimeSpan P50,
+    TimeSpan P95,
+    TimeSpan P99,
+    TimeSpan Max);
@@ -0,0 +1,6 @@
+namespace CrlMonitor.Fetching;
+
+internal sealed record CachedCrlResponse(
+    string? ETag,
+    DateTimeOffset? LastModified,
+    ReadOnlyMemory<byte> Content);
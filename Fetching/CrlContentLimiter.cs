@@ -1,38 +1,89 @@
+using System.Buffers;
+
 namespace CrlMonitor.Fetching;
 
 /// <summary>
 /// Reads stream content whilst enforcing a maximum size.
 /// </summary>
+/// <remarks>
+/// Content is read straight into a buffer rented from <see cref="ArrayPool{T}.Shared"/> and handed back without a
+/// final copy. When the caller knows the length (Content-Length or file size) the buffer is sized once up front;
+/// otherwise it doubles as data arrives.
+/// </remarks>
 internal static class CrlContentLimiter
 {
-    private const int BufferSize = 81920;
+    private const int InitialBufferSize = 81920;
+
+    public static Task<PooledCrlContent> ReadAllBytesAsync(Stream source, Uri uri, long limitBytes, CancellationToken cancellationToken)
+    {
+        return ReadAllBytesAsync(source, uri, limitBytes, expectedLength: null, cancellationToken);
+    }
 
-    public static async Task<byte[]> ReadAllBytesAsync(Stream source, Uri uri, long limitBytes, CancellationToken cancellationToken)
+    public static async Task<PooledCrlContent> ReadAllBytesAsync(
+        Stream source,
+        Uri uri,
+        long limitBytes,
+        long? expectedLength,
+        CancellationToken cancellationToken)
     {
         ArgumentNullException.ThrowIfNull(source);
         ArgumentNullException.ThrowIfNull(uri);
         ArgumentOutOfRangeException.ThrowIfNegativeOrZero(limitBytes);
 
-        using var memory = new MemoryStream();
-        var buffer = new byte[BufferSize];
-        while (true)
+        // One byte beyond the expected length is left free so the end of the stream is detected without a resize.
+        var initialSize = expectedLength is > 0 && expectedLength.Value < Math.Min(limitBytes, Array.MaxLength)
+            ? (int)expectedLength.Value + 1
+            : (int)Math.Min(InitialBufferSize, limitBytes + 1);
+        var buffer = ArrayPool<byte>.Shared.Rent(initialSize);
+        var length = 0;
+        try
         {
-            cancellationToken.ThrowIfCancellationRequested();
-            var read = await source.ReadAsync(buffer.AsMemory(0, buffer.Length), cancellationToken).ConfigureAwait(false);
-            if (read == 0)
+            while (true)
             {
-                break;
+                cancellationToken.ThrowIfCancellationRequested();
+                if (length == buffer.Length)
+                {
+                    buffer = Grow(buffer, length, limitBytes);
+                }
+
+                var read = await source.ReadAsync(buffer.AsMemory(length), cancellationToken).ConfigureAwait(false);
+                if (read == 0)
+                {
+                    break;
+                }
+
+                length += read;
+                if (length > limitBytes)
+                {
+                    throw new CrlTooLargeException(uri, limitBytes, length);
+                }
             }
 
-            if (memory.Length + read > limitBytes)
+            var content = new PooledCrlContent(buffer, length);
+            buffer = null;
+            return content;
+        }
+        finally
+        {
+            if (buffer != null)
             {
-                var observed = memory.Length + read;
-                throw new CrlTooLargeException(uri, limitBytes, observed);
+                ArrayPool<byte>.Shared.Return(buffer);
             }
+        }
+    }
 
-            await memory.WriteAsync(buffer.AsMemory(0, read), cancellationToken).ConfigureAwait(false);
+    private static byte[] Grow(byte[] buffer, int length, long limitBytes)
+    {
+        // Never grow past limit + 1: that is enough to prove the payload is oversized.
+        var target = (int)Math.Min(Math.Min((long)buffer.Length * 2, limitBytes + 1), Array.MaxLength);
+        if (target <= buffer.Length)
+        {
+            throw new InvalidOperationException("CRL content exceeds the maximum supported buffer size.");
         }
 
-        return memory.ToArray();
+        var larger = ArrayPool<byte>.Shared.Rent(target);
+        buffer.AsSpan(0, length).CopyTo(larger);
+        ArrayPool<byte>.Shared.Return(buffer);
+        return larger;
     }
 }
@@ -0,0 +1,114 @@
+using System.Diagnostics;
+using System.Net;
+using System.Net.Security;
+using System.Net.Sockets;
+using System.Security.Cryptography.X509Certificates;
+
+namespace CrlMonitor.Fetching;
+
+/// <summary>
+/// Builds the HttpClient used for CRL downloads on top of <see cref="SocketsHttpHandler"/>.
+/// </summary>
+internal static class CrlHttpClientFactory
+{
+    // Reading the platform proxy settings is the slow part of building a client, so it is done once per process.
+    private static readonly Lazy<IWebProxy> SystemProxy = new(WebRequest.GetSystemWebProxy);
+
+    /// <summary>
+    /// Does the one-off work behind <see cref="Create"/> ahead of time: loads the handler types and, when the system
+    /// proxy is used, reads its settings. Safe to call from a background thread while other startup work runs.
+    /// </summary>
+    public static void WarmUp(bool useSystemProxy)
+    {
+        if (useSystemProxy)
+        {
+            _ = SystemProxy.Value;
+        }
+
+        using var handler = new SocketsHttpHandler();
+    }
+
+    public static HttpClient Create(HttpClientOptions options, bool useSystemProxy)
+    {
+        ArgumentNullException.ThrowIfNull(options);
+#pragma warning disable CA2000 // Ownership passes to the throttling handler and then to HttpClient
+        var sockets = new SocketsHttpHandler {
+            // A bounded lifetime makes pooled connections re-resolve DNS, so CDN changes are picked up.
+            PooledConnectionLifetime = options.ConnectionLifetime,
+            PooledConnectionIdleTimeout = options.ConnectionIdleTimeout,
+            MaxConnectionsPerServer = Math.Max(1, options.MaxRequestsPerHost),
+            EnableMultipleHttp2Connections = options.EnableHttp2,
+            AutomaticDecompression = options.AutomaticDecompression ? DecompressionMethods.All : DecompressionMethods.None,
+            ConnectCallback = ConnectAsync,
+            PlaintextStreamFilter = RecordHandshakeAsync,
+            SslOptions = new SslClientAuthenticationOptions {
+                CertificateRevocationCheckMode = X509RevocationMode.Online
+            }
+        };
+
+        if (useSystemProxy)
+        {
+            sockets.UseProxy = true;
+            sockets.Proxy = SystemProxy.Value;
+            sockets.DefaultProxyCredentials = CredentialCache.DefaultCredentials;
+        }
+
+        var throttling = new HostThrottlingHandler(options) {
+            InnerHandler = sockets
+        };
+#pragma warning restore CA2000
+        var client = new HttpClient(throttling, disposeHandler: true);
+        if (options.EnableHttp2)
+        {
+            client.DefaultRequestVersion = HttpVersion.Version20;
+            client.DefaultVersionPolicy = HttpVersionPolicy.RequestVersionOrLower;
+        }
+
+        return client;
+    }
+
+    private static async ValueTask<Stream> ConnectAsync(SocketsHttpConnectionContext context, CancellationToken cancellationToken)
+    {
+        var request = context.InitialRequestMessage;
+        request.Options.Set(HttpConnectionTracking.NewConnection, true);
+#pragma warning disable CA2000 // The returned NetworkStream owns the socket; it is disposed here on failure
+        var socket = new Socket(SocketType.Stream, ProtocolType.Tcp);
+#pragma warning restore CA2000
+        try
+        {
+            socket.NoDelay = true;
+
+            // Resolving separately from connecting lets the two be timed apart.
+            var startedAt = Stopwatch.GetTimestamp();
+            var addresses = await Dns.GetHostAddressesAsync(context.DnsEndPoint.Host, cancellationToken).ConfigureAwait(false);
+            var resolvedAt = Stopwatch.GetTimestamp();
+            await socket.ConnectAsync(addresses, context.DnsEndPoint.Port, cancellationToken).ConfigureAwait(false);
+            if (request.Options.TryGetValue(HttpConnectionTracking.Timings, out var timings))
+            {
+                timings.RecordConnected(startedAt, resolvedAt);
+            }
+
+            return new NetworkStream(socket, ownsSocket: true);
+        }
+        catch
+        {
+            socket.Dispose();
+            throw;
+        }
+    }
+
+    /// <summary>
+    /// Runs once the connection is ready for HTTP traffic, which for HTTPS is after the TLS handshake.
+    /// </summary>
+    private static ValueTask<Stream> RecordHandshakeAsync(SocketsHttpPlaintextStreamFilterContext context, CancellationToken cancellationToken)
+    {
+        var request = context.InitialRequestMessage;
+        if (request.RequestUri?.Scheme == Uri.UriSchemeHttps &&
+            request.Options.TryGetValue(HttpConnectionTracking.Timings, out var timings))
+        {
+            timings.RecordSecured();
+        }
+
+        return ValueTask.FromResult(context.PlaintextStream);
+    }
+}
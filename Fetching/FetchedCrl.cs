@@ -1,6 +1,25 @@
+using CrlMonitor.Models;
+
 namespace CrlMonitor.Fetching;
 
+/// <summary>
+/// A downloaded CRL. <see cref="Content"/> may be backed by a pooled or memory-mapped buffer held by
+/// <see cref="ContentOwner"/>; it is only valid until the instance is disposed. <see cref="Hedged"/> is set when a
+/// second request was sent because the first was slow to answer.
+/// </summary>
 internal sealed record FetchedCrl(
-    byte[] Content,
+    ReadOnlyMemory<byte> Content,
     TimeSpan Duration,
-    long ContentLength);
+    long ContentLength,
+    bool CacheHit = false,
+    TimeSpan? TimeToFirstByte = null,
+    bool? ConnectionReused = null,
+    CrlStageTimings? Timings = null,
+    IDisposable? ContentOwner = null,
+    bool Hedged = false) : IDisposable
+{
+    public void Dispose()
+    {
+        this.ContentOwner?.Dispose();
+    }
+}
@@ -1,12 +1,21 @@
+using System.Diagnostics;
+using CrlMonitor.Models;
+
 namespace CrlMonitor.Fetching;
 
 internal sealed class FileCrlFetcher : ICrlFetcher
 {
+    /// <summary>
+    /// Files at least this large are memory-mapped rather than read; below it the mapping setup costs more than a copy.
+    /// </summary>
+    internal const long MemoryMapThresholdBytes = 1024 * 1024;
+
     public async Task<FetchedCrl> FetchAsync(CrlConfigEntry entry, CancellationToken cancellationToken)
     {
         ArgumentNullException.ThrowIfNull(entry);
         cancellationToken.ThrowIfCancellationRequested();
 
+        var start = Stopwatch.GetTimestamp();
         var path = entry.Uri.LocalPath;
         if (string.IsNullOrWhiteSpace(path))
         {
@@ -24,14 +33,22 @@ internal sealed class FileCrlFetcher : ICrlFetcher
             throw new CrlTooLargeException(entry.Uri, entry.MaxCrlSizeBytes, fileInfo.Length);
         }
 
+        if (fileInfo.Length >= MemoryMapThresholdBytes)
+        {
+            var mapped = MemoryMappedCrlContent.Open(path, fileInfo.Length);
+            var mapElapsed = Stopwatch.GetElapsedTime(start);
+            return new FetchedCrl(mapped.Memory, mapElapsed, fileInfo.Length, Timings: new CrlStageTimings(Transfer: mapElapsed), ContentOwner: mapped);
+        }
+
         using var stream = new FileStream(
             path,
             FileMode.Open,
             FileAccess.Read,
             FileShare.Read,
-            bufferSize: 81920,
+            bufferSize: 1,
             FileOptions.Asynchronous | FileOptions.SequentialScan);
-        var bytes = await CrlContentLimiter.ReadAllBytesAsync(stream, entry.Uri, entry.MaxCrlSizeBytes, cancellationToken).ConfigureAwait(false);
-        return new FetchedCrl(bytes, TimeSpan.Zero, bytes.LongLength);
+        var content = await CrlContentLimiter.ReadAllBytesAsync(stream, entry.Uri, entry.MaxCrlSizeBytes, fileInfo.Length, cancellationToken).ConfigureAwait(false);
+        var elapsed = Stopwatch.GetElapsedTime(start);
+        return new FetchedCrl(content.Memory, elapsed, content.Memory.Length, Timings: new CrlStageTimings(Transfer: elapsed), ContentOwner: content);
     }
 }
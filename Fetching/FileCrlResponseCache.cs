@@ -0,0 +1,124 @@
+using System.Security.Cryptography;
+using System.Text;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using Serilog;
+
+namespace CrlMonitor.Fetching;
+
+/// <summary>
+/// File-backed response cache storing validators and raw CRL bytes side by side, one pair of files per URI.
+/// </summary>
+internal sealed class FileCrlResponseCache : ICrlResponseCache
+{
+    private const string ContentExtension = ".crl";
+    private const string MetadataExtension = ".json";
+    private readonly string _directory;
+    private static readonly JsonSerializerOptions SerializerOptions = new() {
+        PropertyNameCaseInsensitive = true,
+        WriteIndented = false
+    };
+
+    public FileCrlResponseCache(string directory)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(directory);
+        this._directory = Path.GetFullPath(directory);
+    }
+
+#pragma warning disable CA1031 // A broken cache entry is treated as a miss rather than failing the fetch
+    public async Task<CachedCrlResponse?> GetAsync(Uri uri, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        var (metadataPath, contentPath) = this.GetPaths(uri);
+        if (!File.Exists(metadataPath) || !File.Exists(contentPath))
+        {
+            return null;
+        }
+
+        try
+        {
+            var json = await File.ReadAllTextAsync(metadataPath, cancellationToken).ConfigureAwait(false);
+            var metadata = JsonSerializer.Deserialize<CacheMetadataDocument>(json, SerializerOptions);
+            if (metadata == null ||
+                !string.Equals(metadata.Uri, uri.ToString(), StringComparison.Ordinal) ||
+                (string.IsNullOrWhiteSpace(metadata.ETag) && !metadata.LastModified.HasValue))
+            {
+                return null;
+            }
+
+            var content = await File.ReadAllBytesAsync(contentPath, cancellationToken).ConfigureAwait(false);
+            return content.LongLength != metadata.ContentLength
+                ? null
+                : new CachedCrlResponse(metadata.ETag, metadata.LastModified, content);
+        }
+        catch (OperationCanceledException)
+        {
+            throw;
+        }
+        catch (Exception ex)
+        {
+            Log.Warning(ex, "Ignoring unreadable HTTP cache entry for {Uri}: {Message}", uri, ex.Message);
+            return null;
+        }
+    }
+
+    public async Task SaveAsync(Uri uri, CachedCrlResponse response, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        ArgumentNullException.ThrowIfNull(response);
+        var (metadataPath, contentPath) = this.GetPaths(uri);
+        try
+        {
+            _ = Directory.CreateDirectory(this._directory);
+
+            // Content is written before metadata; a reader only trusts the pair when the recorded length matches.
+            await WriteContentAsync(contentPath, response.Content, cancellationToken).ConfigureAwait(false);
+            var metadata = new CacheMetadataDocument {
+                Uri = uri.ToString(),
+                ETag = response.ETag,
+                LastModified = response.LastModified,
+                ContentLength = response.Content.Length
+            };
+            var json = JsonSerializer.Serialize(metadata, SerializerOptions);
+            await File.WriteAllTextAsync(metadataPath, json, Encoding.UTF8, cancellationToken).ConfigureAwait(false);
+        }
+        catch (OperationCanceledException)
+        {
+            throw;
+        }
+        catch (Exception ex)
+        {
+            Log.Warning(ex, "Failed to update HTTP cache entry for {Uri}: {Message}", uri, ex.Message);
+        }
+    }
+#pragma warning restore CA1031
+
+    private static async Task WriteContentAsync(string path, ReadOnlyMemory<byte> content, CancellationToken cancellationToken)
+    {
+        // Written from the fetcher's own buffer, which may be pooled, so no intermediate array is made.
+        using var stream = new FileStream(path, FileMode.Create, FileAccess.Write, FileShare.None, bufferSize: 1, FileOptions.Asynchronous);
+        await stream.WriteAsync(content, cancellationToken).ConfigureAwait(false);
+    }
+
+    private (string MetadataPath, string ContentPath) GetPaths(Uri uri)
+    {
+        var hash = SHA256.HashData(Encoding.UTF8.GetBytes(uri.ToString()));
+        var name = Convert.ToHexString(hash);
+        return (Path.Combine(this._directory, name + MetadataExtension), Path.Combine(this._directory, name + ContentExtension));
+    }
+
+    private sealed class CacheMetadataDocument
+    {
+        [JsonPropertyName("uri")]
+        public string? Uri { get; set; }
+
+        [JsonPropertyName("etag")]
+        public string? ETag { get; set; }
+
+        [JsonPropertyName("last_modified")]
+        public DateTimeOffset? LastModified { get; set; }
+
+        [JsonPropertyName("content_length")]
+        public long ContentLength { get; set; }
+    }
+}
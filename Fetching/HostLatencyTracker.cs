@@ -0,0 +1,72 @@
+using System.Collections.Concurrent;
+
+namespace CrlMonitor.Fetching;
+
+/// <summary>
+/// Smoothed time to first byte per host. Once a host has enough samples, a request still waiting for its headers
+/// after <c>multiplier</c> times that average is considered slow enough to hedge.
+/// </summary>
+internal sealed class HostLatencyTracker
+{
+    private const int MinSamples = 5;
+    private const double Smoothing = 0.2;
+    private static readonly TimeSpan MinHedgeDelay = TimeSpan.FromMilliseconds(50);
+    private readonly double _multiplier;
+    private readonly ConcurrentDictionary<string, HostLatency> _hosts = new(StringComparer.OrdinalIgnoreCase);
+
+    public HostLatencyTracker(double multiplier)
+    {
+        ArgumentOutOfRangeException.ThrowIfLessThanOrEqual(multiplier, 1);
+        this._multiplier = multiplier;
+    }
+
+    public void Record(string host, TimeSpan timeToFirstByte)
+    {
+        ArgumentNullException.ThrowIfNull(host);
+        this._hosts.GetOrAdd(host, _ => new HostLatency()).Add(timeToFirstByte);
+    }
+
+    /// <summary>
+    /// Gets how long to wait for headers before sending a second request, or null while the host has too little
+    /// history to judge.
+    /// </summary>
+    public TimeSpan? GetHedgeDelay(string host)
+    {
+        ArgumentNullException.ThrowIfNull(host);
+        if (!this._hosts.TryGetValue(host, out var latency) || !latency.TryGetAverage(MinSamples, out var average))
+        {
+            return null;
+        }
+
+        var delay = average * this._multiplier;
+        return delay > MinHedgeDelay ? delay : MinHedgeDelay;
+    }
+
+    private sealed class HostLatency
+    {
+        private readonly object _sync = new();
+        private int _samples;
+        private double _averageTicks;
+
+        public void Add(TimeSpan value)
+        {
+            lock (this._sync)
+            {
+                // Exponential moving average: recent requests count most, so a host that recovers stops being hedged.
+                this._averageTicks = this._samples == 0
+                    ? value.Ticks
+                    : this._averageTicks + (Smoothing * (value.Ticks - this._averageTicks));
+                this._samples++;
+            }
+        }
+
+        public bool TryGetAverage(int minSamples, out TimeSpan average)
+        {
+            lock (this._sync)
+            {
+                average = TimeSpan.FromTicks((long)this._averageTicks);
+                return this._samples >= minSamples;
+            }
+        }
+    }
+}
@@ -0,0 +1,241 @@
+using System.Collections.Concurrent;
+using System.Net;
+
+namespace CrlMonitor.Fetching;
+
+/// <summary>
+/// Caps concurrent requests and, optionally, the request rate per host so that polling many CRLs published on one
+/// CA's CDN does not trip its throttling. Also marks each request so the connect callback can record whether it
+/// needed a new connection.
+/// </summary>
+/// <remarks>
+/// Responses are read with <see cref="HttpCompletionOption.ResponseHeadersRead"/>, so a host's slot is held until the
+/// response body has been read or the response is disposed, not just until the headers arrive; otherwise large bodies
+/// would download with no cap at all.
+/// </remarks>
+internal sealed class HostThrottlingHandler(HttpClientOptions options) : DelegatingHandler
+{
+    private readonly HttpClientOptions _options = options ?? throw new ArgumentNullException(nameof(options));
+    private readonly ConcurrentDictionary<string, HostLimits> _hosts = new(StringComparer.OrdinalIgnoreCase);
+
+    protected override async Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(request);
+        var host = request.RequestUri?.Host ?? string.Empty;
+        var limits = this._hosts.GetOrAdd(host, _ => HostLimits.Create(this._options));
+        await limits.Concurrency.WaitAsync(cancellationToken).ConfigureAwait(false);
+        var slot = new HostSlot(limits.Concurrency);
+        try
+        {
+            if (limits.RateLimit != null)
+            {
+                await limits.RateLimit.AcquireAsync(cancellationToken).ConfigureAwait(false);
+            }
+
+            request.Options.Set(HttpConnectionTracking.NewConnection, false);
+            var response = await base.SendAsync(request, cancellationToken).ConfigureAwait(false);
+#pragma warning disable CA2000 // Disposed with the response
+            response.Content = new SlotContent(response.Content, slot);
+#pragma warning restore CA2000
+            return response;
+        }
+        catch
+        {
+            slot.Release();
+            throw;
+        }
+    }
+
+    protected override void Dispose(bool disposing)
+    {
+        if (disposing)
+        {
+            foreach (var limits in this._hosts.Values)
+            {
+                limits.Concurrency.Dispose();
+            }
+
+            this._hosts.Clear();
+        }
+
+        base.Dispose(disposing);
+    }
+
+    /// <summary>
+    /// One request's hold on its host's concurrency slot; released exactly once, whichever of the body stream, the
+    /// content or the response is finished with first.
+    /// </summary>
+    private sealed class HostSlot(SemaphoreSlim concurrency)
+    {
+        private readonly SemaphoreSlim _concurrency = concurrency;
+        private int _released;
+
+        public void Release()
+        {
+            if (Interlocked.Exchange(ref this._released, 1) != 0)
+            {
+                return;
+            }
+
+            try
+            {
+                _ = this._concurrency.Release();
+            }
+            catch (ObjectDisposedException)
+            {
+                // The handler was disposed while the response was still open; there is nothing left to release.
+            }
+        }
+    }
+
+    /// <summary>
+    /// Passes the response body through and releases the host slot once the body has been read or disposed.
+    /// </summary>
+    private sealed class SlotContent : HttpContent
+    {
+        private readonly HttpContent _inner;
+        private readonly HostSlot _slot;
+
+        public SlotContent(HttpContent inner, HostSlot slot)
+        {
+            this._inner = inner;
+            this._slot = slot;
+            foreach (var header in inner.Headers)
+            {
+                _ = this.Headers.TryAddWithoutValidation(header.Key, header.Value);
+            }
+        }
+
+        protected override Task SerializeToStreamAsync(Stream stream, TransportContext? context)
+        {
+            return this.SerializeToStreamAsync(stream, context, CancellationToken.None);
+        }
+
+        protected override async Task SerializeToStreamAsync(Stream stream, TransportContext? context, CancellationToken cancellationToken)
+        {
+            try
+            {
+                await this._inner.CopyToAsync(stream, context, cancellationToken).ConfigureAwait(false);
+            }
+            finally
+            {
+                this._slot.Release();
+            }
+        }
+
+        protected override Task<Stream> CreateContentReadStreamAsync()
+        {
+            return this.CreateContentReadStreamAsync(CancellationToken.None);
+        }
+
+        protected override async Task<Stream> CreateContentReadStreamAsync(CancellationToken cancellationToken)
+        {
+            var stream = await this._inner.ReadAsStreamAsync(cancellationToken).ConfigureAwait(false);
+            return new SlotStream(stream, this._slot);
+        }
+
+        protected override bool TryComputeLength(out long length)
+        {
+            // The copied Content-Length header, when the server sent one, is all that is known up front.
+            length = 0;
+            return false;
+        }
+
+        protected override void Dispose(bool disposing)
+        {
+            if (disposing)
+            {
+                this._inner.Dispose();
+                this._slot.Release();
+            }
+
+            base.Dispose(disposing);
+        }
+    }
+
+    /// <summary>
+    /// Read-only view of a response body stream that releases the host slot when it is disposed.
+    /// </summary>
+    private sealed class SlotStream(Stream inner, HostSlot slot) : Stream
+    {
+        private readonly Stream _inner = inner;
+        private readonly HostSlot _slot = slot;
+
+        public override bool CanRead => this._inner.CanRead;
+
+        public override bool CanSeek => false;
+
+        public override bool CanWrite => false;
+
+        public override long Length => throw new NotSupportedException();
+
+        public override long Position
+        {
+            get => throw new NotSupportedException();
+            set => throw new NotSupportedException();
+        }
+
+        public override int Read(byte[] buffer, int offset, int count)
+        {
+            return this._inner.Read(buffer, offset, count);
+        }
+
+        public override int Read(Span<byte> buffer)
+        {
+            return this._inner.Read(buffer);
+        }
+
+        public override Task<int> ReadAsync(byte[] buffer, int offset, int count, CancellationToken cancellationToken)
+        {
+            return this._inner.ReadAsync(buffer, offset, count, cancellationToken);
+        }
+
+        public override ValueTask<int> ReadAsync(Memory<byte> buffer, CancellationToken cancellationToken = default)
+        {
+            return this._inner.ReadAsync(buffer, cancellationToken);
+        }
+
+        public override void Flush()
+        {
+        }
+
+        public override long Seek(long offset, SeekOrigin origin)
+        {
+            throw new NotSupportedException();
+        }
+
+        public override void SetLength(long value)
+        {
+            throw new NotSupportedException();
+        }
+
+        public override void Write(byte[] buffer, int offset, int count)
+        {
+            throw new NotSupportedException();
+        }
+
+        protected override void Dispose(bool disposing)
+        {
+            if (disposing)
+            {
+                this._inner.Dispose();
+                this._slot.Release();
+            }
+
+            base.Dispose(disposing);
+        }
+    }
+
+    private sealed record HostLimits(SemaphoreSlim Concurrency, TokenBucket? RateLimit)
+    {
+        public static HostLimits Create(HttpClientOptions options)
+        {
+            var rateLimit = options.RequestsPerSecondPerHost > 0
+                ? new TokenBucket(options.RequestsPerSecondPerHost, Math.Max(1, options.BurstPerHost))
+                : null;
+#pragma warning disable CA2000 // Disposed with the handler
+            return new HostLimits(new SemaphoreSlim(Math.Max(1, options.MaxRequestsPerHost)), rateLimit);
+#pragma warning restore CA2000
+        }
+    }
+}
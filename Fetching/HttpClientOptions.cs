@@ -0,0 +1,16 @@
+namespace CrlMonitor.Fetching;
+
+/// <summary>
+/// Connection pooling and per-host throttling settings for the HTTP stack.
+/// A <see cref="RequestsPerSecondPerHost"/> of zero disables rate limiting, and a <see cref="HedgeLatencyMultiplier"/>
+/// of zero disables hedged requests.
+/// </summary>
+internal sealed record HttpClientOptions(
+    int MaxRequestsPerHost,
+    double RequestsPerSecondPerHost,
+    int BurstPerHost,
+    TimeSpan ConnectionLifetime,
+    TimeSpan ConnectionIdleTimeout,
+    bool EnableHttp2,
+    bool AutomaticDecompression,
+    double HedgeLatencyMultiplier = 0);
@@ -0,0 +1,39 @@
+using System.Diagnostics;
+
+namespace CrlMonitor.Fetching;
+
+/// <summary>
+/// Connection setup times for one request, filled in by the handler's connect callback and stream filter when the
+/// request opens a new connection. All values stay null when a pooled connection is reused.
+/// </summary>
+internal sealed class HttpConnectionTimings
+{
+    private long _connectedAt;
+
+    public TimeSpan? Dns { get; private set; }
+
+    public TimeSpan? Connect { get; private set; }
+
+    public TimeSpan? Tls { get; private set; }
+
+    /// <summary>
+    /// Total time spent opening the connection, which is part of the time to first byte.
+    /// </summary>
+    public TimeSpan Setup => (this.Dns ?? TimeSpan.Zero) + (this.Connect ?? TimeSpan.Zero) + (this.Tls ?? TimeSpan.Zero);
+
+    public void RecordConnected(long startedAt, long resolvedAt)
+    {
+        var connectedAt = Stopwatch.GetTimestamp();
+        this.Dns = Stopwatch.GetElapsedTime(startedAt, resolvedAt);
+        this.Connect = Stopwatch.GetElapsedTime(resolvedAt, connectedAt);
+        this._connectedAt = connectedAt;
+    }
+
+    public void RecordSecured()
+    {
+        if (this._connectedAt != 0)
+        {
+            this.Tls = Stopwatch.GetElapsedTime(this._connectedAt);
+        }
+    }
+}
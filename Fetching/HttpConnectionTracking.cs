@@ -0,0 +1,19 @@
+namespace CrlMonitor.Fetching;
+
+/// <summary>
+/// Request options used to report whether a request had to open a new connection and how long that took.
+/// </summary>
+internal static class HttpConnectionTracking
+{
+    public static readonly HttpRequestOptionsKey<bool> NewConnection = new("CrlMonitor.NewConnection");
+    public static readonly HttpRequestOptionsKey<HttpConnectionTimings> Timings = new("CrlMonitor.ConnectionTimings");
+
+    /// <summary>
+    /// Returns whether the request reused a pooled connection, or null when the handler does not track connections.
+    /// </summary>
+    public static bool? WasReused(HttpRequestMessage request)
+    {
+        ArgumentNullException.ThrowIfNull(request);
+        return request.Options.TryGetValue(NewConnection, out var isNew) ? !isNew : null;
+    }
+}
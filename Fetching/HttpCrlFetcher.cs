@@ -1,17 +1,56 @@
+using System.Diagnostics;
+using System.Net;
+using System.Net.Http.Headers;
+using CrlMonitor.Models;
+
 namespace CrlMonitor.Fetching;
 
-internal sealed class HttpCrlFetcher(HttpClient httpClient) : ICrlFetcher
+/// <summary>
+/// Downloads CRLs over HTTP. With a hedge multiplier set, a request still waiting for headers after that many times
+/// the host's usual time to first byte gets a second, identical request; whichever answers first is used and the
+/// other is cancelled.
+/// </summary>
+internal sealed class HttpCrlFetcher(HttpClient httpClient, ICrlResponseCache? responseCache = null, double hedgeLatencyMultiplier = 0)
+    : ICrlFetcher
 {
     private readonly HttpClient _httpClient = httpClient ?? throw new ArgumentNullException(nameof(httpClient));
+    private readonly ICrlResponseCache? _responseCache = responseCache;
+    private readonly HostLatencyTracker? _latency = hedgeLatencyMultiplier > 0 ? new HostLatencyTracker(hedgeLatencyMultiplier) : null;
 
     public async Task<FetchedCrl> FetchAsync(CrlConfigEntry entry, CancellationToken cancellationToken)
     {
         ArgumentNullException.ThrowIfNull(entry);
-        using var request = new HttpRequestMessage(HttpMethod.Get, entry.Uri);
-        var start = DateTime.UtcNow;
-        using var response = await this._httpClient.SendAsync(request, HttpCompletionOption.ResponseHeadersRead, cancellationToken).ConfigureAwait(false);
-        _ = response.EnsureSuccessStatusCode();
+        var cached = this._responseCache == null
+            ? null
+            : await this._responseCache.GetAsync(entry.Uri, cancellationToken).ConfigureAwait(false);
+        var start = Stopwatch.GetTimestamp();
+        using var sent = await this.SendAsync(entry.Uri, cached, cancellationToken).ConfigureAwait(false);
+        var response = sent.Response;
+        var connection = sent.Connection;
+        var headersAt = Stopwatch.GetTimestamp();
+        var timeToFirstByte = Stopwatch.GetElapsedTime(start, headersAt);
+        var connectionReused = HttpConnectionTracking.WasReused(sent.Request);
         var limit = entry.MaxCrlSizeBytes;
+        if (cached != null && response.StatusCode == HttpStatusCode.NotModified)
+        {
+            if (cached.Content.Length > limit)
+            {
+                throw new CrlTooLargeException(entry.Uri, limit, cached.Content.Length);
+            }
+
+            var revalidated = Stopwatch.GetElapsedTime(start);
+            return new FetchedCrl(
+                cached.Content,
+                revalidated,
+                cached.Content.Length,
+                CacheHit: true,
+                TimeToFirstByte: timeToFirstByte,
+                ConnectionReused: connectionReused,
+                Timings: BuildTimings(connection, timeToFirstByte, transfer: null),
+                Hedged: sent.Hedged);
+        }
+
+        _ = response.EnsureSuccessStatusCode();
         var declaredLength = response.Content.Headers.ContentLength;
         if (declaredLength.HasValue && declaredLength.Value > limit)
         {
@@ -19,8 +58,159 @@ internal sealed class HttpCrlFetcher(HttpClient httpClient) : ICrlFetcher
         }
 
         using var stream = await response.Content.ReadAsStreamAsync(cancellationToken).ConfigureAwait(false);
-        var bytes = await CrlContentLimiter.ReadAllBytesAsync(stream, entry.Uri, limit, cancellationToken).ConfigureAwait(false);
-        var elapsed = DateTime.UtcNow - start;
-        return new FetchedCrl(bytes, elapsed, bytes.LongLength);
+        var content = await CrlContentLimiter.ReadAllBytesAsync(stream, entry.Uri, limit, declaredLength, cancellationToken).ConfigureAwait(false);
+        try
+        {
+            var elapsed = Stopwatch.GetElapsedTime(start);
+            var transfer = Stopwatch.GetElapsedTime(headersAt);
+            await this.TryStoreAsync(entry.Uri, response, content.Memory, cancellationToken).ConfigureAwait(false);
+            return new FetchedCrl(
+                content.Memory,
+                elapsed,
+                content.Memory.Length,
+                TimeToFirstByte: timeToFirstByte,
+                ConnectionReused: connectionReused,
+                Timings: BuildTimings(connection, timeToFirstByte, transfer),
+                ContentOwner: content,
+                Hedged: sent.Hedged);
+        }
+        catch
+        {
+            content.Dispose();
+            throw;
+        }
+    }
+
+    private async Task<SentRequest> SendAsync(Uri uri, CachedCrlResponse? cached, CancellationToken cancellationToken)
+    {
+        var hedgeDelay = this._latency?.GetHedgeDelay(uri.Host);
+        if (!hedgeDelay.HasValue)
+        {
+            return await this.SendOnceAsync(uri, cached, cancellationToken).ConfigureAwait(false);
+        }
+
+        using var primaryCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        using var hedgeCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        var primary = this.SendOnceAsync(uri, cached, primaryCts.Token);
+        using (var timerCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken))
+        {
+            var timer = Task.Delay(hedgeDelay.Value, timerCts.Token);
+            var first = await Task.WhenAny(primary, timer).ConfigureAwait(false);
+            await timerCts.CancelAsync().ConfigureAwait(false);
+            if (first == primary || cancellationToken.IsCancellationRequested)
+            {
+                return await primary.ConfigureAwait(false);
+            }
+        }
+
+        var hedge = this.SendOnceAsync(uri, cached, hedgeCts.Token);
+        var winner = await Task.WhenAny(primary, hedge).ConfigureAwait(false);
+        var (loser, loserCts) = winner == primary ? (hedge, hedgeCts) : (primary, primaryCts);
+        if (!winner.IsCompletedSuccessfully)
+        {
+            // The first to finish failed, so the other request is the only one left that may still succeed.
+            _ = winner.Exception;
+            return await loser.ConfigureAwait(false) with { Hedged = true };
+        }
+
+        await loserCts.CancelAsync().ConfigureAwait(false);
+        _ = loser.ContinueWith(
+            static task =>
+            {
+                if (task.IsCompletedSuccessfully)
+                {
+                    task.Result.Dispose();
+                }
+                else
+                {
+                    _ = task.Exception;
+                }
+            },
+            CancellationToken.None,
+            TaskContinuationOptions.ExecuteSynchronously,
+            TaskScheduler.Default);
+        return winner.Result with { Hedged = true };
+    }
+
+    private async Task<SentRequest> SendOnceAsync(Uri uri, CachedCrlResponse? cached, CancellationToken cancellationToken)
+    {
+#pragma warning disable CA2000 // Ownership passes to the returned SentRequest
+        var request = new HttpRequestMessage(HttpMethod.Get, uri) {
+            Version = this._httpClient.DefaultRequestVersion,
+            VersionPolicy = this._httpClient.DefaultVersionPolicy
+        };
+#pragma warning restore CA2000
+        try
+        {
+            if (cached != null)
+            {
+                AddConditionalHeaders(request, cached);
+            }
+
+            var connection = new HttpConnectionTimings();
+            request.Options.Set(HttpConnectionTracking.Timings, connection);
+            var start = Stopwatch.GetTimestamp();
+            var response = await this._httpClient.SendAsync(request, HttpCompletionOption.ResponseHeadersRead, cancellationToken).ConfigureAwait(false);
+            this._latency?.Record(uri.Host, Stopwatch.GetElapsedTime(start));
+            return new SentRequest(request, response, connection);
+        }
+        catch
+        {
+            request.Dispose();
+            throw;
+        }
+    }
+
+    private static CrlStageTimings BuildTimings(HttpConnectionTimings connection, TimeSpan timeToFirstByte, TimeSpan? transfer)
+    {
+        // Whatever part of the time to first byte was not spent opening the connection was spent waiting on the server.
+        var wait = timeToFirstByte - connection.Setup;
+        return new CrlStageTimings(
+            connection.Dns,
+            connection.Connect,
+            connection.Tls,
+            wait > TimeSpan.Zero ? wait : TimeSpan.Zero,
+            transfer);
+    }
+
+    private static void AddConditionalHeaders(HttpRequestMessage request, CachedCrlResponse cached)
+    {
+        if (!string.IsNullOrWhiteSpace(cached.ETag) && EntityTagHeaderValue.TryParse(cached.ETag, out var etag))
+        {
+            request.Headers.IfNoneMatch.Add(etag);
+        }
+
+        if (cached.LastModified.HasValue)
+        {
+            request.Headers.IfModifiedSince = cached.LastModified.Value;
+        }
+    }
+
+    private async Task TryStoreAsync(Uri uri, HttpResponseMessage response, ReadOnlyMemory<byte> content, CancellationToken cancellationToken)
+    {
+        if (this._responseCache == null)
+        {
+            return;
+        }
+
+        var etag = response.Headers.ETag?.ToString();
+        var lastModified = response.Content.Headers.LastModified;
+        if (string.IsNullOrWhiteSpace(etag) && !lastModified.HasValue)
+        {
+            // Without a validator the server cannot answer 304, so caching the body gains nothing.
+            return;
+        }
+
+        await this._responseCache.SaveAsync(uri, new CachedCrlResponse(etag, lastModified, content), cancellationToken).ConfigureAwait(false);
+    }
+
+    private sealed record SentRequest(HttpRequestMessage Request, HttpResponseMessage Response, HttpConnectionTimings Connection, bool Hedged = false)
+        : IDisposable
+    {
+        public void Dispose()
+        {
+            this.Response.Dispose();
+            this.Request.Dispose();
+        }
     }
 }
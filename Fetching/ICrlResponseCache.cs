@@ -0,0 +1,15 @@
+namespace CrlMonitor.Fetching;
+
+/// <summary>
+/// Stores the last successful HTTP response per CRL URI so unchanged CRLs can be revalidated cheaply.
+/// </summary>
+internal interface ICrlResponseCache
+{
+    Task<CachedCrlResponse?> GetAsync(Uri uri, CancellationToken cancellationToken);
+
+    /// <summary>
+    /// Stores <paramref name="response"/>. Its content may be a view over the fetcher's pooled buffer, so
+    /// implementations must copy or write it out before the returned task completes.
+    /// </summary>
+    Task SaveAsync(Uri uri, CachedCrlResponse response, CancellationToken cancellationToken);
+}
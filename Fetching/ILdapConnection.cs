@@ -2,5 +2,12 @@ namespace CrlMonitor.Fetching;
 
 internal interface ILdapConnection : IDisposable
 {
-    byte[][] GetAttributeValues(string distinguishedName, string attributeName);
+    /// <summary>
+    /// Reads the requested attributes of a single entry in one base-scope search.
+    /// Attributes the entry does not carry are omitted from the result.
+    /// </summary>
+    Task<IReadOnlyDictionary<string, byte[][]>> SearchAsync(
+        string distinguishedName,
+        IReadOnlyList<string> attributeNames,
+        CancellationToken cancellationToken);
 }
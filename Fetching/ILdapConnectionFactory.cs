@@ -2,5 +2,8 @@ namespace CrlMonitor.Fetching;
 
 internal interface ILdapConnectionFactory
 {
-    ILdapConnection Open(Uri uri, LdapCredentials? credentials);
+    /// <summary>
+    /// Opens and binds a connection to the directory named by <paramref name="uri"/>.
+    /// </summary>
+    Task<ILdapConnection> OpenAsync(Uri uri, LdapCredentials? credentials, CancellationToken cancellationToken);
 }
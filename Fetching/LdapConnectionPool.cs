@@ -0,0 +1,210 @@
+using System.DirectoryServices.Protocols;
+
+namespace CrlMonitor.Fetching;
+
+/// <summary>
+/// Keeps bound LDAP connections open between fetches so CRLs published on the same directory share one connection
+/// instead of paying for a new TCP/TLS handshake and bind each time. Connections are pooled per scheme, host, port
+/// and credentials, and each is used by one fetch at a time.
+/// </summary>
+internal sealed class LdapConnectionPool(
+    ILdapConnectionFactory inner,
+    TimeSpan? idleTimeout = null,
+    Func<DateTime>? utcNow = null) : ILdapConnectionFactory, IDisposable
+{
+    private const int MaxIdlePerKey = 8;
+    private static readonly TimeSpan DefaultIdleTimeout = TimeSpan.FromMinutes(2);
+    private readonly ILdapConnectionFactory _inner = inner ?? throw new ArgumentNullException(nameof(inner));
+    private readonly TimeSpan _idleTimeout = idleTimeout ?? DefaultIdleTimeout;
+    private readonly Func<DateTime> _utcNow = utcNow ?? (() => DateTime.UtcNow);
+    private readonly object _sync = new();
+    private readonly Dictionary<PoolKey, Stack<IdleConnection>> _idle = [];
+    private bool _disposed;
+
+    public int IdleCount
+    {
+        get
+        {
+            lock (this._sync)
+            {
+                return this._idle.Values.Sum(stack => stack.Count);
+            }
+        }
+    }
+
+    public async Task<ILdapConnection> OpenAsync(Uri uri, LdapCredentials? credentials, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        ObjectDisposedException.ThrowIf(this._disposed, this);
+        var key = PoolKey.Create(uri, credentials);
+        var reused = this.TryTakeIdle(key);
+        if (reused != null)
+        {
+            return new PooledConnection(this._inner, connection => this.Return(key, connection), uri, credentials, reused, isReused: true);
+        }
+
+        var opened = await this._inner.OpenAsync(uri, credentials, cancellationToken).ConfigureAwait(false);
+        return new PooledConnection(this._inner, connection => this.Return(key, connection), uri, credentials, opened, isReused: false);
+    }
+
+    public void Dispose()
+    {
+        List<IdleConnection> toDispose;
+        lock (this._sync)
+        {
+            if (this._disposed)
+            {
+                return;
+            }
+
+            this._disposed = true;
+            toDispose = [.. this._idle.Values.SelectMany(stack => stack)];
+            this._idle.Clear();
+        }
+
+        foreach (var idle in toDispose)
+        {
+            idle.Connection.Dispose();
+        }
+    }
+
+    private ILdapConnection? TryTakeIdle(PoolKey key)
+    {
+        var expired = new List<ILdapConnection>();
+        ILdapConnection? taken = null;
+        lock (this._sync)
+        {
+            if (this._idle.TryGetValue(key, out var stack))
+            {
+                var cutoff = this._utcNow() - this._idleTimeout;
+                while (stack.TryPop(out var idle))
+                {
+                    if (idle.ReturnedAtUtc >= cutoff)
+                    {
+                        taken = idle.Connection;
+                        break;
+                    }
+
+                    // Directories drop idle sessions, so stale connections are closed rather than risk a failed search.
+                    expired.Add(idle.Connection);
+                }
+            }
+        }
+
+        foreach (var connection in expired)
+        {
+            connection.Dispose();
+        }
+
+        return taken;
+    }
+
+    private void Return(PoolKey key, ILdapConnection connection)
+    {
+        lock (this._sync)
+        {
+            if (!this._disposed)
+            {
+                if (!this._idle.TryGetValue(key, out var stack))
+                {
+                    stack = new Stack<IdleConnection>();
+                    this._idle[key] = stack;
+                }
+
+                if (stack.Count < MaxIdlePerKey)
+                {
+                    stack.Push(new IdleConnection(connection, this._utcNow()));
+                    return;
+                }
+            }
+        }
+
+        connection.Dispose();
+    }
+
+    private sealed record PoolKey(string Scheme, string Host, int Port, LdapCredentials? Credentials)
+    {
+        public static PoolKey Create(Uri uri, LdapCredentials? credentials)
+        {
+            return new PoolKey(uri.Scheme.ToUpperInvariant(), uri.Host.ToUpperInvariant(), uri.Port, credentials);
+        }
+    }
+
+    private sealed record IdleConnection(ILdapConnection Connection, DateTime ReturnedAtUtc);
+
+    /// <summary>
+    /// Lease handed to callers; disposing it returns the underlying connection to the pool unless it failed.
+    /// </summary>
+    private sealed class PooledConnection(
+        ILdapConnectionFactory factory,
+        Action<ILdapConnection> release,
+        Uri uri,
+        LdapCredentials? credentials,
+        ILdapConnection connection,
+        bool isReused) : ILdapConnection
+    {
+        private readonly ILdapConnectionFactory _factory = factory;
+        private readonly Action<ILdapConnection> _release = release;
+        private readonly Uri _uri = uri;
+        private readonly LdapCredentials? _credentials = credentials;
+        private ILdapConnection _connection = connection;
+        private bool _isReused = isReused;
+        private bool _broken;
+        private bool _disposed;
+
+        public async Task<IReadOnlyDictionary<string, byte[][]>> SearchAsync(
+            string distinguishedName,
+            IReadOnlyList<string> attributeNames,
+            CancellationToken cancellationToken)
+        {
+            ObjectDisposedException.ThrowIf(this._disposed, this);
+            try
+            {
+                return await this.SearchCoreAsync(distinguishedName, attributeNames, cancellationToken).ConfigureAwait(false);
+            }
+            catch (LdapException) when (this._isReused && !cancellationToken.IsCancellationRequested)
+            {
+                // The server may have closed a pooled session since it was last used; retry once on a fresh bind.
+                this._connection.Dispose();
+                this._isReused = false;
+                this._connection = await this._factory.OpenAsync(this._uri, this._credentials, cancellationToken).ConfigureAwait(false);
+                this._broken = false;
+                return await this.SearchCoreAsync(distinguishedName, attributeNames, cancellationToken).ConfigureAwait(false);
+            }
+        }
+
+        public void Dispose()
+        {
+            if (this._disposed)
+            {
+                return;
+            }
+
+            this._disposed = true;
+            if (this._broken)
+            {
+                this._connection.Dispose();
+                return;
+            }
+
+            this._release(this._connection);
+        }
+
+        private async Task<IReadOnlyDictionary<string, byte[][]>> SearchCoreAsync(
+            string distinguishedName,
+            IReadOnlyList<string> attributeNames,
+            CancellationToken cancellationToken)
+        {
+            try
+            {
+                return await this._connection.SearchAsync(distinguishedName, attributeNames, cancellationToken).ConfigureAwait(false);
+            }
+            catch (Exception ex) when (ex is not DirectoryOperationException)
+            {
+                // Operation errors (e.g. no such object) leave the session usable; anything else may not.
+                this._broken = true;
+                throw;
+            }
+        }
+    }
+}
@@ -1,11 +1,20 @@
+using System.Diagnostics;
+using CrlMonitor.Models;
+
 namespace CrlMonitor.Fetching;
 
+/// <summary>
+/// Reads a CRL from a directory entry. The attribute comes from the URI's attribute list
+/// (<c>ldap://host/dn?deltaRevocationList</c>, as in RFC 4516) and defaults to <c>certificateRevocationList</c>; it is
+/// always requested in its <c>;binary</c> form.
+/// </summary>
 internal sealed class LdapCrlFetcher(ILdapConnectionFactory connectionFactory) : ICrlFetcher
 {
-    private const string AttributeName = "certificateRevocationList;binary";
+    private const string DefaultAttributeName = "certificateRevocationList;binary";
+    private const string BinaryOption = ";binary";
     private readonly ILdapConnectionFactory _connectionFactory = connectionFactory ?? throw new ArgumentNullException(nameof(connectionFactory));
 
-    public Task<FetchedCrl> FetchAsync(CrlConfigEntry entry, CancellationToken cancellationToken)
+    public async Task<FetchedCrl> FetchAsync(CrlConfigEntry entry, CancellationToken cancellationToken)
     {
         ArgumentNullException.ThrowIfNull(entry);
         if (!IsLdap(entry.Uri))
@@ -14,13 +23,20 @@ internal sealed class LdapCrlFetcher(ILdapConnectionFactory connectionFactory) :
         }
 
         cancellationToken.ThrowIfCancellationRequested();
-        using var connection = this._connectionFactory.Open(entry.Uri, entry.Ldap);
         var distinguishedName = BuildDistinguishedName(entry.Uri);
-        var start = DateTime.UtcNow;
-        var values = connection.GetAttributeValues(distinguishedName, AttributeName);
-        if (values.Length == 0)
+        var attributeName = GetAttributeName(entry.Uri);
+        var start = Stopwatch.GetTimestamp();
+        IReadOnlyDictionary<string, byte[][]> attributes;
+        TimeSpan connect;
+        using (var connection = await this._connectionFactory.OpenAsync(entry.Uri, entry.Ldap, cancellationToken).ConfigureAwait(false))
+        {
+            connect = Stopwatch.GetElapsedTime(start);
+            attributes = await connection.SearchAsync(distinguishedName, [attributeName], cancellationToken).ConfigureAwait(false);
+        }
+
+        if (!attributes.TryGetValue(attributeName, out var values) || values.Length == 0)
         {
-            throw new InvalidOperationException($"LDAP entry '{distinguishedName}' does not contain {AttributeName}.");
+            throw new InvalidOperationException($"LDAP entry '{distinguishedName}' does not contain {attributeName}.");
         }
 
         var crlBytes = values[0];
@@ -28,8 +44,13 @@ internal sealed class LdapCrlFetcher(ILdapConnectionFactory connectionFactory) :
         {
             throw new CrlTooLargeException(entry.Uri, entry.MaxCrlSizeBytes, crlBytes.LongLength);
         }
-        var elapsed = DateTime.UtcNow - start;
-        return Task.FromResult(new FetchedCrl(crlBytes, elapsed, crlBytes.Length));
+
+        var elapsed = Stopwatch.GetElapsedTime(start);
+        return new FetchedCrl(
+            crlBytes,
+            elapsed,
+            crlBytes.Length,
+            Timings: new CrlStageTimings(Connect: connect, Transfer: elapsed - connect));
     }
 
     private static bool IsLdap(Uri uri)
@@ -38,6 +59,17 @@ internal sealed class LdapCrlFetcher(ILdapConnectionFactory connectionFactory) :
                uri.Scheme.Equals("ldaps", StringComparison.OrdinalIgnoreCase);
     }
 
+    private static string GetAttributeName(Uri uri)
+    {
+        // The query is "?attributes?scope?filter"; only the first listed attribute is read.
+        var query = uri.Query.TrimStart('?');
+        var end = query.IndexOfAny(['?', ',']);
+        var attribute = Uri.UnescapeDataString(end >= 0 ? query[..end] : query).Trim();
+        return attribute.Length == 0
+            ? DefaultAttributeName
+            : attribute.EndsWith(BinaryOption, StringComparison.OrdinalIgnoreCase) ? attribute : attribute + BinaryOption;
+    }
+
     private static string BuildDistinguishedName(Uri uri)
     {
         var path = uri.AbsolutePath;
@@ -0,0 +1,85 @@
+using System.Buffers;
+using System.IO.MemoryMappedFiles;
+
+namespace CrlMonitor.Fetching;
+
+/// <summary>
+/// Exposes a read-only memory-mapped view of a CRL file as <see cref="Memory{T}"/>, so large local CRLs are parsed
+/// straight from the page cache without being copied onto the managed heap.
+/// </summary>
+internal sealed unsafe class MemoryMappedCrlContent : MemoryManager<byte>
+{
+    private readonly MemoryMappedFile _file;
+    private readonly MemoryMappedViewAccessor _view;
+    private readonly int _length;
+    private byte* _pointer;
+
+    private MemoryMappedCrlContent(MemoryMappedFile file, MemoryMappedViewAccessor view, int length)
+    {
+        this._file = file;
+        this._view = view;
+        this._length = length;
+        view.SafeMemoryMappedViewHandle.AcquirePointer(ref this._pointer);
+
+        // The view starts on a page boundary; PointerOffset locates the requested offset (zero) within it.
+        this._pointer += view.PointerOffset;
+    }
+
+    /// <summary>
+    /// Maps the first <paramref name="length"/> bytes of <paramref name="path"/> for reading.
+    /// </summary>
+    public static MemoryMappedCrlContent Open(string path, long length)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(path);
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(length);
+        ArgumentOutOfRangeException.ThrowIfGreaterThan(length, int.MaxValue);
+
+        var file = MemoryMappedFile.CreateFromFile(path, FileMode.Open, mapName: null, capacity: 0, MemoryMappedFileAccess.Read);
+        try
+        {
+            var view = file.CreateViewAccessor(0, length, MemoryMappedFileAccess.Read);
+            return new MemoryMappedCrlContent(file, view, (int)length);
+        }
+        catch
+        {
+            file.Dispose();
+            throw;
+        }
+    }
+
+    public override Span<byte> GetSpan()
+    {
+        ObjectDisposedException.ThrowIf(this._pointer == null, this);
+        return new Span<byte>(this._pointer, this._length);
+    }
+
+    public override MemoryHandle Pin(int elementIndex = 0)
+    {
+        ObjectDisposedException.ThrowIf(this._pointer == null, this);
+        ArgumentOutOfRangeException.ThrowIfNegative(elementIndex);
+        ArgumentOutOfRangeException.ThrowIfGreaterThan(elementIndex, this._length);
+
+        // Mapped memory never moves, so there is nothing to pin.
+        return new MemoryHandle(this._pointer + elementIndex);
+    }
+
+    public override void Unpin()
+    {
+    }
+
+    protected override void Dispose(bool disposing)
+    {
+        if (this._pointer == null)
+        {
+            return;
+        }
+
+        this._pointer = null;
+        this._view.SafeMemoryMappedViewHandle.ReleasePointer();
+        if (disposing)
+        {
+            this._view.Dispose();
+            this._file.Dispose();
+        }
+    }
+}
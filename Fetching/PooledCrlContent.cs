@@ -0,0 +1,40 @@
+using System.Buffers;
+
+namespace CrlMonitor.Fetching;
+
+/// <summary>
+/// CRL bytes held in a buffer rented from <see cref="ArrayPool{T}.Shared"/>. The buffer goes back to the pool on dispose.
+/// </summary>
+internal sealed class PooledCrlContent : IMemoryOwner<byte>
+{
+    private byte[]? _buffer;
+    private readonly int _length;
+
+    public PooledCrlContent(byte[] buffer, int length)
+    {
+        ArgumentNullException.ThrowIfNull(buffer);
+        ArgumentOutOfRangeException.ThrowIfNegative(length);
+        ArgumentOutOfRangeException.ThrowIfGreaterThan(length, buffer.Length);
+        this._buffer = buffer;
+        this._length = length;
+    }
+
+    public Memory<byte> Memory
+    {
+        get
+        {
+            var buffer = this._buffer;
+            ObjectDisposedException.ThrowIf(buffer == null, this);
+            return buffer.AsMemory(0, this._length);
+        }
+    }
+
+    public void Dispose()
+    {
+        var buffer = Interlocked.Exchange(ref this._buffer, null);
+        if (buffer != null)
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+    }
+}
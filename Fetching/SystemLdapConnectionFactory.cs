@@ -5,10 +5,20 @@ namespace CrlMonitor.Fetching;
 
 internal sealed class SystemLdapConnectionFactory : ILdapConnectionFactory
 {
-    public ILdapConnection Open(Uri uri, LdapCredentials? credentials)
+    public async Task<ILdapConnection> OpenAsync(Uri uri, LdapCredentials? credentials, CancellationToken cancellationToken)
     {
         ArgumentNullException.ThrowIfNull(uri);
-        return new SystemLdapConnection(uri, credentials);
+        var connection = new SystemLdapConnection(uri, credentials);
+        try
+        {
+            await connection.BindAsync(cancellationToken).ConfigureAwait(false);
+            return connection;
+        }
+        catch
+        {
+            connection.Dispose();
+            throw;
+        }
     }
 
     private static LdapDirectoryIdentifier CreateIdentifier(Uri uri)
@@ -39,37 +49,83 @@ internal sealed class SystemLdapConnectionFactory : ILdapConnectionFactory
             }
         }
 
-        public byte[][] GetAttributeValues(string distinguishedName, string attributeName)
+        public Task BindAsync(CancellationToken cancellationToken)
+        {
+            // System.DirectoryServices.Protocols has no asynchronous bind. The blocking call runs on the thread pool and
+            // the caller stops waiting on cancellation; the caller then disposes the connection, which ends the bind.
+            return Task.Run(this._connection.Bind, CancellationToken.None).WaitAsync(cancellationToken);
+        }
+
+        public async Task<IReadOnlyDictionary<string, byte[][]>> SearchAsync(
+            string distinguishedName,
+            IReadOnlyList<string> attributeNames,
+            CancellationToken cancellationToken)
         {
             ArgumentException.ThrowIfNullOrWhiteSpace(distinguishedName);
-            ArgumentException.ThrowIfNullOrWhiteSpace(attributeName);
+            ArgumentNullException.ThrowIfNull(attributeNames);
+            cancellationToken.ThrowIfCancellationRequested();
 
-            var request = new SearchRequest(distinguishedName, "(objectClass=*)", SearchScope.Base, attributeName);
-            var response = (SearchResponse)this._connection.SendRequest(request);
-            if (response.Entries.Count == 0)
+            var request = new SearchRequest(distinguishedName, "(objectClass=*)", SearchScope.Base, [.. attributeNames]);
+            var completion = new TaskCompletionSource<DirectoryResponse>(TaskCreationOptions.RunContinuationsAsynchronously);
+            var pending = this._connection.BeginSendRequest(
+                request,
+                PartialResultProcessing.NoPartialResultSupport,
+                result => this.Complete(result, completion),
+                null);
+            DirectoryResponse response;
+            using (cancellationToken.Register(() => {
+                if (completion.TrySetCanceled(cancellationToken))
+                {
+                    this._connection.Abort(pending);
+                }
+            }))
             {
-                return [];
+                response = await completion.Task.ConfigureAwait(false);
             }
 
-            var entry = response.Entries[0];
-            var attribute = entry.Attributes[attributeName];
-            if (attribute == null || attribute.Count == 0)
+            return ReadAttributes((SearchResponse)response, attributeNames);
+        }
+
+        public void Dispose()
+        {
+            this._connection.Dispose();
+        }
+
+#pragma warning disable CA1031 // Every outcome of EndSendRequest is handed to the awaiting caller
+        private void Complete(IAsyncResult result, TaskCompletionSource<DirectoryResponse> completion)
+        {
+            try
             {
-                return [];
+                _ = completion.TrySetResult(this._connection.EndSendRequest(result));
             }
-
-            var result = new byte[attribute.Count][];
-            for (var i = 0; i < attribute.Count; i++)
+            catch (Exception ex)
             {
-                result[i] = (byte[])attribute[i];
+                _ = completion.TrySetException(ex);
             }
-
-            return result;
         }
+#pragma warning restore CA1031
 
-        public void Dispose()
+        private static Dictionary<string, byte[][]> ReadAttributes(SearchResponse response, IReadOnlyList<string> attributeNames)
         {
-            this._connection.Dispose();
+            var values = new Dictionary<string, byte[][]>(StringComparer.OrdinalIgnoreCase);
+            if (response.Entries.Count == 0)
+            {
+                return values;
+            }
+
+            var entry = response.Entries[0];
+            foreach (var attributeName in attributeNames)
+            {
+                var attribute = entry.Attributes[attributeName];
+                if (attribute == null || attribute.Count == 0)
+                {
+                    continue;
+                }
+
+                values[attributeName] = (byte[][])attribute.GetValues(typeof(byte[]));
+            }
+
+            return values;
         }
     }
 }
@@ -0,0 +1,56 @@
+namespace CrlMonitor.Fetching;
+
+/// <summary>
+/// Thread-safe token bucket: refills at a steady rate up to a burst capacity, one token per request.
+/// </summary>
+internal sealed class TokenBucket
+{
+    private readonly double _ratePerSecond;
+    private readonly double _capacity;
+    private readonly Func<DateTime> _utcNow;
+    private readonly object _sync = new();
+    private double _tokens;
+    private DateTime _lastRefillUtc;
+
+    public TokenBucket(double ratePerSecond, int capacity, Func<DateTime>? utcNow = null)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(ratePerSecond);
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(capacity);
+        this._ratePerSecond = ratePerSecond;
+        this._capacity = capacity;
+        this._utcNow = utcNow ?? (() => DateTime.UtcNow);
+        this._tokens = capacity;
+        this._lastRefillUtc = this._utcNow();
+    }
+
+    /// <summary>
+    /// Takes a token if one is available; otherwise reports how long until the next one accrues.
+    /// </summary>
+    public bool TryAcquire(out TimeSpan retryAfter)
+    {
+        lock (this._sync)
+        {
+            var now = this._utcNow();
+            var elapsedSeconds = Math.Max(0, (now - this._lastRefillUtc).TotalSeconds);
+            this._tokens = Math.Min(this._capacity, this._tokens + (elapsedSeconds * this._ratePerSecond));
+            this._lastRefillUtc = now;
+            if (this._tokens >= 1)
+            {
+                this._tokens -= 1;
+                retryAfter = TimeSpan.Zero;
+                return true;
+            }
+
+            retryAfter = TimeSpan.FromSeconds((1 - this._tokens) / this._ratePerSecond);
+            return false;
+        }
+    }
+
+    public async Task AcquireAsync(CancellationToken cancellationToken)
+    {
+        while (!this.TryAcquire(out var retryAfter))
+        {
+            await Task.Delay(retryAfter, cancellationToken).ConfigureAwait(false);
+        }
+    }
+}
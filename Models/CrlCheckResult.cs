@@ -12,4 +12,10 @@ internal sealed record CrlCheckResult(
     TimeSpan? DownloadDuration,
     long? ContentLength,
     DateTime CheckedAtUtc,
-    string? SignatureStatus);
+    string? SignatureStatus,
+    bool CacheHit = false,
+    long BytesSaved = 0,
+    TimeSpan? TimeToFirstByte = null,
+    bool? ConnectionReused = null,
+    RevocationDiff? RevocationChanges = null,
+    CrlStageTimings? Timings = null);
@@ -0,0 +1,63 @@
+namespace CrlMonitor.Models;
+
+/// <summary>
+/// Where the time for one CRL check went, measured with the monotonic clock. A stage that did not happen for this
+/// check (no new connection, a 304 response, a failed fetch) is null rather than zero.
+/// </summary>
+/// <remarks>
+/// <see cref="Wait"/> runs from the connection being ready to the response headers arriving, so DNS, connect, TLS and
+/// wait add up to the time to first byte.
+/// </remarks>
+internal sealed record CrlStageTimings(
+    TimeSpan? Dns = null,
+    TimeSpan? Connect = null,
+    TimeSpan? Tls = null,
+    TimeSpan? Wait = null,
+    TimeSpan? Transfer = null,
+    TimeSpan? Parse = null,
+    TimeSpan? Verify = null,
+    TimeSpan? Health = null,
+    TimeSpan? StateWrite = null)
+{
+    public static CrlStageTimings None { get; } = new();
+
+    public TimeSpan? Get(CrlTimingStage stage)
+    {
+        return stage switch {
+            CrlTimingStage.Dns => this.Dns,
+            CrlTimingStage.Connect => this.Connect,
+            CrlTimingStage.Tls => this.Tls,
+            CrlTimingStage.Wait => this.Wait,
+            CrlTimingStage.Transfer => this.Transfer,
+            CrlTimingStage.Parse => this.Parse,
+            CrlTimingStage.Verify => this.Verify,
+            CrlTimingStage.Health => this.Health,
+            CrlTimingStage.StateWrite => this.StateWrite,
+            _ => throw new ArgumentOutOfRangeException(nameof(stage), stage, null)
+        };
+    }
+
+    /// <summary>
+    /// Adds the stages of a second download, such as the base CRL fetched alongside a delta.
+    /// </summary>
+    public CrlStageTimings Combine(CrlStageTimings? other)
+    {
+        return other == null
+            ? this
+            : new CrlStageTimings(
+                Sum(this.Dns, other.Dns),
+                Sum(this.Connect, other.Connect),
+                Sum(this.Tls, other.Tls),
+                Sum(this.Wait, other.Wait),
+                Sum(this.Transfer, other.Transfer),
+                Sum(this.Parse, other.Parse),
+                Sum(this.Verify, other.Verify),
+                Sum(this.Health, other.Health),
+                Sum(this.StateWrite, other.StateWrite));
+    }
+
+    private static TimeSpan? Sum(TimeSpan? first, TimeSpan? second)
+    {
+        return first.HasValue && second.HasValue ? first.Value + second.Value : first ?? second;
+    }
+}
@@ -6,5 +6,10 @@ internal enum CrlStatus
     Warning,
     Expiring,
     Expired,
-    Error
+    Error,
+
+    /// <summary>
+    /// Not checked because the run deadline was reached first.
+    /// </summary>
+    Deferred
 }
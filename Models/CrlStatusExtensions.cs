@@ -10,6 +10,7 @@ internal static class CrlStatusExtensions
             CrlStatus.Expiring => "EXPIRING",
             CrlStatus.Expired => "EXPIRED",
             CrlStatus.Error => "ERROR",
+            CrlStatus.Deferred => "DEFERRED",
             _ => status.ToString().ToUpperInvariant()
         };
     }
@@ -0,0 +1,17 @@
+namespace CrlMonitor.Models;
+
+/// <summary>
+/// Steps a CRL check spends time in, in the order they happen.
+/// </summary>
+internal enum CrlTimingStage
+{
+    Dns,
+    Connect,
+    Tls,
+    Wait,
+    Transfer,
+    Parse,
+    Verify,
+    Health,
+    StateWrite
+}
@@ -0,0 +1,20 @@
+namespace CrlMonitor.Models;
+
+internal static class CrlTimingStageExtensions
+{
+    public static string ToDisplayString(this CrlTimingStage stage)
+    {
+        return stage switch {
+            CrlTimingStage.Dns => "DNS",
+            CrlTimingStage.Connect => "Connect",
+            CrlTimingStage.Tls => "TLS",
+            CrlTimingStage.Wait => "Wait",
+            CrlTimingStage.Transfer => "Transfer",
+            CrlTimingStage.Parse => "Parse",
+            CrlTimingStage.Verify => "Verify",
+            CrlTimingStage.Health => "Health",
+            CrlTimingStage.StateWrite => "State write",
+            _ => stage.ToString()
+        };
+    }
+}
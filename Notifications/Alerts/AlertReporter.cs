@@ -8,6 +8,7 @@ namespace CrlMonitor.Notifications.Alerts;
 
 internal sealed class AlertReporter(AlertOptions options, IEmailClient emailClient, IStateStore stateStore, string? htmlReportUrl) : IReporter
 {
+    private const string NewRevocationsCondition = "NEW_REVOCATIONS";
     private readonly AlertOptions _options = options ?? throw new ArgumentNullException(nameof(options));
     private readonly IEmailClient _emailClient = emailClient ?? throw new ArgumentNullException(nameof(emailClient));
     private readonly IStateStore _stateStore = stateStore ?? throw new ArgumentNullException(nameof(stateStore));
@@ -22,24 +23,31 @@ internal sealed class AlertReporter(AlertOptions options, IEmailClient emailClie
             return;
         }
 
-        var triggered = new List<AlertInstance>();
+        var candidates = new List<AlertInstance>();
         foreach (var result in run.Results)
         {
-            if (!this._statusFilters.Contains(result.Status))
+            if (this._statusFilters.Contains(result.Status))
             {
-                continue;
+                var key = BuildStateKey(result.Status.ToDisplayString(), result.Uri);
+                candidates.Add(new AlertInstance(result.Status, key, result, NewRevocations: false));
             }
 
-            var key = BuildStateKey(result.Status, result.Uri);
-            var lastTriggered = await this._stateStore.GetAlertCooldownAsync(key, cancellationToken).ConfigureAwait(false);
-            if (lastTriggered.HasValue && run.GeneratedAtUtc - lastTriggered.Value < this._options.Cooldown)
+            if (this.ExceedsNewRevocationThreshold(result))
             {
-                continue;
+                var key = BuildStateKey(NewRevocationsCondition, result.Uri);
+                candidates.Add(new AlertInstance(result.Status, key, result, NewRevocations: true));
             }
+        }
 
-            triggered.Add(new AlertInstance(result.Status, key, result));
+        if (candidates.Count == 0)
+        {
+            return;
         }
 
+        // One state read for every candidate and one write for every alert sent, however many CRLs are configured.
+        var keys = candidates.Select(alert => alert.StateKey).ToList();
+        var cooldowns = await this._stateStore.GetAlertCooldownsAsync(keys, cancellationToken).ConfigureAwait(false);
+        var triggered = candidates.Where(alert => !this.IsCoolingDown(cooldowns, alert.StateKey, run.GeneratedAtUtc)).ToList();
         if (triggered.Count == 0)
         {
             return;
@@ -50,10 +58,24 @@ internal sealed class AlertReporter(AlertOptions options, IEmailClient emailClie
         var message = new EmailMessage(this._options.Recipients, subject, body, []);
         await this._emailClient.SendAsync(message, this._options.Smtp, cancellationToken).ConfigureAwait(false);
 
+        var stateChanges = new StateBatch(this._stateStore);
         foreach (var alert in triggered)
         {
-            await this._stateStore.SaveAlertCooldownAsync(alert.StateKey, run.GeneratedAtUtc, cancellationToken).ConfigureAwait(false);
+            stateChanges.SetAlertCooldown(alert.StateKey, run.GeneratedAtUtc);
         }
+
+        await stateChanges.CommitAsync(cancellationToken).ConfigureAwait(false);
+    }
+
+    private bool IsCoolingDown(IReadOnlyDictionary<string, DateTime> cooldowns, string key, DateTime nowUtc)
+    {
+        return cooldowns.TryGetValue(key, out var lastTriggered) && nowUtc - lastTriggered < this._options.Cooldown;
+    }
+
+    private bool ExceedsNewRevocationThreshold(CrlCheckResult result)
+    {
+        var threshold = this._options.NewRevocationsThreshold;
+        return threshold.HasValue && result.RevocationChanges != null && result.RevocationChanges.AddedCount > threshold.Value;
     }
 
     private static string BuildSubject(string prefix, int count)
@@ -76,6 +98,12 @@ internal sealed class AlertReporter(AlertOptions options, IEmailClient emailClie
             _ = builder.AppendLine(FormattableString.Invariant($"URL: {alert.Result.Uri}"));
             _ = builder.AppendLine(FormattableString.Invariant($"Status: {alert.Result.Status.ToDisplayString()}"));
             _ = builder.AppendLine(FormattableString.Invariant($"Checked: {TimeFormatter.FormatUtc(alert.Result.CheckedAtUtc)}"));
+            if (alert.NewRevocations && alert.Result.RevocationChanges != null)
+            {
+                var changes = alert.Result.RevocationChanges;
+                _ = builder.AppendLine(FormattableString.Invariant($"New revocations: {changes.AddedCount} (removed: {changes.RemovedCount})"));
+            }
+
             if (includeDetails && !string.IsNullOrWhiteSpace(alert.Result.ErrorInfo))
             {
                 _ = builder.AppendLine(FormattableString.Invariant($"Details: {alert.Result.ErrorInfo}"));
@@ -102,6 +130,11 @@ internal sealed class AlertReporter(AlertOptions options, IEmailClient emailClie
 
     private static string GetIssueTitle(AlertInstance alert)
     {
+        if (alert.NewRevocations)
+        {
+            return "New Revocations Detected";
+        }
+
         var error = alert.Result.ErrorInfo ?? string.Empty;
         return error.Contains("signature", StringComparison.OrdinalIgnoreCase)
             ? "CRL Verification Failed"
@@ -116,6 +149,11 @@ internal sealed class AlertReporter(AlertOptions options, IEmailClient emailClie
 
     private static string? GetPossibleCause(AlertInstance alert)
     {
+        if (alert.NewRevocations)
+        {
+            return "The CA revoked more certificates than the configured threshold since the previous check.";
+        }
+
         var error = alert.Result.ErrorInfo ?? string.Empty;
         return error.Contains("signature", StringComparison.OrdinalIgnoreCase)
             ? "Mismatched issuer certificate or updated CRL signing key."
@@ -128,10 +166,10 @@ internal sealed class AlertReporter(AlertOptions options, IEmailClient emailClie
                     : null;
     }
 
-    private static string BuildStateKey(CrlStatus condition, Uri uri)
+    private static string BuildStateKey(string condition, Uri uri)
     {
-        return FormattableString.Invariant($"{condition.ToDisplayString()}|{uri}");
+        return FormattableString.Invariant($"{condition}|{uri}");
     }
 
-    private readonly record struct AlertInstance(CrlStatus Condition, string StateKey, CrlCheckResult Result);
+    private readonly record struct AlertInstance(CrlStatus Condition, string StateKey, CrlCheckResult Result, bool NewRevocations);
 }
@@ -17,7 +17,16 @@ internal sealed record ReportOptions(
     bool IncludeSummary,
     bool IncludeFullCsv,
     double? FrequencyHours,
-    SmtpOptions Smtp);
+    SmtpOptions Smtp,
+    CsvAttachmentCompression CsvCompression = CsvAttachmentCompression.None,
+    long CsvCompressionThresholdBytes = 0);
+
+internal enum CsvAttachmentCompression
+{
+    None,
+    Gzip,
+    Zip
+}
 
 internal sealed record AlertOptions(
     bool Enabled,
@@ -26,4 +35,5 @@ internal sealed record AlertOptions(
     TimeSpan Cooldown,
     string SubjectPrefix,
     bool IncludeDetails,
-    SmtpOptions Smtp);
+    SmtpOptions Smtp,
+    int? NewRevocationsThreshold = null);
@@ -1,4 +1,5 @@
 using System.Globalization;
+using System.IO.Compression;
 using System.Text;
 using CrlMonitor.Models;
 using CrlMonitor.Notifications.Email;
@@ -9,6 +10,8 @@ namespace CrlMonitor.Notifications.Reports;
 
 internal sealed class EmailReportReporter(ReportOptions options, IEmailClient emailClient, IStateStore stateStore, ReportingStatus reportingStatus, string? htmlReportUrl) : IReporter
 {
+    private const string CsvContentType = "text/csv";
+
     private readonly ReportOptions _options = options ?? throw new ArgumentNullException(nameof(options));
     private readonly IEmailClient _emailClient = emailClient ?? throw new ArgumentNullException(nameof(emailClient));
     private readonly IStateStore _stateStore = stateStore ?? throw new ArgumentNullException(nameof(stateStore));
@@ -48,17 +51,20 @@ internal sealed class EmailReportReporter(ReportOptions options, IEmailClient em
         }
         // else: frequency not configured, always send
 
-        var summary = CrlStatusSummary.FromResults(run.Results);
-        var subject = BuildSubject(this._options.Subject, summary.Errors);
-        var plainBody = BuildPlainTextBody(run, this._options, summary);
-        var htmlBody = BuildHtmlBody(run, this._options, summary);
+        var cache = RunRenderCache.For(run);
+        var summary = cache.Summary;
         var attachments = new List<EmailAttachment>();
         if (this._options.IncludeFullCsv)
         {
-            var csvBytes = await BuildCsvAttachmentAsync(run, cancellationToken).ConfigureAwait(false);
-            attachments.Add(new EmailAttachment(BuildAttachmentName(run.GeneratedAtUtc), csvBytes, "text/csv"));
+            var csvBytes = await cache.GetCsvAsync(cancellationToken).ConfigureAwait(false);
+            attachments.Add(BuildCsvAttachment(csvBytes, run.GeneratedAtUtc, this._options));
         }
 
+        var csvNote = BuildCsvNote(attachments);
+        var subject = BuildSubject(this._options.Subject, summary.Errors);
+        var plainBody = BuildPlainTextBody(run, csvNote, summary);
+        var htmlBody = BuildHtmlBody(run, csvNote, summary);
+
         var plain = AppendHtmlLinkPlain(plainBody, this._htmlReportUrl);
         var html = AppendHtmlLinkHtml(htmlBody, this._htmlReportUrl);
         var message = new EmailMessage(this._options.Recipients, subject, plain, attachments, html);
@@ -67,12 +73,54 @@ internal sealed class EmailReportReporter(ReportOptions options, IEmailClient em
         await this._stateStore.SaveLastReportSentAsync(run.GeneratedAtUtc, cancellationToken).ConfigureAwait(false);
     }
 
-    private static async Task<byte[]> BuildCsvAttachmentAsync(CrlCheckRun run, CancellationToken cancellationToken)
+    internal static EmailAttachment BuildCsvAttachment(byte[] csv, DateTime generatedAtUtc, ReportOptions options)
+    {
+        var name = BuildAttachmentName(generatedAtUtc);
+        if (options.CsvCompression == CsvAttachmentCompression.None || csv.Length < options.CsvCompressionThresholdBytes)
+        {
+            return new EmailAttachment(name, csv, CsvContentType);
+        }
+
+        return options.CsvCompression == CsvAttachmentCompression.Zip
+            ? new EmailAttachment(Path.ChangeExtension(name, ".zip"), Zip(name, csv), "application/zip")
+            : new EmailAttachment(name + ".gz", Gzip(csv), "application/gzip");
+    }
+
+    private static byte[] Gzip(byte[] content)
+    {
+        using var output = new MemoryStream();
+        using (var gzip = new GZipStream(output, CompressionLevel.Optimal, leaveOpen: true))
+        {
+            gzip.Write(content);
+        }
+
+        return output.ToArray();
+    }
+
+    private static byte[] Zip(string entryName, byte[] content)
     {
-        using var writer = new StringWriter(CultureInfo.InvariantCulture);
-        await CsvReportFormatter.WriteAsync(writer, run, cancellationToken).ConfigureAwait(false);
-        var content = writer.ToString();
-        return Encoding.UTF8.GetBytes(content);
+        using var output = new MemoryStream();
+        using (var archive = new ZipArchive(output, ZipArchiveMode.Create, leaveOpen: true))
+        {
+            var entry = archive.CreateEntry(entryName, CompressionLevel.Optimal);
+            using var entryStream = entry.Open();
+            entryStream.Write(content);
+        }
+
+        return output.ToArray();
+    }
+
+    private static string BuildCsvNote(List<EmailAttachment> attachments)
+    {
+        if (attachments.Count == 0)
+        {
+            return "Full CSV attachment disabled.";
+        }
+
+        var csv = attachments[0];
+        return csv.ContentType == CsvContentType
+            ? "Full CSV attached."
+            : FormattableString.Invariant($"Full CSV attached (compressed as {csv.FileName}).");
     }
 
     private static string BuildAttachmentName(DateTime generatedAtUtc)
@@ -85,7 +133,7 @@ internal sealed class EmailReportReporter(ReportOptions options, IEmailClient em
         return errorCount <= 0 ? baseSubject : FormattableString.Invariant($"{baseSubject}: {errorCount} ERRORS");
     }
 
-    private static string BuildPlainTextBody(CrlCheckRun run, ReportOptions options, CrlStatusSummary summary)
+    private static string BuildPlainTextBody(CrlCheckRun run, string csvNote, CrlStatusSummary summary)
     {
         var builder = new StringBuilder();
         _ = builder.AppendLine(FormattableString.Invariant($"Please find attached the CRL Health Report generated by Red Kestrel CrlMonitor at {TimeFormatter.FormatUtc(run.GeneratedAtUtc)}."));
@@ -94,11 +142,11 @@ internal sealed class EmailReportReporter(ReportOptions options, IEmailClient em
         const int valueWidth = 6;
         AppendSummaryLines(builder, summary, valueWidth);
         _ = builder.AppendLine();
-        _ = builder.AppendLine(options.IncludeFullCsv ? "Full CSV attached." : "Full CSV attachment disabled.");
+        _ = builder.AppendLine(csvNote);
         return builder.ToString();
     }
 
-    private static string BuildHtmlBody(CrlCheckRun run, ReportOptions options, CrlStatusSummary summary)
+    private static string BuildHtmlBody(CrlCheckRun run, string csvNote, CrlStatusSummary summary)
     {
         var builder = new StringBuilder();
         _ = builder.AppendLine("<html><body>");
@@ -111,8 +159,13 @@ internal sealed class EmailReportReporter(ReportOptions options, IEmailClient em
         AppendSummaryRow(builder, "CRLs Expiring", summary.Expiring, null);
         AppendSummaryRow(builder, "CRLs Expired", summary.Expired, summary.Expired > 0 ? "color:#d9534f" : null);
         AppendSummaryRow(builder, "CRLs Failed", summary.Errors, summary.Errors > 0 ? "color:#d9534f" : null);
+        if (summary.Deferred > 0)
+        {
+            AppendSummaryRow(builder, "CRLs Deferred", summary.Deferred, null);
+        }
+
         _ = builder.AppendLine("</table>");
-        _ = builder.AppendLine(FormattableString.Invariant($"<p>{(options.IncludeFullCsv ? "Full CSV attached." : "Full CSV attachment disabled.")}</p>"));
+        _ = builder.AppendLine(FormattableString.Invariant($"<p>{csvNote}</p>"));
         _ = builder.AppendLine("</body></html>");
         return builder.ToString();
     }
@@ -130,6 +183,10 @@ internal sealed class EmailReportReporter(ReportOptions options, IEmailClient em
         _ = builder.AppendLine(FormatSummaryLine("CRLs Expiring:", summary.Expiring, width));
         _ = builder.AppendLine(FormatSummaryLine("CRLs Expired:", summary.Expired, width));
         _ = builder.AppendLine(FormatSummaryLine("CRLs Failed:", summary.Errors, width));
+        if (summary.Deferred > 0)
+        {
+            _ = builder.AppendLine(FormatSummaryLine("CRLs Deferred:", summary.Deferred, width));
+        }
     }
 
     private static void AppendSummaryRow(StringBuilder builder, string label, int value, string? colorStyle)
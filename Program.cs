@@ -1,8 +1,9 @@
-using System.Net;
 using CrlMonitor.Crl;
 using CrlMonitor.Fetching;
 using CrlMonitor.Reporting;
 using CrlMonitor.Runner;
+using CrlMonitor.Service;
+using CrlMonitor.Sharding;
 using CrlMonitor.Validation;
 using CrlMonitor.Health;
 using CrlMonitor.Licensing;
@@ -12,11 +13,19 @@ using CrlMonitor.Notifications.Email;
 using CrlMonitor.Notifications.Reports;
 using CrlMonitor.State;
 using CrlMonitor.Eula;
+using Serilog;
 
 namespace CrlMonitor;
 
 internal static class Program
 {
+    private const string LookupOption = "--lookup";
+    private const string LookupFileOption = "--lookup-file";
+    private const string ShardOption = "--shard";
+    private const string MergeOption = "--merge";
+    private const string PartialDirOption = "--partial-dir";
+    private static readonly string[] ValueOptions = [LookupOption, LookupFileOption, ShardOption, PartialDirOption];
+
     public static async Task<int> Main(string[] args)
     {
         return await ExecuteAsync(args, CancellationToken.None).ConfigureAwait(false);
@@ -27,15 +36,53 @@ internal static class Program
         try
         {
             var autoAcceptEula = HasFlag(args, "--accept-eula");
+            var serviceMode = HasFlag(args, "--service");
             var configPath = ResolveConfigPath(args);
             LoggingSetup.Initialize(configPath);
             LoggingSetup.LogStartup();
 
-            await EulaAcceptanceManager.EnsureAcceptedAsync(cancellationToken, autoAcceptEula).ConfigureAwait(false);
-            await LicenseBootstrapper.EnsureLicensedAsync(cancellationToken).ConfigureAwait(false);
+            var lookupSerial = GetOptionValue(args, LookupOption);
+            var lookupFile = GetOptionValue(args, LookupFileOption);
+            var lookup = lookupSerial != null || lookupFile != null;
+            var shardValue = GetOptionValue(args, ShardOption);
+            var shard = shardValue == null ? null : ShardSpec.Parse(shardValue);
+            var merge = HasFlag(args, MergeOption);
+            var partialDirectory = GetOptionValue(args, PartialDirOption);
+            ValidateShardOptions(shard, merge, partialDirectory, serviceMode, lookup);
+
+            // Loading the configuration and preparing the HTTP stack do not depend on the EULA or the licence, so they
+            // run while those are checked. A failed check still wins: its error is reported, not the configuration's.
+            var prepare = Task.Run(() => PrepareRun(configPath, warmUpHttp: !lookup && !merge), cancellationToken);
+            try
+            {
+                await EulaAcceptanceManager.EnsureAcceptedAsync(cancellationToken, autoAcceptEula).ConfigureAwait(false);
+                await LicenseBootstrapper.EnsureLicensedAsync(cancellationToken).ConfigureAwait(false);
+            }
+            catch
+            {
+                await ObserveAsync(prepare).ConfigureAwait(false);
+                throw;
+            }
+
+            var options = await prepare.ConfigureAwait(false);
+            if (lookup)
+            {
+                RunLookup(options, lookupSerial, lookupFile);
+            }
+            else if (serviceMode)
+            {
+                await RunServiceAsync(options, cancellationToken).ConfigureAwait(false);
+            }
+            else if (merge)
+            {
+                await RunMergeAsync(options, Path.GetFullPath(partialDirectory!), cancellationToken).ConfigureAwait(false);
+            }
+            else
+            {
+                var shardOutput = shard == null ? null : new ShardOutput(shard, Path.GetFullPath(partialDirectory!));
+                await RunAsync(options, serviceMode: false, shardOutput, cancellationToken).ConfigureAwait(false);
+            }
 
-            var options = ConfigLoader.Load(configPath);
-            await RunAsync(options, cancellationToken).ConfigureAwait(false);
             return 0;
         }
         catch (FileNotFoundException ex)
@@ -53,45 +100,73 @@ internal static class Program
             ReportError(ex.Message);
             return 1;
         }
+        catch (InvalidDataException ex)
+        {
+            ReportError(ex.Message);
+            return 1;
+        }
         finally
         {
             LoggingSetup.Shutdown();
         }
     }
 
-    private static async Task RunAsync(RunOptions options, CancellationToken cancellationToken)
+    private static RunOptions PrepareRun(string configPath, bool warmUpHttp)
     {
-        ArgumentNullException.ThrowIfNull(options);
+        var options = ConfigLoader.Load(configPath);
+        if (warmUpHttp)
+        {
+            CrlHttpClientFactory.WarmUp(options.UseSystemProxy);
+        }
+
+        return options;
+    }
 
-        HttpClient httpClient;
-        if (options.UseSystemProxy)
+#pragma warning disable CA1031 // The outcome is discarded; only the failure that stopped startup is reported
+    private static async Task ObserveAsync(Task task)
+    {
+        try
         {
-#pragma warning disable CA2000 // HttpClient disposes handler when disposeHandler: true
-            var handler = new HttpClientHandler
-#pragma warning restore CA2000
-            {
-                UseProxy = true,
-                Proxy = WebRequest.GetSystemWebProxy(),
-                DefaultProxyCredentials = CredentialCache.DefaultCredentials,
-                CheckCertificateRevocationList = true
-            };
-            httpClient = new HttpClient(handler, disposeHandler: true);
+            await task.ConfigureAwait(false);
         }
-        else
+        catch
         {
-#pragma warning disable CA2000 // HttpClient disposes handler when disposeHandler: true
-            var handler = new HttpClientHandler
-#pragma warning restore CA2000
-            {
-                CheckCertificateRevocationList = true
-            };
-            httpClient = new HttpClient(handler, disposeHandler: true);
         }
+    }
+#pragma warning restore CA1031
+
+    private static async Task RunServiceAsync(RunOptions options, CancellationToken cancellationToken)
+    {
+        using var shutdown = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        void OnCancelKeyPress(object? sender, ConsoleCancelEventArgs eventArgs)
+        {
+            // Let the current cycle wind down instead of terminating the process mid-write.
+            eventArgs.Cancel = true;
+            shutdown.Cancel();
+        }
+
+        Console.CancelKeyPress += OnCancelKeyPress;
+        try
+        {
+            await RunAsync(options, serviceMode: true, shard: null, shutdown.Token).ConfigureAwait(false);
+        }
+        finally
+        {
+            Console.CancelKeyPress -= OnCancelKeyPress;
+        }
+    }
+
+    private static async Task RunAsync(RunOptions options, bool serviceMode, ShardOutput? shard, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(options);
 
+        var httpClient = CrlHttpClientFactory.Create(options.Http, options.UseSystemProxy);
         using (httpClient)
         {
-            var httpFetcher = new HttpCrlFetcher(httpClient);
-            var ldapFetcher = new LdapCrlFetcher(new SystemLdapConnectionFactory());
+            var responseCache = string.IsNullOrWhiteSpace(options.HttpCachePath) ? null : new FileCrlResponseCache(options.HttpCachePath);
+            var httpFetcher = new HttpCrlFetcher(httpClient, responseCache, options.Http.HedgeLatencyMultiplier);
+            using var ldapPool = new LdapConnectionPool(new SystemLdapConnectionFactory());
+            var ldapFetcher = new LdapCrlFetcher(ldapPool);
             var fileFetcher = new FileCrlFetcher();
             var resolver = new FetcherResolver(new[]
             {
@@ -102,21 +177,167 @@ internal static class Program
             using var stateStore = new FileStateStore(options.StateFilePath);
             var runner = new CrlCheckRunner(
                 resolver,
-                new CrlParser(SignatureValidationMode.CaCertificate),
-                new CrlSignatureValidator(),
+                new CrlParser(SignatureValidationMode.CaCertificate, options.CountRevokedOnly),
+                new CrlSignatureValidator(new CaCertificateCache(), options.CaBundlePath),
                 new CrlHealthEvaluator(),
-                stateStore);
+                stateStore,
+                options.ParseCacheMaxBytes > 0 ? FileCrlMemoStore.ForStateFile(options.StateFilePath, options.ParseCacheMaxBytes) : null,
+                string.IsNullOrWhiteSpace(options.RevocationSnapshotPath) ? null : new FileRevocationSnapshotStore(options.RevocationSnapshotPath),
+                string.IsNullOrWhiteSpace(options.RevocationIndexPath)
+                    ? null
+                    : new FileRevocationIndexStore(options.RevocationIndexPath, options.Crls.Select(entry => entry.Uri)),
+                options.Resilience,
+                options.Crls.Any(entry => entry.DeltaUri != null) ? FileDeltaBaseStore.ForStateFile(options.StateFilePath) : null);
+            if (serviceMode)
+            {
+                var service = new CrlMonitorService(
+                    runner,
+                    () => BuildReporters(options, stateStore, new ReportingStatus()),
+                    options);
+                await service.RunAsync(cancellationToken).ConfigureAwait(false);
+                return;
+            }
+
+            if (shard != null)
+            {
+                await RunShardAsync(runner, options, shard, cancellationToken).ConfigureAwait(false);
+                return;
+            }
+
             var requests = BuildRequests(options.Crls);
-            var run = await runner.RunAsync(
+            using var reporters = BuildReporters(options, stateStore, new ReportingStatus());
+            var stream = runner.Stream(
                 requests,
                 options.FetchTimeout,
                 options.MaxParallelFetches,
-                cancellationToken).ConfigureAwait(false);
+                options.MaxParallelProcessing,
+                options.RunDeadline,
+                cancellationToken);
+            _ = await reporters.ReportAsync(stream, cancellationToken).ConfigureAwait(false);
+        }
+    }
+
+    /// <summary>
+    /// Checks this node's share of the CRLs and leaves the results for <c>--merge</c>. Nothing is reported here, so
+    /// reports and alerts go out once, from the merge.
+    /// </summary>
+    private static async Task RunShardAsync(CrlCheckRunner runner, RunOptions options, ShardOutput shard, CancellationToken cancellationToken)
+    {
+        var entries = shard.Shard.Select(options.Crls);
+        var run = await runner.RunAsync(
+            entries,
+            options.FetchTimeout,
+            options.MaxParallelFetches,
+            options.MaxParallelProcessing,
+            options.RunDeadline,
+            cancellationToken).ConfigureAwait(false);
+        var path = await ShardPartialFile.WriteAsync(shard.Directory, shard.Shard, run, cancellationToken).ConfigureAwait(false);
+        Log.Information(
+            "Shard {Shard} checked {Count} of {Total} CRL(s); partial result written to {Path}",
+            shard.Shard,
+            entries.Count,
+            options.Crls.Count,
+            path);
+    }
 
-            var reportingStatus = new ReportingStatus();
-            var reporters = BuildReporters(options, stateStore, reportingStatus);
+    /// <summary>
+    /// Combines the shard partials into one run and hands it to the configured reporters, then deletes the partials so
+    /// the next merge only sees results written after this one.
+    /// </summary>
+    private static async Task RunMergeAsync(RunOptions options, string partialDirectory, CancellationToken cancellationToken)
+    {
+        var partials = await ShardPartialFile.ReadAllAsync(partialDirectory, cancellationToken).ConfigureAwait(false);
+        var run = ShardMerger.Merge(options.Crls, partials, DateTime.UtcNow, options.ShardPartialMaxAge);
+        using (var stateStore = new FileStateStore(options.StateFilePath))
+        using (var reporters = BuildReporters(options, stateStore, new ReportingStatus()))
+        {
             await reporters.ReportAsync(run, cancellationToken).ConfigureAwait(false);
         }
+
+        ShardPartialFile.DeleteAll(partials);
+    }
+
+    private static void ValidateShardOptions(ShardSpec? shard, bool merge, string? partialDirectory, bool serviceMode, bool lookup)
+    {
+        if (shard == null && !merge)
+        {
+            if (partialDirectory != null)
+            {
+                throw new InvalidOperationException($"{PartialDirOption} is only used with {ShardOption} or {MergeOption}.");
+            }
+
+            return;
+        }
+
+        if (shard != null && merge)
+        {
+            throw new InvalidOperationException($"{ShardOption} and {MergeOption} cannot be combined.");
+        }
+
+        if (serviceMode || lookup)
+        {
+            throw new InvalidOperationException($"{ShardOption} and {MergeOption} cannot be combined with --service or {LookupOption}.");
+        }
+
+        if (partialDirectory == null)
+        {
+            throw new InvalidOperationException($"{PartialDirOption} is required with {ShardOption} and {MergeOption}.");
+        }
+    }
+
+    /// <summary>
+    /// Answers "is this serial revoked?" from the revocation index written by previous runs. Nothing is fetched or
+    /// parsed; the index is memory-mapped and each serial costs one binary search per indexed CRL.
+    /// </summary>
+    private static void RunLookup(RunOptions options, string? serial, string? serialFile)
+    {
+        if (string.IsNullOrWhiteSpace(options.RevocationIndexPath))
+        {
+            throw new InvalidOperationException("revocation_index_path must be configured to look up serial numbers.");
+        }
+
+        if (!File.Exists(options.RevocationIndexPath))
+        {
+            throw new FileNotFoundException(
+                $"Revocation index '{options.RevocationIndexPath}' not found. Run a check first to build it.",
+                options.RevocationIndexPath);
+        }
+
+        IEnumerable<string> serials = serial != null
+            ? [serial]
+            : File.ReadLines(Path.GetFullPath(serialFile!))
+                .Select(line => line.Trim())
+                .Where(line => line.Length > 0 && !line.StartsWith('#'));
+        using var index = RevocationIndex.Open(options.RevocationIndexPath);
+        var output = Console.Out;
+#pragma warning disable CA1303 // CLI tool emits English-only lookup results; no localization planned
+        output.WriteLine(FormattableString.Invariant($"Index built {TimeFormatter.FormatUtc(index.GeneratedAtUtc)} from {index.Crls.Count} CRL(s)."));
+        foreach (var value in serials)
+        {
+            IReadOnlyList<RevocationIndexCrl> matches;
+            try
+            {
+                matches = index.Lookup(value);
+            }
+            catch (FormatException)
+            {
+                output.WriteLine($"{value}: invalid serial number");
+                continue;
+            }
+
+            if (matches.Count == 0)
+            {
+                output.WriteLine($"{value}: not revoked by any indexed CRL");
+                continue;
+            }
+
+            foreach (var match in matches)
+            {
+                output.WriteLine(FormattableString.Invariant(
+                    $"{value}: REVOKED by {match.Issuer} ({match.CrlUri}, this update {TimeFormatter.FormatUtc(match.ThisUpdate)})"));
+            }
+        }
+#pragma warning restore CA1303
     }
 
     private static IReadOnlyList<CrlConfigEntry> BuildRequests(IReadOnlyList<CrlConfigEntry> entries)
@@ -135,27 +356,37 @@ internal static class Program
 
         if (options.HtmlReportEnabled && !string.IsNullOrWhiteSpace(options.HtmlReportPath))
         {
-            reporters.Add(new HtmlReporter(options.HtmlReportPath, reportingStatus));
+            reporters.Add(new HtmlReporter(options.HtmlReportPath, options.HtmlReportDataFile, reportingStatus));
         }
 
+        if (!string.IsNullOrWhiteSpace(options.NdjsonOutputPath))
+        {
+#pragma warning disable CA2000 // Disposed with the composite reporter
+            reporters.Add(new NdjsonReporter(options.NdjsonOutputPath));
+#pragma warning restore CA2000
+        }
+
+        // The emails link to the HTML report, so they only go out once the new page is in place, and the console
+        // summary lists what everything else produced, so it comes last.
+        var finalReporters = new List<IReporter>();
         var emailClient = new SmtpEmailClient();
 
         if (options.Reports != null && options.Reports.Enabled)
         {
-            reporters.Add(new EmailReportReporter(options.Reports, emailClient, stateStore, reportingStatus, options.HtmlReportUrl));
+            finalReporters.Add(new EmailReportReporter(options.Reports, emailClient, stateStore, reportingStatus, options.HtmlReportUrl));
         }
 
         if (options.Alerts != null && options.Alerts.Enabled)
         {
-            reporters.Add(new AlertReporter(options.Alerts, emailClient, stateStore, options.HtmlReportUrl));
+            finalReporters.Add(new AlertReporter(options.Alerts, emailClient, stateStore, options.HtmlReportUrl));
         }
 
         if (options.ConsoleReports)
         {
-            reporters.Add(new ConsoleReporter(reportingStatus, options.ConsoleVerbose));
+            finalReporters.Add(new ConsoleReporter(reportingStatus, options.ConsoleVerbose));
         }
 
-        return new CompositeReporter(reporters);
+        return new CompositeReporter(reporters, finalReporters);
     }
 
     private static bool HasFlag(string[] args, string flag)
@@ -163,10 +394,28 @@ internal static class Program
         return args.Any(arg => string.Equals(arg, flag, StringComparison.OrdinalIgnoreCase));
     }
 
+    private static string? GetOptionValue(string[] args, string option)
+    {
+        for (var index = 0; index < args.Length; index++)
+        {
+            if (string.Equals(args[index], option, StringComparison.OrdinalIgnoreCase))
+            {
+                return index + 1 < args.Length && !args[index + 1].StartsWith("--", StringComparison.Ordinal)
+                    ? args[index + 1]
+                    : throw new InvalidOperationException($"{option} requires a value.");
+            }
+        }
+
+        return null;
+    }
+
     private static string ResolveConfigPath(string[] args)
     {
-        // Filter out flags to find config path
-        var nonFlags = args.Where(arg => !arg.StartsWith("--", StringComparison.Ordinal)).ToArray();
+        // Filter out flags, and the values of options that take one, to find config path
+        var nonFlags = args
+            .Where((arg, index) => !arg.StartsWith("--", StringComparison.Ordinal)
+                && (index == 0 || !ValueOptions.Contains(args[index - 1], StringComparer.OrdinalIgnoreCase)))
+            .ToArray();
 
         if (nonFlags.Length == 0 || string.IsNullOrWhiteSpace(nonFlags[0]))
         {
@@ -194,14 +443,24 @@ internal static class Program
     private static void PrintUsage()
     {
 #pragma warning disable CA1303 // CLI tool emits English-only usage instructions; no localization planned
-        Console.WriteLine("Usage: CrlMonitor [--accept-eula] <path-to-config.json>");
+        Console.WriteLine("Usage: CrlMonitor [--accept-eula] [--service] [--lookup <serial> | --lookup-file <path>] [--shard <i/n> | --merge] [--partial-dir <dir>] <path-to-config.json>");
         Console.WriteLine();
         Console.WriteLine("Options:");
         Console.WriteLine("  --accept-eula    Automatically accept EULA (for automated deployments)");
+        Console.WriteLine("  --service        Keep running, re-checking each CRL on its own schedule (Ctrl+C to stop)");
+        Console.WriteLine("  --lookup         Report which monitored CRLs revoke a serial (hex), using the revocation index");
+        Console.WriteLine("  --lookup-file    As --lookup, for every serial in a file (one per line)");
+        Console.WriteLine("  --shard          Check only shard i of n (e.g. 2/4) and write a partial result instead of reports");
+        Console.WriteLine("  --merge          Combine the shard partial results and produce the reports and alerts once");
+        Console.WriteLine("  --partial-dir    Folder the shard partial results are written to and merged from");
         Console.WriteLine();
         Console.WriteLine("Examples:");
         Console.WriteLine("  CrlMonitor config.json");
         Console.WriteLine("  CrlMonitor --accept-eula config.json");
+        Console.WriteLine("  CrlMonitor --service config.json");
+        Console.WriteLine("  CrlMonitor --lookup 1A2B3C4D config.json");
+        Console.WriteLine("  CrlMonitor --shard 2/4 --partial-dir \\\\fileserver\\crl-shards config.json");
+        Console.WriteLine("  CrlMonitor --merge --partial-dir \\\\fileserver\\crl-shards config.json");
         Console.WriteLine("  CrlMonitor ./configs/prod.json");
         Console.WriteLine();
         Console.WriteLine("If no argument is supplied, the application looks for 'config.json' in the executable directory.");
@@ -209,6 +468,11 @@ internal static class Program
     }
 }
 
+/// <summary>
+/// Where a sharded run writes its partial result.
+/// </summary>
+internal sealed record ShardOutput(ShardSpec Shard, string Directory);
+
 internal static class FetcherSchemes
 {
     public static readonly string[] Http = ["http", "https"];
@@ -1,17 +1,112 @@
+using System.Collections.Concurrent;
 using CrlMonitor.Models;
+using CrlMonitor.Runner;
+using Serilog;
 
 namespace CrlMonitor.Reporting;
 
-internal sealed class CompositeReporter(IReadOnlyList<IReporter> reporters) : IReporter
+/// <summary>
+/// Fans a run out to several reporters at once. A failing reporter is logged and skipped for the rest of the run so
+/// the others still deliver; the failures are raised together once every reporter has finished.
+/// </summary>
+/// <remarks>
+/// <paramref name="finalReporters"/> run one at a time, in order, after all of <paramref name="reporters"/> have
+/// finished, for reporters such as the report email and console summary that point at what the others produced.
+/// </remarks>
+internal sealed class CompositeReporter(IReadOnlyList<IReporter> reporters, IReadOnlyList<IReporter>? finalReporters = null)
+    : IStreamingReporter, IDisposable
 {
     private readonly IReadOnlyList<IReporter> _reporters = reporters ?? throw new ArgumentNullException(nameof(reporters));
+    private readonly IReadOnlyList<IReporter> _finalReporters = finalReporters ?? [];
+    private readonly ConcurrentDictionary<IReporter, Exception> _failures = new(ReferenceEqualityComparer.Instance);
+
+    /// <summary>
+    /// Feeds each result to the streaming reporters as it completes, then reports the finished run.
+    /// </summary>
+    public async Task<CrlCheckRun> ReportAsync(CrlCheckStream stream, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(stream);
+        await foreach (var result in stream.ReadResultsAsync(cancellationToken).ConfigureAwait(false))
+        {
+            await this.ReportResultAsync(result, cancellationToken).ConfigureAwait(false);
+        }
+
+        var run = await stream.Completion.ConfigureAwait(false);
+        await this.ReportAsync(run, cancellationToken).ConfigureAwait(false);
+        return run;
+    }
+
+    public Task ReportResultAsync(CrlCheckResult result, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(result);
+        var pending = new List<Task>();
+        foreach (var reporter in this._reporters.Concat(this._finalReporters))
+        {
+            if (reporter is IStreamingReporter streaming)
+            {
+                pending.Add(this.RunIsolatedAsync(reporter, () => streaming.ReportResultAsync(result, cancellationToken), cancellationToken));
+            }
+        }
+
+        return Task.WhenAll(pending);
+    }
 
     public async Task ReportAsync(CrlCheckRun run, CancellationToken cancellationToken)
     {
-        foreach (var reporter in this._reporters)
+        ArgumentNullException.ThrowIfNull(run);
+        cancellationToken.ThrowIfCancellationRequested();
+
+        // Reporters share nothing but the run, so a slow SMTP send no longer holds up the report files. Task.Run keeps
+        // reporters that do their work synchronously from serialising the rest.
+        await Task.WhenAll(this._reporters.Select(reporter =>
+            this.RunIsolatedAsync(reporter, () => Task.Run(() => reporter.ReportAsync(run, cancellationToken), cancellationToken), cancellationToken)))
+            .ConfigureAwait(false);
+        foreach (var reporter in this._finalReporters)
+        {
+            await this.RunIsolatedAsync(reporter, () => reporter.ReportAsync(run, cancellationToken), cancellationToken).ConfigureAwait(false);
+        }
+
+        if (!this._failures.IsEmpty)
+        {
+            var failures = this._failures.ToArray();
+            var summary = string.Join("; ", failures.Select(failure => $"{failure.Key.GetType().Name}: {failure.Value.Message}"));
+            throw new InvalidOperationException(
+                $"{failures.Length} reporter(s) failed: {summary}",
+                new AggregateException(failures.Select(failure => failure.Value)));
+        }
+    }
+
+    public void Dispose()
+    {
+        foreach (var reporter in this._reporters.Concat(this._finalReporters))
+        {
+            (reporter as IDisposable)?.Dispose();
+        }
+    }
+
+#pragma warning disable CA1031 // One reporter's failure must not stop the others
+    private async Task RunIsolatedAsync(IReporter reporter, Func<Task> report, CancellationToken cancellationToken)
+    {
+        if (this._failures.ContainsKey(reporter))
+        {
+            return;
+        }
+
+        try
+        {
+            await report().ConfigureAwait(false);
+        }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+        {
+            throw;
+        }
+        catch (Exception ex)
         {
-            cancellationToken.ThrowIfCancellationRequested();
-            await reporter.ReportAsync(run, cancellationToken).ConfigureAwait(false);
+            if (this._failures.TryAdd(reporter, ex))
+            {
+                Log.Error(ex, "{Reporter} failed: {Message}", reporter.GetType().Name, ex.Message);
+            }
         }
     }
+#pragma warning restore CA1031
 }
@@ -1,5 +1,6 @@
 using System.Globalization;
 using System.Text;
+using CrlMonitor.Diagnostics;
 using CrlMonitor.Licensing;
 using CrlMonitor.Models;
 
@@ -29,6 +30,7 @@ internal sealed class ConsoleReporter(ReportingStatus status, bool verbose = tru
     private const int MaxErrorsInSummary = 3;
     private static readonly CompositeFormat TableRowFormat = CompositeFormat.Parse($"{{0,-{UriColumnWidth}}}{{1,-{NextUpdateColumnWidth}}}{{2,-{ExpiresInColumnWidth}}}{{3,-{StatusColumnWidth}}}");
     private static readonly CompositeFormat UriPadFormat = CompositeFormat.Parse($"{{0,-{UriColumnWidth}}}");
+    private static readonly CompositeFormat StageTimingRowFormat = CompositeFormat.Parse("  {0,-13}{1,7}{2,10}{3,10}{4,10}{5,10}");
     private readonly ReportingStatus _status = status ?? throw new ArgumentNullException(nameof(status));
     private readonly bool _verbose = verbose;
 
@@ -63,13 +65,14 @@ internal sealed class ConsoleReporter(ReportingStatus status, bool verbose = tru
         }
 
         Console.WriteLine();
-        this.WriteSummary(run.Results);
+        this.WriteSummary(RunRenderCache.For(run).Summary);
         if (LicenseBootstrapper.ValidatedLicense?.Type == Standard.Licensing.LicenseType.Trial)
         {
             WriteTrialUpgradeMessage();
         }
 
         WriteResultNotes(run.Results);
+        WriteStageTimings(run.Diagnostics.GetStageTimingSummaries());
         WriteDiagnostics(run);
     }
 
@@ -83,8 +86,9 @@ internal sealed class ConsoleReporter(ReportingStatus status, bool verbose = tru
         }
 
         Console.WriteLine();
-        WriteSimpleSummary(run.Results);
-        WriteErrorSummary(run.Results);
+        var cache = RunRenderCache.For(run);
+        WriteSimpleSummary(cache.Summary);
+        WriteErrorSummary(cache.Errors);
         this.WriteReportPaths();
         if (LicenseBootstrapper.ValidatedLicense?.Type == Standard.Licensing.LicenseType.Trial)
         {
@@ -92,9 +96,8 @@ internal sealed class ConsoleReporter(ReportingStatus status, bool verbose = tru
         }
     }
 
-    private static void WriteSimpleSummary(IReadOnlyList<CrlCheckResult> results)
+    private static void WriteSimpleSummary(CrlStatusSummary summary)
     {
-        var summary = CrlStatusSummary.FromResults(results);
         var colorEnabled = IsColorEnabled();
 
         Console.WriteLine();
@@ -107,6 +110,10 @@ internal sealed class ConsoleReporter(ReportingStatus status, bool verbose = tru
             Console.WriteLine($"  {"Expiring:",-10} {Ansi.White}{summary.Expiring}{Ansi.Reset}");
             Console.WriteLine($"  {"Expired:",-10} {Ansi.White}{summary.Expired}{Ansi.Reset}");
             Console.WriteLine($"  {"Errors:",-10} {Ansi.White}{summary.Errors}{Ansi.Reset}");
+            if (summary.Deferred > 0)
+            {
+                Console.WriteLine($"  {"Deferred:",-10} {Ansi.White}{summary.Deferred}{Ansi.Reset}");
+            }
         }
         else
         {
@@ -116,12 +123,15 @@ internal sealed class ConsoleReporter(ReportingStatus status, bool verbose = tru
             Console.WriteLine($"  {"Expiring:",-10} {summary.Expiring}");
             Console.WriteLine($"  {"Expired:",-10} {summary.Expired}");
             Console.WriteLine($"  {"Errors:",-10} {summary.Errors}");
+            if (summary.Deferred > 0)
+            {
+                Console.WriteLine($"  {"Deferred:",-10} {summary.Deferred}");
+            }
         }
     }
 
-    private static void WriteErrorSummary(IReadOnlyList<CrlCheckResult> results)
+    private static void WriteErrorSummary(IReadOnlyList<CrlCheckResult> errors)
     {
-        var errors = results.Where(r => r.Status == CrlStatus.Error).ToList();
         if (errors.Count == 0)
         {
             return;
@@ -326,10 +336,8 @@ internal sealed class ConsoleReporter(ReportingStatus status, bool verbose = tru
         }
     }
 
-    private void WriteSummary(IReadOnlyList<CrlCheckResult> results)
+    private void WriteSummary(CrlStatusSummary summary)
     {
-        var summary = CrlStatusSummary.FromResults(results);
-
         Console.WriteLine("Summary:");
         Console.WriteLine($"  Total:    {summary.Total}");
         Console.WriteLine($"  OK:       {summary.Ok}");
@@ -337,6 +345,10 @@ internal sealed class ConsoleReporter(ReportingStatus status, bool verbose = tru
         Console.WriteLine($"  Expiring: {summary.Expiring}");
         Console.WriteLine($"  Expired:  {summary.Expired}");
         Console.WriteLine($"  Errors:   {summary.Errors}");
+        if (summary.Deferred > 0)
+        {
+            Console.WriteLine($"  Deferred: {summary.Deferred}");
+        }
 
         Console.WriteLine();
         Console.WriteLine("Report written to:");
@@ -396,6 +408,35 @@ internal sealed class ConsoleReporter(ReportingStatus status, bool verbose = tru
         }
     }
 
+    private static void WriteStageTimings(IReadOnlyList<StageTimingSummary> summaries)
+    {
+        if (summaries.Count == 0)
+        {
+            return;
+        }
+
+        Console.WriteLine();
+        Console.WriteLine("Stage timings (ms):");
+        Console.WriteLine(string.Format(CultureInfo.InvariantCulture, StageTimingRowFormat, "Stage", "Count", "p50", "p95", "p99", "Max"));
+        foreach (var summary in summaries)
+        {
+            Console.WriteLine(string.Format(
+                CultureInfo.InvariantCulture,
+                StageTimingRowFormat,
+                summary.Stage.ToDisplayString(),
+                summary.Count,
+                FormatMilliseconds(summary.P50),
+                FormatMilliseconds(summary.P95),
+                FormatMilliseconds(summary.P99),
+                FormatMilliseconds(summary.Max)));
+        }
+    }
+
+    private static string FormatMilliseconds(TimeSpan value)
+    {
+        return value.TotalMilliseconds.ToString("F1", CultureInfo.InvariantCulture);
+    }
+
     private static void WriteDiagnostics(CrlCheckRun run)
     {
         WriteWarningBlock("State warnings", run.Diagnostics.StateWarnings);
@@ -434,6 +475,7 @@ internal sealed class ConsoleReporter(ReportingStatus status, bool verbose = tru
             "EXPIRING" => Ansi.BrightYellow,
             "EXPIRED" => Ansi.Red,
             "ERROR" => Ansi.Red,
+            "DEFERRED" => Ansi.Grey,
             _ => string.Empty
         };
     }
@@ -2,17 +2,52 @@ using CrlMonitor.Models;
 
 namespace CrlMonitor.Reporting;
 
-internal readonly record struct CrlStatusSummary(int Total, int Ok, int Warning, int Expiring, int Expired, int Errors)
+internal readonly record struct CrlStatusSummary(int Total, int Ok, int Warning, int Expiring, int Expired, int Errors, int CacheHits = 0, int Deferred = 0)
 {
     public static CrlStatusSummary FromResults(IEnumerable<CrlCheckResult> results)
     {
-        var list = results.ToList();
-        return new CrlStatusSummary(
-            list.Count,
-            list.Count(r => r.Status == CrlStatus.Ok),
-            list.Count(r => r.Status == CrlStatus.Warning),
-            list.Count(r => r.Status == CrlStatus.Expiring),
-            list.Count(r => r.Status == CrlStatus.Expired),
-            list.Count(r => r.Status == CrlStatus.Error));
+        ArgumentNullException.ThrowIfNull(results);
+        var total = 0;
+        var ok = 0;
+        var warning = 0;
+        var expiring = 0;
+        var expired = 0;
+        var errors = 0;
+        var cacheHits = 0;
+        var deferred = 0;
+        foreach (var result in results)
+        {
+            total++;
+            switch (result.Status)
+            {
+                case CrlStatus.Ok:
+                    ok++;
+                    break;
+                case CrlStatus.Warning:
+                    warning++;
+                    break;
+                case CrlStatus.Expiring:
+                    expiring++;
+                    break;
+                case CrlStatus.Expired:
+                    expired++;
+                    break;
+                case CrlStatus.Error:
+                    errors++;
+                    break;
+                case CrlStatus.Deferred:
+                    deferred++;
+                    break;
+                default:
+                    break;
+            }
+
+            if (result.CacheHit)
+            {
+                cacheHits++;
+            }
+        }
+
+        return new CrlStatusSummary(total, ok, warning, expiring, expired, errors, cacheHits, deferred);
     }
 }
@@ -7,6 +7,19 @@ namespace CrlMonitor.Reporting;
 
 internal static class CsvReportFormatter
 {
+    private static readonly (CrlTimingStage Stage, string Header)[] StageColumns =
+    [
+        (CrlTimingStage.Dns, "DNS_ms"),
+        (CrlTimingStage.Connect, "Connect_ms"),
+        (CrlTimingStage.Tls, "TLS_ms"),
+        (CrlTimingStage.Wait, "Wait_ms"),
+        (CrlTimingStage.Transfer, "Transfer_ms"),
+        (CrlTimingStage.Parse, "Parse_ms"),
+        (CrlTimingStage.Verify, "Verify_ms"),
+        (CrlTimingStage.Health, "Health_ms"),
+        (CrlTimingStage.StateWrite, "State_Write_ms")
+    ];
+
     public static async Task WriteAsync(TextWriter writer, CrlCheckRun run, CancellationToken cancellationToken)
     {
         ArgumentNullException.ThrowIfNull(writer);
@@ -53,8 +66,19 @@ internal static class CsvReportFormatter
         csv.WriteField("Expires_In");
         csv.WriteField("CRL_Size_bytes");
         csv.WriteField("Download_Duration_ms");
+        csv.WriteField("Cache_Hit");
+        csv.WriteField("Bytes_Saved");
+        csv.WriteField("TTFB_ms");
+        csv.WriteField("Connection_Reused");
+        foreach (var (_, header) in StageColumns)
+        {
+            csv.WriteField(header);
+        }
+
         csv.WriteField("Signature_Valid");
         csv.WriteField("Revoked_Count");
+        csv.WriteField("New_Revocations");
+        csv.WriteField("Removed_Revocations");
         csv.WriteField("Checked_Time_UTC");
         csv.WriteField("Previous_Checked_Time_UTC");
         csv.WriteField("CRL_Type");
@@ -69,8 +93,13 @@ internal static class CsvReportFormatter
         var nextUpdate = FormatNullableTimestamp(parsed?.NextUpdate);
         var size = result.ContentLength?.ToString(CultureInfo.InvariantCulture) ?? string.Empty;
         var downloadMs = result.DownloadDuration?.TotalMilliseconds.ToString("F0", CultureInfo.InvariantCulture) ?? string.Empty;
+        var cacheHit = result.CacheHit ? "TRUE" : "FALSE";
+        var bytesSaved = result.BytesSaved.ToString(CultureInfo.InvariantCulture);
+        var ttfbMs = result.TimeToFirstByte?.TotalMilliseconds.ToString("F0", CultureInfo.InvariantCulture) ?? string.Empty;
+        var connectionReused = result.ConnectionReused.HasValue ? (result.ConnectionReused.Value ? "TRUE" : "FALSE") : string.Empty;
         var signature = NormalizeSignatureStatus(result.SignatureStatus);
-        var revokedCount = parsed?.RevokedSerialNumbers?.Count;
+        var revokedCount = parsed?.RevokedSerialNumbers?.EntryCount;
+        var changes = result.RevocationChanges;
         var checkedTime = FormatTimestamp(result.CheckedAtUtc);
         var previousChecked = result.PreviousFetchUtc.HasValue ? FormatTimestamp(result.PreviousFetchUtc.Value) : string.Empty;
         var crlType = parsed == null ? string.Empty : (parsed.IsDelta ? "Delta" : "Full");
@@ -84,8 +113,20 @@ internal static class CsvReportFormatter
         csv.WriteField(ExpiresInFormatter.Format(parsed?.NextUpdate));
         csv.WriteField(size);
         csv.WriteField(downloadMs);
+        csv.WriteField(cacheHit);
+        csv.WriteField(bytesSaved);
+        csv.WriteField(ttfbMs);
+        csv.WriteField(connectionReused);
+        foreach (var (stage, _) in StageColumns)
+        {
+            // Stages are often well under a millisecond, so they keep one decimal place.
+            csv.WriteField(result.Timings?.Get(stage)?.TotalMilliseconds.ToString("F1", CultureInfo.InvariantCulture) ?? string.Empty);
+        }
+
         csv.WriteField(signature);
         csv.WriteField(revokedCount?.ToString(CultureInfo.InvariantCulture) ?? string.Empty);
+        csv.WriteField(changes?.AddedCount.ToString(CultureInfo.InvariantCulture) ?? string.Empty);
+        csv.WriteField(changes?.RemovedCount.ToString(CultureInfo.InvariantCulture) ?? string.Empty);
         csv.WriteField(checkedTime);
         csv.WriteField(previousChecked);
         csv.WriteField(crlType);
@@ -26,6 +26,8 @@ internal sealed class CsvReporter : IReporter
             _ = Directory.CreateDirectory(directory);
         }
 
+        // Streamed straight to the file so large CRL sets are never held in memory; only the email attachment asks
+        // RunRenderCache for the rendered bytes.
         using var stream = new FileStream(this._outputPath, FileMode.Create, FileAccess.Write, FileShare.None);
         using var writer = new StreamWriter(stream);
         await CsvReportFormatter.WriteAsync(writer, run, cancellationToken).ConfigureAwait(false);
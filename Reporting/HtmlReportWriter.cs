@@ -1,14 +1,77 @@
 using System.Globalization;
 using System.Text;
+using System.Text.Json;
+using CrlMonitor.Diagnostics;
 using CrlMonitor.Licensing;
 using CrlMonitor.Models;
 using Standard.Licensing;
 
 namespace CrlMonitor.Reporting;
 
+/// <summary>
+/// Writes the HTML health report.
+/// </summary>
+/// <remarks>
+/// The page is written straight to a temporary file next to the target and renamed over it once complete, so a web
+/// server publishing the report never serves a half-written page. With a data file the rows are written as compact
+/// JSON instead of table markup and the page pages, sorts and filters them in the browser.
+/// </remarks>
 internal static class HtmlReportWriter
 {
-    public static async Task WriteAsync(string path, CrlCheckRun run, CancellationToken cancellationToken)
+    private const string TempSuffix = ".tmp";
+    private const string DataFileExtension = ".data.json";
+    private const int StreamBufferSize = 65536;
+    private const int RowsPerFlush = 256;
+    private const int MaxUriLength = 40;
+
+    private static readonly string[] StatusFilterOptions = ["ERROR", "EXPIRED", "EXPIRING", "WARNING", "OK", "DEFERRED"];
+
+    private static readonly string[] ColumnHeaders =
+    [
+        "URI", "Issuer", "Status", "This Update (UTC)", "Next Update (UTC)", "Expires In", "CRL Size", "Download (ms)",
+        "Cache", "Signature", "Revocations", "Checked (UTC)", "Previous (UTC)", "Type", "Details"
+    ];
+
+    /// <summary>
+    /// Client-side renderer for the data file. Column indexes match <see cref="WriteDataRow"/>; only the current page
+    /// is turned into DOM nodes, so the browser stays responsive with tens of thousands of CRLs.
+    /// </summary>
+    private static readonly string[] PagedTableScript =
+    [
+        "(function(){",
+        "var C={uri:0,issuer:1,status:2,thisUpdate:3,nextUpdate:4,expiresIn:5,size:6,download:7,cache:8,signature:9,revoked:10,added:11,removed:12,checked:13,previous:14,type:15,details:16,timings:17};",
+        "var COLS=[C.uri,C.issuer,C.status,C.thisUpdate,C.nextUpdate,C.expiresIn,C.size,C.download,C.cache,C.signature,C.revoked,C.checked,C.previous,C.type,C.details];",
+        "var RANK={ERROR:0,EXPIRED:1,EXPIRING:2,WARNING:3,OK:4,DEFERRED:5};",
+        "var state={rows:[],view:[],page:0,size:100,sort:-1,dir:1,filter:'',status:''};",
+        "function esc(v){return v==null?'':String(v).replace(/[&<>\"']/g,function(c){return '&#'+c.charCodeAt(0)+';';});}",
+        "function dt(v){return v?esc(v).replace(' ','<br>'):'';}",
+        "function uri(v){var e=esc(v);var text=v.length>" + MaxUriLength.ToString(CultureInfo.InvariantCulture) + "?esc(v.substring(0," + MaxUriLength.ToString(CultureInfo.InvariantCulture) + ")+'...'):e;return /^https?:/i.test(v)?'<a href=\"'+e+'\" title=\"'+e+'\">'+text+'</a>':'<span title=\"'+e+'\">'+text+'</span>';}",
+        "function key(r,i){if(i===C.status){return RANK[r[i]];}if(i===C.expiresIn){i=C.nextUpdate;}var v=r[i];return v==null?'':v;}",
+        "function row(r){var s=r[C.status];var rev=r[C.revoked]==null?'':String(r[C.revoked]);if(r[C.added]||r[C.removed]){rev+='<br>+'+r[C.added]+' / -'+r[C.removed];}var cache=r[C.cache]==null?'':'Hit<br>'+r[C.cache]+' bytes saved';var title=r[C.timings]?' title=\"'+esc(r[C.timings])+'\"':'';",
+        "return '<tr'+(s==='ERROR'||s==='EXPIRED'?' class=\"row-'+s+'\"':'')+'><td>'+uri(r[C.uri])+'</td><td class=\"issuer\">'+esc(r[C.issuer]).replace(/-/g,'&#8209;')+'</td><td class=\"status-'+esc(s)+'\">'+esc(s)+'</td><td class=\"dt\">'+dt(r[C.thisUpdate])+'</td><td class=\"dt\">'+dt(r[C.nextUpdate])+'</td><td>'+esc(r[C.expiresIn])+'</td><td>'+esc(r[C.size])+'</td><td'+title+'>'+esc(r[C.download])+'</td><td>'+cache+'</td><td>'+esc(r[C.signature])+'</td><td>'+rev+'</td><td class=\"dt\">'+dt(r[C.checked])+'</td><td class=\"dt\">'+dt(r[C.previous])+'</td><td>'+esc(r[C.type])+'</td><td>'+esc(r[C.details])+'</td></tr>';}",
+        "function render(){var pages=Math.max(1,Math.ceil(state.view.length/state.size));state.page=Math.min(Math.max(state.page,0),pages-1);var start=state.page*state.size;var html=[];var rows=state.view.slice(start,start+state.size);for(var i=0;i<rows.length;i++){html.push(row(rows[i]));}",
+        "document.getElementById('crl-rows').innerHTML=html.join('');document.getElementById('crl-page').textContent=' Page '+(state.page+1)+' of '+pages+' ('+state.view.length+' of '+state.rows.length+' CRLs) ';document.getElementById('crl-prev').disabled=state.page===0;document.getElementById('crl-next').disabled=state.page>=pages-1;}",
+        "function apply(){var f=state.filter.toLowerCase();state.view=state.rows.filter(function(r){return (!state.status||r[C.status]===state.status)&&(!f||(r[C.uri]+' '+(r[C.issuer]||'')+' '+(r[C.details]||'')).toLowerCase().indexOf(f)>=0);});",
+        "if(state.sort>=0){var i=state.sort,d=state.dir;state.view.sort(function(a,b){var x=key(a,i),y=key(b,i);return x<y?-d:x>y?d:0;});}state.page=0;render();}",
+        "function init(){var table=document.getElementById('crl-table');var src=table.getAttribute('data-src');",
+        "document.getElementById('crl-filter').addEventListener('input',function(e){state.filter=e.target.value;apply();});",
+        "document.getElementById('crl-status').addEventListener('change',function(e){state.status=e.target.value;apply();});",
+        "document.getElementById('crl-size').addEventListener('change',function(e){state.size=parseInt(e.target.value,10);state.page=0;render();});",
+        "document.getElementById('crl-prev').addEventListener('click',function(){state.page--;render();});",
+        "document.getElementById('crl-next').addEventListener('click',function(){state.page++;render();});",
+        "var heads=table.querySelectorAll('thead th');Array.prototype.forEach.call(heads,function(th,n){th.addEventListener('click',function(){state.dir=state.sort===COLS[n]?-state.dir:1;state.sort=COLS[n];apply();});});",
+        "fetch(src).then(function(r){if(!r.ok){throw new Error('HTTP '+r.status);}return r.json();}).then(function(d){state.rows=d.rows;apply();})",
+        ".catch(function(e){document.getElementById('crl-page').textContent=' Could not load '+src+' ('+e.message+'). Open the report through a web server, or set html_report_data_file to false. ';});}",
+        "document.addEventListener('DOMContentLoaded',init);",
+        "})();"
+    ];
+
+    public static Task WriteAsync(string path, CrlCheckRun run, CancellationToken cancellationToken)
+    {
+        return WriteAsync(path, run, useDataFile: false, cancellationToken);
+    }
+
+    public static async Task WriteAsync(string path, CrlCheckRun run, bool useDataFile, CancellationToken cancellationToken)
     {
         ArgumentException.ThrowIfNullOrWhiteSpace(path);
         ArgumentNullException.ThrowIfNull(run);
@@ -19,13 +82,65 @@ internal static class HtmlReportWriter
             _ = Directory.CreateDirectory(directory);
         }
 
-        var html = BuildHtml(run);
-        await File.WriteAllTextAsync(path, html, Encoding.UTF8, cancellationToken).ConfigureAwait(false);
+        var sortedResults = RunRenderCache.For(run).ResultsByStatus;
+        string? dataSource = null;
+        if (useDataFile)
+        {
+            // The data file is replaced before the page, so the page on disk never points at rows older than itself.
+            // The query string stops browsers pairing a new page with a cached data file from an earlier run.
+            var dataPath = GetDataFilePath(path);
+            await WriteAtomicallyAsync(dataPath, stream => WriteDataAsync(stream, sortedResults, run.GeneratedAtUtc, cancellationToken)).ConfigureAwait(false);
+            dataSource = FormattableString.Invariant($"{Path.GetFileName(dataPath)}?v={run.GeneratedAtUtc.Ticks}");
+        }
+
+        await WriteAtomicallyAsync(path, stream => WriteHtmlAsync(stream, run, sortedResults, dataSource, cancellationToken)).ConfigureAwait(false);
 
         // Copy favicon to same directory as report
         await CopyFaviconAsync(directory, cancellationToken).ConfigureAwait(false);
     }
 
+    /// <summary>
+    /// Gets the path of the JSON data file written alongside <paramref name="htmlPath"/>.
+    /// </summary>
+    public static string GetDataFilePath(string htmlPath)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(htmlPath);
+        return Path.ChangeExtension(htmlPath, DataFileExtension);
+    }
+
+    private static async Task WriteAtomicallyAsync(string path, Func<Stream, Task> write)
+    {
+        var tempPath = path + TempSuffix;
+        try
+        {
+            using (var stream = new FileStream(tempPath, FileMode.Create, FileAccess.Write, FileShare.None, StreamBufferSize, useAsync: true))
+            {
+                await write(stream).ConfigureAwait(false);
+            }
+
+            File.Move(tempPath, path, overwrite: true);
+        }
+        catch
+        {
+            TryDelete(tempPath);
+            throw;
+        }
+    }
+
+    private static void TryDelete(string path)
+    {
+        try
+        {
+            File.Delete(path);
+        }
+        catch (IOException)
+        {
+        }
+        catch (UnauthorizedAccessException)
+        {
+        }
+    }
+
     private static async Task CopyFaviconAsync(string? targetDirectory, CancellationToken cancellationToken)
     {
         if (string.IsNullOrWhiteSpace(targetDirectory))
@@ -42,88 +157,143 @@ internal static class HtmlReportWriter
         }
     }
 
-    private static string BuildHtml(CrlCheckRun run)
+    private static async Task WriteHtmlAsync(
+        Stream stream,
+        CrlCheckRun run,
+        IReadOnlyList<CrlCheckResult> sortedResults,
+        string? dataSource,
+        CancellationToken cancellationToken)
     {
-        var summary = BuildSummary(run.Results);
-        var builder = new StringBuilder();
-        _ = builder.AppendLine("<!DOCTYPE html>");
-        _ = builder.AppendLine("<html lang=\"en\"><head>");
-        _ = builder.AppendLine("<meta charset=\"utf-8\" />");
-        _ = builder.AppendLine("<link rel=\"icon\" type=\"image/png\" href=\"data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAKcAAACmCAYAAAC/Sp9JAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAAadEVYdFNvZnR3YXJlAFBhaW50Lk5FVCB2My41LjEwMPRyoQAAG8pJREFUeF7tnWidU1W2xv1yu68jyIwoFPMoMigyaDdi2ygq4IAKCiriRIsDV8QZEURFEXFutVttvfoP3cdUUknN1Dz4H9S+77vO3qd2QkKlqKqck2R9yMNQqeQk+eXda14XGWMucrfeb78ybS8dMC37HjWN991t6jfdZJq2bzEtjzxgzu7bYzreedP0fv2F+eO3X/Arg7+nf9f3YiwYCMEs9ODdH31gWh7bZdJrlpvknOmmdtIl5v/+6yLz+58vMolxfzLJmummbsVik1lznam/6XpT/5c1pvGOW03Tjm2mFVC3PrrLtB8+aLo/PWX6/vWt+eNXBXssPshKfMwh4cz3onvOnDJtB54xjXfeZlILZ5naaeNNcvqV+HOcSc6YYJJXTzKpmVNMErfaq/D//Bn+TM6YiJ/hhv9PAfTknKtM3colpnHrZtOya4dpffIx0/XeUdP7zRem/7efVZ2r/HS6IDjzAdv1/jHT/PAOKOeNJr1ikaklmNPHA0IAuHi2SV87P7gtXyB/1i2eY+oWzpKfE9bkNZME7NopV5jEhItNYvJlJjV/ZvA7UOXG2zeZJkB89h9PmS6oed9/flB4KxzeUYMzF9j+X382nUffMi27HzR1gCs5A/ABQKooVTY1G+YA4AxgxW3ZPFO3ZK6pWzo3+Dv+rFswU6TmXR0AfM3kQJUJsCgwHgu35Kyp8oVoumeLqHnXh+8ptBUC7ZjBmU9d+//3J9P+2ssiZNVvuN4kAV5iwiWmdirMAR7182YIkIS2bgmUVdS1ZvD/oMDyf3Lj30GdeLKi8V8aVBezJgYpTJbTuaNdlhqMMx1VUISscMYYTp9WCGn0XC7jIH8H/46urBvvrFs4MyTdiaoquoPJbmDf/ux+p2Ut8M8v0vOB3adqJk9S45SSxCZI77TqVKdnrxQ0ZNTH+NFCPP0fOr0blNTW3dQSWpRDOy1Hj8SWv+MjDNz7R3w6Q2b04E9xcC9hTnO5PRJ/0f1P4vI2rQ888JRU/f1TKPpO0fQa9fRJDM4CyskPn24f4U1A6eS5u61ZK/Ap5swgL/XDuqWpZ/u68Fyu9P5zl0d6OXC+r+L2UWrzLlO3fI58WSRjRaWmutdMCxTa3j16R6nDVW5wUpk4PNAtLGWf0M8Cq3jl2J8SuhAFZhLApeZdHehf/Lz8W/cj/Z/C+7Ry+pWDt1s0S2xkVljJy8/HStqWy0zdvCnl5UQVbOznXhSgqZnX/6PNtoCuCrAMpXHKSlFgqa6c7FY/OI8YpD48w3DXZMr2o3Lv/pxq5dVL5D3hvex89bBU/fdunBJ8Hvo++VjWqQ+qlH1m70KaoqZtnSfv3S2bZ+qRGnZqn/vnWCioLr08LwlgZfBdJ0fvgDqnV4X2u1T78XxJ9X78YdFlqAqnD5+zO10br7vzN3x0XHa+cg1gPb8NWGf+P3EDBB4LAK4AeFMvN+lrF0jdp1tU4sUAnPd0c1DDqCjgB6bhlltjAafDvPOjDyVAz+F1iaJgNFgx2ug/vN2+p2n7VgG1++OPZHlq7Jmogiq2pzyuVUvcQqC9NpMcfb6lDGjNlEsM+zcP1zvv6u68t1SlHSM4c+E8u3+vqblxfehw+k5R+sb10oIr3QKE5GdaMhDmgT15bfbxyP9xdqhbtiAwD9gDv+n6cz6XfOcpnVsV+HdDU1Ce6fyp+jXKvp25tX/c++LPv3jvpd+mwrSntHT09rR8vMI5XnDmmgOuTM11DYNt/DylfM3kS83/c9/XUcU2/n/3veHzCv+fHQUYiVoWUk9+D54b5fTb9UY0pu8Y59KOf/cprk+VBWyiT24/FyNRVSdnb9tO0wm7KdO8ftUYqdN80SqnKWuB06b3n+9NG6AMJ2L48YbqnNuwWpZVOvXT+vfbTdOu+y2sroPEqG7DavmS8PfzzE3R/1W38V+I5kU7TQPGInZnvuTJgvNcF45//WJo04Z/OzibHnpAam4cHNL4c3/R4Xs3nLqGNWvd9s1Z/3bqmo+F+/JCnB4XL5mwYadpeeQBqfVMXL/GNA5jT3rq2nbwBanHZqPmRqP8PgfsAU4g5JHPfxc/93B61xAenPngdI7PQN+7Tw1O9tRe6yuqmfUlou3L31/5n5b5iq85RDlFi0Ybzobdt4fHpDtPPHg5MOazW2XNYZ5z+j/mK6qD2F2zUlYrc8O6/m+/yBeq0a/jWqGcjqF8J4yDhC3ZPtK4lLp1q7I6SqWi1LVXrvE3g2ldXDbLvb+45c/Mz1E4h6Kezg5t//qrwT1FxQBUu3W0c1LX+tIDskd2HzI1lAr8fdl8+s5/3T+HBakP6w/r+pWy6NN1z13pMQmqmXrd+tUyH9QdY0cL5+P9dY+jvB0YP90M5lR3OhAHd6MNZ8/pTwZ36PANRmjRbtwyRU6bKCnPfJ73ot/3y1cU/Jb/X7lZzJ94Q12/rP9vPDr6Dxz1nRj9H/xA8VgPvQChkubDy//T3z9u8OYL3fEDKS9+90fvi5qGu3tHG04+z97PP5Nd56bA8gN30C6ABAQ7N6eAOnUtNFQDX2NuMc1g00I91fj0W5vjB85cOF3/j6hpfvqTv/WPz/HiQMpzfHDUY5zvcBLGjf4/B6RO0+4rFNDRhpOQ9fBL5ZwjF0pqk48bWZ2R2YeuBxzYSHl+xt9zU0VHG05nOnS+d0x+r/svN7hXKJ/dKo1y+a+pC/c+Cr5Hw32fo45pvrqN8D6F9ubgey+hG/4+30sRrjHI94VwNNuDxgdOh2vT9i1SdkbP/HN1k9G2R1MK+cXy3+U6VTkfE77/vTG5qh+fT09+DzpRhPTigtM9HqYX/T+u4JhGe98dn38u7V5vkEp4rj6so6uc+eDk62g7eDCoqx0rnPnU073fhKzu3g8KsVffj+PIFxCg8fqyZX+wgvjnAacLmjnV7X/q/fz//YP/5vtz6iu//zydKeD+jVmAEyWkY5T13A/sn0r+/nwgRvk+mPcY3D/2/C+9GPlJc7c9wGvbfWlodxLqjtcOZ6kq7/deh++lz34pfqd+eLpQ1cXVabpwFfr9GUs4XUTO/q4ubPwbqby+/en+lm/3+urpkwvncNvDReHEsV6IXez/Owfqc+vNT7Lm+44WwKMN5+v4nz44h4qacr88Hlv5/u1C+s8fmH0YBqZC333+c+fxWAWA4/v9OX9HG+BcOI+j1I4ZsNxl2S/M/W+iXUvU+9m/R3ggXjBcbTj975s/s1PqWr44XcU/1zgfaE/dc+Qr5s6kG/j3+JleVMJzzdX8l23/8pv3fn9mKf/vvY++7VmqcBLi3v//MQBnKPU8VwtmAf/O/Yr9+xm+p6GiA/c5hEqJC1fvD9+au1+Ndjn/l+/vzzmAUj8XL+7/O/L/Xhawjl1fdP8Gtaex/fmC1fOf/t1b/Q/8H9y8vzPf79rxyP87hb69p7JK+H/5f+f/MlTdWXCrw3/ZeQr57FLCePP/nwdn7tvY8+Vn5r+HS5QRYhf6P/vP0/d7cd/79//8Xxo//2LM53v2Y/bfh/P8X+59yeX/unPc/Xv+/H0PvP+D/we/V+M5p91o/n9ZqOnvrp//xb++IQjOXH/gO+7/Y46pS/l/h1sFjWqxf48P9s9z93rOe+2/p9nvo/df8DX76/f+Hn+/f/+D/7vdlw9/fQN/53/O/b/z/+/nO/y/P/r/j/y/m/v3h/J/5+D/Lf67/X/H/Xu+/+f/zvn/7/y/8/8f/P/7+P8P/v/D/7+Q/3/w/x/8/wf//8H/f/D/H/z/B///wf9/8P8f/P8H//9f/P+H/v/D/3/w/x/8/8dQrjHwfy/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f==\">");
-        _ = builder.AppendLine("<title>CRL Health Report — CrlMonitor</title>");
-        _ = builder.AppendLine("<style>");
-        _ = builder.AppendLine("body{font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,sans-serif;background:#f5f7fb;color:#1f2937;margin:0;padding:0;}");
-        _ = builder.AppendLine(".container{max-width:1200px;margin:0 auto;padding:32px;}");
-        _ = builder.AppendLine(".card{background:#fff;border-radius:16px;box-shadow:0 10px 30px rgba(15,23,42,.1);padding:32px;margin-bottom:32px;}");
-        _ = builder.AppendLine(".summary-grid{display:grid;grid-template-columns:repeat(auto-fit,minmax(135px,1fr));gap:16px;}");
-        _ = builder.AppendLine(".summary-card{padding:16px;border-radius:12px;background:#f9fafb;border:1px solid #e5e7eb;}");
-        _ = builder.AppendLine(".summary-label{font-size:14px;color:#6b7280;text-transform:uppercase;letter-spacing:.05em;}");
-        _ = builder.AppendLine(".summary-value{font-size:28px;font-weight:600;color:#111827;margin-top:4px;}");
-        _ = builder.AppendLine(".header-divider{border-bottom:1px solid #e5e7eb;margin:12px 0 24px 0;}");
-        _ = builder.AppendLine(".report-meta{color:#6b7280;font-size:14px;margin-bottom:20px;}");
-        _ = builder.AppendLine(".table-wrapper{overflow-x:auto;}");
-        _ = builder.AppendLine("table{width:100%;border-collapse:collapse;margin-top:16px;font-size:14px;}");
-        _ = builder.AppendLine("th{background:#111827;color:#f9fafb;text-align:left;padding:12px;border-bottom:2px solid #0f172a;}");
-        _ = builder.AppendLine("td{padding:12px;border-bottom:1px solid #e5e7eb;line-height:1.4;}");
-        _ = builder.AppendLine("td:last-child,th:last-child{min-width:220px;}");
-        _ = builder.AppendLine("tr:nth-child(even){background:#f9fafb;}");
-        _ = builder.AppendLine(".status-OK{color:#16a34a;font-weight:600;}");
-        _ = builder.AppendLine(".status-WARNING,.status-EXPIRING{color:#f97316;font-weight:600;}");
-        _ = builder.AppendLine(".status-EXPIRED,.status-ERROR{color:#dc2626;font-weight:600;}");
-        _ = builder.AppendLine(".uri-toggle{color:#2563eb;text-decoration:none;font-size:12px;margin-left:4px;}");
-        _ = builder.AppendLine(".uri-toggle:hover{text-decoration:underline;}");
-        _ = builder.AppendLine(".uri-full{white-space:nowrap;margin-left:4px;}");
-        _ = builder.AppendLine(".issuer{word-break:keep-all;overflow-wrap:normal;}");
-        _ = builder.AppendLine(".dt{white-space:nowrap;}");
-        _ = builder.AppendLine("</style>");
-        _ = builder.AppendLine("<script>");
-        _ = builder.AppendLine("function toggleUri(id){var full=document.getElementById(id+'-full');var short=document.getElementById(id+'-short');var link=document.getElementById(id+'-link');if(full.style.display==='none'){full.style.display='inline';short.style.display='none';link.textContent='(hide)';}else{full.style.display='none';short.style.display='inline';link.textContent='(show)';}}");
-        _ = builder.AppendLine("</script>");
-        _ = builder.AppendLine("</head><body>");
-        _ = builder.AppendLine("<div class=\"container\">");
-        _ = builder.AppendLine("<div class=\"card\">");
-        _ = builder.AppendLine("<h1>CRL Health Report</h1>");
-        _ = builder.AppendLine("<div class=\"header-divider\"></div>");
+        using var writer = new StreamWriter(stream, Encoding.UTF8, StreamBufferSize, leaveOpen: true);
+        WriteHeader(writer, run);
+        if (dataSource == null)
+        {
+            WriteTableStart(writer);
+            for (var i = 0; i < sortedResults.Count; i++)
+            {
+                WriteRow(writer, sortedResults[i], i);
+                if ((i + 1) % RowsPerFlush == 0)
+                {
+                    await writer.FlushAsync(cancellationToken).ConfigureAwait(false);
+                }
+            }
+
+            WriteTableEnd(writer);
+        }
+        else
+        {
+            WritePagedTable(writer, dataSource);
+        }
+
+        WriteFooter(writer);
+        await writer.FlushAsync(cancellationToken).ConfigureAwait(false);
+    }
+
+    private static void WriteHeader(TextWriter writer, CrlCheckRun run)
+    {
+        var summary = RunRenderCache.For(run).Summary;
+        writer.WriteLine("<!DOCTYPE html>");
+        writer.WriteLine("<html lang=\"en\"><head>");
+        writer.WriteLine("<meta charset=\"utf-8\" />");
+        writer.WriteLine("<link rel=\"icon\" type=\"image/png\" href=\"data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAKcAAACmCAYAAAC/Sp9JAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAAadEVYdFNvZnR3YXJlAFBhaW50Lk5FVCB2My41LjEwMPRyoQAAG8pJREFUeF7tnWidU1W2xv1yu68jyIwoFPMoMigyaDdi2ygq4IAKCiriRIsDV8QZEURFEXFutVttvfoP3cdUUknN1Dz4H9S+77vO3qd2QkKlqKqck2R9yMNQqeQk+eXda14XGWMucrfeb78ybS8dMC37HjWN991t6jfdZJq2bzEtjzxgzu7bYzreedP0fv2F+eO3X/Arg7+nf9f3YiwYCMEs9ODdH31gWh7bZdJrlpvknOmmdtIl5v/+6yLz+58vMolxfzLJmummbsVik1lznam/6XpT/5c1pvGOW03Tjm2mFVC3PrrLtB8+aLo/PWX6/vWt+eNXBXssPshKfMwh4cz3onvOnDJtB54xjXfeZlILZ5naaeNNcvqV+HOcSc6YYJJXTzKpmVNMErfaq/D//Bn+TM6YiJ/hhv9PAfTknKtM3colpnHrZtOya4dpffIx0/XeUdP7zRem/7efVZ2r/HS6IDjzAdv1/jHT/PAOKOeNJr1ikaklmNPHA0IAuHi2SV87P7gtXyB/1i2eY+oWzpKfE9bkNZME7NopV5jEhItNYvJlJjV/ZvA7UOXG2zeZJkB89h9PmS6oed9/flB4KxzeUYMzF9j+X382nUffMi27HzR1gCs5A/ABQKooVTY1G+YA4AxgxW3ZPFO3ZK6pWzo3+Dv+rFswU6TmXR0AfM3kQJUJsCgwHgu35Kyp8oVoumeLqHnXh+8ptBUC7ZjBmU9d+//3J9P+2ssiZNVvuN4kAV5iwiWmdirMAR7182YIkIS2bgmUVdS1ZvD/oMDyf3Lj30GdeLKi8V8aVBezJgYpTJbTuaNdlhqMMx1VUISscMYYTp9WCGn0XC7jIH8H/46urBvvrFs4MyTdiaoquoPJbmDf/ux+p2Ut8M8v0vOB3adqJk9S45SSxCZI77TqVKdnrxQ0ZNTH+NFCPP0fOr0blNTW3dQSWpRDOy1Hj8SWv+MjDNz7R3w6Q2b04E9xcC9hTnO5PRJ/0f1P4vI2rQ888JRU/f1TKPpO0fQa9fRJDM4CyskPn24f4U1A6eS5u61ZK/Ap5swgL/XDuqWpZ/u68Fyu9P5zl0d6OXC+r+L2UWrzLlO3fI58WSRjRaWmutdMCxTa3j16R6nDVW5wUpk4PNAtLGWf0M8Cq3jl2J8SuhAFZhLApeZdHehf/Lz8W/cj/Z/C+7Ry+pWDt1s0S2xkVljJy8/HStqWy0zdvCnl5UQVbOznXhSgqZnX/6PNtoCuCrAMpXHKSlFgqa6c7FY/OI8YpD48w3DXZMr2o3Lv/pxq5dVL5D3hvex89bBU/fdunBJ8Hvo++VjWqQ+qlH1m70KaoqZtnSfv3S2bZ+qRGnZqn/vnWCioLr08LwlgZfBdJ0fvgDqnV4X2u1T78XxJ9X78YdFlqAqnD5+zO10br7vzN3x0XHa+cg1gPb8NWGf+P3EDBB4LAK4AeFMvN+lrF0jdp1tU4sUAnPd0c1DDqCjgB6bhlltjAafDvPOjDyVAz+F1iaJgNFgx2ug/vN2+p2n7VgG1++OPZHlq7Jmogiq2pzyuVUvcQqC9NpMcfb6lDGjNlEsM+zcP1zvv6u68t1SlHSM4c+E8u3+vqblxfehw+k5R+sb10oIr3QKE5GdaMhDmgT15bfbxyP9xdqhbtiAwD9gDv+n6cz6XfOcpnVsV+HdDU1Ce6fyp+jXKvp25tX/c++LPv3jvpd+mwrSntHT09rR8vMI5XnDmmgOuTM11DYNt/DylfM3kS83/c9/XUcU2/n/3veHzCv+fHQUYiVoWUk9+D54b5fTb9UY0pu8Y59KOf/cprk+VBWyiT24/FyNRVSdnb9tO0wm7KdO8ftUYqdN80SqnKWuB06b3n+9NG6AMJ2L48YbqnNuwWpZVOvXT+vfbTdOu+y2sroPEqG7DavmS8PfzzE3R/1W38V+I5kU7TQPGInZnvuTJgvNcF45//WJo04Z/OzibHnpAam4cHNL4c3/R4Xs3nLqGNWvd9s1Z/3bqmo+F+/JCnB4XL5mwYadpeeQBqfVMXL/GNA5jT3rq2nbwBanHZqPmRqP8PgfsAU4g5JHPfxc/93B61xAenPngdI7PQN+7Tw1O9tRe6yuqmfUlou3L31/5n5b5iq85RDlFi0Ybzobdt4fHpDtPPHg5MOazW2XNYZ5z+j/mK6qD2F2zUlYrc8O6/m+/yBeq0a/jWqGcjqF8J4yDhC3ZPtK4lLp1q7I6SqWi1LVXrvE3g2ldXDbLvb+45c/Mz1E4h6Kezg5t//qrwT1FxQBUu3W0c1LX+tIDskd2HzI1lAr8fdl8+s5/3T+HBakP6w/r+pWy6NN1z13pMQmqmXrd+tUyH9QdY0cL5+P9dY+jvB0YP90M5lR3OhAHd6MNZ8/pTwZ36PANRmjRbtwyRU6bKCnPfJ73ot/3y1cU/Jb/X7lZzJ94Q12/rP9vPDr6Dxz1nRj9H/xA8VgPvQChkubDy//T3z9u8OYL3fEDKS9+90fvi5qGu3tHG04+z97PP5Nd56bA8gN30C6ABAQ7N6eAOnUtNFQDX2NuMc1g00I91fj0W5vjB85cOF3/j6hpfvqTv/WPz/HiQMpzfHDUY5zvcBLGjf4/B6RO0+4rFNDRhpOQ9fBL5ZwjF0pqk48bWZ2R2YeuBxzYSHl+xt9zU0VHG05nOnS+d0x+r/svN7hXKJ/dKo1y+a+pC/c+Cr5Hw32fo45pvrqN8D6F9ubgey+hG/4+30sRrjHI94VwNNuDxgdOh2vT9i1SdkbP/HN1k9G2R1MK+cXy3+U6VTkfE77/vTG5qh+fT09+DzpRhPTigtM9HqYX/T+u4JhGe98dn38u7V5vkEp4rj6so6uc+eDk62g7eDCoqx0rnPnU073fhKzu3g8KsVffj+PIFxCg8fqyZX+wgvjnAacLmjnV7X/q/fz//YP/5vtz6iu//zydKeD+jVmAEyWkY5T13A/sn0r+/nwgRvk+mPcY3D/2/C+9GPlJc7c9wGvbfWlodxLqjtcOZ6kq7/deh++lz34pfqd+eLpQ1cXVabpwFfr9GUs4XUTO/q4ubPwbqby+/en+lm/3+urpkwvncNvDReHEsV6IXez/Owfqc+vNT7Lm+44WwKMN5+v4nz44h4qacr88Hlv5/u1C+s8fmH0YBqZC333+c+fxWAWA4/v9OX9HG+BcOI+j1I4ZsNxl2S/M/W+iXUvU+9m/R3ggXjBcbTj975s/s1PqWr44XcU/1zgfaE/dc+Qr5s6kG/j3+JleVMJzzdX8l23/8pv3fn9mKf/vvY++7VmqcBLi3v//MQBnKPU8VwtmAf/O/Yr9+xm+p6GiA/c5hEqJC1fvD9+au1+Ndjn/l+/vzzmAUj8XL+7/O/L/Xhawjl1fdP8Gtaex/fmC1fOf/t1b/Q/8H9y8vzPf79rxyP87hb69p7JK+H/5f+f/MlTdWXCrw3/ZeQr57FLCePP/nwdn7tvY8+Vn5r+HS5QRYhf6P/vP0/d7cd/79//8Xxo//2LM53v2Y/bfh/P8X+59yeX/unPc/Xv+/H0PvP+D/we/V+M5p91o/n9ZqOnvrp//xb++IQjOXH/gO+7/Y46pS/l/h1sFjWqxf48P9s9z93rOe+2/p9nvo/df8DX76/f+Hn+/f/+D/7vdlw9/fQN/53/O/b/z/+/nO/y/P/r/j/y/m/v3h/J/5+D/Lf67/X/H/Xu+/+f/zvn/7/y/8/8f/P/7+P8P/v/D/7+Q/3/w/x/8/wf//8H/f/D/H/z/B///wf9/8P8f/P8H//9f/P+H/v/D/3/w/x/8/8dQrjHwfy/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f+j/P/z/h/7/w/9/6P8//P+H/v/D/3/o/z/8/4f+/8P/f==\">");
+        writer.WriteLine("<title>CRL Health Report — CrlMonitor</title>");
+        writer.WriteLine("<style>");
+        writer.WriteLine("body{font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,sans-serif;background:#f5f7fb;color:#1f2937;margin:0;padding:0;}");
+        writer.WriteLine(".container{max-width:1200px;margin:0 auto;padding:32px;}");
+        writer.WriteLine(".card{background:#fff;border-radius:16px;box-shadow:0 10px 30px rgba(15,23,42,.1);padding:32px;margin-bottom:32px;}");
+        writer.WriteLine(".summary-grid{display:grid;grid-template-columns:repeat(auto-fit,minmax(135px,1fr));gap:16px;}");
+        writer.WriteLine(".summary-card{padding:16px;border-radius:12px;background:#f9fafb;border:1px solid #e5e7eb;}");
+        writer.WriteLine(".summary-label{font-size:14px;color:#6b7280;text-transform:uppercase;letter-spacing:.05em;}");
+        writer.WriteLine(".summary-value{font-size:28px;font-weight:600;color:#111827;margin-top:4px;}");
+        writer.WriteLine(".header-divider{border-bottom:1px solid #e5e7eb;margin:12px 0 24px 0;}");
+        writer.WriteLine(".report-meta{color:#6b7280;font-size:14px;margin-bottom:20px;}");
+        writer.WriteLine(".table-wrapper{overflow-x:auto;}");
+        writer.WriteLine("table{width:100%;border-collapse:collapse;margin-top:16px;font-size:14px;}");
+        writer.WriteLine("th{background:#111827;color:#f9fafb;text-align:left;padding:12px;border-bottom:2px solid #0f172a;}");
+        writer.WriteLine("td{padding:12px;border-bottom:1px solid #e5e7eb;line-height:1.4;}");
+        writer.WriteLine("td:last-child,th:last-child{min-width:220px;}");
+        writer.WriteLine("tr:nth-child(even){background:#f9fafb;}");
+        writer.WriteLine(".status-OK{color:#16a34a;font-weight:600;}");
+        writer.WriteLine(".status-WARNING,.status-EXPIRING{color:#f97316;font-weight:600;}");
+        writer.WriteLine(".status-EXPIRED,.status-ERROR{color:#dc2626;font-weight:600;}");
+        writer.WriteLine(".status-DEFERRED{color:#6b7280;font-weight:600;}");
+        writer.WriteLine(".uri-toggle{color:#2563eb;text-decoration:none;font-size:12px;margin-left:4px;}");
+        writer.WriteLine(".uri-toggle:hover{text-decoration:underline;}");
+        writer.WriteLine(".uri-full{white-space:nowrap;margin-left:4px;}");
+        writer.WriteLine(".issuer{word-break:keep-all;overflow-wrap:normal;}");
+        writer.WriteLine(".dt{white-space:nowrap;}");
+        writer.WriteLine(".timings td,.timings th{text-align:right;}");
+        writer.WriteLine(".timings td:first-child,.timings th:first-child{text-align:left;min-width:0;}");
+        writer.WriteLine(".toolbar{display:flex;flex-wrap:wrap;gap:8px;align-items:center;font-size:14px;}");
+        writer.WriteLine(".toolbar input{flex:1;min-width:220px;padding:6px 8px;}");
+        writer.WriteLine("th.sortable{cursor:pointer;user-select:none;}");
+        writer.WriteLine("</style>");
+        writer.WriteLine("<script>");
+        writer.WriteLine("function toggleUri(id){var full=document.getElementById(id+'-full');var short=document.getElementById(id+'-short');var link=document.getElementById(id+'-link');if(full.style.display==='none'){full.style.display='inline';short.style.display='none';link.textContent='(hide)';}else{full.style.display='none';short.style.display='inline';link.textContent='(show)';}}");
+        writer.WriteLine("</script>");
+        writer.WriteLine("</head><body>");
+        writer.WriteLine("<div class=\"container\">");
+        writer.WriteLine("<div class=\"card\">");
+        writer.WriteLine("<h1>CRL Health Report</h1>");
+        writer.WriteLine("<div class=\"header-divider\"></div>");
         var licenseInfo = GetLicenseInfo();
-        _ = builder.AppendLine(FormattableString.Invariant($"<p class=\"report-meta\">Generated: {TimeFormatter.FormatUtc(run.GeneratedAtUtc)} &middot; {licenseInfo}</p>"));
-        _ = builder.AppendLine("<div class=\"summary-grid\">");
-        AppendSummaryCard(builder, "CRL Errors", summary.Errors, summary.Errors > 0 ? "#dc2626" : null);
-        AppendSummaryCard(builder, "CRLs Expired", summary.Expired, summary.Expired > 0 ? "#dc2626" : null);
-        AppendSummaryCard(builder, "CRLs Warning", summary.Warning, null);
-        AppendSummaryCard(builder, "CRLs Expiring", summary.Expiring, null);
-        AppendSummaryCard(builder, "CRLs OK", summary.Ok, null);
-        AppendSummaryCard(builder, "CRLs Checked", summary.Total, null);
-        _ = builder.AppendLine("</div></div>");
-        _ = builder.AppendLine("<div class=\"card table-wrapper\">");
-        _ = builder.AppendLine("<table><thead><tr>");
-        _ = builder.AppendLine("<th>URI</th><th>Issuer</th><th>Status</th><th>This Update (UTC)</th><th>Next Update (UTC)</th><th>Expires In</th><th>CRL Size</th><th>Download (ms)</th><th>Signature</th><th>Revocations</th><th>Checked (UTC)</th><th>Previous (UTC)</th><th>Type</th><th>Details</th>");
-        _ = builder.AppendLine("</tr></thead><tbody>");
-
-        // Sort by status priority: ERROR, EXPIRED, EXPIRING, WARNING, OK
-        var sortedResults = run.Results.OrderBy(r => r.Status switch {
-            CrlStatus.Error => 0,
-            CrlStatus.Expired => 1,
-            CrlStatus.Expiring => 2,
-            CrlStatus.Warning => 3,
-            CrlStatus.Ok => 4,
-            _ => 5
-        }).ToList();
-
-        for (var i = 0; i < sortedResults.Count; i++)
+        writer.WriteLine(FormattableString.Invariant($"<p class=\"report-meta\">Generated: {TimeFormatter.FormatUtc(run.GeneratedAtUtc)} &middot; {licenseInfo}</p>"));
+        writer.WriteLine("<div class=\"summary-grid\">");
+        WriteSummaryCard(writer, "CRL Errors", summary.Errors, summary.Errors > 0 ? "#dc2626" : null);
+        WriteSummaryCard(writer, "CRLs Expired", summary.Expired, summary.Expired > 0 ? "#dc2626" : null);
+        WriteSummaryCard(writer, "CRLs Warning", summary.Warning, null);
+        WriteSummaryCard(writer, "CRLs Expiring", summary.Expiring, null);
+        WriteSummaryCard(writer, "CRLs OK", summary.Ok, null);
+        WriteSummaryCard(writer, "CRLs Checked", summary.Total, null);
+        if (summary.CacheHits > 0)
+        {
+            WriteSummaryCard(writer, "Cache Hits", summary.CacheHits, null);
+        }
+
+        if (summary.Deferred > 0)
+        {
+            WriteSummaryCard(writer, "CRLs Deferred", summary.Deferred, null);
+        }
+        writer.WriteLine("</div></div>");
+        WriteStageTimings(writer, run.Diagnostics.GetStageTimingSummaries());
+        writer.WriteLine("<div class=\"card table-wrapper\">");
+    }
+
+    private static void WriteTableStart(TextWriter writer)
+    {
+        writer.WriteLine("<table><thead><tr>");
+        WriteColumnHeaders(writer);
+        writer.WriteLine("</tr></thead><tbody>");
+    }
+
+    private static void WriteTableEnd(TextWriter writer)
+    {
+        writer.WriteLine("</tbody></table></div></div>");
+    }
+
+    private static void WriteColumnHeaders(TextWriter writer, string? headerClass = null)
+    {
+        var open = headerClass == null ? "<th>" : FormattableString.Invariant($"<th class=\"{headerClass}\">");
+        foreach (var header in ColumnHeaders)
         {
-            AppendRow(builder, sortedResults[i], i);
+            writer.Write(open);
+            writer.Write(header);
+            writer.Write("</th>");
         }
-        _ = builder.AppendLine("</tbody></table></div></div>");
 
+        writer.WriteLine();
+    }
+
+    private static void WriteFooter(TextWriter writer)
+    {
         if (LicenseBootstrapper.ValidatedLicense?.Type == LicenseType.Trial)
         {
             var requestCode = LicenseBootstrapper.CreateRequestCode();
-            _ = builder.AppendLine(FormattableString.Invariant($"<div style=\"text-align:center;color:#374151;font-size:13px;margin-top:24px;\">You are using a trial license. To upgrade, please email <a href=\"mailto:sales@redkestrel.co.uk\">sales@redkestrel.co.uk</a> with your request code: {requestCode}</div>"));
+            writer.WriteLine(FormattableString.Invariant($"<div style=\"text-align:center;color:#374151;font-size:13px;margin-top:24px;\">You are using a trial license. To upgrade, please email <a href=\"mailto:sales@redkestrel.co.uk\">sales@redkestrel.co.uk</a> with your request code: {requestCode}</div>"));
         }
 
-        _ = builder.AppendLine(FormattableString.Invariant($"<footer style=\"text-align:center;color:#6b7280;font-size:12px;margin-top:32px;\">Generated by CRL Monitor {GetVersion()} — © {DateTime.UtcNow:yyyy} Red Kestrel Consulting Limited</footer>"));
-        _ = builder.AppendLine("</div></body></html>");
-        return builder.ToString();
+        writer.WriteLine(FormattableString.Invariant($"<footer style=\"text-align:center;color:#6b7280;font-size:12px;margin-top:32px;\">Generated by CRL Monitor {GetVersion()} — © {DateTime.UtcNow:yyyy} Red Kestrel Consulting Limited</footer>"));
+        writer.WriteLine("</div></body></html>");
     }
 
     private static string GetLicenseInfo()
@@ -154,59 +324,215 @@ internal static class HtmlReportWriter
         return string.Empty;
     }
 
-    private static void AppendSummaryCard(StringBuilder builder, string label, int value, string? color)
+    private static void WriteSummaryCard(TextWriter writer, string label, int value, string? color)
     {
         var valueStyle = string.IsNullOrWhiteSpace(color) ? "summary-value" : $"summary-value\" style=\"color:{color}";
-        _ = builder.AppendLine("<div class=\"summary-card\">");
-        _ = builder.AppendLine(FormattableString.Invariant($"<div class=\"summary-label\">{label}</div>"));
-        _ = builder.AppendLine(FormattableString.Invariant($"<div class=\"{valueStyle}\">{value}</div>"));
-        _ = builder.AppendLine("</div>");
+        writer.WriteLine("<div class=\"summary-card\">");
+        writer.WriteLine(FormattableString.Invariant($"<div class=\"summary-label\">{label}</div>"));
+        writer.WriteLine(FormattableString.Invariant($"<div class=\"{valueStyle}\">{value}</div>"));
+        writer.WriteLine("</div>");
     }
 
-    private static void AppendRow(StringBuilder builder, CrlCheckResult result, int rowIndex)
+    private static void WriteRow(TextWriter writer, CrlCheckResult result, int rowIndex)
     {
         var parsed = result.ParsedCrl;
         var statusClass = $"status-{result.Status.ToDisplayString()}";
         var rowClass = result.Status is CrlStatus.Error or CrlStatus.Expired ? " class=\"row-" + result.Status.ToDisplayString() + "\"" : string.Empty;
-        _ = builder.AppendLine("<tr" + rowClass + ">");
+        writer.WriteLine("<tr" + rowClass + ">");
 
         // Collapsible URI
         var fullUri = result.Uri.ToString();
         var escapedUri = Escape(fullUri);
         var isHttpScheme = result.Uri.Scheme is "http" or "https";
-        const int maxUriLength = 40;
-        if (fullUri.Length > maxUriLength)
+        if (fullUri.Length > MaxUriLength)
         {
-            var truncated = Escape(fullUri[0..maxUriLength] + "...");
+            var truncated = Escape(fullUri[0..MaxUriLength] + "...");
             var truncatedWrapped = isHttpScheme ? FormattableString.Invariant($"<a href=\"{escapedUri}\">{truncated}</a>") : truncated;
             var fullWrapped = isHttpScheme ? FormattableString.Invariant($"<a href=\"{escapedUri}\">{escapedUri}</a>") : escapedUri;
             var uriId = FormattableString.Invariant($"uri{rowIndex}");
-            _ = builder.Append(FormattableString.Invariant($"<td><span id=\"{uriId}-short\" class=\"uri-short\">"));
-            _ = builder.Append(truncatedWrapped);
-            _ = builder.Append("</span>&nbsp;");
-            _ = builder.Append(FormattableString.Invariant($"<a href=\"#\" class=\"uri-toggle\" id=\"{uriId}-link\" onclick=\"toggleUri('{uriId}'); return false;\">(show)</a>"));
-            _ = builder.Append(FormattableString.Invariant($"<span id=\"{uriId}-full\" class=\"uri-full\" style=\"display:none;\">{fullWrapped}</span>"));
-            _ = builder.AppendLine("</td>");
+            writer.Write(FormattableString.Invariant($"<td><span id=\"{uriId}-short\" class=\"uri-short\">"));
+            writer.Write(truncatedWrapped);
+            writer.Write("</span>&nbsp;");
+            writer.Write(FormattableString.Invariant($"<a href=\"#\" class=\"uri-toggle\" id=\"{uriId}-link\" onclick=\"toggleUri('{uriId}'); return false;\">(show)</a>"));
+            writer.Write(FormattableString.Invariant($"<span id=\"{uriId}-full\" class=\"uri-full\" style=\"display:none;\">{fullWrapped}</span>"));
+            writer.WriteLine("</td>");
         }
         else
         {
             var wrappedUri = isHttpScheme ? FormattableString.Invariant($"<a href=\"{escapedUri}\">{escapedUri}</a>") : escapedUri;
-            _ = builder.AppendLine(FormattableString.Invariant($"<td>{wrappedUri}</td>"));
+            writer.WriteLine(FormattableString.Invariant($"<td>{wrappedUri}</td>"));
+        }
+        writer.WriteLine(FormattableString.Invariant($"<td class=\"issuer\">{ProtectHyphens(Escape(parsed?.Issuer ?? string.Empty))}</td>"));
+        writer.WriteLine(FormattableString.Invariant($"<td class=\"{statusClass}\">{Escape(result.Status.ToDisplayString())}</td>"));
+        writer.WriteLine(FormattableString.Invariant($"<td class=\"dt\">{FormatDate(parsed?.ThisUpdate)}</td>"));
+        writer.WriteLine(FormattableString.Invariant($"<td class=\"dt\">{FormatDate(parsed?.NextUpdate)}</td>"));
+        writer.WriteLine(FormattableString.Invariant($"<td>{Escape(ExpiresInFormatter.Format(parsed?.NextUpdate))}</td>"));
+        writer.WriteLine(FormattableString.Invariant($"<td>{result.ContentLength?.ToString(CultureInfo.InvariantCulture) ?? string.Empty}</td>"));
+        var timingsTitle = FormatTimingsTitle(result.Timings);
+        var titleAttribute = timingsTitle.Length == 0 ? string.Empty : FormattableString.Invariant($" title=\"{Escape(timingsTitle)}\"");
+        writer.WriteLine(FormattableString.Invariant($"<td{titleAttribute}>{result.DownloadDuration?.TotalMilliseconds.ToString("F0", CultureInfo.InvariantCulture) ?? string.Empty}</td>"));
+        writer.WriteLine(FormattableString.Invariant($"<td>{FormatCache(result)}</td>"));
+        writer.WriteLine(FormattableString.Invariant($"<td>{Escape(CsvReportFormatter.NormalizeSignatureStatus(result.SignatureStatus))}</td>"));
+        writer.WriteLine(FormattableString.Invariant($"<td>{parsed?.RevokedSerialNumbers?.EntryCount.ToString(CultureInfo.InvariantCulture) ?? string.Empty}{FormatRevocationChanges(result)}</td>"));
+        writer.WriteLine(FormattableString.Invariant($"<td class=\"dt\">{FormatDate(result.CheckedAtUtc)}</td>"));
+        writer.WriteLine(FormattableString.Invariant($"<td class=\"dt\">{FormatDate(result.PreviousFetchUtc)}</td>"));
+        writer.WriteLine(FormattableString.Invariant($"<td>{Escape(FormatType(parsed))}</td>"));
+        writer.WriteLine(FormattableString.Invariant($"<td>{Escape(result.ErrorInfo ?? string.Empty)}</td>"));
+        writer.WriteLine("</tr>");
+    }
+
+    private static void WritePagedTable(TextWriter writer, string dataSource)
+    {
+        writer.WriteLine("<div class=\"toolbar\">");
+        writer.WriteLine("<input id=\"crl-filter\" type=\"search\" placeholder=\"Filter by URI, issuer or details\" aria-label=\"Filter\" />");
+        writer.Write("<select id=\"crl-status\" aria-label=\"Status\"><option value=\"\">All statuses</option>");
+        foreach (var status in StatusFilterOptions)
+        {
+            writer.Write(FormattableString.Invariant($"<option>{status}</option>"));
+        }
+
+        writer.WriteLine("</select>");
+        writer.WriteLine("<select id=\"crl-size\" aria-label=\"Rows per page\"><option>50</option><option selected>100</option><option>500</option><option>1000</option></select>");
+        writer.WriteLine("<button id=\"crl-prev\" type=\"button\">Previous</button><span id=\"crl-page\">Loading&hellip;</span><button id=\"crl-next\" type=\"button\">Next</button>");
+        writer.WriteLine("</div>");
+        writer.WriteLine(FormattableString.Invariant($"<table id=\"crl-table\" data-src=\"{Escape(dataSource)}\"><thead><tr>"));
+        WriteColumnHeaders(writer, "sortable");
+        writer.WriteLine("</tr></thead><tbody id=\"crl-rows\"></tbody></table></div></div>");
+        writer.WriteLine("<script>");
+        foreach (var line in PagedTableScript)
+        {
+            writer.WriteLine(line);
+        }
+
+        writer.WriteLine("</script>");
+    }
+
+    private static async Task WriteDataAsync(Stream stream, IReadOnlyList<CrlCheckResult> sortedResults, DateTime generatedAtUtc, CancellationToken cancellationToken)
+    {
+        using var writer = new Utf8JsonWriter(stream);
+        writer.WriteStartObject();
+        writer.WriteString("generated_at_utc", TimeFormatter.FormatUtc(generatedAtUtc));
+        writer.WriteStartArray("rows");
+        foreach (var result in sortedResults)
+        {
+            WriteDataRow(writer, result);
+            if (writer.BytesPending >= StreamBufferSize)
+            {
+                await writer.FlushAsync(cancellationToken).ConfigureAwait(false);
+            }
+        }
+
+        writer.WriteEndArray();
+        writer.WriteEndObject();
+        await writer.FlushAsync(cancellationToken).ConfigureAwait(false);
+    }
+
+    /// <summary>
+    /// Writes one result as a positional array; keys are left out to keep the file compact.
+    /// </summary>
+    private static void WriteDataRow(Utf8JsonWriter writer, CrlCheckResult result)
+    {
+        var parsed = result.ParsedCrl;
+        var changes = result.RevocationChanges;
+        writer.WriteStartArray();
+        writer.WriteStringValue(result.Uri.ToString());
+        writer.WriteStringValue(parsed?.Issuer ?? string.Empty);
+        writer.WriteStringValue(result.Status.ToDisplayString());
+        writer.WriteStringValue(TimeFormatter.FormatUtc(parsed?.ThisUpdate));
+        writer.WriteStringValue(TimeFormatter.FormatUtc(parsed?.NextUpdate));
+        writer.WriteStringValue(ExpiresInFormatter.Format(parsed?.NextUpdate));
+        WriteNumberOrNull(writer, result.ContentLength);
+        WriteNumberOrNull(writer, result.DownloadDuration.HasValue ? (long)Math.Round(result.DownloadDuration.Value.TotalMilliseconds) : null);
+        WriteNumberOrNull(writer, result.CacheHit ? result.BytesSaved : null);
+        writer.WriteStringValue(CsvReportFormatter.NormalizeSignatureStatus(result.SignatureStatus));
+        WriteNumberOrNull(writer, parsed?.RevokedSerialNumbers?.EntryCount);
+        writer.WriteNumberValue(changes?.AddedCount ?? 0);
+        writer.WriteNumberValue(changes?.RemovedCount ?? 0);
+        writer.WriteStringValue(TimeFormatter.FormatUtc(result.CheckedAtUtc));
+        writer.WriteStringValue(TimeFormatter.FormatUtc(result.PreviousFetchUtc));
+        writer.WriteStringValue(FormatType(parsed));
+        writer.WriteStringValue(result.ErrorInfo ?? string.Empty);
+        writer.WriteStringValue(FormatTimingsTitle(result.Timings));
+        writer.WriteEndArray();
+    }
+
+    private static void WriteNumberOrNull(Utf8JsonWriter writer, long? value)
+    {
+        if (value.HasValue)
+        {
+            writer.WriteNumberValue(value.Value);
+        }
+        else
+        {
+            writer.WriteNullValue();
+        }
+    }
+
+    private static void WriteStageTimings(TextWriter writer, IReadOnlyList<StageTimingSummary> summaries)
+    {
+        if (summaries.Count == 0)
+        {
+            return;
         }
-        _ = builder.AppendLine(FormattableString.Invariant($"<td class=\"issuer\">{ProtectHyphens(Escape(parsed?.Issuer ?? string.Empty))}</td>"));
-        _ = builder.AppendLine(FormattableString.Invariant($"<td class=\"{statusClass}\">{Escape(result.Status.ToDisplayString())}</td>"));
-        _ = builder.AppendLine(FormattableString.Invariant($"<td class=\"dt\">{FormatDate(parsed?.ThisUpdate)}</td>"));
-        _ = builder.AppendLine(FormattableString.Invariant($"<td class=\"dt\">{FormatDate(parsed?.NextUpdate)}</td>"));
-        _ = builder.AppendLine(FormattableString.Invariant($"<td>{Escape(ExpiresInFormatter.Format(parsed?.NextUpdate))}</td>"));
-        _ = builder.AppendLine(FormattableString.Invariant($"<td>{result.ContentLength?.ToString(CultureInfo.InvariantCulture) ?? string.Empty}</td>"));
-        _ = builder.AppendLine(FormattableString.Invariant($"<td>{result.DownloadDuration?.TotalMilliseconds.ToString("F0", CultureInfo.InvariantCulture) ?? string.Empty}</td>"));
-        _ = builder.AppendLine(FormattableString.Invariant($"<td>{Escape(CsvReportFormatter.NormalizeSignatureStatus(result.SignatureStatus))}</td>"));
-        _ = builder.AppendLine(FormattableString.Invariant($"<td>{parsed?.RevokedSerialNumbers?.Count.ToString(CultureInfo.InvariantCulture) ?? string.Empty}</td>"));
-        _ = builder.AppendLine(FormattableString.Invariant($"<td class=\"dt\">{FormatDate(result.CheckedAtUtc)}</td>"));
-        _ = builder.AppendLine(FormattableString.Invariant($"<td class=\"dt\">{FormatDate(result.PreviousFetchUtc)}</td>"));
-        _ = builder.AppendLine(FormattableString.Invariant($"<td>{Escape(parsed == null ? string.Empty : parsed.IsDelta ? "Delta" : "Full")}</td>"));
-        _ = builder.AppendLine(FormattableString.Invariant($"<td>{Escape(result.ErrorInfo ?? string.Empty)}</td>"));
-        _ = builder.AppendLine("</tr>");
+
+        writer.WriteLine("<div class=\"card table-wrapper\">");
+        writer.WriteLine("<h2>Stage Timings (ms)</h2>");
+        writer.WriteLine("<table class=\"timings\"><thead><tr><th>Stage</th><th>Count</th><th>p50</th><th>p95</th><th>p99</th><th>Max</th></tr></thead><tbody>");
+        foreach (var summary in summaries)
+        {
+            writer.WriteLine(FormattableString.Invariant(
+                $"<tr><td>{Escape(summary.Stage.ToDisplayString())}</td><td>{summary.Count}</td><td>{FormatMilliseconds(summary.P50)}</td><td>{FormatMilliseconds(summary.P95)}</td><td>{FormatMilliseconds(summary.P99)}</td><td>{FormatMilliseconds(summary.Max)}</td></tr>"));
+        }
+
+        writer.WriteLine("</tbody></table></div>");
+    }
+
+    /// <summary>
+    /// Per-stage breakdown shown as a tooltip on the download time, which keeps the results table narrow.
+    /// </summary>
+    private static string FormatTimingsTitle(CrlStageTimings? timings)
+    {
+        if (timings == null)
+        {
+            return string.Empty;
+        }
+
+        var parts = new List<string>();
+        foreach (var stage in Enum.GetValues<CrlTimingStage>())
+        {
+            var duration = timings.Get(stage);
+            if (duration.HasValue)
+            {
+                parts.Add(FormattableString.Invariant($"{stage.ToDisplayString()} {FormatMilliseconds(duration.Value)} ms"));
+            }
+        }
+
+        return string.Join(" | ", parts);
+    }
+
+    private static string FormatMilliseconds(TimeSpan value)
+    {
+        return value.TotalMilliseconds.ToString("F1", CultureInfo.InvariantCulture);
+    }
+
+    private static string FormatRevocationChanges(CrlCheckResult result)
+    {
+        var changes = result.RevocationChanges;
+        return changes == null || (changes.AddedCount == 0 && changes.RemovedCount == 0)
+            ? string.Empty
+            : FormattableString.Invariant($"<br>+{changes.AddedCount} / -{changes.RemovedCount}");
+    }
+
+    private static string FormatCache(CrlCheckResult result)
+    {
+        return result.CacheHit
+            ? FormattableString.Invariant($"Hit<br>{result.BytesSaved} bytes saved")
+            : string.Empty;
+    }
+
+    private static string FormatType(ParsedCrl? parsed)
+    {
+        return parsed == null ? string.Empty : parsed.IsDelta ? "Delta" : "Full";
     }
 
     private static string FormatDate(DateTime? value)
@@ -224,17 +550,6 @@ internal static class HtmlReportWriter
             : formatted;
     }
 
-    private static Summary BuildSummary(IReadOnlyList<CrlCheckResult> results)
-    {
-        return new Summary(
-            results.Count,
-            results.Count(r => r.Status == CrlStatus.Ok),
-            results.Count(r => r.Status == CrlStatus.Warning),
-            results.Count(r => r.Status == CrlStatus.Expiring),
-            results.Count(r => r.Status == CrlStatus.Expired),
-            results.Count(r => r.Status == CrlStatus.Error));
-    }
-
     private static string Escape(string value)
     {
         return System.Net.WebUtility.HtmlEncode(value);
@@ -258,6 +573,4 @@ internal static class HtmlReportWriter
         var build = version.Build >= 0 ? version.Build : 0;
         return FormattableString.Invariant($"v{version.Major}.{version.Minor}.{build}");
     }
-
-    private readonly record struct Summary(int Total, int Ok, int Warning, int Expiring, int Expired, int Errors);
 }
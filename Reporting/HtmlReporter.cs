@@ -5,18 +5,25 @@ namespace CrlMonitor.Reporting;
 internal sealed class HtmlReporter : IReporter
 {
     private readonly string _outputPath;
+    private readonly bool _useDataFile;
     private readonly ReportingStatus _status;
 
     public HtmlReporter(string outputPath, ReportingStatus status)
+        : this(outputPath, useDataFile: false, status)
+    {
+    }
+
+    public HtmlReporter(string outputPath, bool useDataFile, ReportingStatus status)
     {
         ArgumentException.ThrowIfNullOrWhiteSpace(outputPath);
         this._outputPath = outputPath;
+        this._useDataFile = useDataFile;
         this._status = status ?? throw new ArgumentNullException(nameof(status));
     }
 
     public async Task ReportAsync(CrlCheckRun run, CancellationToken cancellationToken)
     {
-        await HtmlReportWriter.WriteAsync(this._outputPath, run, cancellationToken).ConfigureAwait(false);
+        await HtmlReportWriter.WriteAsync(this._outputPath, run, this._useDataFile, cancellationToken).ConfigureAwait(false);
         this._status.RecordHtml(this._outputPath);
     }
 }
@@ -0,0 +1,12 @@
+using CrlMonitor.Models;
+
+namespace CrlMonitor.Reporting;
+
+/// <summary>
+/// A reporter that can emit each result as soon as its check finishes. <see cref="IReporter.ReportAsync"/> is still
+/// called once with the whole run, and may be the only call when results were not streamed.
+/// </summary>
+internal interface IStreamingReporter : IReporter
+{
+    Task ReportResultAsync(CrlCheckResult result, CancellationToken cancellationToken);
+}
@@ -0,0 +1,204 @@
+using System.Buffers;
+using System.Text.Json;
+using CrlMonitor.Diagnostics;
+using CrlMonitor.Models;
+
+namespace CrlMonitor.Reporting;
+
+/// <summary>
+/// Writes one JSON object per line: a <c>result</c> line per CRL, flushed as each check finishes, followed by a
+/// <c>summary</c> line once the run is complete. The path <c>-</c> writes to standard output for piping into other
+/// tools.
+/// </summary>
+internal sealed class NdjsonReporter : IStreamingReporter, IDisposable
+{
+    public const string StandardOutputPath = "-";
+
+    private readonly string _outputPath;
+    private readonly SemaphoreSlim _gate = new(1, 1);
+    private readonly ArrayBufferWriter<byte> _buffer = new();
+    private Stream? _stream;
+    private bool _streamed;
+
+    public NdjsonReporter(string outputPath)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(outputPath);
+        this._outputPath = outputPath;
+    }
+
+    public async Task ReportResultAsync(CrlCheckResult result, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(result);
+        await this._gate.WaitAsync(cancellationToken).ConfigureAwait(false);
+        try
+        {
+            await this.WriteLineAsync(writer => WriteResult(writer, result), cancellationToken).ConfigureAwait(false);
+            this._streamed = true;
+        }
+        finally
+        {
+            _ = this._gate.Release();
+        }
+    }
+
+    public async Task ReportAsync(CrlCheckRun run, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(run);
+        await this._gate.WaitAsync(cancellationToken).ConfigureAwait(false);
+        try
+        {
+            if (!this._streamed)
+            {
+                foreach (var result in run.Results)
+                {
+                    await this.WriteLineAsync(writer => WriteResult(writer, result), cancellationToken).ConfigureAwait(false);
+                }
+            }
+
+            await this.WriteLineAsync(writer => WriteSummary(writer, run), cancellationToken).ConfigureAwait(false);
+        }
+        finally
+        {
+            this.CloseOutput();
+            _ = this._gate.Release();
+        }
+    }
+
+    public void Dispose()
+    {
+        this.CloseOutput();
+        this._gate.Dispose();
+    }
+
+    private async Task WriteLineAsync(Action<Utf8JsonWriter> write, CancellationToken cancellationToken)
+    {
+        this._buffer.ResetWrittenCount();
+        using (var writer = new Utf8JsonWriter(this._buffer))
+        {
+            write(writer);
+        }
+
+        this._buffer.GetSpan(1)[0] = (byte)'\n';
+        this._buffer.Advance(1);
+        var stream = this.OpenOutput();
+        await stream.WriteAsync(this._buffer.WrittenMemory, cancellationToken).ConfigureAwait(false);
+
+        // Flushing every line lets a reader tailing the output see each result as soon as it is known.
+        await stream.FlushAsync(cancellationToken).ConfigureAwait(false);
+    }
+
+    private Stream OpenOutput()
+    {
+        if (this._stream != null)
+        {
+            return this._stream;
+        }
+
+        if (this._outputPath == StandardOutputPath)
+        {
+            this._stream = Console.OpenStandardOutput();
+            return this._stream;
+        }
+
+        var directory = Path.GetDirectoryName(this._outputPath);
+        if (!string.IsNullOrEmpty(directory))
+        {
+            _ = Directory.CreateDirectory(directory);
+        }
+
+        this._stream = new FileStream(this._outputPath, FileMode.Create, FileAccess.Write, FileShare.Read, bufferSize: 4096, useAsync: true);
+        return this._stream;
+    }
+
+    private void CloseOutput()
+    {
+        this._stream?.Dispose();
+        this._stream = null;
+    }
+
+    private static void WriteResult(Utf8JsonWriter writer, CrlCheckResult result)
+    {
+        var parsed = result.ParsedCrl;
+        writer.WriteStartObject();
+        writer.WriteString("type", "result");
+        writer.WriteString("uri", result.Uri.ToString());
+        writer.WriteString("status", result.Status.ToDisplayString());
+        writer.WriteString("checked_at_utc", result.CheckedAtUtc);
+        writer.WriteNumber("duration_ms", Math.Round(result.Duration.TotalMilliseconds, 1));
+        WriteOptionalString(writer, "issuer", parsed?.Issuer);
+        WriteOptionalDate(writer, "this_update_utc", parsed?.ThisUpdate);
+        WriteOptionalDate(writer, "next_update_utc", parsed?.NextUpdate);
+        if (parsed?.RevokedSerialNumbers != null)
+        {
+            writer.WriteNumber("revoked_count", parsed.RevokedSerialNumbers.EntryCount);
+        }
+
+        if (result.RevocationChanges != null)
+        {
+            writer.WriteNumber("new_revocations", result.RevocationChanges.AddedCount);
+            writer.WriteNumber("removed_revocations", result.RevocationChanges.RemovedCount);
+        }
+
+        WriteOptionalString(writer, "signature", CsvReportFormatter.NormalizeSignatureStatus(result.SignatureStatus));
+        if (result.ContentLength.HasValue)
+        {
+            writer.WriteNumber("content_length", result.ContentLength.Value);
+        }
+
+        if (result.DownloadDuration.HasValue)
+        {
+            writer.WriteNumber("download_ms", Math.Round(result.DownloadDuration.Value.TotalMilliseconds, 1));
+        }
+
+        writer.WriteBoolean("cache_hit", result.CacheHit);
+        WriteOptionalString(writer, "error", result.ErrorInfo);
+        if (result.Timings != null)
+        {
+            writer.WriteStartObject("timings_ms");
+            foreach (var stage in Enum.GetValues<CrlTimingStage>())
+            {
+                var duration = result.Timings.Get(stage);
+                if (duration.HasValue)
+                {
+                    writer.WriteNumber(CrlMonitorMetrics.GetStageName(stage), Math.Round(duration.Value.TotalMilliseconds, 1));
+                }
+            }
+
+            writer.WriteEndObject();
+        }
+
+        writer.WriteEndObject();
+    }
+
+    private static void WriteSummary(Utf8JsonWriter writer, CrlCheckRun run)
+    {
+        var summary = RunRenderCache.For(run).Summary;
+        writer.WriteStartObject();
+        writer.WriteString("type", "summary");
+        writer.WriteString("generated_at_utc", run.GeneratedAtUtc);
+        writer.WriteNumber("total", summary.Total);
+        writer.WriteNumber("ok", summary.Ok);
+        writer.WriteNumber("warning", summary.Warning);
+        writer.WriteNumber("expiring", summary.Expiring);
+        writer.WriteNumber("expired", summary.Expired);
+        writer.WriteNumber("errors", summary.Errors);
+        writer.WriteNumber("deferred", summary.Deferred);
+        writer.WriteEndObject();
+    }
+
+    private static void WriteOptionalString(Utf8JsonWriter writer, string name, string? value)
+    {
+        if (!string.IsNullOrEmpty(value))
+        {
+            writer.WriteString(name, value);
+        }
+    }
+
+    private static void WriteOptionalDate(Utf8JsonWriter writer, string name, DateTime? value)
+    {
+        if (value.HasValue)
+        {
+            writer.WriteString(name, value.Value);
+        }
+    }
+}
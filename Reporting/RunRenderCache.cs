@@ -0,0 +1,98 @@
+using System.Runtime.CompilerServices;
+using System.Text;
+using CrlMonitor.Models;
+
+namespace CrlMonitor.Reporting;
+
+/// <summary>
+/// Report artifacts derived from a finished run, computed once and shared by every reporter that handles it.
+/// </summary>
+/// <remarks>
+/// All reporters receive the same <see cref="CrlCheckRun"/> instance, so the cache hangs off the run itself rather
+/// than being threaded through <see cref="IReporter"/>, and is collected along with it.
+/// </remarks>
+internal sealed class RunRenderCache
+{
+    private static readonly ConditionalWeakTable<CrlCheckRun, RunRenderCache> Caches = new();
+    private static readonly UTF8Encoding CsvEncoding = new(encoderShouldEmitUTF8Identifier: false);
+
+    private readonly CrlCheckRun _run;
+    private readonly Lazy<CrlStatusSummary> _summary;
+    private readonly Lazy<IReadOnlyList<CrlCheckResult>> _resultsByStatus;
+    private readonly Lazy<IReadOnlyList<CrlCheckResult>> _errors;
+    private readonly object _csvLock = new();
+    private Task<byte[]>? _csv;
+
+    private RunRenderCache(CrlCheckRun run)
+    {
+        this._run = run;
+        this._summary = new Lazy<CrlStatusSummary>(() => CrlStatusSummary.FromResults(run.Results));
+        this._resultsByStatus = new Lazy<IReadOnlyList<CrlCheckResult>>(() => SortByStatus(run.Results));
+        this._errors = new Lazy<IReadOnlyList<CrlCheckResult>>(() => run.Results.Where(r => r.Status == CrlStatus.Error).ToList());
+    }
+
+    /// <summary>
+    /// Status counts for the run.
+    /// </summary>
+    public CrlStatusSummary Summary => this._summary.Value;
+
+    /// <summary>
+    /// Results ordered ERROR, EXPIRED, EXPIRING, WARNING, OK; configuration order is kept within each status.
+    /// </summary>
+    public IReadOnlyList<CrlCheckResult> ResultsByStatus => this._resultsByStatus.Value;
+
+    /// <summary>
+    /// Results with status ERROR, in configuration order.
+    /// </summary>
+    public IReadOnlyList<CrlCheckResult> Errors => this._errors.Value;
+
+    public static RunRenderCache For(CrlCheckRun run)
+    {
+        ArgumentNullException.ThrowIfNull(run);
+        return Caches.GetValue(run, static r => new RunRenderCache(r));
+    }
+
+    /// <summary>
+    /// Gets the CSV report as UTF-8 bytes without a byte order mark, matching what <see cref="CsvReporter"/> streams to
+    /// <c>csv_output_path</c>. The bytes are only rendered when a reporter asks for them, so runs without an email
+    /// report never hold the whole CSV in memory.
+    /// </summary>
+    public Task<byte[]> GetCsvAsync(CancellationToken cancellationToken)
+    {
+        lock (this._csvLock)
+        {
+            // A cancelled or failed render is not kept, so the next reporter to ask tries again.
+            if (this._csv == null || this._csv.IsFaulted || this._csv.IsCanceled)
+            {
+                this._csv = RenderCsvAsync(this._run, cancellationToken);
+            }
+
+            return this._csv;
+        }
+    }
+
+    private static async Task<byte[]> RenderCsvAsync(CrlCheckRun run, CancellationToken cancellationToken)
+    {
+        using var stream = new MemoryStream();
+        using (var writer = new StreamWriter(stream, CsvEncoding, leaveOpen: true))
+        {
+            await CsvReportFormatter.WriteAsync(writer, run, cancellationToken).ConfigureAwait(false);
+            await writer.FlushAsync(cancellationToken).ConfigureAwait(false);
+        }
+
+        return stream.ToArray();
+    }
+
+    private static List<CrlCheckResult> SortByStatus(IReadOnlyList<CrlCheckResult> results)
+    {
+        return results.OrderBy(r => r.Status switch {
+            CrlStatus.Error => 0,
+            CrlStatus.Expired => 1,
+            CrlStatus.Expiring => 2,
+            CrlStatus.Warning => 3,
+            CrlStatus.Ok => 4,
+            CrlStatus.Deferred => 5,
+            _ => 6
+        }).ToList();
+    }
+}
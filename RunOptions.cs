@@ -1,4 +1,7 @@
+using CrlMonitor.Fetching;
 using CrlMonitor.Notifications;
+using CrlMonitor.Runner;
+using CrlMonitor.Service;
 
 namespace CrlMonitor;
 
@@ -11,11 +14,25 @@ internal sealed record RunOptions(
     bool HtmlReportEnabled,
     string? HtmlReportPath,
     string? HtmlReportUrl,
+    bool HtmlReportDataFile,
+    string? NdjsonOutputPath,
     long DefaultMaxCrlSizeBytes,
     TimeSpan FetchTimeout,
     int MaxParallelFetches,
+    int MaxParallelProcessing,
+    TimeSpan? RunDeadline,
+    TimeSpan ShardPartialMaxAge,
     string StateFilePath,
     bool UseSystemProxy,
+    HttpClientOptions Http,
+    FetchResilienceOptions Resilience,
+    string? HttpCachePath,
+    long ParseCacheMaxBytes,
+    bool CountRevokedOnly,
+    string? CaBundlePath,
+    string? RevocationSnapshotPath,
+    string? RevocationIndexPath,
+    ServiceOptions Service,
     IReadOnlyList<CrlConfigEntry> Crls,
     ReportOptions? Reports,
     AlertOptions? Alerts);
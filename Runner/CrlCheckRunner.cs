@@ -1,6 +1,9 @@
 using System.Diagnostics;
 using System.Globalization;
 using System.DirectoryServices.Protocols;
+using System.Net;
+using System.Net.Sockets;
+using System.Threading.Channels;
 using CrlMonitor.Crl;
 using CrlMonitor.Diagnostics;
 using CrlMonitor.Fetching;
@@ -8,6 +11,7 @@ using CrlMonitor.Models;
 using CrlMonitor.Validation;
 using CrlMonitor.Health;
 using CrlMonitor.State;
+using Org.BouncyCastle.X509;
 using Serilog;
 
 namespace CrlMonitor.Runner;
@@ -17,155 +21,462 @@ internal sealed class CrlCheckRunner(
     ICrlParser parser,
     ICrlSignatureValidator signatureValidator,
     ICrlHealthEvaluator healthEvaluator,
-    IStateStore stateStore)
+    IStateStore stateStore,
+    ICrlMemoStore? memoStore = null,
+    IRevocationSnapshotStore? snapshotStore = null,
+    IRevocationIndexStore? indexStore = null,
+    FetchResilienceOptions? resilience = null,
+    IDeltaBaseStore? deltaBaseStore = null)
 {
     private readonly IFetcherResolver _fetcherResolver = fetcherResolver ?? throw new ArgumentNullException(nameof(fetcherResolver));
     private readonly ICrlParser _parser = parser ?? throw new ArgumentNullException(nameof(parser));
     private readonly ICrlSignatureValidator _signatureValidator = signatureValidator ?? throw new ArgumentNullException(nameof(signatureValidator));
     private readonly ICrlHealthEvaluator _healthEvaluator = healthEvaluator ?? throw new ArgumentNullException(nameof(healthEvaluator));
     private readonly IStateStore _stateStore = stateStore ?? throw new ArgumentNullException(nameof(stateStore));
+    private readonly ICrlMemoStore? _memoStore = memoStore;
+    private readonly IRevocationSnapshotStore? _snapshotStore = snapshotStore;
+    private readonly IRevocationIndexStore? _indexStore = indexStore;
+    private readonly FetchResilienceOptions _resilience = resilience ?? FetchResilienceOptions.Disabled;
+    private readonly DeltaBaseCache _deltaBases = new(deltaBaseStore);
 
-    public async Task<CrlCheckRun> RunAsync(
+    public Task<CrlCheckRun> RunAsync(
         IReadOnlyList<CrlConfigEntry> entries,
         TimeSpan fetchTimeout,
         int maxParallelFetches,
         CancellationToken cancellationToken)
+    {
+        return this.RunAsync(entries, fetchTimeout, maxParallelFetches, Environment.ProcessorCount, cancellationToken);
+    }
+
+    /// <summary>
+    /// Runs the checks as three channel-connected stages: fetch (I/O bound), parse/verify/evaluate (CPU bound) and
+    /// state update. The fetch and processing stages have their own worker counts so slow downloads do not hold
+    /// CPU slots and large parses do not hold network slots. Each CRL's history (last fetch, validity and last failure)
+    /// is read from the state store once up front and the changes are written back in a single batch when the run ends.
+    /// </summary>
+    public Task<CrlCheckRun> RunAsync(
+        IReadOnlyList<CrlConfigEntry> entries,
+        TimeSpan fetchTimeout,
+        int maxParallelFetches,
+        int maxParallelProcessing,
+        CancellationToken cancellationToken)
+    {
+        return this.RunAsync(entries, fetchTimeout, maxParallelFetches, maxParallelProcessing, null, cancellationToken);
+    }
+
+    /// <summary>
+    /// Runs the checks within <paramref name="runDeadline"/>, measured from the start of the run. CRLs are checked
+    /// most urgent first: those never checked or whose last check failed, then by how soon they cross their expiry
+    /// threshold according to the validity recorded by earlier runs. Once too little time is left for a full fetch,
+    /// CRLs not yet past their threshold are deferred, and once the deadline has passed every CRL still queued is.
+    /// Deferred CRLs are reported with <see cref="CrlStatus.Deferred"/>.
+    /// </summary>
+    public Task<CrlCheckRun> RunAsync(
+        IReadOnlyList<CrlConfigEntry> entries,
+        TimeSpan fetchTimeout,
+        int maxParallelFetches,
+        int maxParallelProcessing,
+        TimeSpan? runDeadline,
+        CancellationToken cancellationToken)
     {
         ArgumentNullException.ThrowIfNull(entries);
+        return this.RunCoreAsync(entries, fetchTimeout, maxParallelFetches, maxParallelProcessing, runDeadline, null, cancellationToken);
+    }
+
+    /// <summary>
+    /// Starts a run and returns at once, so callers can consume each result as its check finishes instead of
+    /// waiting for the slowest endpoint.
+    /// </summary>
+    public CrlCheckStream Stream(
+        IReadOnlyList<CrlConfigEntry> entries,
+        TimeSpan fetchTimeout,
+        int maxParallelFetches,
+        int maxParallelProcessing,
+        CancellationToken cancellationToken)
+    {
+        return this.Stream(entries, fetchTimeout, maxParallelFetches, maxParallelProcessing, null, cancellationToken);
+    }
+
+    /// <summary>
+    /// Streams a run bounded by <paramref name="runDeadline"/>; see
+    /// <see cref="RunAsync(IReadOnlyList{CrlConfigEntry}, TimeSpan, int, int, TimeSpan?, CancellationToken)"/>.
+    /// </summary>
+    public CrlCheckStream Stream(
+        IReadOnlyList<CrlConfigEntry> entries,
+        TimeSpan fetchTimeout,
+        int maxParallelFetches,
+        int maxParallelProcessing,
+        TimeSpan? runDeadline,
+        CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(entries);
+
+        // Unbounded so a slow consumer never stalls the state stage; the results are held by the run anyway.
+        var completed = Channel.CreateUnbounded<CrlCheckResult>(new UnboundedChannelOptions { SingleReader = true, SingleWriter = true });
+        var run = this.RunCoreAsync(entries, fetchTimeout, maxParallelFetches, maxParallelProcessing, runDeadline, completed.Writer, cancellationToken);
+        return new CrlCheckStream(completed.Reader, run);
+    }
+
+    private async Task<CrlCheckRun> RunCoreAsync(
+        IReadOnlyList<CrlConfigEntry> entries,
+        TimeSpan fetchTimeout,
+        int maxParallelFetches,
+        int maxParallelProcessing,
+        TimeSpan? runDeadline,
+        ChannelWriter<CrlCheckResult>? completed,
+        CancellationToken cancellationToken)
+    {
+        try
+        {
+            var run = await this.RunPipelineAsync(entries, fetchTimeout, maxParallelFetches, maxParallelProcessing, runDeadline, completed, cancellationToken)
+                .ConfigureAwait(false);
+            _ = completed?.TryComplete();
+            return run;
+        }
+        catch (Exception ex)
+        {
+            _ = completed?.TryComplete(ex);
+            throw;
+        }
+    }
 
+    private async Task<CrlCheckRun> RunPipelineAsync(
+        IReadOnlyList<CrlConfigEntry> entries,
+        TimeSpan fetchTimeout,
+        int maxParallelFetches,
+        int maxParallelProcessing,
+        TimeSpan? runDeadline,
+        ChannelWriter<CrlCheckResult>? completed,
+        CancellationToken cancellationToken)
+    {
+        var budget = new RunBudget(runDeadline);
+        var breaker = new HostCircuitBreaker(this._resilience.CircuitBreakerThreshold, this._resilience.CircuitBreakerCooldown);
         var diagnostics = new RunDiagnostics();
-#pragma warning disable CA1031
-        var maxParallel = Math.Max(1, maxParallelFetches);
-        using var semaphore = new SemaphoreSlim(maxParallel);
-        var tasks = new List<Task>();
         var results = new CrlCheckResult[entries.Count];
+        var fetchWorkers = Math.Max(1, maxParallelFetches);
+        var processWorkers = Math.Max(1, maxParallelProcessing);
 
-        for (var index = 0; index < entries.Count; index++)
+        // The entry list is already in memory, so the fetch queue is unbounded. The later queues hold downloaded CRLs
+        // and are bounded so a busy processing stage pushes back on the fetchers instead of buffering every payload.
+        var fetchQueue = Channel.CreateUnbounded<PendingFetch>(new UnboundedChannelOptions { SingleWriter = true });
+        var processQueue = Channel.CreateBounded<FetchOutcome>(new BoundedChannelOptions(processWorkers));
+        var stateQueue = Channel.CreateBounded<ProcessedOutcome>(new BoundedChannelOptions(processWorkers) { SingleReader = true });
+        var histories = await this.TryGetHistoriesAsync(entries, diagnostics, cancellationToken).ConfigureAwait(false);
+        foreach (var pending in OrderByUrgency(entries, histories))
+        {
+            _ = fetchQueue.Writer.TryWrite(pending);
+        }
+
+        fetchQueue.Writer.Complete();
+        diagnostics.RecordQueueDepth(PipelineStage.Fetch, fetchQueue.Reader.Count);
+
+        var stateChanges = new StateBatch(this._stateStore);
+        var fetchStage = RunStageAsync(
+            fetchWorkers,
+            () => this.FetchWorkerAsync(fetchQueue.Reader, processQueue, fetchTimeout, budget, breaker, diagnostics, cancellationToken),
+            processQueue.Writer);
+        var processStage = RunStageAsync(
+            processWorkers,
+            () => this.ProcessWorkerAsync(processQueue.Reader, stateQueue, diagnostics),
+            stateQueue.Writer);
+        var stateStage = StateWorkerAsync(stateQueue.Reader, results, completed, stateChanges, diagnostics);
+
+        try
+        {
+            // The fetch stage is awaited first so a user cancellation surfaces as the fetcher's own exception.
+            await Task.WhenAll(fetchStage, processStage, stateStage).ConfigureAwait(false);
+        }
+        finally
+        {
+            // Checks that finished before a cancellation still record their fetch time.
+            await TryCommitStateAsync(stateChanges, diagnostics).ConfigureAwait(false);
+        }
+
+        if (this._indexStore != null)
+        {
+            await UpdateRevocationIndexAsync(this._indexStore, results, diagnostics).ConfigureAwait(false);
+        }
+
+        var deferred = results.Count(result => result.Status == CrlStatus.Deferred);
+        if (deferred > 0)
+        {
+            diagnostics.AddRuntimeWarning(
+                FormattableString.Invariant($"Run deadline of {budget.Deadline!.Value.TotalSeconds:F0}s reached; deferred {deferred} CRL(s) to the next run."));
+        }
+
+        foreach (var (host, retries) in diagnostics.FetchRetries.OrderBy(pair => pair.Key, StringComparer.OrdinalIgnoreCase))
+        {
+            diagnostics.AddRuntimeWarning(FormattableString.Invariant($"Retried {retries} fetch(es) from {host} after transient failures."));
+        }
+
+        return new CrlCheckRun(results, diagnostics, DateTime.UtcNow);
+    }
+
+    private static async Task RunStageAsync<T>(int workerCount, Func<Task> worker, ChannelWriter<T> output)
+    {
+        var workers = new Task[workerCount];
+        for (var index = 0; index < workerCount; index++)
+        {
+            workers[index] = Task.Run(worker);
+        }
+
+        try
+        {
+            await Task.WhenAll(workers).ConfigureAwait(false);
+        }
+        finally
+        {
+            // Downstream stages drain whatever was produced, even when this stage was cancelled.
+            output.Complete();
+        }
+    }
+
+    private async Task FetchWorkerAsync(
+        ChannelReader<PendingFetch> input,
+        Channel<FetchOutcome> output,
+        TimeSpan fetchTimeout,
+        RunBudget budget,
+        HostCircuitBreaker breaker,
+        RunDiagnostics diagnostics,
+        CancellationToken cancellationToken)
+    {
+        while (await input.WaitToReadAsync(cancellationToken).ConfigureAwait(false))
         {
-            cancellationToken.ThrowIfCancellationRequested();
-            var localIndex = index;
-            var entry = entries[localIndex];
-            await semaphore.WaitAsync(cancellationToken).ConfigureAwait(false);
-            tasks.Add(Task.Run(async () => {
+            while (input.TryRead(out var pending))
+            {
+                cancellationToken.ThrowIfCancellationRequested();
+                var previousFetch = pending.History?.LastFetchUtc;
+                var outcome = budget.ShouldDefer(pending.AttentionUtc, fetchTimeout, DateTime.UtcNow)
+                    ? FetchFailed(pending, previousFetch, TimeSpan.Zero, CrlStatus.Deferred, "Deferred: run deadline reached before the check started.")
+                    : await this.FetchEntryAsync(pending, previousFetch, budget.LimitTimeout(fetchTimeout), breaker, diagnostics, cancellationToken).ConfigureAwait(false);
                 try
                 {
-                    results[localIndex] = await this.ProcessEntryAsync(entry, fetchTimeout, diagnostics, cancellationToken).ConfigureAwait(false);
+                    await output.Writer.WriteAsync(outcome, cancellationToken).ConfigureAwait(false);
                 }
-                finally
+                catch
                 {
-                    _ = semaphore.Release();
+                    outcome.Fetched?.Dispose();
+                    outcome.Delta?.BaseFetched?.Dispose();
+                    throw;
                 }
-            }, cancellationToken));
+
+                diagnostics.RecordQueueDepth(PipelineStage.Process, output.Reader.Count);
+            }
         }
+    }
 
-        await Task.WhenAll(tasks).ConfigureAwait(false);
-#pragma warning restore CA1031
-        return new CrlCheckRun(results, diagnostics, DateTime.UtcNow);
+    private async Task ProcessWorkerAsync(
+        ChannelReader<FetchOutcome> input,
+        Channel<ProcessedOutcome> output,
+        RunDiagnostics diagnostics)
+    {
+        await foreach (var outcome in input.ReadAllAsync().ConfigureAwait(false))
+        {
+            ProcessedOutcome processed;
+            using (outcome.Fetched)
+            using (outcome.Delta?.BaseFetched)
+            {
+                // The fetched content may live in a pooled or mapped buffer, which is released once it has been parsed.
+                processed = outcome.Failure != null
+                    ? new ProcessedOutcome(outcome.Index, outcome.Entry, outcome.Failure, PersistFetch: false)
+                    : this.ProcessFetched(outcome, diagnostics);
+            }
+
+            if (this._snapshotStore != null && processed.PersistFetch)
+            {
+                processed = await AttachRevocationDiffAsync(this._snapshotStore, processed, diagnostics).ConfigureAwait(false);
+            }
+
+            await output.Writer.WriteAsync(processed).ConfigureAwait(false);
+            diagnostics.RecordQueueDepth(PipelineStage.State, output.Reader.Count);
+        }
+    }
+
+    private static async Task StateWorkerAsync(
+        ChannelReader<ProcessedOutcome> input,
+        CrlCheckResult[] results,
+        ChannelWriter<CrlCheckResult>? completed,
+        StateBatch stateChanges,
+        RunDiagnostics diagnostics)
+    {
+        await foreach (var processed in input.ReadAllAsync(CancellationToken.None).ConfigureAwait(false))
+        {
+            var result = processed.Result;
+            if (processed.PersistFetch)
+            {
+                // This is the only task recording into the batch; it is written out once the whole run has finished.
+                stateChanges.SetLastFetch(processed.Entry.Uri, result.CheckedAtUtc);
+                if (result.ParsedCrl != null)
+                {
+                    stateChanges.SetValidity(processed.Entry.Uri, result.ParsedCrl.ThisUpdate, result.ParsedCrl.NextUpdate);
+                }
+            }
+
+            if (result.Status == CrlStatus.Error)
+            {
+                // Remembered so the next run checks this CRL first.
+                stateChanges.SetLastFailure(processed.Entry.Uri, result.CheckedAtUtc);
+            }
+
+            diagnostics.RecordStageTimings(result.Timings);
+            CrlMonitorMetrics.RecordCheck(result);
+            results[processed.Index] = result;
+            _ = completed?.TryWrite(result);
+        }
     }
 
 #pragma warning disable CA1031
-    private async Task<CrlCheckResult> ProcessEntryAsync(
-        CrlConfigEntry entry,
+    private async Task<FetchOutcome> FetchEntryAsync(
+        PendingFetch pending,
+        DateTime? previousFetch,
         TimeSpan fetchTimeout,
+        HostCircuitBreaker breaker,
         RunDiagnostics diagnostics,
         CancellationToken cancellationToken)
     {
+        var entry = pending.Entry;
+        var host = entry.Uri.Host;
+        if (!breaker.TryEnter(host))
+        {
+            diagnostics.RecordCircuitRejections(host);
+            return FetchFailed(pending, previousFetch, TimeSpan.Zero, CrlStatus.Error, $"Skipped: {host} stopped responding earlier in this run.");
+        }
+
         var stopwatch = Stopwatch.StartNew();
-        var previousFetch = await this.TryGetLastFetchAsync(entry, diagnostics, cancellationToken).ConfigureAwait(false);
-        TimeSpan? downloadDuration = null;
-        long? contentLength = null;
         try
         {
-            var fetcher = this._fetcherResolver.Resolve(entry.Uri);
             using var timeoutCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
             if (fetchTimeout > TimeSpan.Zero)
             {
                 timeoutCts.CancelAfter(fetchTimeout);
             }
 
-            var fetched = await fetcher.FetchAsync(entry, timeoutCts.Token).ConfigureAwait(false);
-            downloadDuration = fetched.Duration;
-            contentLength = fetched.ContentLength;
-            var parsed = this._parser.Parse(fetched.Content);
-            var signature = this._signatureValidator.Validate(parsed, entry);
-            var health = this._healthEvaluator.Evaluate(parsed, entry, DateTime.UtcNow);
+            var (fetched, delta) = await this.FetchWithRetryAsync(entry, breaker, diagnostics, timeoutCts.Token).ConfigureAwait(false);
             stopwatch.Stop();
+            breaker.RecordSuccess(host);
+            if (fetched.Hedged)
+            {
+                diagnostics.RecordHedgedFetches(host);
+            }
 
-            var status = DetermineStatus(entry, diagnostics, signature, health);
-            var errorInfo = BuildErrorInfo(signature, health, status);
-            var completedAt = DateTime.UtcNow;
-            await this.TrySaveLastFetchAsync(entry, diagnostics, completedAt, cancellationToken).ConfigureAwait(false);
-
-            return new CrlCheckResult(
-                entry.Uri,
-                status,
-                stopwatch.Elapsed,
-                parsed,
-                errorInfo,
-                previousFetch,
-                downloadDuration,
-                contentLength,
-                completedAt,
-                signature.Status);
+            return new FetchOutcome(pending.Index, entry, previousFetch, fetched, stopwatch.Elapsed, null, delta);
         }
         catch (CrlTooLargeException ex)
         {
             stopwatch.Stop();
+            breaker.RecordSuccess(host);
             var message = BuildOversizeStatusMessage(ex);
             diagnostics.AddRuntimeWarning(BuildProcessingErrorMessage(entry.Uri, message));
             Log.Warning("CRL size exceeded limit for {Uri}: {Message}", entry.Uri, message);
-            return new CrlCheckResult(
-                entry.Uri,
-                CrlStatus.Warning,
-                stopwatch.Elapsed,
-                null,
-                message,
-                previousFetch,
-                downloadDuration,
-                contentLength,
-                DateTime.UtcNow,
-                null);
+            return FetchFailed(pending, previousFetch, stopwatch.Elapsed, CrlStatus.Warning, message);
+        }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+        {
+            // Cancelling the run says nothing about the host, so a probe hands its turn back instead of leaving the
+            // circuit stuck half-open.
+            breaker.ReleaseProbe(host);
+            throw;
         }
         catch (OperationCanceledException) when (fetchTimeout > TimeSpan.Zero)
         {
             stopwatch.Stop();
-            if (cancellationToken.IsCancellationRequested)
-            {
-                throw;
-            }
-
+            this.RecordHostFailure(breaker, host, diagnostics);
             var msg = $"Fetch timed out after {fetchTimeout.TotalSeconds:F1}s";
             diagnostics.AddRuntimeWarning(BuildProcessingErrorMessage(entry.Uri, msg));
             Log.Error("CRL fetch timeout for {Uri}: {Message}", entry.Uri, msg);
-            return new CrlCheckResult(
-                entry.Uri,
-                CrlStatus.Error,
-                stopwatch.Elapsed,
-                null,
-                msg,
-                previousFetch,
-                downloadDuration,
-                contentLength,
-                DateTime.UtcNow,
-                null);
+            return FetchFailed(pending, previousFetch, stopwatch.Elapsed, CrlStatus.Error, msg);
         }
         catch (LdapException ldapEx)
         {
             stopwatch.Stop();
+            this.RecordHostOutcome(breaker, host, ldapEx, diagnostics);
             var friendly = ConvertLdapException(ldapEx);
             diagnostics.AddRuntimeWarning(BuildProcessingErrorMessage(entry.Uri, friendly));
             Log.Error(ldapEx, "LDAP fetch failed for {Uri}: {ErrorCode} - {Message}", entry.Uri, ldapEx.ErrorCode, friendly);
-            return new CrlCheckResult(
+            return FetchFailed(pending, previousFetch, stopwatch.Elapsed, CrlStatus.Error, friendly);
+        }
+        catch (Exception ex)
+        {
+            stopwatch.Stop();
+            this.RecordHostOutcome(breaker, host, ex, diagnostics);
+            var message = BuildProcessingErrorMessage(entry.Uri, ex.Message);
+            diagnostics.AddRuntimeWarning(message);
+            LogFetchError(entry.Uri, ex);
+            return FetchFailed(pending, previousFetch, stopwatch.Elapsed, CrlStatus.Error, ex.Message);
+        }
+    }
+
+    /// <summary>
+    /// Fetches the entry, and its delta when it has one, retrying transient failures after a jittered, exponentially
+    /// growing pause. Retries run under the caller's token, so they share the entry's fetch timeout, and stop once the
+    /// host's circuit has opened. The breaker only hears about the final outcome, so one broken CRL counts once.
+    /// </summary>
+    private async Task<(FetchedCrl Fetched, DeltaFetch? Delta)> FetchWithRetryAsync(
+        CrlConfigEntry entry,
+        HostCircuitBreaker breaker,
+        RunDiagnostics diagnostics,
+        CancellationToken cancellationToken)
+    {
+        var host = entry.Uri.Host;
+        for (var retry = 1; ; retry++)
+        {
+            try
+            {
+                (FetchedCrl Fetched, DeltaFetch? Delta) fetched = entry.DeltaUri != null
+                    ? await this.FetchWithDeltaAsync(entry, cancellationToken).ConfigureAwait(false)
+                    : (await this._fetcherResolver.Resolve(entry.Uri).FetchAsync(entry, cancellationToken).ConfigureAwait(false), null);
+                return fetched;
+            }
+            catch (Exception ex) when (IsTransientFetchFailure(ex) && !cancellationToken.IsCancellationRequested)
+            {
+                if (retry > this._resilience.MaxRetries || breaker.IsOpen(host))
+                {
+                    throw;
+                }
+
+                var delay = this._resilience.GetRetryDelay(retry);
+                diagnostics.RecordFetchRetries(host);
+                Log.Warning("Fetch attempt {Attempt} for {Uri} failed, retrying in {DelayMs:F0} ms: {Message}", retry, entry.Uri, delay.TotalMilliseconds, ex.Message);
+                await Task.Delay(delay, cancellationToken).ConfigureAwait(false);
+            }
+        }
+    }
+
+    private ProcessedOutcome ProcessFetched(FetchOutcome outcome, RunDiagnostics diagnostics)
+    {
+        var entry = outcome.Entry;
+        var fetched = outcome.Fetched!;
+        var stopwatch = Stopwatch.StartNew();
+        var timings = new ProcessingTimings();
+        try
+        {
+            var (parsed, signature) = outcome.Delta == null
+                ? this.ParseAndValidate(fetched.Content, entry, timings)
+                : this.ApplyDelta(entry, outcome.Delta, timings);
+            var evaluatedFrom = Stopwatch.GetTimestamp();
+            var health = this._healthEvaluator.Evaluate(parsed, entry, DateTime.UtcNow);
+            timings.Health = Stopwatch.GetElapsedTime(evaluatedFrom);
+            stopwatch.Stop();
+
+            var status = DetermineStatus(entry, diagnostics, signature, health);
+            var errorInfo = BuildErrorInfo(signature, health, status);
+            var result = new CrlCheckResult(
                 entry.Uri,
-                CrlStatus.Error,
-                stopwatch.Elapsed,
-                null,
-                friendly,
-                previousFetch,
-                downloadDuration,
-                contentLength,
+                status,
+                outcome.FetchElapsed + stopwatch.Elapsed,
+                parsed,
+                errorInfo,
+                outcome.PreviousFetchUtc,
+                fetched.Duration,
+                fetched.ContentLength,
                 DateTime.UtcNow,
-                null);
+                signature.Status,
+                fetched.CacheHit,
+                fetched.CacheHit ? fetched.ContentLength : 0,
+                fetched.TimeToFirstByte,
+                fetched.ConnectionReused,
+                Timings: timings.AppendTo(fetched.Timings));
+            return new ProcessedOutcome(outcome.Index, entry, result, PersistFetch: true);
         }
         catch (Exception ex)
         {
@@ -173,18 +484,210 @@ internal sealed class CrlCheckRunner(
             var message = BuildProcessingErrorMessage(entry.Uri, ex.Message);
             diagnostics.AddRuntimeWarning(message);
             LogFetchError(entry.Uri, ex);
-            return new CrlCheckResult(
+            var result = new CrlCheckResult(
                 entry.Uri,
                 CrlStatus.Error,
-                stopwatch.Elapsed,
+                outcome.FetchElapsed + stopwatch.Elapsed,
                 null,
                 ex.Message,
-                previousFetch,
-                downloadDuration,
-                contentLength,
+                outcome.PreviousFetchUtc,
+                fetched.Duration,
+                fetched.ContentLength,
                 DateTime.UtcNow,
-                null);
+                null,
+                fetched.CacheHit,
+                fetched.CacheHit ? fetched.ContentLength : 0,
+                fetched.TimeToFirstByte,
+                fetched.ConnectionReused,
+                Timings: timings.AppendTo(fetched.Timings));
+            return new ProcessedOutcome(outcome.Index, entry, result, PersistFetch: false);
+        }
+    }
+
+    /// <summary>
+    /// Diffs the revoked serials against the snapshot from the previous check and stores the new snapshot when the
+    /// set changed. The first check of a CRL only records a baseline, so it reports no changes.
+    /// </summary>
+    private static async Task<ProcessedOutcome> AttachRevocationDiffAsync(
+        IRevocationSnapshotStore snapshotStore,
+        ProcessedOutcome processed,
+        RunDiagnostics diagnostics)
+    {
+        var serials = processed.Result.ParsedCrl?.RevokedSerialNumbers;
+        if (serials == null || !serials.SerialsRetained)
+        {
+            return processed;
+        }
+
+        var uri = processed.Entry.Uri;
+        try
+        {
+            var previous = await snapshotStore.LoadAsync(uri, CancellationToken.None).ConfigureAwait(false);
+            if (previous == null)
+            {
+                await snapshotStore.SaveAsync(uri, serials, CancellationToken.None).ConfigureAwait(false);
+                return processed;
+            }
+
+            var diff = RevocationDiff.Compute(previous, serials);
+            if (diff.AddedCount > 0 || diff.RemovedCount > 0)
+            {
+                await snapshotStore.SaveAsync(uri, serials, CancellationToken.None).ConfigureAwait(false);
+            }
+
+            return processed with { Result = processed.Result with { RevocationChanges = diff } };
+        }
+        catch (Exception ex)
+        {
+            diagnostics.AddStateWarning($"Failed to update revocation snapshot for '{uri}': {ex.Message}");
+            return processed;
+        }
+    }
+
+    private static async Task UpdateRevocationIndexAsync(
+        IRevocationIndexStore indexStore,
+        IReadOnlyList<CrlCheckResult> results,
+        RunDiagnostics diagnostics)
+    {
+        try
+        {
+            await indexStore.UpdateAsync(results, CancellationToken.None).ConfigureAwait(false);
+        }
+        catch (Exception ex)
+        {
+            diagnostics.AddStateWarning($"Failed to update revocation index: {ex.Message}");
+        }
+    }
+#pragma warning restore CA1031
+
+    private static FetchOutcome FetchFailed(
+        PendingFetch pending,
+        DateTime? previousFetch,
+        TimeSpan elapsed,
+        CrlStatus status,
+        string message)
+    {
+        var result = new CrlCheckResult(
+            pending.Entry.Uri,
+            status,
+            elapsed,
+            null,
+            message,
+            previousFetch,
+            null,
+            null,
+            DateTime.UtcNow,
+            null);
+        return new FetchOutcome(pending.Index, pending.Entry, previousFetch, null, elapsed, result);
+    }
+
+    private (ParsedCrl Parsed, SignatureValidationResult Signature) ParseAndValidate(
+        ReadOnlyMemory<byte> content,
+        CrlConfigEntry entry,
+        ProcessingTimings timings)
+    {
+        var started = Stopwatch.GetTimestamp();
+        if (this._memoStore == null)
+        {
+            var (parsedCrl, crl) = this._parser.Decode(content);
+            var parsedCrlAt = Stopwatch.GetTimestamp();
+            var validated = this._signatureValidator.Validate(parsedCrl, crl, entry);
+            timings.Record(started, parsedCrlAt);
+            return (parsedCrl, validated);
+        }
+
+        var key = CrlMemoKey.Create(content.Span, entry);
+        if (this._memoStore.TryGet(key, out var memo) && memo != null)
+        {
+            // A memoised CRL only costs the hash of its content, which is counted as parsing.
+            timings.Record(started, Stopwatch.GetTimestamp());
+            return (memo.Parsed, memo.Signature);
+        }
+
+        var (parsed, decoded) = this._parser.Decode(content);
+        var parsedAt = Stopwatch.GetTimestamp();
+        var signature = this._signatureValidator.Validate(parsed, decoded, entry);
+        timings.Record(started, parsedAt);
+
+        // Validation errors (e.g. an unreadable CA file) may be transient, so only settled outcomes are memoised.
+        if (!string.Equals(signature.Status, "Error", StringComparison.OrdinalIgnoreCase))
+        {
+            this._memoStore.Add(key, new CrlMemoEntry(parsed, signature), content.Length);
+        }
+
+        return (parsed, signature);
+    }
+
+    /// <summary>
+    /// Fetches and parses the delta CRL, then fetches the base only when the cached one cannot be used with it.
+    /// The returned <see cref="FetchedCrl"/> carries the combined transfer metrics but no content.
+    /// </summary>
+    private async Task<(FetchedCrl Fetched, DeltaFetch Delta)> FetchWithDeltaAsync(CrlConfigEntry entry, CancellationToken cancellationToken)
+    {
+        var deltaEntry = entry with { Uri = entry.DeltaUri! };
+        var deltaFetcher = this._fetcherResolver.Resolve(deltaEntry.Uri);
+        var deltaFetched = await deltaFetcher.FetchAsync(deltaEntry, cancellationToken).ConfigureAwait(false);
+        ParsedCrl parsedDelta;
+        X509Crl? deltaCrl;
+        TimeSpan deltaParse;
+        using (deltaFetched)
+        {
+            // Deltas are small, so parsing here to read the base CRL number costs little and avoids a second round trip.
+            var started = Stopwatch.GetTimestamp();
+            (parsedDelta, deltaCrl) = this._parser.Decode(deltaFetched.Content);
+            deltaParse = Stopwatch.GetElapsedTime(started);
+        }
+
+        var metrics = deltaFetched with {
+            Content = ReadOnlyMemory<byte>.Empty,
+            ContentOwner = null,
+            Timings = (deltaFetched.Timings ?? CrlStageTimings.None).Combine(new CrlStageTimings(Parse: deltaParse))
+        };
+        if (!this._deltaBases.NeedsBase(entry.Uri, parsedDelta, DateTime.UtcNow))
+        {
+            return (metrics, new DeltaFetch(parsedDelta, deltaCrl, null));
+        }
+
+        var baseFetched = await this._fetcherResolver.Resolve(entry.Uri).FetchAsync(entry, cancellationToken).ConfigureAwait(false);
+        metrics = metrics with {
+            Duration = metrics.Duration + baseFetched.Duration,
+            ContentLength = metrics.ContentLength + baseFetched.ContentLength,
+            CacheHit = metrics.CacheHit && baseFetched.CacheHit,
+            Hedged = metrics.Hedged || baseFetched.Hedged,
+            Timings = (metrics.Timings ?? CrlStageTimings.None).Combine(baseFetched.Timings)
+        };
+        return (metrics, new DeltaFetch(parsedDelta, deltaCrl, baseFetched));
+    }
+
+    private (ParsedCrl Parsed, SignatureValidationResult Signature) ApplyDelta(CrlConfigEntry entry, DeltaFetch delta, ProcessingTimings timings)
+    {
+        CrlMemoEntry? baseCrl;
+        if (delta.BaseFetched != null)
+        {
+            var (parsedBase, baseSignature) = this.ParseAndValidate(delta.BaseFetched.Content, entry, timings);
+            baseCrl = new CrlMemoEntry(parsedBase, baseSignature);
+            if (!string.Equals(baseSignature.Status, "Error", StringComparison.OrdinalIgnoreCase))
+            {
+                this._deltaBases.Store(entry.Uri, baseCrl);
+            }
         }
+        else if (!this._deltaBases.TryGet(entry.Uri, out baseCrl) || baseCrl == null)
+        {
+            throw new InvalidOperationException("Base CRL is not available.");
+        }
+
+        var mergeStarted = Stopwatch.GetTimestamp();
+        var merged = DeltaCrlMerger.Merge(baseCrl.Parsed, delta.Parsed);
+        var mergedAt = Stopwatch.GetTimestamp();
+        var deltaSignature = this._signatureValidator.Validate(delta.Parsed, delta.Crl, entry);
+        timings.Record(mergeStarted, mergedAt);
+
+        // The effective CRL is only as trustworthy as the weaker of its two signatures.
+        var signature = string.Equals(baseCrl.Signature.Status, "Valid", StringComparison.OrdinalIgnoreCase) ||
+                        !string.Equals(deltaSignature.Status, "Valid", StringComparison.OrdinalIgnoreCase)
+            ? deltaSignature
+            : baseCrl.Signature with { ErrorMessage = $"Base CRL: {baseCrl.Signature.ErrorMessage}" };
+        return (merged, signature);
     }
 
     private static void LogFetchError(Uri uri, Exception ex)
@@ -223,6 +726,71 @@ internal sealed class CrlCheckRunner(
         }
     }
 
+    /// <summary>
+    /// Reports how a CRL's fetch ended to the breaker: only a failure to reach the host counts against it, while any
+    /// answer from the host, even an error, shows it is up.
+    /// </summary>
+    private void RecordHostOutcome(HostCircuitBreaker breaker, string host, Exception failure, RunDiagnostics diagnostics)
+    {
+        if (IsConnectFailure(failure))
+        {
+            this.RecordHostFailure(breaker, host, diagnostics);
+        }
+        else
+        {
+            breaker.RecordSuccess(host);
+        }
+    }
+
+    private void RecordHostFailure(HostCircuitBreaker breaker, string host, RunDiagnostics diagnostics)
+    {
+        if (breaker.RecordFailure(host))
+        {
+            var threshold = this._resilience.CircuitBreakerThreshold;
+            var cooldown = this._resilience.CircuitBreakerCooldown.TotalSeconds;
+            diagnostics.AddRuntimeWarning(
+                FormattableString.Invariant($"Circuit opened for {host} after {threshold} CRLs in a row could not connect or timed out; its CRLs are skipped until a probe after {cooldown:F0}s gets through."));
+            Log.Warning("Circuit opened for {Host} after {Failures} consecutive CRLs could not connect or timed out", host, threshold);
+        }
+    }
+
+    /// <summary>
+    /// Whether a fetch failure is worth retrying: the connection could not be made or was cut, the server asked the
+    /// client to come back later (408, 429, 500, 502, 503, 504), or an LDAP server was busy, unavailable or timed out.
+    /// </summary>
+    private static bool IsTransientFetchFailure(Exception ex)
+    {
+        return ex switch {
+            HttpRequestException { StatusCode: { } status } => status is HttpStatusCode.RequestTimeout
+                or HttpStatusCode.TooManyRequests
+                or HttpStatusCode.InternalServerError
+                or HttpStatusCode.BadGateway
+                or HttpStatusCode.ServiceUnavailable
+                or HttpStatusCode.GatewayTimeout,
+            HttpRequestException http => http.HttpRequestError is HttpRequestError.ConnectionError
+                    or HttpRequestError.NameResolutionError
+                    or HttpRequestError.ResponseEnded ||
+                http.InnerException is SocketException or IOException,
+            SocketException => true,
+            LdapException ldap => ldap.ErrorCode is 51 or 52 or 81 or 85 or 91,
+            _ => false
+        };
+    }
+
+    /// <summary>
+    /// Whether a fetch failure means the host could not be reached at all, which counts towards opening its circuit.
+    /// </summary>
+    private static bool IsConnectFailure(Exception ex)
+    {
+        return ex switch {
+            HttpRequestException { StatusCode: null } http => http.HttpRequestError is HttpRequestError.ConnectionError or HttpRequestError.NameResolutionError ||
+                http.InnerException is SocketException,
+            SocketException => true,
+            LdapException ldap => ldap.ErrorCode is 81 or 91,
+            _ => false
+        };
+    }
+
     private static string ConvertLdapException(LdapException ex)
     {
         return ex.ErrorCode switch {
@@ -315,36 +883,128 @@ internal sealed class CrlCheckRunner(
     }
 
 #pragma warning disable CA1031
-    private async Task<DateTime?> TryGetLastFetchAsync(
-        CrlConfigEntry entry,
+    private async Task<IReadOnlyDictionary<Uri, CrlHistory>> TryGetHistoriesAsync(
+        IReadOnlyList<CrlConfigEntry> entries,
         RunDiagnostics diagnostics,
         CancellationToken cancellationToken)
     {
         try
         {
-            return await this._stateStore.GetLastFetchAsync(entry.Uri, cancellationToken).ConfigureAwait(false);
+            var uris = entries.Select(entry => entry.Uri).ToList();
+            return await this._stateStore.GetCrlHistoriesAsync(uris, cancellationToken).ConfigureAwait(false);
         }
-        catch (Exception ex)
+        catch (Exception ex) when (!cancellationToken.IsCancellationRequested)
         {
-            diagnostics.AddStateWarning($"Failed to read state for '{entry.Uri}': {ex.Message}");
-            return null;
+            diagnostics.AddStateWarning($"Failed to read state for {entries.Count} CRL(s): {ex.Message}");
+            return new Dictionary<Uri, CrlHistory>();
         }
     }
 
-    private async Task TrySaveLastFetchAsync(
-        CrlConfigEntry entry,
-        RunDiagnostics diagnostics,
-        DateTime fetchedAtUtc,
-        CancellationToken cancellationToken)
+    /// <summary>
+    /// Orders the entries most urgent first, keeping configuration order among equals. Results are still stored by
+    /// configuration index, so reports do not see the reordering.
+    /// </summary>
+    private static List<PendingFetch> OrderByUrgency(IReadOnlyList<CrlConfigEntry> entries, IReadOnlyDictionary<Uri, CrlHistory> histories)
+    {
+        var pending = new List<PendingFetch>(entries.Count);
+        for (var index = 0; index < entries.Count; index++)
+        {
+            var entry = entries[index];
+            var history = histories.TryGetValue(entry.Uri, out var found) ? found : null;
+            pending.Add(new PendingFetch(index, entry, history, GetAttentionUtc(entry, history)));
+        }
+
+        // OrderBy is stable, so entries with the same attention time keep their configuration order.
+        return pending.OrderBy(item => item.AttentionUtc).ToList();
+    }
+
+    /// <summary>
+    /// Gets when a CRL needs attention: at once when it was never checked or its last check failed, otherwise when
+    /// its recorded validity crosses the expiry threshold. A CRL without a next update never does.
+    /// </summary>
+    private static DateTime GetAttentionUtc(CrlConfigEntry entry, CrlHistory? history)
+    {
+        if (history?.ThisUpdate == null || history.LastCheckFailed)
+        {
+            return DateTime.MinValue;
+        }
+
+        if (history.NextUpdate == null)
+        {
+            return DateTime.MaxValue;
+        }
+
+        var window = history.NextUpdate.Value - history.ThisUpdate.Value;
+        return history.ThisUpdate.Value + TimeSpan.FromTicks((long)(window.Ticks * entry.ExpiryThreshold));
+    }
+
+    private static async Task TryCommitStateAsync(StateBatch stateChanges, RunDiagnostics diagnostics)
     {
+        var pending = stateChanges.Count;
+        if (pending == 0)
+        {
+            return;
+        }
+
         try
         {
-            await this._stateStore.SaveLastFetchAsync(entry.Uri, fetchedAtUtc, cancellationToken).ConfigureAwait(false);
+            // Not cancellable: the checks have already run, and dropping their fetch times would only hide them.
+            var started = Stopwatch.GetTimestamp();
+            await stateChanges.CommitAsync(CancellationToken.None).ConfigureAwait(false);
+
+            // The write is shared by the whole run, so it is one run-level sample rather than a per-check timing.
+            diagnostics.RecordStageTimings(new CrlStageTimings(StateWrite: Stopwatch.GetElapsedTime(started)));
         }
         catch (Exception ex)
         {
-            diagnostics.AddStateWarning($"Failed to update state for '{entry.Uri}': {ex.Message}");
+            diagnostics.AddStateWarning($"Failed to update state for {pending} CRL(s): {ex.Message}");
         }
     }
 #pragma warning restore CA1031
+
+    private sealed record PendingFetch(int Index, CrlConfigEntry Entry, CrlHistory? History, DateTime AttentionUtc);
+
+    private sealed record FetchOutcome(
+        int Index,
+        CrlConfigEntry Entry,
+        DateTime? PreviousFetchUtc,
+        FetchedCrl? Fetched,
+        TimeSpan FetchElapsed,
+        CrlCheckResult? Failure,
+        DeltaFetch? Delta = null);
+
+    /// <summary>
+    /// A fetched delta, kept with its decoded CRL until the processing stage has checked its signature. Deltas are
+    /// small, so holding the decoded form that long is cheap, unlike the base.
+    /// </summary>
+    private sealed record DeltaFetch(ParsedCrl Parsed, X509Crl? Crl, FetchedCrl? BaseFetched);
+
+    private sealed record ProcessedOutcome(int Index, CrlConfigEntry Entry, CrlCheckResult Result, bool PersistFetch);
+
+    /// <summary>
+    /// Processing-stage times for one entry. A delta entry may parse and verify twice, so the times accumulate.
+    /// </summary>
+    private sealed class ProcessingTimings
+    {
+        public TimeSpan? Parse { get; private set; }
+
+        public TimeSpan? Verify { get; private set; }
+
+        public TimeSpan? Health { get; set; }
+
+        /// <summary>
+        /// Adds a parse that ran from <paramref name="startedAt"/> to <paramref name="parsedAt"/>, followed by a
+        /// verification that ran until now.
+        /// </summary>
+        public void Record(long startedAt, long parsedAt)
+        {
+            this.Parse = (this.Parse ?? TimeSpan.Zero) + Stopwatch.GetElapsedTime(startedAt, parsedAt);
+            this.Verify = (this.Verify ?? TimeSpan.Zero) + Stopwatch.GetElapsedTime(parsedAt);
+        }
+
+        public CrlStageTimings AppendTo(CrlStageTimings? fetchTimings)
+        {
+            return (fetchTimings ?? CrlStageTimings.None).Combine(new CrlStageTimings(Parse: this.Parse, Verify: this.Verify, Health: this.Health));
+        }
+    }
 }
@@ -0,0 +1,23 @@
+using System.Threading.Channels;
+using CrlMonitor.Models;
+
+namespace CrlMonitor.Runner;
+
+/// <summary>
+/// A run in progress. Results become readable as soon as each check (including its state update) completes, in
+/// completion order rather than configuration order; <see cref="Completion"/> yields the full run afterwards.
+/// </summary>
+internal sealed class CrlCheckStream(ChannelReader<CrlCheckResult> results, Task<CrlCheckRun> completion)
+{
+    private readonly ChannelReader<CrlCheckResult> _results = results ?? throw new ArgumentNullException(nameof(results));
+
+    public Task<CrlCheckRun> Completion { get; } = completion ?? throw new ArgumentNullException(nameof(completion));
+
+    /// <summary>
+    /// Yields each result once. The sequence ends when the run finishes and rethrows the run's failure, if any.
+    /// </summary>
+    public IAsyncEnumerable<CrlCheckResult> ReadResultsAsync(CancellationToken cancellationToken)
+    {
+        return this._results.ReadAllAsync(cancellationToken);
+    }
+}
@@ -0,0 +1,156 @@
+using System.Text;
+using CrlMonitor.Crl;
+using CrlMonitor.Validation;
+using Org.BouncyCastle.Math;
+
+namespace CrlMonitor.Runner;
+
+/// <summary>
+/// A parsed CRL together with the outcome of its signature check.
+/// </summary>
+/// <remarks>
+/// <see cref="WriteSnapshot"/> stores the entry in a compact binary form so a later run can reuse it: a header with
+/// the CRL metadata and signature outcome, then the revoked (and, for deltas, removed) serials as
+/// <see cref="RevokedSerialCollection"/> snapshots. Count-only collections store just their entry count.
+/// </remarks>
+internal sealed record CrlMemoEntry(
+    ParsedCrl Parsed,
+    SignatureValidationResult Signature)
+{
+    private const uint SnapshotMagic = 0x4D4C5243; // "CRLM" little-endian
+    private const byte SnapshotVersion = 1;
+
+    public void WriteSnapshot(Stream destination)
+    {
+        ArgumentNullException.ThrowIfNull(destination);
+        var parsed = this.Parsed;
+        using var writer = new BinaryWriter(destination, Encoding.UTF8, leaveOpen: true);
+        writer.Write(SnapshotMagic);
+        writer.Write(SnapshotVersion);
+        writer.Write(parsed.Issuer);
+        writer.Write(parsed.ThisUpdate.Ticks);
+        WriteOptional(writer, parsed.NextUpdate?.Ticks);
+        writer.Write(parsed.IsDelta);
+        writer.Write(parsed.SignatureStatus);
+        WriteOptional(writer, parsed.SignatureError);
+        WriteOptional(writer, parsed.CrlNumber);
+        WriteOptional(writer, parsed.BaseCrlNumber);
+        writer.Write(this.Signature.Status);
+        WriteOptional(writer, this.Signature.ErrorMessage);
+        WriteSerials(writer, parsed.RevokedSerialNumbers);
+        writer.Write(parsed.RemovedSerialNumbers != null);
+        if (parsed.RemovedSerialNumbers != null)
+        {
+            WriteSerials(writer, parsed.RemovedSerialNumbers);
+        }
+    }
+
+    /// <summary>
+    /// Reads an entry written by <see cref="WriteSnapshot"/>.
+    /// </summary>
+    /// <exception cref="InvalidDataException">The stream does not hold a valid entry.</exception>
+    public static CrlMemoEntry ReadSnapshot(Stream source)
+    {
+        ArgumentNullException.ThrowIfNull(source);
+        using var reader = new BinaryReader(source, Encoding.UTF8, leaveOpen: true);
+        if (reader.ReadUInt32() != SnapshotMagic || reader.ReadByte() != SnapshotVersion)
+        {
+            throw new InvalidDataException("Unrecognised CRL snapshot.");
+        }
+
+        var issuer = reader.ReadString();
+        var thisUpdate = new DateTime(reader.ReadInt64(), DateTimeKind.Utc);
+        DateTime? nextUpdate = reader.ReadBoolean() ? new DateTime(reader.ReadInt64(), DateTimeKind.Utc) : null;
+        var isDelta = reader.ReadBoolean();
+        var parsedStatus = reader.ReadString();
+        var parsedError = ReadOptionalString(reader);
+        var crlNumber = ReadOptionalInteger(reader);
+        var baseCrlNumber = ReadOptionalInteger(reader);
+        var signature = new SignatureValidationResult(reader.ReadString(), ReadOptionalString(reader));
+        var revoked = ReadSerials(reader);
+        var removed = reader.ReadBoolean() ? ReadSerials(reader) : null;
+        var parsed = new ParsedCrl(issuer, thisUpdate, nextUpdate, revoked, isDelta, parsedStatus, parsedError, crlNumber, baseCrlNumber, removed);
+        return new CrlMemoEntry(parsed, signature);
+    }
+
+    private static void WriteSerials(BinaryWriter writer, RevokedSerialCollection serials)
+    {
+        writer.Write(serials.SerialsRetained);
+        writer.Write(serials.EntryCount);
+        if (serials.SerialsRetained)
+        {
+            writer.Flush();
+            serials.WriteSnapshot(writer.BaseStream);
+        }
+    }
+
+    private static RevokedSerialCollection ReadSerials(BinaryReader reader)
+    {
+        var retained = reader.ReadBoolean();
+        var entryCount = reader.ReadInt32();
+        if (entryCount < 0)
+        {
+            throw new InvalidDataException("Corrupt CRL snapshot serial count.");
+        }
+
+        if (!retained)
+        {
+            return RevokedSerialCollection.CountOnly(entryCount);
+        }
+
+        var serials = RevokedSerialCollection.ReadSnapshot(reader.BaseStream);
+        return entryCount >= serials.Count
+            ? serials.WithEntryCount(entryCount)
+            : throw new InvalidDataException("Corrupt CRL snapshot serial count.");
+    }
+
+    private static void WriteOptional(BinaryWriter writer, long? value)
+    {
+        writer.Write(value.HasValue);
+        if (value.HasValue)
+        {
+            writer.Write(value.Value);
+        }
+    }
+
+    private static void WriteOptional(BinaryWriter writer, string? value)
+    {
+        writer.Write(value != null);
+        if (value != null)
+        {
+            writer.Write(value);
+        }
+    }
+
+    private static void WriteOptional(BinaryWriter writer, BigInteger? value)
+    {
+        writer.Write(value != null);
+        if (value != null)
+        {
+            var bytes = value.ToByteArray();
+            writer.Write(bytes.Length);
+            writer.Write(bytes);
+        }
+    }
+
+    private static string? ReadOptionalString(BinaryReader reader)
+    {
+        return reader.ReadBoolean() ? reader.ReadString() : null;
+    }
+
+    private static BigInteger? ReadOptionalInteger(BinaryReader reader)
+    {
+        if (!reader.ReadBoolean())
+        {
+            return null;
+        }
+
+        var length = reader.ReadInt32();
+        if (length is <= 0 or > 64)
+        {
+            throw new InvalidDataException("Corrupt CRL snapshot CRL number.");
+        }
+
+        return new BigInteger(reader.ReadBytes(length));
+    }
+}
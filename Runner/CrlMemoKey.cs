@@ -0,0 +1,33 @@
+using System.Globalization;
+using System.Security.Cryptography;
+using CrlMonitor.Crl;
+
+namespace CrlMonitor.Runner;
+
+/// <summary>
+/// Builds memo keys from the CRL content hash and the identity of the CA certificate used to verify it.
+/// </summary>
+internal static class CrlMemoKey
+{
+    public static string Create(ReadOnlySpan<byte> content, CrlConfigEntry entry)
+    {
+        ArgumentNullException.ThrowIfNull(entry);
+
+        var contentHash = Convert.ToHexString(SHA256.HashData(content));
+        return string.Concat(contentHash, "|", DescribeCaIdentity(entry));
+    }
+
+    private static string DescribeCaIdentity(CrlConfigEntry entry)
+    {
+        if (entry.SignatureValidationMode == SignatureValidationMode.None || string.IsNullOrWhiteSpace(entry.CaCertificatePath))
+        {
+            return entry.SignatureValidationMode.ToString();
+        }
+
+        // Length and write time stand in for the certificate contents so a replaced CA file invalidates the memo.
+        var fileInfo = new FileInfo(entry.CaCertificatePath);
+        return fileInfo.Exists
+            ? string.Create(CultureInfo.InvariantCulture, $"{entry.SignatureValidationMode}|{fileInfo.FullName}|{fileInfo.Length}|{fileInfo.LastWriteTimeUtc.Ticks}")
+            : string.Create(CultureInfo.InvariantCulture, $"{entry.SignatureValidationMode}|{fileInfo.FullName}|missing");
+    }
+}
@@ -0,0 +1,96 @@
+namespace CrlMonitor.Runner;
+
+/// <summary>
+/// In-memory memo store with least-recently-used eviction bounded by the total size of the memoised CRLs.
+/// </summary>
+internal sealed class CrlMemoStore : ICrlMemoStore
+{
+    private readonly long _capacityBytes;
+    private readonly object _sync = new();
+    private readonly Dictionary<string, LinkedListNode<MemoItem>> _items = new(StringComparer.Ordinal);
+    private readonly LinkedList<MemoItem> _recency = new();
+    private long _sizeBytes;
+
+    public CrlMemoStore(long capacityBytes)
+    {
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(capacityBytes);
+        this._capacityBytes = capacityBytes;
+    }
+
+    public int Count
+    {
+        get
+        {
+            lock (this._sync)
+            {
+                return this._items.Count;
+            }
+        }
+    }
+
+    public long SizeBytes
+    {
+        get
+        {
+            lock (this._sync)
+            {
+                return this._sizeBytes;
+            }
+        }
+    }
+
+    public bool TryGet(string key, out CrlMemoEntry? entry)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(key);
+        lock (this._sync)
+        {
+            if (!this._items.TryGetValue(key, out var node))
+            {
+                entry = null;
+                return false;
+            }
+
+            this._recency.Remove(node);
+            this._recency.AddFirst(node);
+            entry = node.Value.Entry;
+            return true;
+        }
+    }
+
+    public void Add(string key, CrlMemoEntry entry, long sizeBytes)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(key);
+        ArgumentNullException.ThrowIfNull(entry);
+        ArgumentOutOfRangeException.ThrowIfNegative(sizeBytes);
+        if (sizeBytes > this._capacityBytes)
+        {
+            return;
+        }
+
+        lock (this._sync)
+        {
+            if (this._items.TryGetValue(key, out var existing))
+            {
+                this.RemoveNode(existing);
+            }
+
+            var node = this._recency.AddFirst(new MemoItem(key, entry, sizeBytes));
+            this._items[key] = node;
+            this._sizeBytes += sizeBytes;
+
+            while (this._sizeBytes > this._capacityBytes && this._recency.Last != null)
+            {
+                this.RemoveNode(this._recency.Last);
+            }
+        }
+    }
+
+    private void RemoveNode(LinkedListNode<MemoItem> node)
+    {
+        this._recency.Remove(node);
+        _ = this._items.Remove(node.Value.Key);
+        this._sizeBytes -= node.Value.SizeBytes;
+    }
+
+    private sealed record MemoItem(string Key, CrlMemoEntry Entry, long SizeBytes);
+}
@@ -0,0 +1,105 @@
+using System.Collections.Concurrent;
+using CrlMonitor.Crl;
+using Serilog;
+
+namespace CrlMonitor.Runner;
+
+/// <summary>
+/// Holds the parsed base CRL for each entry that is monitored through a delta CRL, so the (large) base is only
+/// fetched again when it expires or a delta refers to a newer base. With an <see cref="IDeltaBaseStore"/> the bases
+/// are also saved to disk and read back on first use, so separate runs share them; otherwise they last as long as the
+/// process.
+/// </summary>
+internal sealed class DeltaBaseCache(IDeltaBaseStore? store = null)
+{
+    private readonly IDeltaBaseStore? _store = store;
+    private readonly ConcurrentDictionary<Uri, CrlMemoEntry> _bases = new();
+
+    public bool TryGet(Uri uri, out CrlMemoEntry? entry)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        if (this._bases.TryGetValue(uri, out entry))
+        {
+            return true;
+        }
+
+        entry = this.Load(uri);
+        if (entry == null)
+        {
+            return false;
+        }
+
+        entry = this._bases.GetOrAdd(uri, entry);
+        return true;
+    }
+
+    public void Store(Uri uri, CrlMemoEntry entry)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        ArgumentNullException.ThrowIfNull(entry);
+        this._bases[uri] = entry;
+        if (this._store == null)
+        {
+            return;
+        }
+
+        try
+        {
+            this._store.Save(uri, entry);
+        }
+        catch (IOException ex)
+        {
+            // The base is still used from memory; the next run just fetches it again.
+            Log.Warning(ex, "Failed to save base CRL for {Uri}: {Message}", uri, ex.Message);
+        }
+        catch (UnauthorizedAccessException ex)
+        {
+            Log.Warning(ex, "Failed to save base CRL for {Uri}: {Message}", uri, ex.Message);
+        }
+    }
+
+    /// <summary>
+    /// Returns true when the cached base for <paramref name="uri"/> is missing, past its next update, or too old
+    /// for <paramref name="delta"/> to apply to it.
+    /// </summary>
+    public bool NeedsBase(Uri uri, ParsedCrl delta, DateTime utcNow)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        ArgumentNullException.ThrowIfNull(delta);
+        if (!this.TryGet(uri, out var cached) || cached == null)
+        {
+            return true;
+        }
+
+        var nextUpdate = cached.Parsed.NextUpdate;
+        return (nextUpdate.HasValue && nextUpdate.Value <= utcNow) || !DeltaCrlMerger.CanApply(cached.Parsed, delta);
+    }
+
+    private CrlMemoEntry? Load(Uri uri)
+    {
+        if (this._store == null)
+        {
+            return null;
+        }
+
+        try
+        {
+            return this._store.Load(uri);
+        }
+        catch (IOException ex)
+        {
+            // Covers a truncated file too (EndOfStreamException); the base is simply fetched again.
+            Log.Warning(ex, "Failed to read saved base CRL for {Uri}: {Message}", uri, ex.Message);
+        }
+        catch (InvalidDataException ex)
+        {
+            Log.Warning(ex, "Ignored unreadable saved base CRL for {Uri}: {Message}", uri, ex.Message);
+        }
+        catch (UnauthorizedAccessException ex)
+        {
+            Log.Warning(ex, "Failed to read saved base CRL for {Uri}: {Message}", uri, ex.Message);
+        }
+
+        return null;
+    }
+}
@@ -0,0 +1,30 @@
+namespace CrlMonitor.Runner;
+
+/// <summary>
+/// Retry and circuit breaker settings for CRL fetches. A <see cref="MaxRetries"/> of zero disables retries and a
+/// <see cref="CircuitBreakerThreshold"/> of zero disables the breaker. An open circuit lets one probe through after
+/// <see cref="CircuitBreakerCooldown"/>.
+/// </summary>
+internal sealed record FetchResilienceOptions(
+    int MaxRetries,
+    TimeSpan RetryBaseDelay,
+    TimeSpan RetryMaxDelay,
+    int CircuitBreakerThreshold,
+    TimeSpan CircuitBreakerCooldown)
+{
+    public static FetchResilienceOptions Disabled { get; } = new(0, TimeSpan.Zero, TimeSpan.Zero, 0, TimeSpan.Zero);
+
+    /// <summary>
+    /// Gets the wait before retry <paramref name="retry"/> (1-based): a random time up to the base delay doubled
+    /// for each earlier retry, capped at <see cref="RetryMaxDelay"/>. The randomness keeps CRLs that failed together
+    /// from retrying in lockstep.
+    /// </summary>
+    public TimeSpan GetRetryDelay(int retry)
+    {
+        ArgumentOutOfRangeException.ThrowIfLessThan(retry, 1);
+        var ceiling = Math.Min(this.RetryBaseDelay.TotalMilliseconds * Math.Pow(2, retry - 1), this.RetryMaxDelay.TotalMilliseconds);
+#pragma warning disable CA5394 // Jitter only spreads retries out; it needs no cryptographic strength
+        return TimeSpan.FromMilliseconds(Random.Shared.NextDouble() * ceiling);
+#pragma warning restore CA5394
+    }
+}
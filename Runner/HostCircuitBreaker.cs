@@ -0,0 +1,162 @@
+using System.Collections.Concurrent;
+
+namespace CrlMonitor.Runner;
+
+/// <summary>
+/// Per-host circuit breaker for one run. Once <c>threshold</c> CRLs in a row on a host have failed with a connection
+/// failure or timeout (after their own retries), its circuit opens and the CRLs it serves fail at once instead of
+/// each waiting out the fetch timeout. After <c>cooldown</c> one CRL is let through as a probe: if the host answers
+/// the circuit closes again, otherwise it stays open for another cool-down. Any answer from the host resets the
+/// count. URIs without a host (local files) are never tripped.
+/// </summary>
+internal sealed class HostCircuitBreaker(int threshold, TimeSpan cooldown, Func<DateTime>? utcNow = null)
+{
+    private readonly int _threshold = threshold;
+    private readonly TimeSpan _cooldown = cooldown;
+    private readonly Func<DateTime> _utcNow = utcNow ?? (() => DateTime.UtcNow);
+    private readonly ConcurrentDictionary<string, HostCircuit> _hosts = new(StringComparer.OrdinalIgnoreCase);
+
+    /// <summary>
+    /// Whether the circuit is open, so further attempts against the host are pointless. A circuit with a probe in
+    /// flight is not open: the probe itself must still be allowed to retry.
+    /// </summary>
+    public bool IsOpen(string host)
+    {
+        return this.Enabled(host) && this._hosts.TryGetValue(host, out var circuit) && circuit.IsOpen;
+    }
+
+    /// <summary>
+    /// Returns false when a CRL on <paramref name="host"/> must not be fetched now. Once the cool-down has passed,
+    /// the first caller is let through as the probe and the others are still turned away until it reports back.
+    /// </summary>
+    public bool TryEnter(string host)
+    {
+        return !this.Enabled(host) || !this._hosts.TryGetValue(host, out var circuit) || circuit.TryEnter(this._cooldown, this._utcNow());
+    }
+
+    /// <summary>
+    /// Counts a CRL that could not reach the host and returns true when it is the one that opened the circuit.
+    /// </summary>
+    public bool RecordFailure(string host)
+    {
+        return this.Enabled(host) && this._hosts.GetOrAdd(host, _ => new HostCircuit()).RecordFailure(this._threshold, this._utcNow());
+    }
+
+    public void RecordSuccess(string host)
+    {
+        if (this.Enabled(host) && this._hosts.TryGetValue(host, out var circuit))
+        {
+            circuit.RecordSuccess();
+        }
+    }
+
+    /// <summary>
+    /// Hands back a probe that ended without an answer either way (the run was cancelled), so the circuit is open
+    /// again and the next caller becomes the probe. Does nothing when no probe is in flight.
+    /// </summary>
+    public void ReleaseProbe(string host)
+    {
+        if (this.Enabled(host) && this._hosts.TryGetValue(host, out var circuit))
+        {
+            circuit.ReleaseProbe();
+        }
+    }
+
+    private bool Enabled(string host)
+    {
+        return this._threshold > 0 && !string.IsNullOrEmpty(host);
+    }
+
+    private sealed class HostCircuit
+    {
+        private readonly object _sync = new();
+        private int _consecutiveFailures;
+        private CircuitState _state;
+        private DateTime _openedAtUtc;
+
+        private enum CircuitState
+        {
+            Closed,
+            Open,
+            Probing
+        }
+
+        public bool IsOpen
+        {
+            get
+            {
+                lock (this._sync)
+                {
+                    return this._state == CircuitState.Open;
+                }
+            }
+        }
+
+        public bool TryEnter(TimeSpan cooldown, DateTime utcNow)
+        {
+            lock (this._sync)
+            {
+                if (this._state == CircuitState.Closed)
+                {
+                    return true;
+                }
+
+                if (this._state == CircuitState.Open && utcNow - this._openedAtUtc >= cooldown)
+                {
+                    this._state = CircuitState.Probing;
+                    return true;
+                }
+
+                return false;
+            }
+        }
+
+        public bool RecordFailure(int threshold, DateTime utcNow)
+        {
+            lock (this._sync)
+            {
+                switch (this._state)
+                {
+                    case CircuitState.Probing:
+                        // The probe failed too, so the host gets another full cool-down.
+                        this._state = CircuitState.Open;
+                        this._openedAtUtc = utcNow;
+                        return false;
+                    case CircuitState.Open:
+                        return false;
+                    default:
+                        this._consecutiveFailures++;
+                        if (this._consecutiveFailures < threshold)
+                        {
+                            return false;
+                        }
+
+                        this._state = CircuitState.Open;
+                        this._openedAtUtc = utcNow;
+                        return true;
+                }
+            }
+        }
+
+        public void ReleaseProbe()
+        {
+            lock (this._sync)
+            {
+                // The original opening time is kept, so the cool-down has already passed for the next probe.
+                if (this._state == CircuitState.Probing)
+                {
+                    this._state = CircuitState.Open;
+                }
+            }
+        }
+
+        public void RecordSuccess()
+        {
+            lock (this._sync)
+            {
+                this._state = CircuitState.Closed;
+                this._consecutiveFailures = 0;
+            }
+        }
+    }
+}
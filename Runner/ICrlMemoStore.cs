@@ -0,0 +1,11 @@
+namespace CrlMonitor.Runner;
+
+/// <summary>
+/// Remembers parse and signature outcomes for CRL content that has already been processed.
+/// </summary>
+internal interface ICrlMemoStore
+{
+    bool TryGet(string key, out CrlMemoEntry? entry);
+
+    void Add(string key, CrlMemoEntry entry, long sizeBytes);
+}
@@ -0,0 +1,12 @@
+namespace CrlMonitor.Runner;
+
+/// <summary>
+/// Persists the base CRL last used for each delta-monitored entry, so a later run can apply a new delta without
+/// downloading the base again.
+/// </summary>
+internal interface IDeltaBaseStore
+{
+    CrlMemoEntry? Load(Uri uri);
+
+    void Save(Uri uri, CrlMemoEntry entry);
+}
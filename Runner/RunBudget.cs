@@ -0,0 +1,62 @@
+using System.Diagnostics;
+
+namespace CrlMonitor.Runner;
+
+/// <summary>
+/// Time left before a run's deadline, measured from when the budget was created. Without a deadline nothing is
+/// deferred and fetch timeouts are left as configured.
+/// </summary>
+internal sealed class RunBudget
+{
+    private readonly long _startedAt = Stopwatch.GetTimestamp();
+
+    public RunBudget(TimeSpan? deadline)
+    {
+        if (deadline.HasValue)
+        {
+            ArgumentOutOfRangeException.ThrowIfLessThanOrEqual(deadline.Value, TimeSpan.Zero, nameof(deadline));
+        }
+
+        this.Deadline = deadline;
+    }
+
+    public TimeSpan? Deadline { get; }
+
+    public TimeSpan? Remaining => this.Deadline - Stopwatch.GetElapsedTime(this._startedAt);
+
+    /// <summary>
+    /// Decides whether a check should be skipped: always once the deadline has passed, and for CRLs whose attention
+    /// time is still ahead once less than one fetch timeout is left.
+    /// </summary>
+    public bool ShouldDefer(DateTime attentionUtc, TimeSpan fetchTimeout, DateTime utcNow)
+    {
+        var remaining = this.Remaining;
+        if (!remaining.HasValue)
+        {
+            return false;
+        }
+
+        if (remaining.Value <= TimeSpan.Zero)
+        {
+            return true;
+        }
+
+        return fetchTimeout > TimeSpan.Zero && remaining.Value < fetchTimeout && attentionUtc > utcNow;
+    }
+
+    /// <summary>
+    /// Shortens a fetch timeout so the fetch cannot run past the deadline.
+    /// </summary>
+    public TimeSpan LimitTimeout(TimeSpan fetchTimeout)
+    {
+        var remaining = this.Remaining;
+        if (!remaining.HasValue)
+        {
+            return fetchTimeout;
+        }
+
+        // The deadline may pass between the deferral check and the fetch; keep the timeout positive so it still applies.
+        var limit = remaining.Value > TimeSpan.Zero ? remaining.Value : TimeSpan.FromMilliseconds(1);
+        return fetchTimeout > TimeSpan.Zero && fetchTimeout < limit ? fetchTimeout : limit;
+    }
+}
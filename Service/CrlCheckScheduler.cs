@@ -0,0 +1,92 @@
+using CrlMonitor.Models;
+
+namespace CrlMonitor.Service;
+
+/// <summary>
+/// Tracks when each CRL is next due, polling near-expiry or failing CRLs often and stable CRLs rarely.
+/// </summary>
+internal sealed class CrlCheckScheduler
+{
+    private const int MaxFailureBackoffDoublings = 2;
+    private readonly ServiceOptions _options;
+    private readonly Dictionary<Uri, ScheduleState> _states = [];
+    private readonly List<CrlConfigEntry> _entries;
+
+    public CrlCheckScheduler(IReadOnlyList<CrlConfigEntry> entries, ServiceOptions options, DateTime utcNow)
+    {
+        ArgumentNullException.ThrowIfNull(entries);
+        ArgumentNullException.ThrowIfNull(options);
+        this._options = options;
+        this._entries = [.. entries];
+        foreach (var entry in this._entries)
+        {
+            this._states[entry.Uri] = new ScheduleState(utcNow, 0);
+        }
+    }
+
+    public DateTime NextDueUtc => this._states.Count == 0 ? DateTime.MaxValue : this._states.Values.Min(state => state.NextCheckUtc);
+
+    public IReadOnlyList<CrlConfigEntry> GetDue(DateTime utcNow)
+    {
+        return this._entries.Where(entry => this._states[entry.Uri].NextCheckUtc <= utcNow).ToList();
+    }
+
+    public DateTime GetNextCheck(Uri uri)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        return this._states[uri].NextCheckUtc;
+    }
+
+    public void Record(CrlConfigEntry entry, CrlCheckResult result, DateTime utcNow)
+    {
+        ArgumentNullException.ThrowIfNull(entry);
+        ArgumentNullException.ThrowIfNull(result);
+
+        var failures = result.Status == CrlStatus.Error ? this._states[entry.Uri].ConsecutiveFailures + 1 : 0;
+        var interval = this.ComputeInterval(entry, result, failures, utcNow);
+        this._states[entry.Uri] = new ScheduleState(utcNow + interval, failures);
+    }
+
+    public int GetConsecutiveFailures(Uri uri)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        return this._states[uri].ConsecutiveFailures;
+    }
+
+    private TimeSpan ComputeInterval(CrlConfigEntry entry, CrlCheckResult result, int failures, DateTime utcNow)
+    {
+        if (failures > 0)
+        {
+            // Retry failing CRLs quickly, easing off slightly during a sustained outage.
+            var backoff = this._options.MinCheckInterval * Math.Pow(2, Math.Min(failures - 1, MaxFailureBackoffDoublings));
+            return Clamp(backoff, this._options.MinCheckInterval, this._options.MaxCheckInterval);
+        }
+
+        if (result.Status is CrlStatus.Expired or CrlStatus.Expiring)
+        {
+            return this._options.MinCheckInterval;
+        }
+
+        var parsed = result.ParsedCrl;
+        if (parsed?.NextUpdate == null)
+        {
+            return this._options.MaxCheckInterval;
+        }
+
+        // Aim to look again halfway to the point where the CRL crosses its expiry threshold,
+        // so the interval shrinks as that point approaches.
+        var window = parsed.NextUpdate.Value - parsed.ThisUpdate;
+        var thresholdUtc = parsed.ThisUpdate + TimeSpan.FromTicks((long)(window.Ticks * entry.ExpiryThreshold));
+        var remaining = thresholdUtc - utcNow;
+        return remaining <= TimeSpan.Zero
+            ? this._options.MinCheckInterval
+            : Clamp(remaining / 2, this._options.MinCheckInterval, this._options.MaxCheckInterval);
+    }
+
+    private static TimeSpan Clamp(TimeSpan value, TimeSpan min, TimeSpan max)
+    {
+        return value < min ? min : value > max ? max : value;
+    }
+
+    private sealed record ScheduleState(DateTime NextCheckUtc, int ConsecutiveFailures);
+}
@@ -0,0 +1,167 @@
+using CrlMonitor.Diagnostics;
+using CrlMonitor.Models;
+using CrlMonitor.Reporting;
+using CrlMonitor.Runner;
+using Serilog;
+
+namespace CrlMonitor.Service;
+
+/// <summary>
+/// Resident mode: re-checks each CRL on its own schedule and runs the reporters on a fixed cadence.
+/// </summary>
+internal sealed class CrlMonitorService(
+    CrlCheckRunner runner,
+    Func<CompositeReporter> reporterFactory,
+    RunOptions options)
+{
+    private readonly CrlCheckRunner _runner = runner ?? throw new ArgumentNullException(nameof(runner));
+    private readonly Func<CompositeReporter> _reporterFactory = reporterFactory ?? throw new ArgumentNullException(nameof(reporterFactory));
+    private readonly RunOptions _options = options ?? throw new ArgumentNullException(nameof(options));
+
+    public async Task RunAsync(CancellationToken cancellationToken)
+    {
+        var serviceOptions = this._options.Service;
+        var entries = this._options.Crls;
+        var scheduler = new CrlCheckScheduler(entries, serviceOptions, DateTime.UtcNow);
+        var latest = new Dictionary<Uri, CrlCheckResult>();
+        var pendingDiagnostics = new List<RunDiagnostics>();
+        var nextReportUtc = DateTime.UtcNow;
+        Log.Information(
+            "Service mode started for {Count} CRLs (check interval {Min}-{Max}, report interval {Report})",
+            entries.Count,
+            serviceOptions.MinCheckInterval,
+            serviceOptions.MaxCheckInterval,
+            serviceOptions.ReportInterval);
+
+        try
+        {
+            while (!cancellationToken.IsCancellationRequested)
+            {
+                var due = scheduler.GetDue(DateTime.UtcNow);
+                if (due.Count > 0)
+                {
+                    var run = await this._runner.RunAsync(
+                        due,
+                        this._options.FetchTimeout,
+                        this._options.MaxParallelFetches,
+                        this._options.MaxParallelProcessing,
+                        cancellationToken).ConfigureAwait(false);
+                    pendingDiagnostics.Add(run.Diagnostics);
+                    for (var index = 0; index < due.Count; index++)
+                    {
+                        var result = run.Results[index];
+                        latest[due[index].Uri] = result;
+                        scheduler.Record(due[index], result, result.CheckedAtUtc);
+                    }
+                }
+
+                // Hold the first report until every CRL has been checked once so it never shows a partial list.
+                if (DateTime.UtcNow >= nextReportUtc && latest.Count == entries.Count)
+                {
+                    var results = entries.Select(entry => latest[entry.Uri]).ToList();
+                    var snapshot = new CrlCheckRun(results, Combine(pendingDiagnostics, results), DateTime.UtcNow);
+                    pendingDiagnostics.Clear();
+                    await this.TryReportAsync(snapshot, cancellationToken).ConfigureAwait(false);
+                    nextReportUtc = DateTime.UtcNow + serviceOptions.ReportInterval;
+                }
+
+                var wakeUtc = latest.Count == entries.Count
+                    ? Min(scheduler.NextDueUtc, nextReportUtc)
+                    : scheduler.NextDueUtc;
+                var delay = wakeUtc - DateTime.UtcNow;
+                if (delay > TimeSpan.Zero)
+                {
+                    await Task.Delay(delay, cancellationToken).ConfigureAwait(false);
+                }
+            }
+        }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+        {
+            // Shutdown requested; fall through to the stop message.
+        }
+
+        Log.Information("Service mode stopped");
+    }
+
+#pragma warning disable CA1031 // A failing reporter must not stop the service loop
+    private async Task TryReportAsync(CrlCheckRun run, CancellationToken cancellationToken)
+    {
+        try
+        {
+            using var reporter = this._reporterFactory();
+            await reporter.ReportAsync(run, cancellationToken).ConfigureAwait(false);
+        }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+        {
+            throw;
+        }
+        catch (Exception ex)
+        {
+            Log.Error(ex, "Reporting failed in service mode: {Message}", ex.Message);
+        }
+    }
+#pragma warning restore CA1031
+
+    /// <summary>
+    /// Merges the warnings raised since the last report. Stage timings are taken from the reported results, so the
+    /// percentiles describe the latest check of every CRL rather than only those checked since the last report.
+    /// </summary>
+    private static RunDiagnostics Combine(IReadOnlyList<RunDiagnostics> runs, IReadOnlyList<CrlCheckResult> results)
+    {
+        var combined = new RunDiagnostics();
+        foreach (var result in results)
+        {
+            combined.RecordStageTimings(result.Timings);
+        }
+
+        foreach (var diagnostics in runs)
+        {
+            foreach (var warning in diagnostics.StateWarnings)
+            {
+                combined.AddStateWarning(warning);
+            }
+
+            foreach (var warning in diagnostics.SignatureWarnings)
+            {
+                combined.AddSignatureWarning(warning);
+            }
+
+            foreach (var warning in diagnostics.ConfigurationWarnings)
+            {
+                combined.AddConfigurationWarning(warning);
+            }
+
+            foreach (var warning in diagnostics.RuntimeWarnings)
+            {
+                combined.AddRuntimeWarning(warning);
+            }
+
+            foreach (var (stage, depth) in diagnostics.QueueDepthPeaks)
+            {
+                combined.RecordQueueDepth(stage, depth);
+            }
+
+            foreach (var (host, count) in diagnostics.FetchRetries)
+            {
+                combined.RecordFetchRetries(host, count);
+            }
+
+            foreach (var (host, count) in diagnostics.HedgedFetches)
+            {
+                combined.RecordHedgedFetches(host, count);
+            }
+
+            foreach (var (host, count) in diagnostics.CircuitRejections)
+            {
+                combined.RecordCircuitRejections(host, count);
+            }
+        }
+
+        return combined;
+    }
+
+    private static DateTime Min(DateTime first, DateTime second)
+    {
+        return first <= second ? first : second;
+    }
+}
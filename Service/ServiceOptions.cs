@@ -0,0 +1,6 @@
+namespace CrlMonitor.Service;
+
+internal sealed record ServiceOptions(
+    TimeSpan MinCheckInterval,
+    TimeSpan MaxCheckInterval,
+    TimeSpan ReportInterval);
@@ -0,0 +1,136 @@
+using CrlMonitor.Diagnostics;
+using CrlMonitor.Models;
+
+namespace CrlMonitor.Sharding;
+
+/// <summary>
+/// Combines the partials of a sharded run into the single run the reporters see. Results come out in configuration
+/// order, as from an unsharded run. A configured CRL that no partial reports (its shard's file is missing or was
+/// written from an older configuration) is reported as an error rather than dropped, so it still shows up in reports
+/// and alerts. Partials generated more than <c>maxPartialAge</c> before the merge are left out with a warning, so a
+/// shard that failed this time is reported as missing rather than with an earlier run's results.
+/// </summary>
+internal static class ShardMerger
+{
+    public static CrlCheckRun Merge(
+        IReadOnlyList<CrlConfigEntry> entries,
+        IReadOnlyList<ShardPartial> partials,
+        DateTime nowUtc,
+        TimeSpan? maxPartialAge = null)
+    {
+        ArgumentNullException.ThrowIfNull(entries);
+        ArgumentNullException.ThrowIfNull(partials);
+        if (partials.Count == 0)
+        {
+            throw new InvalidOperationException("No shard partials found to merge.");
+        }
+
+        var diagnostics = new RunDiagnostics();
+        if (maxPartialAge.HasValue)
+        {
+            var oldest = nowUtc - maxPartialAge.Value;
+            foreach (var stale in partials.Where(partial => partial.Run.GeneratedAtUtc < oldest))
+            {
+                diagnostics.AddRuntimeWarning(FormattableString.Invariant(
+                    $"Ignored partial for shard {stale.Shard} generated at {stale.Run.GeneratedAtUtc:yyyy-MM-dd HH:mm:ss} UTC; it is older than {maxPartialAge.Value.TotalMinutes:F0} minutes."));
+            }
+
+            partials = partials.Where(partial => partial.Run.GeneratedAtUtc >= oldest).ToList();
+            if (partials.Count == 0)
+            {
+                throw new InvalidOperationException(
+                    FormattableString.Invariant($"Every shard partial is older than {maxPartialAge.Value.TotalMinutes:F0} minutes; there are no current results to merge."));
+            }
+        }
+
+        var shardCount = partials[0].Shard.Count;
+        var mismatched = partials.FirstOrDefault(partial => partial.Shard.Count != shardCount);
+        if (mismatched != null)
+        {
+            throw new InvalidOperationException(
+                $"Shard partials disagree on the shard count ({partials[0].Shard} and {mismatched.Shard}); remove the partials of the old split.");
+        }
+
+        var duplicate = partials.GroupBy(partial => partial.Shard.Index).FirstOrDefault(group => group.Count() > 1);
+        if (duplicate != null)
+        {
+            throw new InvalidOperationException(
+                FormattableString.Invariant($"Found more than one partial for shard {duplicate.Key}/{shardCount}."));
+        }
+
+        var received = new HashSet<int>();
+        var byUri = new Dictionary<string, CrlCheckResult>(StringComparer.OrdinalIgnoreCase);
+        foreach (var partial in partials)
+        {
+            _ = received.Add(partial.Shard.Index);
+            CopyWarnings(partial.Run.Diagnostics, diagnostics);
+            foreach (var result in partial.Run.Results)
+            {
+                byUri[result.Uri.ToString()] = result;
+            }
+        }
+
+        for (var index = 1; index <= shardCount; index++)
+        {
+            if (!received.Contains(index))
+            {
+                diagnostics.AddRuntimeWarning(FormattableString.Invariant($"No partial result for shard {index}/{shardCount}."));
+            }
+        }
+
+        var results = new List<CrlCheckResult>(entries.Count);
+        foreach (var entry in entries)
+        {
+            if (!byUri.Remove(entry.Uri.ToString(), out var result))
+            {
+                var shard = ShardSpec.GetShardIndex(entry.Uri, shardCount);
+                result = new CrlCheckResult(
+                    entry.Uri,
+                    CrlStatus.Error,
+                    TimeSpan.Zero,
+                    null,
+                    FormattableString.Invariant($"No result from shard {shard}/{shardCount}."),
+                    null,
+                    null,
+                    null,
+                    nowUtc,
+                    null);
+            }
+
+            diagnostics.RecordStageTimings(result.Timings);
+            results.Add(result);
+        }
+
+        if (byUri.Count > 0)
+        {
+            diagnostics.AddConfigurationWarning(
+                FormattableString.Invariant($"Ignored {byUri.Count} result(s) for CRLs that are no longer configured."));
+        }
+
+        var generatedAtUtc = partials.Max(partial => partial.Run.GeneratedAtUtc);
+        return new CrlCheckRun(results, diagnostics, generatedAtUtc);
+    }
+
+    private static void CopyWarnings(RunDiagnostics source, RunDiagnostics target)
+    {
+        foreach (var warning in source.StateWarnings)
+        {
+            target.AddStateWarning(warning);
+        }
+
+        foreach (var warning in source.SignatureWarnings)
+        {
+            target.AddSignatureWarning(warning);
+        }
+
+        foreach (var warning in source.ConfigurationWarnings)
+        {
+            target.AddConfigurationWarning(warning);
+        }
+
+        foreach (var warning in source.RuntimeWarnings)
+        {
+            target.AddRuntimeWarning(warning);
+        }
+    }
+}
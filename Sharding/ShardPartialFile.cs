@@ -0,0 +1,434 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using CrlMonitor.Crl;
+using CrlMonitor.Diagnostics;
+using CrlMonitor.Models;
+using Serilog;
+
+namespace CrlMonitor.Sharding;
+
+/// <summary>
+/// A shard's results as read back from its partial file, which <see cref="Path"/> names.
+/// </summary>
+internal sealed record ShardPartial(ShardSpec Shard, CrlCheckRun Run, string? Path = null);
+
+/// <summary>
+/// Reads and writes the partial result a shard leaves for <c>--merge</c>: one JSON file per shard, named after it,
+/// holding what the reporters need from each result and the run's warnings. Revoked serials and the raw CRL are not
+/// kept; a result read back carries the revoked count only. Statuses and stage names are written as the display
+/// names the reports use, not enum member names, so the format does not change with obfuscated builds.
+/// </summary>
+internal static partial class ShardPartialFile
+{
+    private const int FormatVersion = 1;
+    private const string FilePattern = "shard-*-of-*.json";
+    private const string TempSuffix = ".tmp";
+
+    /// <summary>
+    /// Writes the partial for <paramref name="shard"/> into <paramref name="directory"/>, replacing the previous one
+    /// through a temp file so a merge never reads half a file.
+    /// </summary>
+    public static async Task<string> WriteAsync(string directory, ShardSpec shard, CrlCheckRun run, CancellationToken cancellationToken)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(directory);
+        ArgumentNullException.ThrowIfNull(shard);
+        ArgumentNullException.ThrowIfNull(run);
+        _ = Directory.CreateDirectory(directory);
+        var path = Path.Combine(directory, shard.PartialFileName);
+        var tempPath = path + TempSuffix;
+        var document = ToDocument(shard, run);
+        using (var stream = new FileStream(tempPath, FileMode.Create, FileAccess.Write, FileShare.None))
+        {
+            await JsonSerializer.SerializeAsync(stream, document, ShardJsonContext.Default.PartialDocument, cancellationToken).ConfigureAwait(false);
+            await stream.FlushAsync(cancellationToken).ConfigureAwait(false);
+        }
+
+        File.Move(tempPath, path, overwrite: true);
+        return path;
+    }
+
+    /// <summary>
+    /// Reads every partial in <paramref name="directory"/>, ordered by shard index.
+    /// </summary>
+    public static async Task<IReadOnlyList<ShardPartial>> ReadAllAsync(string directory, CancellationToken cancellationToken)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(directory);
+        if (!Directory.Exists(directory))
+        {
+            throw new InvalidOperationException($"Shard partial directory '{directory}' not found.");
+        }
+
+        var partials = new List<ShardPartial>();
+        foreach (var path in Directory.EnumerateFiles(directory, FilePattern))
+        {
+            var partial = await ReadAsync(path, cancellationToken).ConfigureAwait(false);
+            if (partial != null)
+            {
+                partials.Add(partial);
+            }
+        }
+
+        return partials.OrderBy(partial => partial.Shard.Index).ToList();
+    }
+
+    /// <summary>
+    /// Deletes the files the partials were read from once they have been merged, so a shard that fails next time
+    /// shows up as missing instead of its old results being reported again.
+    /// </summary>
+    public static void DeleteAll(IEnumerable<ShardPartial> partials)
+    {
+        ArgumentNullException.ThrowIfNull(partials);
+        foreach (var partial in partials)
+        {
+            if (partial.Path == null)
+            {
+                continue;
+            }
+
+            try
+            {
+                File.Delete(partial.Path);
+            }
+            catch (IOException ex)
+            {
+                Log.Warning(ex, "Failed to delete merged shard partial {Path}", partial.Path);
+            }
+            catch (UnauthorizedAccessException ex)
+            {
+                Log.Warning(ex, "Failed to delete merged shard partial {Path}", partial.Path);
+            }
+        }
+    }
+
+    private static async Task<ShardPartial?> ReadAsync(string path, CancellationToken cancellationToken)
+    {
+        PartialDocument? document;
+        try
+        {
+            using var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.Read);
+            document = await JsonSerializer.DeserializeAsync(stream, ShardJsonContext.Default.PartialDocument, cancellationToken).ConfigureAwait(false);
+        }
+        catch (JsonException ex)
+        {
+            throw new InvalidDataException($"Shard partial '{path}' is not valid JSON: {ex.Message}", ex);
+        }
+
+        if (document == null || document.Version != FormatVersion)
+        {
+            Log.Warning("Skipping shard partial {Path}: unsupported format version {Version}", path, document?.Version);
+            return null;
+        }
+
+        ShardSpec shard;
+        try
+        {
+            shard = new ShardSpec(document.ShardIndex, document.ShardCount);
+        }
+        catch (ArgumentOutOfRangeException ex)
+        {
+            throw new InvalidDataException($"Shard partial '{path}' names an invalid shard {document.ShardIndex}/{document.ShardCount}.", ex);
+        }
+
+        var results = (document.Results ?? []).Select(result => FromDocument(result, path)).ToList();
+        return new ShardPartial(shard, new CrlCheckRun(results, FromDocument(document.Warnings), document.GeneratedAtUtc), path);
+    }
+
+    private static PartialDocument ToDocument(ShardSpec shard, CrlCheckRun run)
+    {
+        var diagnostics = run.Diagnostics;
+        return new PartialDocument {
+            Version = FormatVersion,
+            ShardIndex = shard.Index,
+            ShardCount = shard.Count,
+            GeneratedAtUtc = run.GeneratedAtUtc,
+            Results = run.Results.Select(ToDocument).ToList(),
+            Warnings = new WarningsDocument {
+                State = [.. diagnostics.StateWarnings],
+                Signature = [.. diagnostics.SignatureWarnings],
+                Configuration = [.. diagnostics.ConfigurationWarnings],
+                Runtime = [.. diagnostics.RuntimeWarnings]
+            }
+        };
+    }
+
+    private static ResultDocument ToDocument(CrlCheckResult result)
+    {
+        var parsed = result.ParsedCrl;
+        return new ResultDocument {
+            Uri = result.Uri.ToString(),
+            Status = result.Status.ToDisplayString(),
+            Duration = result.Duration,
+            ErrorInfo = result.ErrorInfo,
+            PreviousFetchUtc = result.PreviousFetchUtc,
+            DownloadDuration = result.DownloadDuration,
+            ContentLength = result.ContentLength,
+            CheckedAtUtc = result.CheckedAtUtc,
+            SignatureStatus = result.SignatureStatus,
+            CacheHit = result.CacheHit,
+            BytesSaved = result.BytesSaved,
+            TimeToFirstByte = result.TimeToFirstByte,
+            ConnectionReused = result.ConnectionReused,
+            NewRevocations = result.RevocationChanges?.AddedCount,
+            RemovedRevocations = result.RevocationChanges?.RemovedCount,
+            Timings = ToDocument(result.Timings),
+            Crl = parsed == null
+                ? null
+                : new CrlDocument {
+                    Issuer = parsed.Issuer,
+                    ThisUpdate = parsed.ThisUpdate,
+                    NextUpdate = parsed.NextUpdate,
+                    RevokedCount = parsed.RevokedSerialNumbers.EntryCount,
+                    IsDelta = parsed.IsDelta,
+                    SignatureStatus = parsed.SignatureStatus,
+                    SignatureError = parsed.SignatureError
+                }
+        };
+    }
+
+    private static CrlCheckResult FromDocument(ResultDocument document, string path)
+    {
+        if (string.IsNullOrWhiteSpace(document.Uri) || !Uri.TryCreate(document.Uri, UriKind.Absolute, out var uri))
+        {
+            throw new InvalidDataException($"Shard partial '{path}' contains an invalid uri '{document.Uri}'.");
+        }
+
+        var status = ParseStatus(document.Status) ??
+            throw new InvalidDataException($"Shard partial '{path}' contains an unknown status '{document.Status}' for {uri}.");
+        var crl = document.Crl;
+        var parsed = crl == null
+            ? null
+            : new ParsedCrl(
+                crl.Issuer ?? string.Empty,
+                crl.ThisUpdate,
+                crl.NextUpdate,
+                RevokedSerialCollection.CountOnly(crl.RevokedCount),
+                crl.IsDelta,
+                crl.SignatureStatus ?? string.Empty,
+                crl.SignatureError);
+        var changes = document.NewRevocations.HasValue || document.RemovedRevocations.HasValue
+            ? new RevocationDiff(
+                RevokedSerialCollection.CountOnly(document.NewRevocations ?? 0),
+                RevokedSerialCollection.CountOnly(document.RemovedRevocations ?? 0))
+            : null;
+        return new CrlCheckResult(
+            uri,
+            status,
+            document.Duration,
+            parsed,
+            document.ErrorInfo,
+            document.PreviousFetchUtc,
+            document.DownloadDuration,
+            document.ContentLength,
+            document.CheckedAtUtc,
+            document.SignatureStatus,
+            document.CacheHit,
+            document.BytesSaved,
+            document.TimeToFirstByte,
+            document.ConnectionReused,
+            changes,
+            FromDocument(document.Timings));
+    }
+
+    private static CrlStatus? ParseStatus(string? value)
+    {
+        foreach (var status in Enum.GetValues<CrlStatus>())
+        {
+            if (string.Equals(status.ToDisplayString(), value, StringComparison.Ordinal))
+            {
+                return status;
+            }
+        }
+
+        return null;
+    }
+
+    private static Dictionary<string, TimeSpan>? ToDocument(CrlStageTimings? timings)
+    {
+        if (timings == null)
+        {
+            return null;
+        }
+
+        var stages = new Dictionary<string, TimeSpan>(StringComparer.Ordinal);
+        foreach (var stage in Enum.GetValues<CrlTimingStage>())
+        {
+            var duration = timings.Get(stage);
+            if (duration.HasValue)
+            {
+                stages[CrlMonitorMetrics.GetStageName(stage)] = duration.Value;
+            }
+        }
+
+        return stages;
+    }
+
+    private static CrlStageTimings? FromDocument(Dictionary<string, TimeSpan>? stages)
+    {
+        if (stages == null)
+        {
+            return null;
+        }
+
+        TimeSpan? Get(CrlTimingStage stage)
+        {
+            return stages.TryGetValue(CrlMonitorMetrics.GetStageName(stage), out var duration) ? duration : null;
+        }
+
+        return new CrlStageTimings(
+            Get(CrlTimingStage.Dns),
+            Get(CrlTimingStage.Connect),
+            Get(CrlTimingStage.Tls),
+            Get(CrlTimingStage.Wait),
+            Get(CrlTimingStage.Transfer),
+            Get(CrlTimingStage.Parse),
+            Get(CrlTimingStage.Verify),
+            Get(CrlTimingStage.Health),
+            Get(CrlTimingStage.StateWrite));
+    }
+
+    private static RunDiagnostics FromDocument(WarningsDocument? warnings)
+    {
+        var diagnostics = new RunDiagnostics();
+        foreach (var warning in warnings?.State ?? [])
+        {
+            diagnostics.AddStateWarning(warning);
+        }
+
+        foreach (var warning in warnings?.Signature ?? [])
+        {
+            diagnostics.AddSignatureWarning(warning);
+        }
+
+        foreach (var warning in warnings?.Configuration ?? [])
+        {
+            diagnostics.AddConfigurationWarning(warning);
+        }
+
+        foreach (var warning in warnings?.Runtime ?? [])
+        {
+            diagnostics.AddRuntimeWarning(warning);
+        }
+
+        return diagnostics;
+    }
+
+    [JsonSourceGenerationOptions(DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull)]
+    [JsonSerializable(typeof(PartialDocument))]
+    private sealed partial class ShardJsonContext : JsonSerializerContext
+    {
+    }
+
+    private sealed class PartialDocument
+    {
+        [JsonPropertyName("version")]
+        public int Version { get; init; }
+
+        [JsonPropertyName("shard_index")]
+        public int ShardIndex { get; init; }
+
+        [JsonPropertyName("shard_count")]
+        public int ShardCount { get; init; }
+
+        [JsonPropertyName("generated_at_utc")]
+        public DateTime GeneratedAtUtc { get; init; }
+
+        [JsonPropertyName("results")]
+        public List<ResultDocument>? Results { get; init; }
+
+        [JsonPropertyName("warnings")]
+        public WarningsDocument? Warnings { get; init; }
+    }
+
+    private sealed class WarningsDocument
+    {
+        [JsonPropertyName("state")]
+        public List<string>? State { get; init; }
+
+        [JsonPropertyName("signature")]
+        public List<string>? Signature { get; init; }
+
+        [JsonPropertyName("configuration")]
+        public List<string>? Configuration { get; init; }
+
+        [JsonPropertyName("runtime")]
+        public List<string>? Runtime { get; init; }
+    }
+
+    private sealed class ResultDocument
+    {
+        [JsonPropertyName("uri")]
+        public string? Uri { get; init; }
+
+        [JsonPropertyName("status")]
+        public string? Status { get; init; }
+
+        [JsonPropertyName("duration")]
+        public TimeSpan Duration { get; init; }
+
+        [JsonPropertyName("error")]
+        public string? ErrorInfo { get; init; }
+
+        [JsonPropertyName("previous_fetch_utc")]
+        public DateTime? PreviousFetchUtc { get; init; }
+
+        [JsonPropertyName("download_duration")]
+        public TimeSpan? DownloadDuration { get; init; }
+
+        [JsonPropertyName("content_length")]
+        public long? ContentLength { get; init; }
+
+        [JsonPropertyName("checked_at_utc")]
+        public DateTime CheckedAtUtc { get; init; }
+
+        [JsonPropertyName("signature")]
+        public string? SignatureStatus { get; init; }
+
+        [JsonPropertyName("cache_hit")]
+        public bool CacheHit { get; init; }
+
+        [JsonPropertyName("bytes_saved")]
+        public long BytesSaved { get; init; }
+
+        [JsonPropertyName("time_to_first_byte")]
+        public TimeSpan? TimeToFirstByte { get; init; }
+
+        [JsonPropertyName("connection_reused")]
+        public bool? ConnectionReused { get; init; }
+
+        [JsonPropertyName("new_revocations")]
+        public int? NewRevocations { get; init; }
+
+        [JsonPropertyName("removed_revocations")]
+        public int? RemovedRevocations { get; init; }
+
+        [JsonPropertyName("timings")]
+        public Dictionary<string, TimeSpan>? Timings { get; init; }
+
+        [JsonPropertyName("crl")]
+        public CrlDocument? Crl { get; init; }
+    }
+
+    private sealed class CrlDocument
+    {
+        [JsonPropertyName("issuer")]
+        public string? Issuer { get; init; }
+
+        [JsonPropertyName("this_update_utc")]
+        public DateTime ThisUpdate { get; init; }
+
+        [JsonPropertyName("next_update_utc")]
+        public DateTime? NextUpdate { get; init; }
+
+        [JsonPropertyName("revoked_count")]
+        public int RevokedCount { get; init; }
+
+        [JsonPropertyName("is_delta")]
+        public bool IsDelta { get; init; }
+
+        [JsonPropertyName("signature_status")]
+        public string? SignatureStatus { get; init; }
+
+        [JsonPropertyName("signature_error")]
+        public string? SignatureError { get; init; }
+    }
+}
@@ -0,0 +1,79 @@
+using System.Buffers.Binary;
+using System.Globalization;
+using System.Security.Cryptography;
+using System.Text;
+
+namespace CrlMonitor.Sharding;
+
+/// <summary>
+/// One slice of the CRL inventory, written <c>index/count</c> with a 1-based index. A CRL belongs to the shard picked
+/// by the SHA-256 of its URI, so every node running the same configuration agrees on the split without coordinating,
+/// and adding or removing one CRL does not move the others.
+/// </summary>
+internal sealed record ShardSpec
+{
+    public const int MaxCount = 1024;
+
+    public ShardSpec(int index, int count)
+    {
+        ArgumentOutOfRangeException.ThrowIfLessThan(count, 1);
+        ArgumentOutOfRangeException.ThrowIfGreaterThan(count, MaxCount);
+        ArgumentOutOfRangeException.ThrowIfLessThan(index, 1);
+        ArgumentOutOfRangeException.ThrowIfGreaterThan(index, count);
+        this.Index = index;
+        this.Count = count;
+    }
+
+    public int Index { get; }
+
+    public int Count { get; }
+
+    /// <summary>
+    /// Name of the partial result file this shard writes.
+    /// </summary>
+    public string PartialFileName => FormattableString.Invariant($"shard-{this.Index}-of-{this.Count}.json");
+
+    public static ShardSpec Parse(string value)
+    {
+        ArgumentNullException.ThrowIfNull(value);
+        var separator = value.IndexOf('/', StringComparison.Ordinal);
+        return separator > 0 &&
+            int.TryParse(value.AsSpan(0, separator), NumberStyles.None, CultureInfo.InvariantCulture, out var index) &&
+            int.TryParse(value.AsSpan(separator + 1), NumberStyles.None, CultureInfo.InvariantCulture, out var count) &&
+            count is >= 1 and <= MaxCount &&
+            index >= 1 && index <= count
+            ? new ShardSpec(index, count)
+            : throw new InvalidOperationException(
+                FormattableString.Invariant($"Invalid shard '{value}'. Use index/count with 1 <= index <= count <= {MaxCount}, for example 2/4."));
+    }
+
+    /// <summary>
+    /// Gets the 1-based shard that checks <paramref name="uri"/> when the inventory is split <paramref name="count"/> ways.
+    /// </summary>
+    public static int GetShardIndex(Uri uri, int count)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        ArgumentOutOfRangeException.ThrowIfLessThan(count, 1);
+        var hash = SHA256.HashData(Encoding.UTF8.GetBytes(uri.ToString()));
+        return (int)(BinaryPrimitives.ReadUInt64BigEndian(hash) % (ulong)count) + 1;
+    }
+
+    public bool Contains(Uri uri)
+    {
+        return GetShardIndex(uri, this.Count) == this.Index;
+    }
+
+    /// <summary>
+    /// Keeps the entries of this shard, in configuration order.
+    /// </summary>
+    public IReadOnlyList<CrlConfigEntry> Select(IReadOnlyList<CrlConfigEntry> entries)
+    {
+        ArgumentNullException.ThrowIfNull(entries);
+        return entries.Where(entry => this.Contains(entry.Uri)).ToList();
+    }
+
+    public override string ToString()
+    {
+        return FormattableString.Invariant($"{this.Index}/{this.Count}");
+    }
+}
@@ -0,0 +1,13 @@
+namespace CrlMonitor.State;
+
+/// <summary>
+/// What earlier runs recorded about one CRL. <see cref="ThisUpdate"/> and <see cref="NextUpdate"/> come from the last
+/// CRL that was downloaded and parsed; either may be missing for a CRL that was never parsed or has no next update.
+/// </summary>
+internal sealed record CrlHistory(DateTime? LastFetchUtc, DateTime? ThisUpdate, DateTime? NextUpdate, DateTime? LastFailureUtc)
+{
+    /// <summary>
+    /// True when the most recent check of the CRL failed.
+    /// </summary>
+    public bool LastCheckFailed => this.LastFailureUtc.HasValue && (!this.LastFetchUtc.HasValue || this.LastFailureUtc >= this.LastFetchUtc);
+}
@@ -0,0 +1,172 @@
+using System.Security.Cryptography;
+using System.Text;
+using CrlMonitor.Runner;
+using Serilog;
+
+namespace CrlMonitor.State;
+
+/// <summary>
+/// Memo store that keeps parsed CRLs and their signature outcomes in a directory next to the state file, so separate
+/// runs skip decoding and verifying CRLs whose content has not changed. Each entry is one file named by the SHA-256 of
+/// its memo key (content hash plus CA identity); the oldest files are deleted once the directory grows beyond the
+/// size budget. Entries read or written by this process are also kept in an in-memory <see cref="CrlMemoStore"/>
+/// with the same budget.
+/// </summary>
+internal sealed class FileCrlMemoStore : ICrlMemoStore
+{
+    private const string DirectorySuffix = ".memo";
+    private const string MemoExtension = ".memo";
+    private const string TempExtension = ".tmp";
+    private const int StreamBufferSize = 64 * 1024;
+    private readonly string _directory;
+    private readonly long _capacityBytes;
+    private readonly CrlMemoStore _memory;
+    private readonly object _evictionSync = new();
+
+    public FileCrlMemoStore(string directory, long capacityBytes)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(directory);
+        ArgumentOutOfRangeException.ThrowIfNegativeOrZero(capacityBytes);
+        this._directory = Path.GetFullPath(directory);
+        this._capacityBytes = capacityBytes;
+        this._memory = new CrlMemoStore(capacityBytes);
+    }
+
+    /// <summary>
+    /// Creates the store used alongside <paramref name="stateFilePath"/>.
+    /// </summary>
+    public static FileCrlMemoStore ForStateFile(string stateFilePath, long capacityBytes)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(stateFilePath);
+        return new FileCrlMemoStore(Path.GetFullPath(stateFilePath) + DirectorySuffix, capacityBytes);
+    }
+
+    public bool TryGet(string key, out CrlMemoEntry? entry)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(key);
+        if (this._memory.TryGet(key, out entry))
+        {
+            return true;
+        }
+
+        var path = this.GetPath(key);
+        try
+        {
+            if (!File.Exists(path))
+            {
+                return false;
+            }
+
+            long length;
+            using (var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.Read, StreamBufferSize, FileOptions.SequentialScan))
+            {
+                length = stream.Length;
+                entry = CrlMemoEntry.ReadSnapshot(stream);
+            }
+
+            // The write time doubles as the recency used for eviction.
+            File.SetLastWriteTimeUtc(path, DateTime.UtcNow);
+            this._memory.Add(key, entry, length);
+            return true;
+        }
+        catch (IOException ex)
+        {
+            // Covers a truncated file too (EndOfStreamException); the CRL is simply parsed again.
+            Log.Warning(ex, "Failed to read memoised CRL {Path}: {Message}", path, ex.Message);
+        }
+        catch (InvalidDataException ex)
+        {
+            Log.Warning(ex, "Ignored unreadable memoised CRL {Path}: {Message}", path, ex.Message);
+            TryDelete(path);
+        }
+        catch (UnauthorizedAccessException ex)
+        {
+            Log.Warning(ex, "Failed to read memoised CRL {Path}: {Message}", path, ex.Message);
+        }
+
+        entry = null;
+        return false;
+    }
+
+    public void Add(string key, CrlMemoEntry entry, long sizeBytes)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(key);
+        ArgumentNullException.ThrowIfNull(entry);
+        ArgumentOutOfRangeException.ThrowIfNegative(sizeBytes);
+        this._memory.Add(key, entry, sizeBytes);
+
+        var path = this.GetPath(key);
+        // A unique temp name keeps concurrent writers of the same key from sharing a file.
+        var tempPath = string.Concat(path, ".", Path.GetRandomFileName(), TempExtension);
+        try
+        {
+            _ = Directory.CreateDirectory(this._directory);
+            using (var stream = new FileStream(tempPath, FileMode.Create, FileAccess.Write, FileShare.None, StreamBufferSize))
+            {
+                entry.WriteSnapshot(stream);
+            }
+
+            File.Move(tempPath, path, overwrite: true);
+            this.Evict();
+        }
+        catch (IOException ex)
+        {
+            // The entry is still memoised in memory; the next run just parses the CRL again.
+            Log.Warning(ex, "Failed to save memoised CRL {Path}: {Message}", path, ex.Message);
+            TryDelete(tempPath);
+        }
+        catch (UnauthorizedAccessException ex)
+        {
+            Log.Warning(ex, "Failed to save memoised CRL {Path}: {Message}", path, ex.Message);
+            TryDelete(tempPath);
+        }
+    }
+
+    /// <summary>
+    /// Deletes the least recently used files until the directory fits the size budget. This only runs after a memo
+    /// miss, which has just paid for a full parse, so scanning the directory is cheap by comparison.
+    /// </summary>
+    private void Evict()
+    {
+        lock (this._evictionSync)
+        {
+            var files = new DirectoryInfo(this._directory)
+                .EnumerateFiles("*" + MemoExtension)
+                .OrderByDescending(file => file.LastWriteTimeUtc)
+                .ToList();
+            long total = 0;
+            foreach (var file in files)
+            {
+                if (total + file.Length > this._capacityBytes)
+                {
+                    TryDelete(file.FullName);
+                    continue;
+                }
+
+                total += file.Length;
+            }
+        }
+    }
+
+    private static void TryDelete(string path)
+    {
+        try
+        {
+            File.Delete(path);
+        }
+        catch (IOException ex)
+        {
+            Log.Warning(ex, "Failed to delete memoised CRL {Path}: {Message}", path, ex.Message);
+        }
+        catch (UnauthorizedAccessException ex)
+        {
+            Log.Warning(ex, "Failed to delete memoised CRL {Path}: {Message}", path, ex.Message);
+        }
+    }
+
+    private string GetPath(string key)
+    {
+        var hash = SHA256.HashData(Encoding.UTF8.GetBytes(key));
+        return Path.Combine(this._directory, Convert.ToHexString(hash) + MemoExtension);
+    }
+}
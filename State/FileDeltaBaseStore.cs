@@ -0,0 +1,69 @@
+using System.Security.Cryptography;
+using System.Text;
+using CrlMonitor.Runner;
+
+namespace CrlMonitor.State;
+
+/// <summary>
+/// Stores the parsed base CRL of each delta-monitored entry in a directory next to the state file, one file per base
+/// URI named by the SHA-256 of the URI. Each file is written to a temp file and renamed into place so a crash never
+/// leaves a truncated base behind.
+/// </summary>
+internal sealed class FileDeltaBaseStore : IDeltaBaseStore
+{
+    private const string DirectorySuffix = ".bases";
+    private const string BaseExtension = ".base";
+    private const string TempSuffix = ".tmp";
+    private const int StreamBufferSize = 64 * 1024;
+    private readonly string _directory;
+
+    public FileDeltaBaseStore(string directory)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(directory);
+        this._directory = Path.GetFullPath(directory);
+    }
+
+    /// <summary>
+    /// Creates the store used alongside <paramref name="stateFilePath"/>, so shards with their own state files keep
+    /// their own bases.
+    /// </summary>
+    public static FileDeltaBaseStore ForStateFile(string stateFilePath)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(stateFilePath);
+        return new FileDeltaBaseStore(Path.GetFullPath(stateFilePath) + DirectorySuffix);
+    }
+
+    public CrlMemoEntry? Load(Uri uri)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        var path = this.GetPath(uri);
+        if (!File.Exists(path))
+        {
+            return null;
+        }
+
+        using var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.Read, StreamBufferSize, FileOptions.SequentialScan);
+        return CrlMemoEntry.ReadSnapshot(stream);
+    }
+
+    public void Save(Uri uri, CrlMemoEntry entry)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        ArgumentNullException.ThrowIfNull(entry);
+        _ = Directory.CreateDirectory(this._directory);
+        var path = this.GetPath(uri);
+        var tempPath = path + TempSuffix;
+        using (var stream = new FileStream(tempPath, FileMode.Create, FileAccess.Write, FileShare.None, StreamBufferSize))
+        {
+            entry.WriteSnapshot(stream);
+        }
+
+        File.Move(tempPath, path, overwrite: true);
+    }
+
+    private string GetPath(Uri uri)
+    {
+        var hash = SHA256.HashData(Encoding.UTF8.GetBytes(uri.ToString()));
+        return Path.Combine(this._directory, Convert.ToHexString(hash) + BaseExtension);
+    }
+}
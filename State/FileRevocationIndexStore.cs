@@ -0,0 +1,94 @@
+using CrlMonitor.Crl;
+using CrlMonitor.Models;
+
+namespace CrlMonitor.State;
+
+/// <summary>
+/// Writes the revocation index to a single file. The latest serials of each monitored CRL are kept in memory so a
+/// service cycle that checks only some CRLs still publishes a complete index; on first use they are seeded from the
+/// existing file. The index is written to a temp file and renamed into place so readers never see a partial index.
+/// </summary>
+internal sealed class FileRevocationIndexStore : IRevocationIndexStore
+{
+    private const string TempSuffix = ".tmp";
+    private const int StreamBufferSize = 64 * 1024;
+    private readonly string _path;
+    private readonly HashSet<Uri> _monitoredUris;
+    private readonly Dictionary<Uri, RevocationIndexEntry> _entries = [];
+    private readonly object _sync = new();
+    private bool _seeded;
+
+    public FileRevocationIndexStore(string path, IEnumerable<Uri> monitoredUris)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(path);
+        ArgumentNullException.ThrowIfNull(monitoredUris);
+        this._path = Path.GetFullPath(path);
+        this._monitoredUris = [.. monitoredUris];
+    }
+
+    // The index is written synchronously: it is a single local file produced once per run.
+    public Task UpdateAsync(IReadOnlyList<CrlCheckResult> results, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(results);
+        cancellationToken.ThrowIfCancellationRequested();
+        lock (this._sync)
+        {
+            if (!this._seeded)
+            {
+                this.Seed();
+                this._seeded = true;
+            }
+
+            foreach (var result in results)
+            {
+                var parsed = result.ParsedCrl;
+                if (parsed != null && parsed.RevokedSerialNumbers.SerialsRetained)
+                {
+                    this._entries[result.Uri] = new RevocationIndexEntry(parsed.Issuer, result.Uri, parsed.ThisUpdate, parsed.RevokedSerialNumbers);
+                }
+            }
+
+            var directory = Path.GetDirectoryName(this._path);
+            if (!string.IsNullOrEmpty(directory))
+            {
+                _ = Directory.CreateDirectory(directory);
+            }
+
+            var tempPath = this._path + TempSuffix;
+            using (var stream = new FileStream(tempPath, FileMode.Create, FileAccess.Write, FileShare.None, StreamBufferSize))
+            {
+                RevocationIndex.Write(stream, this._entries.Values, DateTime.UtcNow);
+            }
+
+            File.Move(tempPath, this._path, overwrite: true);
+        }
+
+        return Task.CompletedTask;
+    }
+
+    private void Seed()
+    {
+        if (!File.Exists(this._path))
+        {
+            return;
+        }
+
+        try
+        {
+            using var index = RevocationIndex.Open(this._path);
+            for (var position = 0; position < index.Crls.Count; position++)
+            {
+                var crl = index.Crls[position];
+                if (this._monitoredUris.Contains(crl.CrlUri))
+                {
+                    this._entries[crl.CrlUri] = new RevocationIndexEntry(crl.Issuer, crl.CrlUri, crl.ThisUpdate, index.ReadSerials(position));
+                }
+            }
+        }
+        catch (InvalidDataException)
+        {
+            // An unreadable index is simply rebuilt from this run's results.
+            this._entries.Clear();
+        }
+    }
+}
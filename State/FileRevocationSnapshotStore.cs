@@ -0,0 +1,62 @@
+using System.Security.Cryptography;
+using System.Text;
+using CrlMonitor.Crl;
+
+namespace CrlMonitor.State;
+
+/// <summary>
+/// Stores one binary snapshot per CRL URI in a directory, named by the SHA-256 of the URI. Each snapshot is written to
+/// a temp file and renamed into place so a crash never leaves a truncated snapshot behind.
+/// </summary>
+internal sealed class FileRevocationSnapshotStore : IRevocationSnapshotStore
+{
+    private const string SnapshotExtension = ".serials";
+    private const string TempSuffix = ".tmp";
+    private const int StreamBufferSize = 64 * 1024;
+    private readonly string _directory;
+
+    public FileRevocationSnapshotStore(string directory)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(directory);
+        this._directory = Path.GetFullPath(directory);
+    }
+
+    // Snapshots are read and written synchronously: the runner calls these from its CPU-bound processing workers and
+    // the files are local, so async file I/O would only add overhead.
+    public Task<RevokedSerialCollection?> LoadAsync(Uri uri, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        cancellationToken.ThrowIfCancellationRequested();
+        var path = this.GetPath(uri);
+        if (!File.Exists(path))
+        {
+            return Task.FromResult<RevokedSerialCollection?>(null);
+        }
+
+        using var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.Read, StreamBufferSize, FileOptions.SequentialScan);
+        return Task.FromResult<RevokedSerialCollection?>(RevokedSerialCollection.ReadSnapshot(stream));
+    }
+
+    public Task SaveAsync(Uri uri, RevokedSerialCollection serials, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        ArgumentNullException.ThrowIfNull(serials);
+        cancellationToken.ThrowIfCancellationRequested();
+        _ = Directory.CreateDirectory(this._directory);
+        var path = this.GetPath(uri);
+        var tempPath = path + TempSuffix;
+        using (var stream = new FileStream(tempPath, FileMode.Create, FileAccess.Write, FileShare.None, StreamBufferSize))
+        {
+            serials.WriteSnapshot(stream);
+        }
+
+        File.Move(tempPath, path, overwrite: true);
+        return Task.CompletedTask;
+    }
+
+    private string GetPath(Uri uri)
+    {
+        var hash = SHA256.HashData(Encoding.UTF8.GetBytes(uri.ToString()));
+        return Path.Combine(this._directory, Convert.ToHexString(hash) + SnapshotExtension);
+    }
+}
@@ -1,21 +1,48 @@
 using System.Text.Json;
 using System.Text.Json.Serialization;
+using Serilog;
 
 namespace CrlMonitor.State;
 
-internal sealed class FileStateStore : IStateStore, IDisposable
+/// <summary>
+/// State store that loads the snapshot once, serves lookups from memory and records changes in an append-only
+/// journal next to the snapshot. The journal is folded back into the snapshot (temp file + rename) once it grows
+/// past <see cref="CompactionThreshold"/> entries and when the store is disposed. Both files are read and written with
+/// a source-generated serializer.
+/// </summary>
+/// <remarks>
+/// Every load, append and compaction holds an exclusive lock on a <c>.lock</c> file beside the snapshot, and compaction
+/// rebuilds the snapshot from the files rather than from memory, so several processes sharing one state file do not
+/// overwrite each other's updates. The journal is only open while the lock is held.
+/// </remarks>
+internal sealed partial class FileStateStore : IStateStore, IDisposable
 {
+    private const int CompactionThreshold = 256;
+    private const string JournalSuffix = ".journal";
+    private const string TempSuffix = ".tmp";
+    private const string LockSuffix = ".lock";
+    private const int LockAttempts = 400;
+    private static readonly TimeSpan LockRetryDelay = TimeSpan.FromMilliseconds(25);
+    private const string LastFetchEntry = "last_fetch";
+    private const string AlertCooldownEntry = "alert_cooldown";
+    private const string LastReportSentEntry = "last_report_sent";
+    private const string ThisUpdateEntry = "this_update";
+    private const string NextUpdateEntry = "next_update";
+    private const string LastFailureEntry = "last_failure";
     private readonly string _filePath;
+    private readonly string _journalPath;
+    private readonly string _lockPath;
     private readonly SemaphoreSlim _gate = new(1, 1);
-    private static readonly JsonSerializerOptions SerializerOptions = new() {
-        PropertyNameCaseInsensitive = true,
-        WriteIndented = false
-    };
+    private StateDocument? _state;
+    private int _journalEntries;
+    private bool _disposed;
 
     public FileStateStore(string filePath)
     {
         ArgumentException.ThrowIfNullOrWhiteSpace(filePath);
         this._filePath = Path.GetFullPath(filePath);
+        this._journalPath = this._filePath + JournalSuffix;
+        this._lockPath = this._filePath + LockSuffix;
     }
 
     public async Task<DateTime?> GetLastFetchAsync(Uri uri, CancellationToken cancellationToken)
@@ -24,7 +51,7 @@ internal sealed class FileStateStore : IStateStore, IDisposable
         await this._gate.WaitAsync(cancellationToken).ConfigureAwait(false);
         try
         {
-            var state = await this.ReadStateAsync(cancellationToken).ConfigureAwait(false);
+            var state = await this.EnsureLoadedAsync(cancellationToken).ConfigureAwait(false);
             return state.LastFetch.TryGetValue(uri.ToString(), out var value) ? value : null;
         }
         finally
@@ -33,16 +60,20 @@ internal sealed class FileStateStore : IStateStore, IDisposable
         }
     }
 
-    public async Task SaveLastFetchAsync(Uri uri, DateTime fetchedAtUtc, CancellationToken cancellationToken)
+    public Task SaveLastFetchAsync(Uri uri, DateTime fetchedAtUtc, CancellationToken cancellationToken)
     {
         ArgumentNullException.ThrowIfNull(uri);
         var normalized = DateTime.SpecifyKind(fetchedAtUtc, DateTimeKind.Utc);
+        return this.MutateAsync([new JournalEntry(LastFetchEntry, uri.ToString(), normalized)], cancellationToken);
+    }
+
+    public async Task<DateTime?> GetLastReportSentAsync(CancellationToken cancellationToken)
+    {
         await this._gate.WaitAsync(cancellationToken).ConfigureAwait(false);
         try
         {
-            var state = await this.ReadStateAsync(cancellationToken).ConfigureAwait(false);
-            state.LastFetch[uri.ToString()] = normalized;
-            await this.WriteStateAsync(state, cancellationToken).ConfigureAwait(false);
+            var state = await this.EnsureLoadedAsync(cancellationToken).ConfigureAwait(false);
+            return state.LastReportSentUtc;
         }
         finally
         {
@@ -50,13 +81,20 @@ internal sealed class FileStateStore : IStateStore, IDisposable
         }
     }
 
-    public async Task<DateTime?> GetLastReportSentAsync(CancellationToken cancellationToken)
+    public Task SaveLastReportSentAsync(DateTime sentAtUtc, CancellationToken cancellationToken)
+    {
+        var normalized = DateTime.SpecifyKind(sentAtUtc, DateTimeKind.Utc);
+        return this.MutateAsync([new JournalEntry(LastReportSentEntry, null, normalized)], cancellationToken);
+    }
+
+    public async Task<DateTime?> GetAlertCooldownAsync(string key, CancellationToken cancellationToken)
     {
+        ArgumentException.ThrowIfNullOrWhiteSpace(key);
         await this._gate.WaitAsync(cancellationToken).ConfigureAwait(false);
         try
         {
-            var state = await this.ReadStateAsync(cancellationToken).ConfigureAwait(false);
-            return state.LastReportSentUtc;
+            var state = await this.EnsureLoadedAsync(cancellationToken).ConfigureAwait(false);
+            return state.AlertCooldowns.TryGetValue(key, out var timestamp) ? timestamp : null;
         }
         finally
         {
@@ -64,15 +102,30 @@ internal sealed class FileStateStore : IStateStore, IDisposable
         }
     }
 
-    public async Task SaveLastReportSentAsync(DateTime sentAtUtc, CancellationToken cancellationToken)
+    public Task SaveAlertCooldownAsync(string key, DateTime triggeredAtUtc, CancellationToken cancellationToken)
     {
-        var normalized = DateTime.SpecifyKind(sentAtUtc, DateTimeKind.Utc);
+        ArgumentException.ThrowIfNullOrWhiteSpace(key);
+        var normalized = DateTime.SpecifyKind(triggeredAtUtc, DateTimeKind.Utc);
+        return this.MutateAsync([new JournalEntry(AlertCooldownEntry, key, normalized)], cancellationToken);
+    }
+
+    public async Task<IReadOnlyDictionary<Uri, DateTime>> GetLastFetchesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(uris);
         await this._gate.WaitAsync(cancellationToken).ConfigureAwait(false);
         try
         {
-            var state = await this.ReadStateAsync(cancellationToken).ConfigureAwait(false);
-            state.LastReportSentUtc = normalized;
-            await this.WriteStateAsync(state, cancellationToken).ConfigureAwait(false);
+            var state = await this.EnsureLoadedAsync(cancellationToken).ConfigureAwait(false);
+            var found = new Dictionary<Uri, DateTime>(uris.Count);
+            foreach (var uri in uris)
+            {
+                if (state.LastFetch.TryGetValue(uri.ToString(), out var value))
+                {
+                    found[uri] = value;
+                }
+            }
+
+            return found;
         }
         finally
         {
@@ -80,14 +133,29 @@ internal sealed class FileStateStore : IStateStore, IDisposable
         }
     }
 
-    public async Task<DateTime?> GetAlertCooldownAsync(string key, CancellationToken cancellationToken)
+    public async Task<IReadOnlyDictionary<Uri, CrlHistory>> GetCrlHistoriesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken)
     {
-        ArgumentException.ThrowIfNullOrWhiteSpace(key);
+        ArgumentNullException.ThrowIfNull(uris);
         await this._gate.WaitAsync(cancellationToken).ConfigureAwait(false);
         try
         {
-            var state = await this.ReadStateAsync(cancellationToken).ConfigureAwait(false);
-            return state.AlertCooldowns.TryGetValue(key, out var timestamp) ? timestamp : null;
+            var state = await this.EnsureLoadedAsync(cancellationToken).ConfigureAwait(false);
+            var found = new Dictionary<Uri, CrlHistory>(uris.Count);
+            foreach (var uri in uris)
+            {
+                var key = uri.ToString();
+                var history = new CrlHistory(
+                    Find(state.LastFetch, key),
+                    Find(state.ThisUpdates, key),
+                    Find(state.NextUpdates, key),
+                    Find(state.LastFailures, key));
+                if (history.LastFetchUtc.HasValue || history.ThisUpdate.HasValue || history.LastFailureUtc.HasValue)
+                {
+                    found[uri] = history;
+                }
+            }
+
+            return found;
         }
         finally
         {
@@ -95,16 +163,28 @@ internal sealed class FileStateStore : IStateStore, IDisposable
         }
     }
 
-    public async Task SaveAlertCooldownAsync(string key, DateTime triggeredAtUtc, CancellationToken cancellationToken)
+    private static DateTime? Find(Dictionary<string, DateTime> values, string key)
     {
-        ArgumentException.ThrowIfNullOrWhiteSpace(key);
-        var normalized = DateTime.SpecifyKind(triggeredAtUtc, DateTimeKind.Utc);
+        return values.TryGetValue(key, out var value) ? value : null;
+    }
+
+    public async Task<IReadOnlyDictionary<string, DateTime>> GetAlertCooldownsAsync(IReadOnlyCollection<string> keys, CancellationToken cancellationToken)
+    {
+        ArgumentNullException.ThrowIfNull(keys);
         await this._gate.WaitAsync(cancellationToken).ConfigureAwait(false);
         try
         {
-            var state = await this.ReadStateAsync(cancellationToken).ConfigureAwait(false);
-            state.AlertCooldowns[key] = normalized;
-            await this.WriteStateAsync(state, cancellationToken).ConfigureAwait(false);
+            var state = await this.EnsureLoadedAsync(cancellationToken).ConfigureAwait(false);
+            var found = new Dictionary<string, DateTime>(keys.Count, StringComparer.OrdinalIgnoreCase);
+            foreach (var key in keys)
+            {
+                if (state.AlertCooldowns.TryGetValue(key, out var timestamp))
+                {
+                    found[key] = timestamp;
+                }
+            }
+
+            return found;
         }
         finally
         {
@@ -112,14 +192,126 @@ internal sealed class FileStateStore : IStateStore, IDisposable
         }
     }
 
-    private async Task<StateDocument> ReadStateAsync(CancellationToken cancellationToken)
+    public Task SaveBatchAsync(StateBatch batch, CancellationToken cancellationToken)
     {
-        if (!File.Exists(this._filePath))
+        ArgumentNullException.ThrowIfNull(batch);
+        var entries = new List<JournalEntry>(batch.Count);
+        foreach (var (uri, fetchedAtUtc) in batch.LastFetches)
         {
-            return new StateDocument();
+            entries.Add(new JournalEntry(LastFetchEntry, uri.ToString(), DateTime.SpecifyKind(fetchedAtUtc, DateTimeKind.Utc)));
         }
 
-        var json = await File.ReadAllTextAsync(this._filePath, cancellationToken).ConfigureAwait(false);
+        foreach (var (key, triggeredAtUtc) in batch.AlertCooldowns)
+        {
+            entries.Add(new JournalEntry(AlertCooldownEntry, key, DateTime.SpecifyKind(triggeredAtUtc, DateTimeKind.Utc)));
+        }
+
+        foreach (var (uri, thisUpdate) in batch.ThisUpdates)
+        {
+            // A CRL that no longer carries a next update clears the one recorded before, stored as MaxValue.
+            var nextUpdate = batch.NextUpdates.TryGetValue(uri, out var value) ? value : DateTime.MaxValue;
+            entries.Add(new JournalEntry(ThisUpdateEntry, uri.ToString(), DateTime.SpecifyKind(thisUpdate, DateTimeKind.Utc)));
+            entries.Add(new JournalEntry(NextUpdateEntry, uri.ToString(), DateTime.SpecifyKind(nextUpdate, DateTimeKind.Utc)));
+        }
+
+        foreach (var (uri, failedAtUtc) in batch.LastFailures)
+        {
+            entries.Add(new JournalEntry(LastFailureEntry, uri.ToString(), DateTime.SpecifyKind(failedAtUtc, DateTimeKind.Utc)));
+        }
+
+        if (batch.LastReportSentUtc.HasValue)
+        {
+            entries.Add(new JournalEntry(LastReportSentEntry, null, DateTime.SpecifyKind(batch.LastReportSentUtc.Value, DateTimeKind.Utc)));
+        }
+
+        return entries.Count == 0 ? Task.CompletedTask : this.MutateAsync(entries, cancellationToken);
+    }
+
+    private async Task MutateAsync(IReadOnlyList<JournalEntry> entries, CancellationToken cancellationToken)
+    {
+        await this._gate.WaitAsync(cancellationToken).ConfigureAwait(false);
+        try
+        {
+            using var fileLock = await this.AcquireFileLockAsync(cancellationToken).ConfigureAwait(false);
+            var state = await this.LoadLockedAsync(cancellationToken).ConfigureAwait(false);
+
+            // The first write creates the snapshot outright so the state file always exists once anything is saved.
+            // A batch that would take the journal past the threshold is folded straight into the snapshot instead.
+            // Either way the entries reach memory only once they are on disk, so a failed write leaves no trace.
+            if (!File.Exists(this._filePath) || this._journalEntries + entries.Count >= CompactionThreshold)
+            {
+                // Another process may have written since this one loaded, so the snapshot is rebuilt from the files.
+                var (current, _) = await this.ReadFromDiskAsync(cancellationToken).ConfigureAwait(false);
+                ApplyAll(current, entries);
+                await this.CompactAsync(current, cancellationToken).ConfigureAwait(false);
+                this._state = current;
+            }
+            else
+            {
+                await this.AppendJournalAsync(entries, cancellationToken).ConfigureAwait(false);
+                ApplyAll(state, entries);
+            }
+        }
+        finally
+        {
+            _ = this._gate.Release();
+        }
+    }
+
+    private async Task<StateDocument> EnsureLoadedAsync(CancellationToken cancellationToken)
+    {
+        if (this._state != null)
+        {
+            return this._state;
+        }
+
+        // The lock keeps another process's compaction from deleting the journal between reading the snapshot and
+        // replaying it.
+        using var fileLock = await this.AcquireFileLockAsync(cancellationToken).ConfigureAwait(false);
+        return await this.LoadLockedAsync(cancellationToken).ConfigureAwait(false);
+    }
+
+    private async Task<StateDocument> LoadLockedAsync(CancellationToken cancellationToken)
+    {
+        if (this._state != null)
+        {
+            return this._state;
+        }
+
+        var (state, journalEntries) = await this.ReadFromDiskAsync(cancellationToken).ConfigureAwait(false);
+        this._journalEntries = journalEntries;
+        this._state = state;
+        return state;
+    }
+
+    private async Task<(StateDocument State, int JournalEntries)> ReadFromDiskAsync(CancellationToken cancellationToken)
+    {
+        var json = File.Exists(this._filePath)
+            ? await File.ReadAllTextAsync(this._filePath, cancellationToken).ConfigureAwait(false)
+            : null;
+        var lines = File.Exists(this._journalPath)
+            ? await File.ReadAllLinesAsync(this._journalPath, cancellationToken).ConfigureAwait(false)
+            : Array.Empty<string>();
+        return BuildState(json, lines);
+    }
+
+    private (StateDocument State, int JournalEntries) ReadFromDisk()
+    {
+        var json = File.Exists(this._filePath) ? File.ReadAllText(this._filePath) : null;
+        var lines = File.Exists(this._journalPath) ? File.ReadAllLines(this._journalPath) : Array.Empty<string>();
+        return BuildState(json, lines);
+    }
+
+    private static (StateDocument State, int JournalEntries) BuildState(string? json, string[] journalLines)
+    {
+        var state = ParseState(json);
+        var journalEntries = ReplayJournal(state, journalLines);
+        state.Normalize();
+        return (state, journalEntries);
+    }
+
+    private static StateDocument ParseState(string? json)
+    {
         if (string.IsNullOrWhiteSpace(json))
         {
             return new StateDocument();
@@ -127,7 +319,7 @@ internal sealed class FileStateStore : IStateStore, IDisposable
 
         try
         {
-            var state = JsonSerializer.Deserialize<StateDocument>(json, SerializerOptions) ?? new StateDocument();
+            var state = JsonSerializer.Deserialize(json, StateJsonContext.Default.StateDocument) ?? new StateDocument();
             state.Normalize();
             return state;
         }
@@ -138,30 +330,296 @@ internal sealed class FileStateStore : IStateStore, IDisposable
         }
     }
 
-    private async Task WriteStateAsync(StateDocument state, CancellationToken cancellationToken)
+    private static int ReplayJournal(StateDocument state, string[] lines)
+    {
+        var applied = 0;
+        foreach (var line in lines)
+        {
+            if (string.IsNullOrWhiteSpace(line))
+            {
+                continue;
+            }
+
+            try
+            {
+                var entry = JsonSerializer.Deserialize(line, StateJsonContext.Default.JournalEntry);
+                if (entry != null)
+                {
+                    Apply(state, entry);
+                    applied++;
+                }
+            }
+            catch (JsonException)
+            {
+                // A torn final line from an interrupted write is skipped; earlier entries still apply.
+            }
+        }
+
+        return applied;
+    }
+
+    private static void Apply(StateDocument state, JournalEntry entry)
+    {
+        switch (entry.Type)
+        {
+            case LastFetchEntry when !string.IsNullOrWhiteSpace(entry.Key):
+                state.LastFetch[entry.Key] = entry.Value;
+                break;
+            case AlertCooldownEntry when !string.IsNullOrWhiteSpace(entry.Key):
+                state.AlertCooldowns[entry.Key] = entry.Value;
+                break;
+            case LastReportSentEntry:
+                state.LastReportSentUtc = entry.Value;
+                break;
+            case ThisUpdateEntry when !string.IsNullOrWhiteSpace(entry.Key):
+                state.ThisUpdates[entry.Key] = entry.Value;
+                break;
+            case NextUpdateEntry when !string.IsNullOrWhiteSpace(entry.Key):
+                if (entry.Value == DateTime.MaxValue)
+                {
+                    _ = state.NextUpdates.Remove(entry.Key);
+                }
+                else
+                {
+                    state.NextUpdates[entry.Key] = entry.Value;
+                }
+
+                break;
+            case LastFailureEntry when !string.IsNullOrWhiteSpace(entry.Key):
+                state.LastFailures[entry.Key] = entry.Value;
+                break;
+            default:
+                break;
+        }
+    }
+
+    private async Task AppendJournalAsync(IReadOnlyList<JournalEntry> entries, CancellationToken cancellationToken)
+    {
+        // Other processes append to and delete the journal too, so it is only kept open under the file lock.
+        using var journal = this.OpenJournal();
+
+        // All lines of a batch go out in one write and one flush; a torn tail only loses the lines it cut.
+        var lines = SerializeJournalLines(entries);
+        await journal.WriteAsync(lines, cancellationToken).ConfigureAwait(false);
+        await journal.FlushAsync(cancellationToken).ConfigureAwait(false);
+        this._journalEntries += entries.Count;
+    }
+
+    private FileStream OpenJournal()
+    {
+        var journal = new FileStream(this._journalPath, FileMode.OpenOrCreate, FileAccess.ReadWrite, FileShare.Read);
+        try
+        {
+            var end = FindLastCompleteLine(journal);
+            if (end != journal.Length)
+            {
+                // A crash mid-append leaves a partial last line. Appending straight after it would glue the next entry
+                // onto the fragment and lose both, so the journal is cut back to its last complete line first.
+                Log.Warning("Discarded incomplete last line of state journal {Path}", this._journalPath);
+                journal.SetLength(end);
+            }
+
+            journal.Position = end;
+            return journal;
+        }
+        catch
+        {
+            journal.Dispose();
+            throw;
+        }
+    }
+
+    private static long FindLastCompleteLine(FileStream journal)
+    {
+        var buffer = new byte[4096];
+        var end = journal.Length;
+        while (end > 0)
+        {
+            var start = Math.Max(0, end - buffer.Length);
+            var count = (int)(end - start);
+            journal.Position = start;
+            journal.ReadExactly(buffer, 0, count);
+            var newline = buffer.AsSpan(0, count).LastIndexOf((byte)'\n');
+            if (newline >= 0)
+            {
+                return start + newline + 1;
+            }
+
+            end = start;
+        }
+
+        return 0;
+    }
+
+    private static byte[] SerializeJournalLines(IReadOnlyList<JournalEntry> entries)
+    {
+        using var buffer = new MemoryStream();
+        foreach (var entry in entries)
+        {
+            JsonSerializer.Serialize(buffer, entry, StateJsonContext.Default.JournalEntry);
+            buffer.WriteByte((byte)'\n');
+        }
+
+        return buffer.ToArray();
+    }
+
+    private static void ApplyAll(StateDocument state, IReadOnlyList<JournalEntry> entries)
+    {
+        foreach (var entry in entries)
+        {
+            Apply(state, entry);
+        }
+    }
+
+    private async Task CompactAsync(StateDocument state, CancellationToken cancellationToken)
+    {
+        var tempPath = this.PrepareSnapshotTarget();
+        using (var stream = new FileStream(tempPath, FileMode.Create, FileAccess.Write, FileShare.None))
+        {
+            await JsonSerializer.SerializeAsync(stream, state, StateJsonContext.Default.StateDocument, cancellationToken).ConfigureAwait(false);
+
+            // The journal is deleted once the snapshot is renamed into place, so the snapshot must be on disk first.
+            stream.Flush(flushToDisk: true);
+        }
+
+        this.CommitSnapshot(tempPath);
+    }
+
+    private void Compact(StateDocument state)
+    {
+        var tempPath = this.PrepareSnapshotTarget();
+        using (var stream = new FileStream(tempPath, FileMode.Create, FileAccess.Write, FileShare.None))
+        {
+            JsonSerializer.Serialize(stream, state, StateJsonContext.Default.StateDocument);
+            stream.Flush(flushToDisk: true);
+        }
+
+        this.CommitSnapshot(tempPath);
+    }
+
+    private string PrepareSnapshotTarget()
+    {
+        this.EnsureDirectory();
+        return this._filePath + TempSuffix;
+    }
+
+    private void EnsureDirectory()
     {
         var directory = Path.GetDirectoryName(this._filePath);
         if (!string.IsNullOrEmpty(directory))
         {
             _ = Directory.CreateDirectory(directory);
         }
+    }
+
+    private async Task<FileStream> AcquireFileLockAsync(CancellationToken cancellationToken)
+    {
+        for (var attempt = 1; ; attempt++)
+        {
+            try
+            {
+                return this.OpenLockFile();
+            }
+            catch (IOException) when (attempt < LockAttempts)
+            {
+                // Another process (or store instance) holds the lock; its critical sections are short.
+                await Task.Delay(LockRetryDelay, cancellationToken).ConfigureAwait(false);
+            }
+        }
+    }
+
+    private FileStream AcquireFileLock()
+    {
+        for (var attempt = 1; ; attempt++)
+        {
+            try
+            {
+                return this.OpenLockFile();
+            }
+            catch (IOException) when (attempt < LockAttempts)
+            {
+                Thread.Sleep(LockRetryDelay);
+            }
+        }
+    }
+
+    private FileStream OpenLockFile()
+    {
+        this.EnsureDirectory();
+
+        // FileShare.None is an exclusive lock on Windows and an flock on Unix, so it excludes other processes and
+        // other store instances alike. The file is left in place; deleting it would race with the next opener.
+        return new FileStream(this._lockPath, FileMode.OpenOrCreate, FileAccess.ReadWrite, FileShare.None);
+    }
+
+    private void CommitSnapshot(string tempPath)
+    {
+        // Rename is atomic on the same volume, so readers see either the old or the new snapshot, never a partial one.
+        File.Move(tempPath, this._filePath, overwrite: true);
+        if (File.Exists(this._journalPath))
+        {
+            File.Delete(this._journalPath);
+        }
 
-        using var stream = new FileStream(this._filePath, FileMode.Create, FileAccess.Write, FileShare.None);
-        await JsonSerializer.SerializeAsync(stream, state, SerializerOptions, cancellationToken).ConfigureAwait(false);
-        await stream.FlushAsync(cancellationToken).ConfigureAwait(false);
+        this._journalEntries = 0;
     }
 
     public void Dispose()
     {
-        this._gate.Dispose();
+        if (this._disposed)
+        {
+            return;
+        }
+
+        this._disposed = true;
+        this._gate.Wait();
+        try
+        {
+            if (this._state != null && this._journalEntries > 0)
+            {
+                // Rebuilt from the files, not from memory, so updates from other processes since the load survive.
+                using var fileLock = this.AcquireFileLock();
+                var (current, _) = this.ReadFromDisk();
+                this.Compact(current);
+            }
+        }
+        catch (IOException ex)
+        {
+            // The journal is left in place and replayed on the next load.
+            Log.Warning(ex, "Failed to compact state journal {Path}: {Message}", this._journalPath, ex.Message);
+        }
+        catch (UnauthorizedAccessException ex)
+        {
+            Log.Warning(ex, "Failed to compact state journal {Path}: {Message}", this._journalPath, ex.Message);
+        }
+        finally
+        {
+            _ = this._gate.Release();
+            this._gate.Dispose();
+        }
     }
 
+    [JsonSourceGenerationOptions(PropertyNameCaseInsensitive = true)]
+    [JsonSerializable(typeof(StateDocument))]
+    [JsonSerializable(typeof(JournalEntry))]
+    private sealed partial class StateJsonContext : JsonSerializerContext
+    {
+    }
+
+    private sealed record JournalEntry(
+        [property: JsonPropertyName("type")] string Type,
+        [property: JsonPropertyName("key")] string? Key,
+        [property: JsonPropertyName("value")] DateTime Value);
+
     private sealed class StateDocument
     {
         public StateDocument()
         {
             this.LastFetch = new Dictionary<string, DateTime>(StringComparer.OrdinalIgnoreCase);
             this.AlertCooldowns = new Dictionary<string, DateTime>(StringComparer.OrdinalIgnoreCase);
+            this.ThisUpdates = new Dictionary<string, DateTime>(StringComparer.OrdinalIgnoreCase);
+            this.NextUpdates = new Dictionary<string, DateTime>(StringComparer.OrdinalIgnoreCase);
+            this.LastFailures = new Dictionary<string, DateTime>(StringComparer.OrdinalIgnoreCase);
         }
 
         [JsonPropertyName("last_fetch")]
@@ -170,6 +628,15 @@ internal sealed class FileStateStore : IStateStore, IDisposable
         [JsonPropertyName("alert_cooldowns")]
         public Dictionary<string, DateTime> AlertCooldowns { get; set; }
 
+        [JsonPropertyName("this_update")]
+        public Dictionary<string, DateTime> ThisUpdates { get; set; }
+
+        [JsonPropertyName("next_update")]
+        public Dictionary<string, DateTime> NextUpdates { get; set; }
+
+        [JsonPropertyName("last_failure")]
+        public Dictionary<string, DateTime> LastFailures { get; set; }
+
         [JsonPropertyName("last_report_sent_utc")]
         public DateTime? LastReportSentUtc { get; set; }
 
@@ -181,9 +648,21 @@ internal sealed class FileStateStore : IStateStore, IDisposable
             this.AlertCooldowns = this.AlertCooldowns != null
                 ? new Dictionary<string, DateTime>(this.AlertCooldowns, StringComparer.OrdinalIgnoreCase)
                 : new Dictionary<string, DateTime>(StringComparer.OrdinalIgnoreCase);
+            this.ThisUpdates = this.ThisUpdates != null
+                ? new Dictionary<string, DateTime>(this.ThisUpdates, StringComparer.OrdinalIgnoreCase)
+                : new Dictionary<string, DateTime>(StringComparer.OrdinalIgnoreCase);
+            this.NextUpdates = this.NextUpdates != null
+                ? new Dictionary<string, DateTime>(this.NextUpdates, StringComparer.OrdinalIgnoreCase)
+                : new Dictionary<string, DateTime>(StringComparer.OrdinalIgnoreCase);
+            this.LastFailures = this.LastFailures != null
+                ? new Dictionary<string, DateTime>(this.LastFailures, StringComparer.OrdinalIgnoreCase)
+                : new Dictionary<string, DateTime>(StringComparer.OrdinalIgnoreCase);
 
             NormalizeDictionary(this.LastFetch);
             NormalizeDictionary(this.AlertCooldowns);
+            NormalizeDictionary(this.ThisUpdates);
+            NormalizeDictionary(this.NextUpdates);
+            NormalizeDictionary(this.LastFailures);
             if (this.LastReportSentUtc.HasValue)
             {
                 this.LastReportSentUtc = NormalizeDateTime(this.LastReportSentUtc.Value);
@@ -0,0 +1,15 @@
+using CrlMonitor.Models;
+
+namespace CrlMonitor.State;
+
+/// <summary>
+/// Maintains the on-disk revoked serial index that answers serial lookups without fetching or parsing CRLs.
+/// </summary>
+internal interface IRevocationIndexStore
+{
+    /// <summary>
+    /// Replaces the indexed serials of every CRL parsed in <paramref name="results"/>. CRLs that failed keep their
+    /// previously indexed serials.
+    /// </summary>
+    Task UpdateAsync(IReadOnlyList<CrlCheckResult> results, CancellationToken cancellationToken);
+}
@@ -0,0 +1,13 @@
+using CrlMonitor.Crl;
+
+namespace CrlMonitor.State;
+
+/// <summary>
+/// Persists the revoked serial set last seen for each CRL so the next check can report what changed.
+/// </summary>
+internal interface IRevocationSnapshotStore
+{
+    Task<RevokedSerialCollection?> LoadAsync(Uri uri, CancellationToken cancellationToken);
+
+    Task SaveAsync(Uri uri, RevokedSerialCollection serials, CancellationToken cancellationToken);
+}
@@ -13,4 +13,25 @@ internal interface IStateStore
     Task<DateTime?> GetAlertCooldownAsync(string key, CancellationToken cancellationToken);
 
     Task SaveAlertCooldownAsync(string key, DateTime triggeredAtUtc, CancellationToken cancellationToken);
+
+    /// <summary>
+    /// Reads the last fetch time of every given CRL in one state access. CRLs that were never fetched are left out.
+    /// </summary>
+    Task<IReadOnlyDictionary<Uri, DateTime>> GetLastFetchesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken);
+
+    /// <summary>
+    /// Reads the cooldown timestamp of every given alert key in one state access. Keys never triggered are left out.
+    /// </summary>
+    Task<IReadOnlyDictionary<string, DateTime>> GetAlertCooldownsAsync(IReadOnlyCollection<string> keys, CancellationToken cancellationToken);
+
+    /// <summary>
+    /// Reads the fetch, validity and failure history of every given CRL in one state access. CRLs with nothing
+    /// recorded are left out.
+    /// </summary>
+    Task<IReadOnlyDictionary<Uri, CrlHistory>> GetCrlHistoriesAsync(IReadOnlyCollection<Uri> uris, CancellationToken cancellationToken);
+
+    /// <summary>
+    /// Writes every change in the batch as a single state update.
+    /// </summary>
+    Task SaveBatchAsync(StateBatch batch, CancellationToken cancellationToken);
 }
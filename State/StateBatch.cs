@@ -0,0 +1,97 @@
+namespace CrlMonitor.State;
+
+/// <summary>
+/// State changes collected over a run and written to the store in one operation by <see cref="CommitAsync"/>.
+/// </summary>
+/// <remarks>
+/// A later change to the same key replaces the earlier one. Instances are not thread-safe; each run or reporter
+/// keeps its own batch and records into it from one task at a time.
+/// </remarks>
+internal sealed class StateBatch(IStateStore store)
+{
+    private readonly IStateStore _store = store ?? throw new ArgumentNullException(nameof(store));
+    private readonly Dictionary<Uri, DateTime> _lastFetches = [];
+    private readonly Dictionary<string, DateTime> _alertCooldowns = new(StringComparer.OrdinalIgnoreCase);
+    private readonly Dictionary<Uri, DateTime> _thisUpdates = [];
+    private readonly Dictionary<Uri, DateTime> _nextUpdates = [];
+    private readonly Dictionary<Uri, DateTime> _lastFailures = [];
+
+    public IReadOnlyDictionary<Uri, DateTime> LastFetches => this._lastFetches;
+
+    public IReadOnlyDictionary<Uri, DateTime> ThisUpdates => this._thisUpdates;
+
+    public IReadOnlyDictionary<Uri, DateTime> NextUpdates => this._nextUpdates;
+
+    public IReadOnlyDictionary<Uri, DateTime> LastFailures => this._lastFailures;
+
+    public IReadOnlyDictionary<string, DateTime> AlertCooldowns => this._alertCooldowns;
+
+    public DateTime? LastReportSentUtc { get; private set; }
+
+    /// <summary>
+    /// Number of pending changes.
+    /// </summary>
+    public int Count =>
+        this._lastFetches.Count + this._alertCooldowns.Count + this._thisUpdates.Count + this._nextUpdates.Count +
+        this._lastFailures.Count + (this.LastReportSentUtc.HasValue ? 1 : 0);
+
+    public void SetLastFetch(Uri uri, DateTime fetchedAtUtc)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        this._lastFetches[uri] = fetchedAtUtc;
+    }
+
+    /// <summary>
+    /// Records the validity window of the CRL just parsed. A CRL without a next update only records its this update.
+    /// </summary>
+    public void SetValidity(Uri uri, DateTime thisUpdate, DateTime? nextUpdate)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        this._thisUpdates[uri] = thisUpdate;
+        if (nextUpdate.HasValue)
+        {
+            this._nextUpdates[uri] = nextUpdate.Value;
+        }
+        else
+        {
+            _ = this._nextUpdates.Remove(uri);
+        }
+    }
+
+    public void SetLastFailure(Uri uri, DateTime failedAtUtc)
+    {
+        ArgumentNullException.ThrowIfNull(uri);
+        this._lastFailures[uri] = failedAtUtc;
+    }
+
+    public void SetAlertCooldown(string key, DateTime triggeredAtUtc)
+    {
+        ArgumentException.ThrowIfNullOrWhiteSpace(key);
+        this._alertCooldowns[key] = triggeredAtUtc;
+    }
+
+    public void SetLastReportSent(DateTime sentAtUtc)
+    {
+        this.LastReportSentUtc = sentAtUtc;
+    }
+
+    /// <summary>
+    /// Writes the pending changes and clears the batch. Nothing is written when the batch is empty, and the changes
+    /// are kept when the write fails so the caller may retry.
+    /// </summary>
+    public async Task CommitAsync(CancellationToken cancellationToken)
+    {
+        if (this.Count == 0)
+        {
+            return;
+        }
+
+        await this._store.SaveBatchAsync(this, cancellationToken).ConfigureAwait(false);
+        this._lastFetches.Clear();
+        this._alertCooldowns.Clear();
+        this._thisUpdates.Clear();
+        this._nextUpdates.Clear();
+        this._lastFailures.Clear();
+        this.LastReportSentUtc = null;
+    }
+}
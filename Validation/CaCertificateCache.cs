@@ -0,0 +1,75 @@
+using System.Collections.Concurrent;
+using Org.BouncyCastle.X509;
+
+namespace CrlMonitor.Validation;
+
+/// <summary>
+/// Process-wide cache of parsed CA certificates and their public keys, keyed by file path.
+/// Entries are reused while the file length and last write time are unchanged and reloaded otherwise.
+/// </summary>
+internal sealed class CaCertificateCache
+{
+    private readonly ConcurrentDictionary<string, CaCertificateFile> _files = new(StringComparer.Ordinal);
+    private readonly object _loadSync = new();
+    private int _loadCount;
+
+    /// <summary>
+    /// Number of times a CA file has been read and parsed; exposed for diagnostics and tests.
+    /// </summary>
+    public int LoadCount => Volatile.Read(ref this._loadCount);
+
+    /// <summary>
+    /// Returns the certificates held in <paramref name="file"/>, parsing the file only when it is new or has changed.
+    /// </summary>
+    /// <exception cref="IOException">The file could not be read.</exception>
+    public IReadOnlyList<CaKey> GetKeys(FileInfo file)
+    {
+        ArgumentNullException.ThrowIfNull(file);
+        var path = file.FullName;
+        var length = file.Length;
+        var lastWriteTicks = file.LastWriteTimeUtc.Ticks;
+        if (this._files.TryGetValue(path, out var cached) && cached.Matches(length, lastWriteTicks))
+        {
+            return cached.Keys;
+        }
+
+        lock (this._loadSync)
+        {
+            if (this._files.TryGetValue(path, out cached) && cached.Matches(length, lastWriteTicks))
+            {
+                return cached.Keys;
+            }
+
+            var loaded = new CaCertificateFile(length, lastWriteTicks, Load(path));
+            this._files[path] = loaded;
+            _ = Interlocked.Increment(ref this._loadCount);
+            return loaded.Keys;
+        }
+    }
+
+    private static List<CaKey> Load(string path)
+    {
+        var parser = new X509CertificateParser();
+        var certificates = parser.ReadCertificates(File.ReadAllBytes(path));
+        var keys = new List<CaKey>(certificates?.Count ?? 0);
+        if (certificates == null)
+        {
+            return keys;
+        }
+
+        foreach (var certificate in certificates)
+        {
+            keys.Add(new CaKey(certificate, certificate.GetPublicKey()));
+        }
+
+        return keys;
+    }
+
+    private sealed record CaCertificateFile(long Length, long LastWriteTicks, IReadOnlyList<CaKey> Keys)
+    {
+        public bool Matches(long length, long lastWriteTicks)
+        {
+            return this.Length == length && this.LastWriteTicks == lastWriteTicks;
+        }
+    }
+}
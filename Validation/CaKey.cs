@@ -0,0 +1,9 @@
+using Org.BouncyCastle.Crypto;
+using Org.BouncyCastle.X509;
+
+namespace CrlMonitor.Validation;
+
+/// <summary>
+/// A parsed CA certificate together with its decoded public key.
+/// </summary>
+internal sealed record CaKey(X509Certificate Certificate, AsymmetricKeyParameter PublicKey);
@@ -4,11 +4,14 @@ using Serilog;
 
 namespace CrlMonitor.Validation;
 
-internal sealed class CrlSignatureValidator : ICrlSignatureValidator
+internal sealed class CrlSignatureValidator(CaCertificateCache? certificateCache = null, string? caBundlePath = null) : ICrlSignatureValidator
 {
     private const long MaxCaCertificateBytes = 200 * 1024;
+    internal const long MaxCaBundleBytes = 10 * 1024 * 1024;
+    private readonly CaCertificateCache _certificateCache = certificateCache ?? new CaCertificateCache();
+    private readonly string? _caBundlePath = string.IsNullOrWhiteSpace(caBundlePath) ? null : Path.GetFullPath(caBundlePath);
 
-    public SignatureValidationResult Validate(ParsedCrl parsedCrl, CrlConfigEntry entry)
+    public SignatureValidationResult Validate(ParsedCrl parsedCrl, X509Crl? crl, CrlConfigEntry entry)
     {
         ArgumentNullException.ThrowIfNull(parsedCrl);
         ArgumentNullException.ThrowIfNull(entry);
@@ -18,46 +21,92 @@ internal sealed class CrlSignatureValidator : ICrlSignatureValidator
             return SignatureValidationResult.Skipped("Signature validation disabled.");
         }
 
-        if (string.IsNullOrWhiteSpace(entry.CaCertificatePath))
+        if (crl == null)
+        {
+            return SignatureValidationResult.Skipped("CRL content not available.");
+        }
+
+        var caPath = string.IsNullOrWhiteSpace(entry.CaCertificatePath) ? this._caBundlePath : entry.CaCertificatePath;
+        if (string.IsNullOrWhiteSpace(caPath))
         {
             return SignatureValidationResult.Failure("CA certificate path not specified.");
         }
 
-        if (!File.Exists(entry.CaCertificatePath))
+        var fileInfo = new FileInfo(caPath);
+        if (!fileInfo.Exists)
         {
             return SignatureValidationResult.Failure("CA certificate file not found.");
         }
 
-        var fileInfo = new FileInfo(entry.CaCertificatePath);
-        if (fileInfo.Length > MaxCaCertificateBytes)
+        var isBundle = string.Equals(fileInfo.FullName, this._caBundlePath, StringComparison.Ordinal);
+        if (!isBundle && fileInfo.Length > MaxCaCertificateBytes)
         {
             return SignatureValidationResult.Skipped("CA certificate exceeds 200 KB limit.");
         }
 
+        if (isBundle && fileInfo.Length > MaxCaBundleBytes)
+        {
+            return SignatureValidationResult.Skipped("CA bundle exceeds 10 MB limit.");
+        }
+
         try
         {
-            var parser = new X509CertificateParser();
-            var cert = parser.ReadCertificate(File.ReadAllBytes(entry.CaCertificatePath));
-            if (cert == null)
+            var keys = this._certificateCache.GetKeys(fileInfo);
+            if (keys.Count == 0)
             {
-                Log.Error("CA certificate parsing failed for {CertPath}. File may be malformed or not in PEM/DER format.", entry.CaCertificatePath);
+                Log.Error("CA certificate parsing failed for {CertPath}. File may be malformed or not in PEM/DER format.", caPath);
                 return SignatureValidationResult.Failure("CA certificate could not be parsed. Ensure file is valid PEM or DER format.");
             }
 
-            parsedCrl.RawCrl.Verify(cert.GetPublicKey());
-            return SignatureValidationResult.Valid();
+            var candidates = SelectCandidates(keys, crl, isBundle);
+            return candidates.Count == 0
+                ? SignatureValidationResult.Failure($"No certificate in the CA bundle matches issuer {parsedCrl.Issuer}.")
+                : Verify(crl, candidates);
         }
-        catch (Org.BouncyCastle.Security.InvalidKeyException ex)
+        catch (Org.BouncyCastle.Security.Certificates.CertificateException ex)
         {
-            return SignatureValidationResult.Invalid(ex.Message);
-        }
-        catch (Org.BouncyCastle.Security.Certificates.CrlException ex)
-        {
-            return SignatureValidationResult.Invalid(ex.Message);
+            Log.Error(ex, "CA certificate parsing failed for {CertPath}.", caPath);
+            return SignatureValidationResult.Failure("CA certificate could not be parsed. Ensure file is valid PEM or DER format.");
         }
         catch (IOException ex)
         {
             return SignatureValidationResult.Failure(ex.Message);
         }
     }
+
+    private static List<CaKey> SelectCandidates(IReadOnlyList<CaKey> keys, X509Crl crl, bool isBundle)
+    {
+        if (keys.Count == 1 && !isBundle)
+        {
+            // A dedicated CA file is trusted as configured, whatever its subject says.
+            return [keys[0]];
+        }
+
+        var matching = keys.Where(key => key.Certificate.SubjectDN.Equivalent(crl.IssuerDN)).ToList();
+        return matching.Count > 0 || isBundle ? matching : [.. keys];
+    }
+
+    private static SignatureValidationResult Verify(X509Crl crl, List<CaKey> candidates)
+    {
+        // Re-keyed or cross-signed issuers can share a subject, so every candidate is tried before reporting failure.
+        string? lastError = null;
+        foreach (var candidate in candidates)
+        {
+            try
+            {
+                crl.Verify(candidate.PublicKey);
+                return SignatureValidationResult.Valid();
+            }
+            catch (Org.BouncyCastle.Security.InvalidKeyException ex)
+            {
+                lastError = ex.Message;
+            }
+            catch (Org.BouncyCastle.Security.Certificates.CrlException ex)
+            {
+                lastError = ex.Message;
+            }
+        }
+
+        return SignatureValidationResult.Invalid(lastError ?? "CRL signature could not be verified.");
+    }
 }
@@ -1,8 +1,9 @@
 using CrlMonitor.Crl;
+using Org.BouncyCastle.X509;
 
 namespace CrlMonitor.Validation;
 
 internal interface ICrlSignatureValidator
 {
-    SignatureValidationResult Validate(ParsedCrl parsedCrl, CrlConfigEntry entry);
+    SignatureValidationResult Validate(ParsedCrl parsedCrl, X509Crl? crl, CrlConfigEntry entry);
 }
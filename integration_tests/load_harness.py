@@ -0,0 +1,555 @@
+"""Load harness: serves thousands of synthetic CRLs over HTTP and a minimal LDAP stand-in, drives the real
+CrlMonitor binary against them and records wall-clock time, peak RSS and per-URI timings.
+
+Stdlib only. CRLs carry a dummy signature and are configured with signature_validation_mode "none", so the
+harness needs no crypto library; parsing, fetching and reporting are exercised exactly as in production.
+"""
+
+import argparse
+import csv
+import json
+import random
+import re
+import shutil
+import socket
+import socketserver
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional, cast
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+LDAP_BASE_DN = "o=LoadTest"
+LDAP_CRL_ATTRIBUTE = "certificateRevocationList;binary"
+CHUNK_SIZE = 16 * 1024
+
+
+@dataclass
+class ServeProfile:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    bandwidth_kbps: float = 0.0
+    error_rate: float = 0.0
+    seed: int = 1
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    def delay_seconds(self) -> float:
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms > 0 else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000.0
+
+    def should_fail(self) -> bool:
+        if self.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+
+@dataclass
+class CrlCatalogue:
+    """Maps CRL numbers to payloads. Only one payload per size is generated and shared across numbers."""
+
+    sizes: list[int]
+    payloads: dict[int, bytes] = field(default_factory=dict)
+
+    def build(self) -> None:
+        for size in sorted(set(self.sizes)):
+            self.payloads[size] = build_crl(size)
+
+    def payload_for(self, number: int) -> bytes:
+        return self.payloads[self.sizes[number % len(self.sizes)]]
+
+
+# --- DER encoding --------------------------------------------------------------------------------------------------
+
+def _der_length(length: int) -> bytes:
+    if length < 0x80:
+        return bytes([length])
+    encoded = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([0x80 | len(encoded)]) + encoded
+
+
+def _tlv(tag: int, value: bytes) -> bytes:
+    return bytes([tag]) + _der_length(len(value)) + value
+
+
+def _der_integer(value: int) -> bytes:
+    encoded = value.to_bytes(max(1, (value.bit_length() + 8) // 8), "big")
+    return _tlv(0x02, encoded)
+
+
+def _der_oid(dotted: str) -> bytes:
+    parts = [int(part) for part in dotted.split(".")]
+    body = bytearray([parts[0] * 40 + parts[1]])
+    for part in parts[2:]:
+        chunk = [part & 0x7F]
+        part >>= 7
+        while part:
+            chunk.append(0x80 | (part & 0x7F))
+            part >>= 7
+        body.extend(reversed(chunk))
+    return _tlv(0x06, bytes(body))
+
+
+def _der_utc_time(value: datetime) -> bytes:
+    return _tlv(0x17, value.strftime("%y%m%d%H%M%SZ").encode("ascii"))
+
+
+def build_crl(entries: int) -> bytes:
+    """Builds a v2 CRL with `entries` 16-byte serials and a dummy sha256WithRSA signature."""
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    algorithm = _tlv(0x30, _der_oid("1.2.840.113549.1.1.11") + b"\x05\x00")
+    common_name = _tlv(0x30, _der_oid("2.5.4.3") + _tlv(0x0C, f"Load Test CA {entries}".encode("utf-8")))
+    issuer = _tlv(0x30, _tlv(0x31, common_name))
+    revocation_date = _der_utc_time(now - timedelta(days=1))
+    serial_base = 0x5DEECE66D << 80
+    revoked = b"".join(
+        _tlv(0x30, _der_integer(serial_base + index * 7919) + revocation_date) for index in range(entries)
+    )
+    tbs = (
+        _der_integer(1)
+        + algorithm
+        + issuer
+        + _der_utc_time(now - timedelta(hours=1))
+        + _der_utc_time(now + timedelta(days=7))
+        + (_tlv(0x30, revoked) if entries else b"")
+    )
+    signature = _tlv(0x03, b"\x00" + bytes(256))
+    return _tlv(0x30, _tlv(0x30, tbs) + algorithm + signature)
+
+
+# --- HTTP server ---------------------------------------------------------------------------------------------------
+
+class _ThreadedHttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, address: tuple[str, int], catalogue: CrlCatalogue, profile: ServeProfile):
+        super().__init__(address, _CrlRequestHandler)
+        self.catalogue = catalogue
+        self.profile = profile
+
+
+class _CrlRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    _path_pattern = re.compile(r"^/crl/(\d+)\.crl$")
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        server = cast(_ThreadedHttpServer, self.server)
+        match = self._path_pattern.match(self.path)
+        if match is None:
+            self._send_status(404)
+            return
+
+        time.sleep(server.profile.delay_seconds())
+        if server.profile.should_fail():
+            self._send_status(503)
+            return
+
+        payload = server.catalogue.payload_for(int(match.group(1)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/pkix-crl")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        _write_throttled(self.wfile.write, payload, server.profile.bandwidth_kbps)
+
+    def _send_status(self, status: int) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - signature fixed by http.server
+        pass
+
+
+def _write_throttled(write, payload: bytes, bandwidth_kbps: float) -> None:
+    if bandwidth_kbps <= 0:
+        write(payload)
+        return
+
+    bytes_per_second = bandwidth_kbps * 1024
+    started = time.monotonic()
+    for offset in range(0, len(payload), CHUNK_SIZE):
+        chunk = payload[offset:offset + CHUNK_SIZE]
+        write(chunk)
+        ahead = (offset + len(chunk)) / bytes_per_second - (time.monotonic() - started)
+        if ahead > 0:
+            time.sleep(ahead)
+
+
+# --- LDAP stand-in -------------------------------------------------------------------------------------------------
+# Just enough LDAPv3 (RFC 4511) for CrlMonitor: anonymous simple bind, base-scope search returning the CRL
+# attribute, abandon and unbind.
+
+_LDAP_BIND_REQUEST = 0x60
+_LDAP_UNBIND_REQUEST = 0x42
+_LDAP_SEARCH_REQUEST = 0x63
+_LDAP_ABANDON_REQUEST = 0x50
+_LDAP_SUCCESS = 0
+_LDAP_NO_SUCH_OBJECT = 32
+_LDAP_BUSY = 51
+
+
+def _read_exact(stream, count: int) -> Optional[bytes]:
+    data = stream.read(count)
+    return data if data is not None and len(data) == count else None
+
+
+def _read_tlv(stream) -> Optional[tuple[int, bytes]]:
+    header = _read_exact(stream, 2)
+    if header is None:
+        return None
+    tag, length = header[0], header[1]
+    if length & 0x80:
+        length_bytes = _read_exact(stream, length & 0x7F)
+        if length_bytes is None:
+            return None
+        length = int.from_bytes(length_bytes, "big")
+    value = _read_exact(stream, length)
+    return None if value is None else (tag, value)
+
+
+def _split_tlvs(data: bytes) -> list[tuple[int, bytes]]:
+    elements = []
+    offset = 0
+    while offset < len(data):
+        tag = data[offset]
+        length = data[offset + 1]
+        offset += 2
+        if length & 0x80:
+            count = length & 0x7F
+            length = int.from_bytes(data[offset:offset + count], "big")
+            offset += count
+        elements.append((tag, data[offset:offset + length]))
+        offset += length
+    return elements
+
+
+def _ldap_message(message_id: bytes, operation: bytes) -> bytes:
+    return _tlv(0x30, _tlv(0x02, message_id) + operation)
+
+
+def _ldap_result(tag: int, code: int) -> bytes:
+    return _tlv(tag, _tlv(0x0A, bytes([code])) + _tlv(0x04, b"") + _tlv(0x04, b""))
+
+
+class _ThreadedLdapServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, address: tuple[str, int], catalogue: CrlCatalogue, profile: ServeProfile):
+        super().__init__(address, _LdapRequestHandler)
+        self.catalogue = catalogue
+        self.profile = profile
+
+
+class _LdapRequestHandler(socketserver.StreamRequestHandler):
+    _dn_pattern = re.compile(r"cn=crl(\d+)", re.IGNORECASE)
+
+    def handle(self) -> None:
+        server = cast(_ThreadedLdapServer, self.server)
+        while True:
+            message = _read_tlv(self.rfile)
+            if message is None:
+                return
+            parts = _split_tlvs(message[1])
+            if len(parts) < 2:
+                return
+            message_id = parts[0][1]
+            operation_tag, operation = parts[1]
+            if operation_tag == _LDAP_BIND_REQUEST:
+                self.wfile.write(_ldap_message(message_id, _ldap_result(0x61, _LDAP_SUCCESS)))
+            elif operation_tag == _LDAP_SEARCH_REQUEST:
+                self._search(server, message_id, operation)
+            elif operation_tag == _LDAP_UNBIND_REQUEST:
+                return
+            elif operation_tag != _LDAP_ABANDON_REQUEST:
+                return
+            self.wfile.flush()
+
+    def _search(self, server: "_ThreadedLdapServer", message_id: bytes, operation: bytes) -> None:
+        base_dn = _split_tlvs(operation)[0][1].decode("utf-8", errors="replace")
+        time.sleep(server.profile.delay_seconds())
+        if server.profile.should_fail():
+            self.wfile.write(_ldap_message(message_id, _ldap_result(0x65, _LDAP_BUSY)))
+            return
+
+        match = self._dn_pattern.search(base_dn)
+        if match is None:
+            self.wfile.write(_ldap_message(message_id, _ldap_result(0x65, _LDAP_NO_SUCH_OBJECT)))
+            return
+
+        payload = server.catalogue.payload_for(int(match.group(1)))
+        attribute = _tlv(0x30, _tlv(0x04, LDAP_CRL_ATTRIBUTE.encode("ascii")) + _tlv(0x31, _tlv(0x04, payload)))
+        entry = _tlv(0x64, _tlv(0x04, base_dn.encode("utf-8")) + _tlv(0x30, attribute))
+        _write_throttled(self.wfile.write, _ldap_message(message_id, entry), server.profile.bandwidth_kbps)
+        self.wfile.write(_ldap_message(message_id, _ldap_result(0x65, _LDAP_SUCCESS)))
+
+
+class _ServerController:
+    def __init__(self, server: socketserver.TCPServer):
+        self.server = server
+        self.thread = threading.Thread(target=server.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.server.server_address[1]
+
+    def __enter__(self) -> "_ServerController":
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join(timeout=5)
+
+
+# --- Driver --------------------------------------------------------------------------------------------------------
+
+@dataclass
+class RunResult:
+    max_parallel_fetches: int
+    exit_code: int
+    wall_clock_seconds: float
+    peak_rss_mb: Optional[float]
+    crl_count: int
+    crls_per_second: float
+    status_counts: dict[str, int]
+    download_ms_p50: Optional[float]
+    download_ms_p95: Optional[float]
+    download_ms_p99: Optional[float]
+    download_ms_max: Optional[float]
+    slowest_uris: list[dict[str, str]]
+    report_path: str
+
+
+def _resolve_command(binary: Optional[str]) -> list[str]:
+    if binary is None:
+        subprocess.run(
+            ["dotnet", "build", "CrlMonitor.csproj", "-c", "Release", "-nologo", "-v", "quiet"],
+            cwd=REPO_ROOT,
+            check=True,
+        )
+        binary = str(REPO_ROOT / "bin" / "Release" / "net8.0" / "CrlMonitor.dll")
+    return ["dotnet", binary] if binary.endswith(".dll") else [binary]
+
+
+def _write_config(output_dir: Path, uris: list[str], parallel: int, timeout_seconds: int) -> tuple[Path, Path]:
+    report_path = output_dir / f"report-p{parallel}.csv"
+    config_path = output_dir / f"config-p{parallel}.json"
+    state_path = output_dir / f"state-p{parallel}.json"
+    if state_path.exists():
+        state_path.unlink()
+    config = {
+        "logging": {
+            "min_level": "Warning",
+            "log_file_path": str(output_dir / "load.log"),
+            "rolling_interval": "Day",
+            "retained_file_count_limit": 7
+        },
+        "console_reports": False,
+        "csv_reports": True,
+        "csv_output_path": str(report_path),
+        "csv_append_timestamp": False,
+        "fetch_timeout_seconds": timeout_seconds,
+        "max_parallel_fetches": parallel,
+        "state_file_path": str(state_path),
+        "uris": [
+            {"uri": uri, "signature_validation_mode": "none", "expiry_threshold": 0.8} for uri in uris
+        ],
+    }
+    config_path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    return config_path, report_path
+
+
+def _read_peak_rss_kb(pid: int) -> Optional[int]:
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+def _run_monitor(command: list[str], config_path: Path) -> tuple[int, float, Optional[float]]:
+    """Runs one check and returns exit code, wall-clock seconds and peak RSS in MB (None where unavailable)."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        command + ["--accept-eula", str(config_path)],
+        cwd=REPO_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    peak_kb: Optional[int] = None
+    while process.poll() is None:
+        sample = _read_peak_rss_kb(process.pid)
+        if sample is not None:
+            peak_kb = max(peak_kb or 0, sample)
+        time.sleep(0.05)
+    elapsed = time.perf_counter() - started
+    if peak_kb is None:
+        peak_kb = _children_max_rss_kb()
+    if process.returncode != 0 and process.stderr is not None:
+        sys.stderr.write(process.stderr.read().decode("utf-8", errors="replace"))
+    return process.returncode, elapsed, None if peak_kb is None else peak_kb / 1024
+
+
+def _children_max_rss_kb() -> Optional[int]:
+    # Fallback where /proc is unavailable: the largest RSS of any child so far, so sweeps report a running maximum.
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max_rss // 1024 if sys.platform == "darwin" else max_rss
+
+
+def _percentile(values: list[float], percent: float) -> Optional[float]:
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(percent) - 1]
+
+
+def _summarise(parallel: int, exit_code: int, elapsed: float, peak_rss_mb: Optional[float], report_path: Path) -> RunResult:
+    lines = [line for line in report_path.read_text(encoding="utf-8").splitlines() if not line.startswith("#")]
+    rows = list(csv.DictReader(lines))
+    status_counts: dict[str, int] = {}
+    for row in rows:
+        status_counts[row["Status"]] = status_counts.get(row["Status"], 0) + 1
+    timed = [row for row in rows if row["Download_Duration_ms"]]
+    downloads = sorted(float(row["Download_Duration_ms"]) for row in timed)
+    slowest = sorted(timed, key=lambda row: float(row["Download_Duration_ms"]), reverse=True)[:10]
+    return RunResult(
+        max_parallel_fetches=parallel,
+        exit_code=exit_code,
+        wall_clock_seconds=round(elapsed, 3),
+        peak_rss_mb=None if peak_rss_mb is None else round(peak_rss_mb, 1),
+        crl_count=len(rows),
+        crls_per_second=round(len(rows) / elapsed, 1) if elapsed > 0 else 0.0,
+        status_counts=status_counts,
+        download_ms_p50=_percentile(downloads, 50),
+        download_ms_p95=_percentile(downloads, 95),
+        download_ms_p99=_percentile(downloads, 99),
+        download_ms_max=downloads[-1] if downloads else None,
+        slowest_uris=[
+            {"uri": row["URI"], "status": row["Status"], "download_ms": row["Download_Duration_ms"], "ttfb_ms": row["TTFB_ms"]}
+            for row in slowest
+        ],
+        report_path=str(report_path),
+    )
+
+
+def _print_table(results: list[RunResult]) -> None:
+    print()
+    print(f"{'parallel':>8} {'wall s':>8} {'CRL/s':>8} {'peak MB':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  statuses")
+    for result in results:
+        peak = "n/a" if result.peak_rss_mb is None else f"{result.peak_rss_mb:.0f}"
+        statuses = ", ".join(f"{status}={count}" for status, count in sorted(result.status_counts.items()))
+        print(
+            f"{result.max_parallel_fetches:>8} {result.wall_clock_seconds:>8.1f} {result.crls_per_second:>8.1f} {peak:>8} "
+            f"{_format_ms(result.download_ms_p50):>8} {_format_ms(result.download_ms_p95):>8} {_format_ms(result.download_ms_p99):>8}  {statuses}"
+        )
+
+
+def _format_ms(value: Optional[float]) -> str:
+    return "n/a" if value is None else f"{value:.0f}"
+
+
+def _parse_int_list(value: str) -> list[int]:
+    try:
+        items = [int(item) for item in value.split(",") if item.strip()]
+    except ValueError as ex:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers, got '{value}'") from ex
+    if not items or any(item < 0 for item in items):
+        raise argparse.ArgumentTypeError(f"expected non-negative integers, got '{value}'")
+    return items
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve synthetic CRLs over HTTP and LDAP and measure CrlMonitor against them",
+        epilog=(
+            "Examples:\n"
+            "  python3 integration_tests/load_harness.py --http-count 4000 --ldap-count 1000 --parallel 8,32,64\n"
+            "  python3 integration_tests/load_harness.py --latency-ms 80 --jitter-ms 40 --bandwidth-kbps 512 --error-rate 0.02"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--http-count", type=int, default=2000, help="number of HTTP CRL URIs (default 2000)")
+    parser.add_argument("--ldap-count", type=int, default=500, help="number of LDAP CRL URIs (default 500)")
+    parser.add_argument("--sizes", type=_parse_int_list, default=[10, 1000, 20000],
+                        help="revoked entries per CRL, assigned round-robin (default 10,1000,20000)")
+    parser.add_argument("--parallel", type=_parse_int_list, default=[8, 32, 64],
+                        help="max_parallel_fetches values to sweep (default 8,32,64)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="base response latency (default 20)")
+    parser.add_argument("--jitter-ms", type=float, default=10.0, help="uniform latency jitter, +/- (default 10)")
+    parser.add_argument("--bandwidth-kbps", type=float, default=0.0, help="per-connection bandwidth cap in KiB/s, 0 = unlimited")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail (HTTP 503 / LDAP busy)")
+    parser.add_argument("--timeout-seconds", type=int, default=60, help="fetch_timeout_seconds for the monitor (default 60)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for latency jitter and errors")
+    parser.add_argument("--binary", help="CrlMonitor executable or CrlMonitor.dll (default: Release build of this repo)")
+    parser.add_argument("--output", type=Path, default=Path(__file__).parent / "load_output",
+                        help="directory for configs, reports and results.json")
+    args = parser.parse_args()
+
+    if args.http_count < 0 or args.ldap_count < 0 or args.http_count + args.ldap_count == 0:
+        parser.error("at least one HTTP or LDAP URI is required")
+    if not 0 <= args.error_rate <= 1:
+        parser.error("--error-rate must be between 0 and 1")
+
+    if args.output.exists():
+        shutil.rmtree(args.output)
+    args.output.mkdir(parents=True)
+
+    print(f"Generating CRLs for sizes {args.sizes}...")
+    catalogue = CrlCatalogue(args.sizes)
+    catalogue.build()
+    profile = ServeProfile(args.latency_ms, args.jitter_ms, args.bandwidth_kbps, args.error_rate, args.seed)
+    command = _resolve_command(args.binary)
+
+    results: list[RunResult] = []
+    http_server = _ThreadedHttpServer(("127.0.0.1", 0), catalogue, profile)
+    ldap_server = _ThreadedLdapServer(("127.0.0.1", 0), catalogue, profile)
+    with _ServerController(http_server) as http, _ServerController(ldap_server) as ldap:
+        uris = [f"http://127.0.0.1:{http.port}/crl/{number}.crl" for number in range(args.http_count)]
+        uris += [
+            f"ldap://127.0.0.1:{ldap.port}/cn=crl{number},{LDAP_BASE_DN}?{LDAP_CRL_ATTRIBUTE}"
+            for number in range(args.http_count, args.http_count + args.ldap_count)
+        ]
+        for parallel in args.parallel:
+            config_path, report_path = _write_config(args.output, uris, parallel, args.timeout_seconds)
+            print(f"Running {len(uris)} CRLs with max_parallel_fetches={parallel}...")
+            exit_code, elapsed, peak_rss_mb = _run_monitor(command, config_path)
+            if not report_path.exists():
+                print(f"error: monitor exited with {exit_code} and wrote no report", file=sys.stderr)
+                return 1
+            results.append(_summarise(parallel, exit_code, elapsed, peak_rss_mb, report_path))
+
+    _print_table(results)
+    settings = {key: (str(value) if isinstance(value, Path) else value) for key, value in vars(args).items()}
+    results_path = args.output / "results.json"
+    results_path.write_text(
+        json.dumps({"settings": settings, "runs": [asdict(result) for result in results]}, indent=2),
+        encoding="utf-8",
+    )
+    print(f"\nResults written to {results_path}")
+    return 0 if all(result.exit_code == 0 for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())